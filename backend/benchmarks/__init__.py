@@ -0,0 +1 @@
+"""Benchmarks for forgebase (run from ``backend/`` with ``PYTHONPATH=src``)."""
@@ -0,0 +1,147 @@
+"""Benchmark: Semantic Kernel overhead per streamed token and per tool call.
+
+A local mock deployment answers instantly, so the measured time is spent in
+the client stack. Each scenario is timed through the real ``Agent`` and
+through the bare ``AsyncAzureOpenAI`` client; the difference is the overhead
+added by Semantic Kernel and the agent:
+
+* per token: slope of turn time between a short and a long reply
+* per tool call: a turn with one ``PRDTools-update_prd`` call minus a plain
+  turn and the extra model request the tool call needs
+
+Usage (from ``backend/``)::
+
+    PYTHONPATH=src python -m benchmarks.bench_agent_overhead [--turns 50]
+
+Exits with status 1 if an overhead exceeds its budget.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import statistics
+import sys
+import time
+from typing import Any, Awaitable, Callable
+
+from openai import AsyncAzureOpenAI
+from semantic_kernel.connectors.ai.open_ai.const import DEFAULT_AZURE_API_VERSION
+
+from forgebase.core.project_service import ProjectService
+from forgebase.infrastructure.agent import Agent
+from forgebase.infrastructure.mock_llm_server import (
+    MockLLMBehavior,
+    MockLLMServer,
+    MockToolCall,
+)
+from forgebase.infrastructure.project_repository import InMemoryProjectRepository
+from forgebase.tools.prd_tools import PRDTools
+
+SHORT_TOKENS = 1
+LONG_TOKENS = 500
+TOOL_CALL = MockToolCall("PRDTools-update_prd", {"prd_content": "# Benchmark PRD"})
+
+
+async def median_seconds(turn: Callable[[], Awaitable[Any]], turns: int) -> float:
+    """Median duration of ``turns`` runs of ``turn`` after a warm-up run."""
+    await turn()
+    durations = []
+    for _ in range(turns):
+        started = time.perf_counter()
+        await turn()
+        durations.append(time.perf_counter() - started)
+    return statistics.median(durations)
+
+
+async def run(turns: int) -> dict[str, float]:
+    """Time raw and agent turns against mock deployments.
+
+    Returns:
+        Per-token and per-tool-call timings in microseconds and milliseconds
+    """
+    behavior = MockLLMBehavior()
+    service = ProjectService(InMemoryProjectRepository())
+    project = await service.create_project("test-user-123", "Benchmark")
+
+    with MockLLMServer(behavior) as server:
+        client = AsyncAzureOpenAI(
+            azure_endpoint=server.endpoint,
+            api_key="bench-key",
+            api_version=DEFAULT_AZURE_API_VERSION,
+        )
+        agent = Agent(
+            endpoint=server.endpoint,
+            api_key="bench-key",
+            deployment_name="mock",
+            tools=[PRDTools(service)],
+        )
+        agent.set_project_context(str(project.id))
+
+        async def raw_turn() -> None:
+            stream = await client.chat.completions.create(
+                model="mock",
+                messages=[{"role": "user", "content": "Hello"}],
+                stream=True,
+            )
+            async for _ in stream:
+                pass
+
+        async def agent_turn() -> None:
+            # A fresh thread keeps the request size constant across turns
+            await agent.reset()
+            async for _ in agent.send_message_stream("Hello"):
+                pass
+
+        timings: dict[str, float] = {}
+        for tokens in (SHORT_TOKENS, LONG_TOKENS):
+            behavior.chunks = [" token"] * tokens
+            timings[f"raw_{tokens}"] = await median_seconds(raw_turn, turns)
+            timings[f"agent_{tokens}"] = await median_seconds(agent_turn, turns)
+
+        behavior.chunks = [" token"] * SHORT_TOKENS
+        behavior.tool_calls = [TOOL_CALL]
+        timings["agent_tool"] = await median_seconds(agent_turn, turns)
+
+    span = LONG_TOKENS - SHORT_TOKENS
+    raw_per_token = (
+        timings[f"raw_{LONG_TOKENS}"] - timings[f"raw_{SHORT_TOKENS}"]
+    ) / span
+    agent_per_token = (
+        timings[f"agent_{LONG_TOKENS}"] - timings[f"agent_{SHORT_TOKENS}"]
+    ) / span
+    raw_request = timings[f"raw_{SHORT_TOKENS}"]
+    tool_call = timings["agent_tool"] - timings[f"agent_{SHORT_TOKENS}"] - raw_request
+
+    return {
+        "raw_turn_ms": round(raw_request * 1000, 2),
+        "agent_turn_ms": round(timings[f"agent_{SHORT_TOKENS}"] * 1000, 2),
+        "raw_us_per_token": round(raw_per_token * 1e6, 1),
+        "agent_us_per_token": round(agent_per_token * 1e6, 1),
+        "sk_overhead_us_per_token": round((agent_per_token - raw_per_token) * 1e6, 1),
+        "sk_overhead_ms_per_tool_call": round(tool_call * 1000, 2),
+    }
+
+
+def main() -> None:
+    """Run the benchmark and check the overheads against their budgets."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=50)
+    parser.add_argument("--budget-us-per-token", type=float, default=500.0)
+    parser.add_argument("--budget-ms-per-tool-call", type=float, default=50.0)
+    args = parser.parse_args()
+
+    # Keep the tools' debug output out of the JSON results
+    with contextlib.redirect_stdout(sys.stderr):
+        results = asyncio.run(run(args.turns))
+    within_budget = (
+        results["sk_overhead_us_per_token"] <= args.budget_us_per_token
+        and results["sk_overhead_ms_per_tool_call"] <= args.budget_ms_per_tool_call
+    )
+    print(json.dumps({"within_budget": within_budget, **results}, indent=2))
+    if not within_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Benchmark: memory held by idle conversations with and without spilling.
+
+Builds many agents, each with a persisted conversation of several turns, and
+measures the traced Python memory of their threads while resident and after
+the memory manager spilled them as idle. Then one conversation is resumed to
+time its restore. Results are printed as JSON.
+
+Usage (from ``backend/``)::
+
+    PYTHONPATH=src python -m benchmarks.bench_conversation_memory [--agents 200]
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import tempfile
+import time
+import tracemalloc
+
+from forgebase.infrastructure.agent import Agent
+from forgebase.infrastructure.conversation_memory import ConversationMemoryManager
+from forgebase.infrastructure.conversation_store import ConversationStore
+
+
+class ManualClock:
+    """Clock advanced by the benchmark to make every conversation idle."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def traced_bytes() -> int:
+    """Get the currently traced memory after a full collection."""
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+async def run(agents: int, turns: int, directory: str) -> dict[str, float]:
+    """Fill conversations, spill them and resume one.
+
+    Returns:
+        Memory per conversation before and after spilling, and restore time
+    """
+    clock = ManualClock()
+    manager = ConversationMemoryManager(idle_timeout=60.0, clock=clock)
+    store = ConversationStore(directory)
+    pool = [
+        Agent(
+            endpoint="https://bench.openai.azure.com/",
+            api_key="bench-key",
+            deployment_name="bench",
+            conversation_store=store,
+            memory_manager=manager,
+        )
+        for _ in range(agents)
+    ]
+
+    tracemalloc.start()
+    empty = traced_bytes()
+    for index, agent in enumerate(pool):
+        agent.set_conversation(f"conversation-{index}")
+        for turn in range(turns):
+            await agent.record_turn(
+                f"Requirement {turn}: users can export the PRD as PDF. " * 4,
+                f"Added requirement {turn} with acceptance criteria. " * 8,
+            )
+    resident = traced_bytes()
+    estimated = manager.resident_bytes
+
+    clock.now = 120.0
+    manager.sweep()
+    spilled = traced_bytes()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    await pool[0].record_turn("Resume", "Welcome back")
+    restore_ms = (time.perf_counter() - start) * 1000
+
+    return {
+        "resident_bytes_per_conversation": round((resident - empty) / agents),
+        "spilled_bytes_per_conversation": round((spilled - empty) / agents),
+        "estimated_bytes_per_conversation": round(estimated / agents),
+        "restore_ms": round(restore_ms, 2),
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, default=200)
+    parser.add_argument("--turns", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        results = asyncio.run(run(args.agents, args.turns, directory))
+    print(json.dumps({"agents": args.agents, "turns": args.turns, **results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Benchmark: TTFT percentiles with and without hedged requests.
+
+Two local mock deployments stall before the first token on a small share of
+requests. Agents are built the way the app builds them, through ``config``
+with the deployments and ``FORGEBASE_HEDGE_PERCENTILE`` set in the
+environment, and every simulated chat session gets a new agent after a few
+turns. The same seeded workload runs once with hedging off and once with it
+on (percentile 95, the default 2 s initial delay), and the TTFT percentiles
+and the share of hedged requests are printed as JSON.
+
+Usage (from ``backend/``)::
+
+    PYTHONPATH=src python -m benchmarks.bench_hedging [--turns 400]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from typing import Any
+
+from forgebase.core.project_service import ProjectService
+from forgebase.infrastructure import config
+from forgebase.infrastructure.mock_llm_server import MockLLMBehavior, MockLLMServer
+from forgebase.infrastructure.project_repository import InMemoryProjectRepository
+
+# Settings of config that would change the agents built for the benchmark
+UNSET = (
+    "AZURE_OPENAI_ENDPOINT",
+    "AZURE_OPENAI_API_KEY",
+    "AZURE_OPENAI_DEPLOYMENT_NAME",
+    "FORGEBASE_RESPONSE_CACHE_SIZE",
+    "FORGEBASE_CONVERSATION_DIR",
+    "FORGEBASE_AGENT_POOL_SIZE",
+)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    ordered = sorted(values)
+    index = max(int(round(pct / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(index, len(ordered) - 1)]
+
+
+def stalling_delay(rng: random.Random, stall_rate: float, stall: float):
+    """Build a first-token delay sampler with occasional stalls."""
+
+    def sample() -> float:
+        if rng.random() < stall_rate:
+            return stall
+        return rng.uniform(0.02, 0.06)
+
+    return sample
+
+
+def configure(endpoints: list[str], hedge: bool) -> None:
+    """Point config at the mock deployments, with or without hedging."""
+    for name in UNSET:
+        os.environ.pop(name, None)
+    os.environ["AZURE_OPENAI_DEPLOYMENTS"] = json.dumps(
+        [
+            {"endpoint": endpoint, "api_key": "mock-key", "deployment_name": "mock"}
+            for endpoint in endpoints
+        ]
+    )
+    os.environ["FORGEBASE_HEDGE_PERCENTILE"] = "95" if hedge else "0"
+    config.reset_deployment_router()
+    config.reset_hedge_policy()
+
+
+async def run(turns: int, concurrency: int, session_turns: int) -> dict[str, Any]:
+    """Run the workload and collect TTFTs."""
+    project_service = ProjectService(InMemoryProjectRepository())
+    ttfts: list[float] = []
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for turn in range(turns):
+        queue.put_nowait(turn)
+
+    async def user() -> None:
+        agent = None
+        while not queue.empty():
+            turn = queue.get_nowait()
+            if agent is None or turn % session_turns == 0:
+                # A new chat session gets a new agent, as from the app
+                agent = config._create_agent(project_service)
+            await agent.reset()
+            started = time.perf_counter()
+            first = None
+            async for _ in agent.send_message_stream("Hello"):
+                if first is None:
+                    first = time.perf_counter() - started
+            ttfts.append(first if first is not None else float("nan"))
+
+    await asyncio.gather(*(user() for _ in range(concurrency)))
+    return {
+        "p50": percentile(ttfts, 50),
+        "p95": percentile(ttfts, 95),
+        "p99": percentile(ttfts, 99),
+        "max": max(ttfts),
+    }
+
+
+def main() -> None:
+    """Run baseline and hedged workloads and print the comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--stall-rate", type=float, default=0.03)
+    parser.add_argument("--stall", type=float, default=3.0)
+    parser.add_argument("--session-turns", type=int, default=5)
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {}
+    for mode in ("baseline", "hedged"):
+        rng = random.Random(42)
+        behaviors = [
+            MockLLMBehavior(
+                first_token_delay=stalling_delay(rng, args.stall_rate, args.stall)
+            )
+            for _ in range(2)
+        ]
+        servers = [MockLLMServer(b).start() for b in behaviors]
+        try:
+            configure([s.endpoint for s in servers], hedge=mode == "hedged")
+            results[mode] = asyncio.run(
+                run(args.turns, args.concurrency, args.session_turns)
+            )
+            results[mode]["requests_per_turn"] = (
+                sum(b.requests for b in behaviors) / args.turns
+            )
+        finally:
+            for server in servers:
+                server.stop()
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Benchmark: import time of the stub (no Azure credentials) startup path.
+
+Each run starts a fresh interpreter with ``python -X importtime``, imports the
+web app and CLI and builds the stub agent, then parses the cumulative import
+time of the top-level modules. The best of several runs is compared against a
+budget and the heavy Semantic Kernel / Azure stack must not be loaded at all.
+
+Usage (from ``backend/``)::
+
+    PYTHONPATH=src python -m benchmarks.bench_import_time [--budget-ms 1000]
+
+Exits with status 1 if the budget is exceeded or Semantic Kernel is imported.
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+STUB_STARTUP = (
+    "from forgebase.interfaces import cli, web\n"
+    "from forgebase.infrastructure import config\n"
+    "config._create_agent(config.get_project_service())\n"
+)
+
+HEAVY_PACKAGES = ("semantic_kernel", "openai", "azure")
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def measure(code: str) -> dict[str, Any]:
+    """Run ``code`` in a fresh interpreter and collect import timings.
+
+    Args:
+        code: Python source to execute
+
+    Returns:
+        Total import time in ms, the slowest top-level imports and the heavy
+        packages that were loaded
+    """
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if not key.startswith(("AZURE_OPENAI_", "FORGEBASE_"))
+    }
+    env["PYTHONPATH"] = str(SRC)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    top_level: dict[str, int] = {}
+    loaded: set[str] = set()
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        _, cumulative, indent, module = match.groups()
+        loaded.add(module.split(".")[0])
+        if len(indent) == 1:
+            top_level[module] = int(cumulative)
+    slowest = sorted(top_level.items(), key=lambda item: item[1], reverse=True)
+    return {
+        "total_ms": round(sum(top_level.values()) / 1000, 1),
+        "slowest_ms": {name: round(us / 1000, 1) for name, us in slowest[:5]},
+        "heavy_packages": sorted(loaded.intersection(HEAVY_PACKAGES)),
+    }
+
+
+def main() -> None:
+    """Measure the stub startup path and check it against the budget."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=1000.0)
+    args = parser.parse_args()
+
+    runs = [measure(STUB_STARTUP) for _ in range(args.runs)]
+    best = min(runs, key=lambda run: run["total_ms"])
+    within_budget = best["total_ms"] <= args.budget_ms and not best["heavy_packages"]
+    print(
+        json.dumps(
+            {"budget_ms": args.budget_ms, "within_budget": within_budget, **best},
+            indent=2,
+        )
+    )
+    if not within_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
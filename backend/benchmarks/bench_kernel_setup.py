@@ -0,0 +1,79 @@
+"""Benchmark: per-session kernel setup with and without cached tool plugins.
+
+Builds many kernels, each with a fresh ``PRDTools`` instance registered as a
+plugin, once through Semantic Kernel's reflective ``Kernel.add_plugin`` and
+once through ``add_tool_plugin`` (metadata cached per tool class). Prints the
+mean cost per kernel as JSON.
+
+Usage (from ``backend/``)::
+
+    PYTHONPATH=src python -m benchmarks.bench_kernel_setup [--kernels 10000]
+"""
+
+import argparse
+import json
+import time
+from typing import Callable
+
+from semantic_kernel import Kernel
+
+from forgebase.core.project_service import ProjectService
+from forgebase.infrastructure.project_repository import InMemoryProjectRepository
+from forgebase.tools.prd_tools import PRDTools
+from forgebase.tools.tool_function import add_tool_plugin
+
+
+def reflective(kernel: Kernel, tools: PRDTools) -> None:
+    """Register the tool the uncached way, introspecting it every time."""
+    kernel.add_plugin(tools, plugin_name=tools.plugin_name)
+
+
+def cached(kernel: Kernel, tools: PRDTools) -> None:
+    """Register the tool from its cached plugin template."""
+    add_tool_plugin(kernel, tools, tools.plugin_name)
+
+
+def run(
+    register: Callable[[Kernel, PRDTools], None],
+    service: ProjectService,
+    kernels: int,
+) -> float:
+    """Build ``kernels`` kernels with one registered tool each.
+
+    Returns:
+        Mean microseconds per kernel
+    """
+    start = time.perf_counter()
+    for _ in range(kernels):
+        kernel = Kernel()
+        register(kernel, PRDTools(service))
+    return (time.perf_counter() - start) / kernels * 1e6
+
+
+def main() -> None:
+    """Run both variants and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--kernels", type=int, default=10_000)
+    args = parser.parse_args()
+
+    service = ProjectService(InMemoryProjectRepository())
+    # Warm up: attaches the SK metadata and fills the template cache
+    cached(Kernel(), PRDTools(service))
+
+    reflective_us = run(reflective, service, args.kernels)
+    cached_us = run(cached, service, args.kernels)
+    print(
+        json.dumps(
+            {
+                "kernels": args.kernels,
+                "reflective_us_per_kernel": round(reflective_us, 1),
+                "cached_us_per_kernel": round(cached_us, 1),
+                "speedup": round(reflective_us / cached_us, 1),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
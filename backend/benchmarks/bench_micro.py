@@ -0,0 +1,197 @@
+"""Micro-benchmarks of the core and infrastructure hot paths.
+
+Covers ``InMemoryProjectRepository`` at several repository sizes,
+``ProjectService.update_project`` and ``list_projects``, project response
+serialization (the former pydantic path, the direct serializer and cached
+payloads), SSE framing of chat chunks, ``Project.create`` and
+``ProjectResponse.model_validate``.
+
+Every repository holds projects of many users; the benchmark user owns
+``USER_PROJECTS`` of them, so listing measures the scan over all projects.
+
+Results (microseconds per operation) are compared against
+``benchmarks/baselines/micro.json``; ``--save`` records a new baseline.
+Baselines depend on the machine, so record one before comparing branches.
+
+Usage (from ``backend/``)::
+
+    PYTHONPATH=src python -m benchmarks.bench_micro [--sizes 1000,100000]
+        [-k repository] [--save] [--tolerance 0.5]
+
+Exits with status 1 if a case is slower than its baseline by more than the
+tolerance.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from benchmarks.harness import Case, compare, load_baseline, run_cases, save_baseline
+from forgebase.core.entities import Project
+from forgebase.core.project_service import ProjectService
+from forgebase.infrastructure.project_repository import InMemoryProjectRepository
+from forgebase.interfaces import project_models, web
+from forgebase.interfaces.project_json import (
+    ProjectPayloadCache,
+    project_to_json,
+    projects_to_json,
+)
+
+BASELINE = Path(__file__).resolve().parent / "baselines" / "micro.json"
+
+USER_ID = "bench-user"
+USER_PROJECTS = 100
+OTHER_USERS = 1000
+SERVICE_SIZE = 10_000
+
+PRD = (
+    "# Product Requirements\n\n## Overview\nExport PRDs as PDF and Markdown.\n\n"
+    + "## Requirements\n"
+    + "".join(f"- Requirement {i}: users can do thing {i}.\n" for i in range(40))
+)
+
+
+def build_repository(size: int) -> tuple[InMemoryProjectRepository, Project]:
+    """Build a repository of ``size`` projects.
+
+    Returns:
+        The repository and one of the benchmark user's projects
+    """
+    repository = InMemoryProjectRepository()
+    owned = min(USER_PROJECTS, size)
+    for index in range(size):
+        owner = USER_ID if index < owned else f"user-{index % OTHER_USERS}"
+        project = Project.create(owner, f"Project {index}", PRD)
+        # pylint: disable=protected-access
+        repository._projects[project.id] = project
+    sample = next(iter(repository._projects.values()))
+    return repository, sample
+
+
+def repository_cases(size: int) -> list[Case]:
+    """Repository operations at one size."""
+    repository, project = build_repository(size)
+    scratch = Project.create(USER_ID, "Scratch", PRD)
+
+    async def get() -> None:
+        await repository.get_by_id_for_user(project.id, USER_ID)
+
+    async def list_for_user() -> None:
+        await repository.get_all_for_user(USER_ID)
+
+    async def update() -> None:
+        await repository.update(project)
+
+    async def create_delete() -> None:
+        await repository.create(scratch)
+        await repository.delete(scratch.id)
+
+    return [
+        Case(f"repository.get_by_id_for_user[{size}]", get),
+        Case(f"repository.get_all_for_user[{size}]", list_for_user),
+        Case(f"repository.update[{size}]", update),
+        Case(f"repository.create_delete[{size}]", create_delete),
+    ]
+
+
+def service_cases() -> list[Case]:
+    """ProjectService operations over a mid-sized repository."""
+    repository, project = build_repository(SERVICE_SIZE)
+    service = ProjectService(repository)
+    project_id = str(project.id)
+    prds = (PRD, PRD + "\n")
+    turn = [0]
+
+    async def update_project() -> None:
+        # Alternate the PRD so every call really changes the project
+        turn[0] ^= 1
+        await service.update_project(project_id, USER_ID, prd=prds[turn[0]])
+
+    async def list_projects() -> None:
+        await service.list_projects(USER_ID)
+
+    return [
+        Case(f"service.update_project[{SERVICE_SIZE}]", update_project),
+        Case(f"service.list_projects[{SERVICE_SIZE}]", list_projects),
+    ]
+
+
+def serialization_cases() -> list[Case]:
+    """Entity creation, validation and response serialization."""
+    project = Project.create(USER_ID, "Serialized", PRD)
+    project.update_prd(PRD)
+    projects = [
+        Project.create(USER_ID, f"Project {index}", PRD)
+        for index in range(USER_PROJECTS)
+    ]
+    chunk = "Added the export requirement.\nNext: acceptance criteria"
+    payloads = ProjectPayloadCache()
+
+    def pydantic_payload(item: Project) -> dict[str, Any]:
+        # The endpoints' former path, kept as the reference
+        response = project_models.ProjectResponse.model_validate(item)
+        return response.model_dump(mode="json", by_alias=True)
+
+    def payload() -> None:
+        JSONResponse(content=pydantic_payload(project))
+
+    def payload_list() -> None:
+        JSONResponse(content=[pydantic_payload(p) for p in projects])
+
+    return [
+        Case("Project.create", lambda: Project.create(USER_ID, "New", PRD)),
+        Case(
+            "ProjectResponse.model_validate",
+            lambda: project_models.ProjectResponse.model_validate(project),
+        ),
+        Case("web.project_payload", payload),
+        Case(f"web.project_payload_list[{USER_PROJECTS}]", payload_list),
+        Case("project_to_json", lambda: project_to_json(project)),
+        Case(f"projects_to_json[{USER_PROJECTS}]", lambda: projects_to_json(projects)),
+        Case(
+            "ProjectPayloadCache.project_json", lambda: payloads.project_json(project)
+        ),
+        Case(
+            f"ProjectPayloadCache.projects_json[{USER_PROJECTS}]",
+            lambda: payloads.projects_json(projects),
+        ),
+        Case("web.sse_event", lambda: web._sse_event(chunk)),
+    ]
+
+
+def main() -> None:
+    """Run the suite, compare it with the baseline and report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,100000,1000000")
+    parser.add_argument("-k", dest="keyword", help="Only run cases containing this")
+    parser.add_argument("--min-time", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    parser.add_argument("--save", action="store_true", help="Record a new baseline")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    args = parser.parse_args()
+
+    groups = [serialization_cases, service_cases] + [
+        (lambda size=int(size): repository_cases(size))
+        for size in args.sizes.split(",")
+    ]
+    results: dict[str, float] = {}
+    for build in groups:
+        # Build one group at a time so large repositories are freed early
+        cases = [c for c in build() if not args.keyword or args.keyword in c.name]
+        results.update(run_cases(cases, args.min_time, args.repeat))
+
+    if args.save:
+        save_baseline(args.baseline, results)
+    report = compare(results, load_baseline(args.baseline), args.tolerance)
+    print(json.dumps(report, indent=2))
+    if any(entry.get("regression") for entry in report.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
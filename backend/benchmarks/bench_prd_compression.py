@@ -0,0 +1,266 @@
+"""Benchmark: memory and read latency of compressed PRD storage.
+
+Builds a corpus of PRDs from the markdown shipped in the repository (the PRD
+system prompt, READMEs and contributor instructions): a word bigram model
+trained on it writes new sections of prose, bullet lists, acceptance
+criteria and tables under the headings of the PRD template, so the documents
+read and compress like real PRDs rather than repeating the same paragraphs.
+The PRDs go into the service stack the app builds from ``config``
+(repository, revision history, work executor) with compression off and on.
+Every PRD is edited a few times and all projects are listed and read through
+the app's JSON payload cache, so every copy of a PRD the app keeps is
+counted. The benchmark reports the memory held, the cost of compressing, and
+the latency of reading a PRD that is decompressed in the hot cache and of
+one that must be decompressed. Results are printed as JSON.
+
+Usage (from ``backend/``)::
+
+    PYTHONPATH=src python -m benchmarks.bench_prd_compression [--projects 150] [--edits 3]
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import random
+import re
+import statistics
+import time
+import tracemalloc
+import zlib
+from collections import defaultdict
+from pathlib import Path
+from uuid import UUID
+
+from forgebase.infrastructure import config
+from forgebase.interfaces.project_json import ProjectPayloadCache
+
+USER_ID = "bench-user"
+ROOT = Path(__file__).resolve().parents[2]
+SOURCES = (
+    "backend/src/forgebase/prompts/prd.system.md",
+    "backend/README.md",
+    "backend/.github/instructions/backend.instructions.md",
+    "frontend/README.md",
+    "frontend/.github/instructions/frontend.instructions.md",
+    "README.md",
+)
+SIZES = (16 * 1024, 64 * 1024, 256 * 1024)
+
+
+class PrdWriter:
+    """Writes markdown PRDs with a word bigram model of a corpus."""
+
+    def __init__(self, corpus: str, seed: int) -> None:
+        """Train on a corpus."""
+        self._rng = random.Random(seed)
+        words = re.findall(r"[A-Za-z][A-Za-z'/-]*|[.,;:]", corpus)
+        self._next: dict[str, list[str]] = defaultdict(list)
+        for word, following in zip(words, words[1:]):
+            self._next[word].append(following)
+        self._starts = [w for w in self._next if w[0].isupper()]
+        self._headings = [
+            line.lstrip("#").strip()
+            for line in corpus.splitlines()
+            if line.startswith("#")
+        ]
+
+    def sentence(self, words: int) -> str:
+        """Generate a sentence of about ``words`` words."""
+        word = self._rng.choice(self._starts)
+        out = [word]
+        while len(out) < words or out[-1] not in ".":
+            word = self._rng.choice(self._next.get(word) or self._starts)
+            out.append(word)
+            if len(out) > words * 3:
+                out.append(".")
+                break
+        return re.sub(r" ([.,;:])", r"\1", " ".join(out))
+
+    def section(self, number: int) -> str:
+        """Generate one section of a PRD."""
+        rng = self._rng
+        parts = [f"## {number}. {rng.choice(self._headings)}\n\n"]
+        parts.append(" ".join(self.sentence(18) for _ in range(rng.randint(2, 5))))
+        parts.append("\n\n")
+        for item in range(rng.randint(3, 8)):
+            parts.append(f"- **FR-{number}.{item}** {self.sentence(14)}\n")
+        parts.append("\n### Acceptance criteria\n\n")
+        for _ in range(rng.randint(2, 4)):
+            parts.append(
+                f"- Given {self.sentence(6)} When {self.sentence(6)}"
+                f" Then {self.sentence(8)}\n"
+            )
+        if rng.random() < 0.4:
+            parts.append("\n| Metric | Target | Owner |\n|---|---|---|\n")
+            for _ in range(rng.randint(2, 5)):
+                parts.append(
+                    f"| {self.sentence(3)} | {rng.randint(1, 99)}% "
+                    f"| {rng.choice(self._starts)} |\n"
+                )
+        parts.append("\n")
+        return "".join(parts)
+
+    def prd(self, size: int) -> str:
+        """Generate a PRD of about ``size`` characters."""
+        parts = [f"# PRD: {self.sentence(4)}\n\n"]
+        length = len(parts[0])
+        number = 1
+        while length < size:
+            parts.append(self.section(number))
+            length += len(parts[-1])
+            number += 1
+        return "".join(parts)
+
+
+def corpus(count: int) -> list[str]:
+    """Generate ``count`` PRDs, sizes mixed evenly."""
+    text = "\n".join((ROOT / source).read_text(encoding="utf-8") for source in SOURCES)
+    writer = PrdWriter(text, seed=3)
+    return [writer.prd(size) for size in SIZES for _ in range(count // len(SIZES))]
+
+
+class Stack:
+    """The services the app builds from ``config``, with its payload cache."""
+
+    def __init__(self) -> None:
+        """Build the services from the environment, as the app lifespan does."""
+        self.service = config.get_project_service()
+        self.repository = config.get_project_repository()
+        self.history = config.get_prd_history()
+        self.payloads = ProjectPayloadCache(
+            max_prd_chars=self.repository.compress_min_chars
+        )
+        config.get_project_events().add_listener(
+            lambda event: self.payloads.invalidate(event.project_id)
+        )
+
+    async def fill(self, prds: list[str], edits: int) -> list[UUID]:
+        """Create projects, edit each PRD a few times and serve them as JSON."""
+        ids = [
+            await self.create(f"Project {index}", prd, edits)
+            for index, prd in enumerate(prds)
+        ]
+        self.payloads.projects_json(await self.service.list_projects(USER_ID))
+        for project_id in ids:
+            project = await self.service.get_project(str(project_id), USER_ID)
+            self.payloads.project_json(project)
+        return ids
+
+    async def create(self, name: str, prd: str, edits: int) -> UUID:
+        """Create a project and append a line to its PRD ``edits`` times."""
+        project = await self.service.create_project(USER_ID, name, prd=prd)
+        for edit in range(edits):
+            prd = f"{prd}- Note {edit}\n"
+            await self.service.update_project(str(project.id), USER_ID, prd=prd)
+        project_id: UUID = project.id
+        return project_id
+
+
+def configure(compress_min_chars: int) -> None:
+    """Set the compression mode and drop the services built before."""
+    os.environ["FORGEBASE_PRD_COMPRESS_MIN_CHARS"] = str(compress_min_chars)
+    config.reset_project_repository()
+    config.reset_prd_history()
+    config.reset_project_events()
+    config.reset_prd_html_cache()
+    config.reset_work_executor()
+
+
+def held_bytes(
+    prds: list[str], compress_min_chars: int, edits: int
+) -> tuple[int, Stack, list[UUID]]:
+    """Measure the memory the filled service stack holds, PRDs included."""
+    configure(compress_min_chars)
+    # Copies, so the services own the only reference to every PRD
+    copies = ["".join([prd[:1], prd[1:]]) for prd in prds]
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    stack = Stack()
+    ids = asyncio.run(stack.fill(copies, edits))
+    del copies
+    gc.collect()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return held - before, stack, ids
+
+
+def read_latency(stack: Stack, ids: list[UUID]) -> dict:
+    """Time reads of hot and of compressed PRDs, in microseconds."""
+
+    async def read(project_id: UUID) -> float:
+        started = time.perf_counter()
+        project = await stack.service.get_project(str(project_id), USER_ID)
+        project.prd  # noqa: B018
+        return (time.perf_counter() - started) * 1e6
+
+    async def run() -> dict:
+        cold: dict[int, list[float]] = defaultdict(list)
+        hot: list[float] = []
+        for project_id in ids:
+            stored = await stack.repository.get_by_id(project_id)
+            assert stored is not None
+            size = stored.prd_length
+            cold[size // 1024 // 16 * 16].append(await read(project_id))
+            hot.append(await read(project_id))
+        return {
+            "hot_read_us": round(statistics.median(hot), 2),
+            "cold_read_us_by_kb": {
+                f"{kb}-{kb + 16}": {
+                    "median": round(statistics.median(times), 1),
+                    "max": round(max(times), 1),
+                }
+                for kb, times in sorted(cold.items())
+            },
+        }
+
+    return asyncio.run(run())
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=150)
+    parser.add_argument("--edits", type=int, default=3)
+    args = parser.parse_args()
+
+    prds = corpus(args.projects)
+    text_chars = sum(len(prd) for prd in prds)
+    try:
+        plain, _, _ = held_bytes(prds, 0, args.edits)
+        compressed, stack, ids = held_bytes(prds, 8 * 1024, args.edits)
+        latency = read_latency(stack, ids)
+    finally:
+        config.reset_work_executor()
+
+    started = time.perf_counter()
+    for prd in prds[:30]:
+        zlib.compress(prd.encode("utf-8"), 6)
+    compress_us_per_kb = (
+        (time.perf_counter() - started)
+        * 1e6
+        / (sum(len(prd) for prd in prds[:30]) / 1024)
+    )
+
+    print(
+        json.dumps(
+            {
+                "projects": len(prds),
+                "edits_per_project": args.edits,
+                "prd_chars": text_chars,
+                "held_bytes": {"plain": plain, "compressed": compressed},
+                "memory_saved": round(1 - compressed / plain, 3),
+                "compressions": stack.repository.compressions,
+                "history_stored": stack.history.stored_chars,
+                "compress_us_per_kb": round(compress_us_per_kb, 1),
+                **latency,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Benchmark: PRD revision history storage and reconstruction cost.
+
+Replays an agent revising a PRD turn after turn: most turns rewrite a few
+lines of one section, some append a section, and a few rewrite the whole
+document. Every revision goes through ``ProjectService.update_project`` into
+an ``InMemoryPrdHistory``. For each keyframe interval the benchmark reports
+the characters stored against keeping a full copy per revision, the cost of
+recording a revision (including its diff) and the time to reconstruct
+revisions. Results are printed as JSON.
+
+Usage (from ``backend/``)::
+
+    PYTHONPATH=src python -m benchmarks.bench_prd_history [--revisions 500]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+
+from forgebase.core.project_service import ProjectService
+from forgebase.infrastructure.prd_history import InMemoryPrdHistory
+from forgebase.infrastructure.project_repository import InMemoryProjectRepository
+
+USER_ID = "bench-user"
+INTERVALS = (1, 8, 32, 128)
+
+
+def agent_revisions(count: int, seed: int = 7) -> list[str]:
+    """Generate successive PRD revisions the way the agent edits them."""
+    rng = random.Random(seed)
+    sections = [
+        [f"## Section {s}\n"]
+        + [f"- Requirement {s}.{i}: {'x' * 60}\n" for i in range(12)]
+        for s in range(20)
+    ]
+    revisions = []
+    for turn in range(count):
+        roll = rng.random()
+        if roll < 0.02:
+            for section in sections:
+                section[1:] = [f"- Rewritten {turn}: {'y' * 60}\n" for _ in section[1:]]
+        elif roll < 0.12:
+            sections.append(
+                [f"## Section {len(sections)}\n"]
+                + [f"- New requirement {turn}.{i}\n" for i in range(8)]
+            )
+        else:
+            section = rng.choice(sections)
+            for _ in range(rng.randint(1, 3)):
+                section[rng.randrange(1, len(section))] = (
+                    f"- Edited {turn}: {'z' * 50}\n"
+                )
+        revisions.append("# PRD\n\n" + "".join(line for s in sections for line in s))
+    return revisions
+
+
+async def run(revisions: list[str], interval: int) -> dict[str, float]:
+    """Record all revisions with one keyframe interval and time reconstruction."""
+    history = InMemoryPrdHistory(keyframe_interval=interval)
+    service = ProjectService(InMemoryProjectRepository(), prd_history=history)
+    project = await service.create_project(USER_ID, "Bench", prd=revisions[0])
+    project_id = str(project.id)
+
+    started = time.perf_counter()
+    for prd in revisions[1:]:
+        await service.update_project(project_id, USER_ID, prd=prd)
+    record_seconds = (time.perf_counter() - started) / (len(revisions) - 1)
+
+    durations = []
+    for version in range(len(revisions)):
+        started = time.perf_counter()
+        prd = await history.get_revision(project.id, version)
+        durations.append(time.perf_counter() - started)
+        assert prd == revisions[version]
+
+    full_copies = sum(len(prd) for prd in revisions)
+    return {
+        "stored_chars": history.stored_chars,
+        "stored_ratio": round(history.stored_chars / full_copies, 4),
+        "record_us": round(record_seconds * 1e6, 1),
+        "reconstruct_mean_us": round(statistics.mean(durations) * 1e6, 1),
+        "reconstruct_max_us": round(max(durations) * 1e6, 1),
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--revisions", type=int, default=500)
+    args = parser.parse_args()
+
+    revisions = agent_revisions(args.revisions)
+    results = {
+        "revisions": len(revisions),
+        "mean_prd_chars": round(statistics.mean(len(prd) for prd in revisions)),
+        "full_copy_chars": sum(len(prd) for prd in revisions),
+        "keyframe_interval": {
+            str(interval): asyncio.run(run(revisions, interval))
+            for interval in INTERVALS
+        },
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Benchmark: small edits to a 1 MB PRD with and without the rope.
+
+Applies thousands of keystroke-sized edits (inserts, deletes and short
+replacements at random positions) to a PRD of about 1 MB, through
+``ProjectService.edit_prd`` as the incremental PATCH endpoint does. The same
+edits run once with the rope disabled, where every edit copies and re-diffs
+the whole document, and once with it enabled. Also reported: the cost of a
+bare rope edit and of materializing the rope into a string for a response.
+Results are printed as JSON.
+
+Usage (from ``backend/``)::
+
+    PYTHONPATH=src python -m benchmarks.bench_prd_rope [--edits 2000]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from forgebase.core import entities
+from forgebase.core.prd_edits import PrdEdit
+from forgebase.core.prd_rope import PrdRope
+from forgebase.core.project_service import ProjectService
+from forgebase.infrastructure.prd_history import InMemoryPrdHistory
+from forgebase.infrastructure.project_repository import InMemoryProjectRepository
+
+USER_ID = "bench-user"
+PRD_BYTES = 1024 * 1024
+
+
+def large_prd() -> str:
+    """Build a markdown PRD of about ``PRD_BYTES`` characters."""
+    lines = []
+    size = 0
+    section = 0
+    while size < PRD_BYTES:
+        line = (
+            f"## Section {section}\n"
+            if len(lines) % 40 == 0
+            else f"- Requirement {len(lines)}: the system shall do thing {len(lines)}\n"
+        )
+        section += line.startswith("##")
+        lines.append(line)
+        size += len(line)
+    return "".join(lines)
+
+
+def keystroke_edits(count: int, length: int, seed: int = 11) -> list[PrdEdit]:
+    """Generate small edits valid for a document whose length drifts with them."""
+    rng = random.Random(seed)
+    edits = []
+    for _ in range(count):
+        offset = rng.randrange(length)
+        kind = rng.random()
+        if kind < 0.5:
+            edit = PrdEdit(offset, 0, rng.choice(["a", "the ", "\n", "- New item\n"]))
+        elif kind < 0.8:
+            edit = PrdEdit(offset, min(rng.randint(1, 5), length - offset))
+        else:
+            edit = PrdEdit(offset, min(3, length - offset), "xyz")
+        length += len(edit.inserted) - edit.deleted
+        edits.append(edit)
+    return edits
+
+
+async def time_service(prd: str, edits: list[PrdEdit], rope: bool) -> float:
+    """Apply edits one PATCH at a time; returns microseconds per edit."""
+    entities.PRD_ROPE_THRESHOLD = 64 * 1024 if rope else len(prd) * 10
+    service = ProjectService(
+        InMemoryProjectRepository(), prd_history=InMemoryPrdHistory()
+    )
+    project = await service.create_project(USER_ID, "Bench", prd=prd)
+    project_id = str(project.id)
+
+    started = time.perf_counter()
+    for version, edit in enumerate(edits):
+        await service.edit_prd(project_id, USER_ID, version, [edit])
+    return (time.perf_counter() - started) / len(edits) * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--edits", type=int, default=2000)
+    args = parser.parse_args()
+
+    prd = large_prd()
+    edits = keystroke_edits(args.edits, len(prd))
+
+    rope = PrdRope(prd)
+    started = time.perf_counter()
+    for edit in edits:
+        rope.apply_edits([edit])
+    rope_edit_us = (time.perf_counter() - started) / len(edits) * 1e6
+
+    started = time.perf_counter()
+    text = str(rope)
+    materialize_us = (time.perf_counter() - started) * 1e6
+
+    string_us = asyncio.run(time_service(prd, edits, rope=False))
+    rope_us = asyncio.run(time_service(prd, edits, rope=True))
+    print(
+        json.dumps(
+            {
+                "prd_chars": len(prd),
+                "edits": len(edits),
+                "final_chars": len(text),
+                "chunks": rope.chunk_count,
+                "rope_edit_us": round(rope_edit_us, 1),
+                "materialize_us": round(materialize_us, 1),
+                "service_edit_us": {
+                    "string": round(string_us, 1),
+                    "rope": round(rope_us, 1),
+                },
+                "speedup": round(string_us / rope_us, 1),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
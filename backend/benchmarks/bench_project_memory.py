@@ -0,0 +1,98 @@
+"""Benchmark: memory held per Project entity.
+
+Creates many projects the way the repository holds them, spread over a few
+hundred owners and with half of them updated, once with the slotted
+``Project`` and once with ``DictProject``, a copy of the dataclass layout it
+replaced (per-instance ``__dict__``, one owner ID string per project,
+``datetime`` timestamps). PRDs are empty so only the entity itself is
+measured. Reports the traced bytes per project of both layouts and the
+saving. Results are printed as JSON.
+
+Usage (from ``backend/``)::
+
+    PYTHONPATH=src python -m benchmarks.bench_project_memory [--projects 100000]
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Optional
+from uuid import UUID, uuid4
+
+from forgebase.core.entities import Project
+
+OWNERS = 500
+
+
+@dataclass
+class DictProject:
+    """The former layout of ``Project``."""
+
+    id: UUID
+    user_id: str
+    name: str
+    prd: str
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    prd_version: int = 0
+    _prd: Optional[str] = field(default=None, repr=False, compare=False)
+    _prd_rope: Optional[object] = field(default=None, repr=False, compare=False)
+    _prd_outline: Optional[object] = field(default=None, repr=False, compare=False)
+    _prd_packed: Optional[object] = field(default=None, repr=False, compare=False)
+
+
+def bytes_per_project(cls: type, count: int) -> float:
+    """Measure the traced memory of ``count`` projects, per project."""
+    prd = ""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    projects = {}
+    for index in range(count):
+        # Owner IDs arrive as new strings, e.g. parsed from request headers
+        user_id = "".join(["user-", str(index % OWNERS).zfill(8)])
+        project = cls(
+            id=uuid4(),
+            user_id=user_id,
+            name=f"Project {index}",
+            prd=prd,
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC) if index % 2 else None,
+        )
+        projects[project.id] = project
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (after - before) / count
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=100_000)
+    args = parser.parse_args()
+
+    dict_bytes = bytes_per_project(DictProject, args.projects)
+    slotted_bytes = bytes_per_project(Project, args.projects)
+    print(
+        json.dumps(
+            {
+                "projects": args.projects,
+                "owners": OWNERS,
+                "bytes_per_project": {
+                    "dataclass": round(dict_bytes, 1),
+                    "slotted": round(slotted_bytes, 1),
+                },
+                "bytes_saved_per_project": round(dict_bytes - slotted_bytes, 1),
+                "memory_saved": round(1 - slotted_bytes / dict_bytes, 3),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark: event loop stalls while large PRDs are processed.
+
+A ticker task stands in for the chat and event streams: it sleeps 1 ms at a
+time and records how late it wakes up. Meanwhile a few requests diff and
+render a PRD of about 1 MB, once inline on the event loop and once through
+the shared ``WorkExecutor``. Reported per mode: the wall time of the work and
+the worst and 99th percentile lateness of the ticker. Results are printed as
+JSON.
+
+Usage (from ``backend/``)::
+
+    PYTHONPATH=src python -m benchmarks.bench_work_executor [--requests 4]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from benchmarks.bench_prd_rope import large_prd
+from forgebase.core.prd_diff import diff_prd
+from forgebase.core.prd_html import render_prd_html
+from forgebase.infrastructure.work_executor import WorkExecutor
+
+
+async def ticker(lateness: list[float], stop: asyncio.Event) -> None:
+    """Sleep 1 ms at a time, recording how late every wake-up is."""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lateness.append(time.perf_counter() - started - 0.001)
+
+
+async def process(prd: str, edited: str, executor: WorkExecutor | None) -> None:
+    """Diff and render a PRD like the PRD endpoints do."""
+    if executor is None:
+        diff_prd(prd, edited)
+        render_prd_html(edited)
+        return
+    size = len(prd) + len(edited)
+    await executor.run_cpu(diff_prd, prd, edited, size=size)
+    await executor.run_cpu(render_prd_html, edited, size=len(edited))
+
+
+async def run(requests: int, executor: WorkExecutor | None) -> dict[str, float]:
+    """Process concurrent requests while the ticker runs."""
+    prd = large_prd()
+    edited = prd.replace("thing 100\n", "thing one hundred\n", 1)
+    if executor is not None:
+        # Start the workers before measuring
+        await executor.run_cpu(len, "", size=1 << 62)
+
+    lateness: list[float] = []
+    stop = asyncio.Event()
+    tick = asyncio.create_task(ticker(lateness, stop))
+    await asyncio.sleep(0.05)
+    started = time.perf_counter()
+    await asyncio.gather(*(process(prd, edited, executor) for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await tick
+    return {
+        "wall_ms": round(elapsed * 1000, 1),
+        "loop_stall_max_ms": round(max(lateness) * 1000, 1),
+        "loop_stall_p99_ms": round(
+            statistics.quantiles(lateness, n=100, method="inclusive")[98] * 1000, 1
+        ),
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=4)
+    args = parser.parse_args()
+
+    executor = WorkExecutor()
+    try:
+        results = {
+            "requests": args.requests,
+            "inline": asyncio.run(run(args.requests, None)),
+            "executor": asyncio.run(run(args.requests, executor)),
+            "executor_metrics": executor.metrics(),
+        }
+    finally:
+        executor.shutdown()
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
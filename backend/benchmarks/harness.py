@@ -0,0 +1,142 @@
+"""Minimal micro-benchmark harness with stored baselines.
+
+A case is a zero-argument callable, sync or async. Each case is calibrated
+to a number of calls taking at least ``min_time`` seconds, timed ``repeat``
+times, and the fastest repetition gives its time per call. As with
+``timeit``, garbage collection is paused while timing. Async cases run
+their calls inside one event loop pass, so loop overhead is not measured.
+
+Results can be saved as a JSON baseline and later runs compared against it;
+a case slower than its baseline by more than the tolerance is a regression.
+Baselines are only meaningful on the machine that recorded them.
+"""
+
+import asyncio
+import gc
+import inspect
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+
+@dataclass(frozen=True)
+class Case:
+    """A named operation to time."""
+
+    name: str
+    func: Callable[[], Any]
+
+
+def _runner(
+    func: Callable[[], Any], loop: asyncio.AbstractEventLoop
+) -> Callable[[int], float]:
+    """Build a function timing ``n`` calls of ``func``."""
+    if inspect.iscoroutinefunction(func):
+
+        async def batch(n: int) -> float:
+            started = time.perf_counter()
+            for _ in range(n):
+                await func()
+            return time.perf_counter() - started
+
+        return lambda n: loop.run_until_complete(batch(n))
+
+    def run(n: int) -> float:
+        started = time.perf_counter()
+        for _ in range(n):
+            func()
+        return time.perf_counter() - started
+
+    return run
+
+
+def measure(
+    func: Callable[[], Any],
+    loop: asyncio.AbstractEventLoop,
+    min_time: float = 0.1,
+    repeat: int = 5,
+) -> float:
+    """Time one case.
+
+    Args:
+        func: Operation to time
+        loop: Event loop for async operations
+        min_time: Minimum seconds per repetition
+        repeat: Number of repetitions
+
+    Returns:
+        Seconds per call of the fastest repetition
+    """
+    run = _runner(func, loop)
+    gc.collect()
+    gc.disable()
+    try:
+        calls = 1
+        while (elapsed := run(calls)) < min_time:
+            calls = max(calls * 2, int(calls * min_time / max(elapsed, 1e-9) * 1.2))
+        best = elapsed / calls
+        for _ in range(repeat - 1):
+            best = min(best, run(calls) / calls)
+    finally:
+        gc.enable()
+    return best
+
+
+def run_cases(
+    cases: Iterable[Case], min_time: float = 0.1, repeat: int = 5
+) -> dict[str, float]:
+    """Time all cases.
+
+    Returns:
+        Microseconds per call, by case name
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        return {
+            case.name: round(measure(case.func, loop, min_time, repeat) * 1e6, 3)
+            for case in cases
+        }
+    finally:
+        loop.close()
+
+
+def load_baseline(path: Path) -> dict[str, float]:
+    """Load a saved baseline, or an empty one if there is none."""
+    if not path.exists():
+        return {}
+    return dict(json.loads(path.read_text(encoding="utf-8")))
+
+
+def save_baseline(path: Path, results: dict[str, float]) -> None:
+    """Save results as the new baseline, keeping cases that were not run."""
+    baseline = load_baseline(path)
+    baseline.update(results)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n", "utf-8")
+
+
+def compare(
+    results: dict[str, float], baseline: dict[str, float], tolerance: float
+) -> dict[str, dict[str, Any]]:
+    """Compare results with a baseline.
+
+    Args:
+        results: Microseconds per call, by case name
+        baseline: Baseline microseconds per call, by case name
+        tolerance: Allowed relative slowdown, e.g. 0.3 for 30 %
+
+    Returns:
+        Per case: time, baseline, relative change and regression flag
+    """
+    report: dict[str, dict[str, Any]] = {}
+    for name, us in results.items():
+        entry: dict[str, Any] = {"us_per_op": us}
+        if name in baseline:
+            change = us / baseline[name] - 1
+            entry["baseline_us"] = baseline[name]
+            entry["change"] = round(change, 3)
+            entry["regression"] = change > tolerance
+        report[name] = entry
+    return report
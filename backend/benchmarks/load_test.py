@@ -0,0 +1,284 @@
+"""Load test: concurrent simulated users against a real web server.
+
+Starts ``forgebase.interfaces.web:app`` under uvicorn in a subprocess (or
+targets ``--url``) and runs ``--users`` concurrent users for ``--duration``
+seconds. Each user repeatedly creates a project, streams a chat turn over
+SSE with the project as context, patches the project's PRD and lists the
+projects. The agent is the ``StubAgent`` with the ``--stub-profile``
+latency profile, or the real ``Agent`` against a local mock deployment with
+``--mock-llm``.
+
+Throughput, latency percentiles per operation, chat time to first token and
+error rates are printed as JSON (and written to ``--output``), so runs can
+be compared across commits.
+
+Usage (from ``backend/``)::
+
+    PYTHONPATH=src python -m benchmarks.load_test --users 50 --duration 30 \\
+        [--stub-profile realistic | --mock-llm] [--output results.json]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+import httpx
+
+from forgebase.infrastructure.mock_llm_server import MockLLMBehavior, MockLLMServer
+
+BACKEND = Path(__file__).resolve().parents[1]
+
+OPERATIONS = ("create_project", "chat_stream", "patch_prd", "list_projects")
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    ordered = sorted(values)
+    index = max(int(round(pct / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(index, len(ordered) - 1)]
+
+
+def summarize(values: list[float]) -> dict[str, float]:
+    """Latency percentiles in milliseconds."""
+    if not values:
+        return {}
+    return {
+        f"p{pct}_ms": round(percentile(values, pct) * 1000, 1) for pct in (50, 95, 99)
+    }
+
+
+@dataclass
+class Results:
+    """Latencies and errors collected by all users."""
+
+    latencies: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    ttfts: list[float] = field(default_factory=list)
+
+    def report(self, elapsed: float) -> dict[str, Any]:
+        """Summarize the run as a JSON-serializable dict."""
+        operations = {}
+        for name in OPERATIONS:
+            count = len(self.latencies[name])
+            attempts = count + self.errors[name]
+            operations[name] = {
+                "count": count,
+                "errors": self.errors[name],
+                "error_rate": round(self.errors[name] / attempts, 4) if attempts else 0,
+                "throughput_per_s": round(count / elapsed, 2),
+                **summarize(self.latencies[name]),
+            }
+        completed = sum(len(values) for values in self.latencies.values())
+        failed = sum(self.errors.values())
+        return {
+            "elapsed_s": round(elapsed, 2),
+            "throughput_per_s": round(completed / elapsed, 2),
+            "error_rate": round(failed / (completed + failed), 4) if failed else 0,
+            "chat_ttft": summarize(self.ttfts),
+            "operations": operations,
+        }
+
+
+@contextlib.contextmanager
+def timed(results: Results, operation: str) -> Iterator[None]:
+    """Record the latency of an operation, or count it as an error."""
+    started = time.perf_counter()
+    try:
+        yield
+    except (httpx.HTTPError, ValueError):
+        results.errors[operation] += 1
+    else:
+        results.latencies[operation].append(time.perf_counter() - started)
+
+
+async def chat_turn(
+    client: httpx.AsyncClient, project_id: str, results: Results
+) -> None:
+    """Stream one chat turn, recording the time to the first SSE data event.
+
+    Raises:
+        ValueError: If the stream ends without the completion marker
+    """
+    started = time.perf_counter()
+    first = True
+    body = {
+        "message": "Add a requirement for exporting the PRD",
+        "project_id": project_id,
+    }
+    async with client.stream("POST", "/api/chat/stream", json=body) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if not line.startswith("data: "):
+                continue
+            if line == "data: [DONE]":
+                return
+            if first:
+                first = False
+                results.ttfts.append(time.perf_counter() - started)
+    raise ValueError("Chat stream ended without [DONE]")
+
+
+async def user(client: httpx.AsyncClient, deadline: float, results: Results) -> None:
+    """Run the simulated user's session until the deadline."""
+    while time.perf_counter() < deadline:
+        project_id = None
+        with timed(results, "create_project"):
+            response = await client.post(
+                "/api/projects", json={"name": f"Load test {uuid.uuid4()}"}
+            )
+            response.raise_for_status()
+            project_id = response.json()["id"]
+        if project_id is None:
+            continue
+        with timed(results, "chat_stream"):
+            await chat_turn(client, project_id, results)
+        with timed(results, "patch_prd"):
+            response = await client.patch(
+                f"/api/projects/{project_id}",
+                json={"prd": f"# Load test\n\nUpdated at {time.time()}\n"},
+            )
+            response.raise_for_status()
+        with timed(results, "list_projects"):
+            response = await client.get("/api/projects")
+            response.raise_for_status()
+
+
+async def run(url: str, users: int, duration: float) -> dict[str, Any]:
+    """Run all users against the server at ``url``."""
+    results = Results()
+    limits = httpx.Limits(max_connections=users * 2)
+    timeout = httpx.Timeout(60.0)
+    async with httpx.AsyncClient(
+        base_url=url, limits=limits, timeout=timeout
+    ) as client:
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(*(user(client, deadline, results) for _ in range(users)))
+        elapsed = time.perf_counter() - started
+    return results.report(elapsed)
+
+
+def free_port() -> int:
+    """Get a free local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+@contextlib.contextmanager
+def web_server(env: dict[str, str]) -> Iterator[str]:
+    """Run the web app under uvicorn in a subprocess until it is healthy.
+
+    Yields:
+        Base URL of the server
+    """
+    port = free_port()
+    process = subprocess.Popen(  # pylint: disable=consider-using-with
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "forgebase.interfaces.web:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        cwd=BACKEND,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        # Request logging goes to stderr; keep it out of the results
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}"
+    try:
+        for _ in range(300):
+            if process.poll() is not None:
+                raise RuntimeError(
+                    f"Web server exited during startup ({process.returncode})"
+                )
+            try:
+                if httpx.get(f"{url}/api/health").status_code == 200:
+                    break
+            except httpx.TransportError:
+                pass
+            time.sleep(0.1)
+        else:
+            raise RuntimeError("Web server did not become healthy")
+        yield url
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def server_env(args: argparse.Namespace, mock_endpoint: str | None) -> dict[str, str]:
+    """Environment of the web server for the selected agent."""
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if not key.startswith(("AZURE_OPENAI_", "FORGEBASE_"))
+    }
+    env["PYTHONPATH"] = str(BACKEND / "src")
+    if mock_endpoint is not None:
+        env["AZURE_OPENAI_ENDPOINT"] = mock_endpoint
+        env["AZURE_OPENAI_API_KEY"] = "load-test-key"
+        env["AZURE_OPENAI_DEPLOYMENT_NAME"] = "mock"
+    else:
+        env["FORGEBASE_STUB_PROFILE"] = args.stub_profile
+    return env
+
+
+def main() -> None:
+    """Run the load test and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--url", help="Target a running server instead")
+    parser.add_argument("--stub-profile", default="realistic")
+    parser.add_argument(
+        "--mock-llm",
+        action="store_true",
+        help="Use the real Agent against a local mock deployment",
+    )
+    parser.add_argument("--output", type=Path, help="Also write the JSON here")
+    args = parser.parse_args()
+
+    with contextlib.ExitStack() as stack:
+        if args.url:
+            url = args.url
+            agent = "external"
+        else:
+            mock_endpoint = None
+            if args.mock_llm:
+                behavior = MockLLMBehavior(
+                    chunks=[" token"] * 200, first_token_delay=0.5, token_rate=60
+                )
+                mock_endpoint = stack.enter_context(MockLLMServer(behavior)).endpoint
+                agent = "mock-llm"
+            else:
+                agent = f"stub:{args.stub_profile}"
+            url = stack.enter_context(web_server(server_env(args, mock_endpoint)))
+        report = asyncio.run(run(url, args.users, args.duration))
+
+    output = {"users": args.users, "duration_s": args.duration, "agent": agent}
+    output.update(report)
+    text = json.dumps(output, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
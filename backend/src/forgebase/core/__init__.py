@@ -1,3 +1,16 @@
 """Core package for forgebase."""
 
-from . import entities, exceptions, ports, chat_service, project_service, tool_port
+from . import (
+    entities,
+    exceptions,
+    metrics,
+    ports,
+    prd_diff,
+    prd_edits,
+    prd_outline,
+    prd_rope,
+    chat_service,
+    project_events,
+    project_service,
+    tool_port,
+)
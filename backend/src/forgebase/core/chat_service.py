@@ -3,6 +3,7 @@
 from __future__ import annotations
 from typing import AsyncIterator
 
+from forgebase.core.metrics import TurnMetricsCallback, TurnRecorder
 from forgebase.core.ports import AgentPort
 
 
@@ -13,15 +14,25 @@ class ChatService:
     Focused solely on chat-related concerns.
     """
 
-    def __init__(self, agent: AgentPort, current_project_id: str | None = None):
+    def __init__(
+        self,
+        agent: AgentPort,
+        current_project_id: str | None = None,
+        metrics_callback: TurnMetricsCallback | None = None,
+    ):
         """Initialize with an agent implementation.
 
         Args:
             agent: Agent implementation for chat functionality
             current_project_id: Optional project context for the conversation
+            metrics_callback: Optional hook receiving per-turn metrics from both
+                the service (``source="chat_service"``) and the agent
         """
         self._agent = agent
         self._current_project_id = current_project_id
+        self._metrics_callback = metrics_callback
+        if metrics_callback is not None:
+            self._agent.set_metrics_callback(metrics_callback)
 
         # Set project context in agent if provided
         if current_project_id:
@@ -36,13 +47,36 @@ class ChatService:
         Yields:
             String chunks of the agent's response
         """
-        async for chunk in self._agent.send_message_stream(user_text):
-            yield chunk
+        if self._metrics_callback is None:
+            async for chunk in self._agent.send_message_stream(user_text):
+                yield chunk
+            return
+
+        recorder = TurnRecorder(source="chat_service", role=self._agent.role)
+        completed = False
+        try:
+            async for chunk in self._agent.send_message_stream(user_text):
+                recorder.on_chunk()
+                yield chunk
+            completed = True
+        finally:
+            self._metrics_callback(recorder.finish(completed=completed))
 
     async def reset_chat(self) -> None:
         """Reset chat conversation state."""
         await self._agent.reset()
 
+    def set_conversation(self, conversation_id: str | None) -> bool:
+        """Continue or start a persisted conversation.
+
+        Args:
+            conversation_id: Conversation to switch to, or None
+
+        Returns:
+            True if earlier turns of the conversation will be restored
+        """
+        return self._agent.set_conversation(conversation_id)
+
     def set_project_context(self, project_id: str | None) -> None:
         """Set the current project context for the conversation.
 
@@ -1,26 +1,149 @@
 """Core domain entities."""
 
+import time
 from dataclasses import dataclass
-from datetime import datetime, UTC
-from typing import Optional
+from datetime import datetime, timedelta, UTC
+from sys import intern
+from typing import Callable, Optional, Sequence, overload
 from uuid import UUID, uuid4
 
+from forgebase.core.prd_diff import PrdHunk, diff_prd
+from forgebase.core.prd_edits import PrdEdit, apply_prd_edits
+from forgebase.core.prd_outline import PrdOutline
+from forgebase.core.prd_rope import PrdRope
 
-@dataclass
-class Project:
+# PRDs at least this long are edited in a rope instead of being copied per edit
+PRD_ROPE_THRESHOLD = 64 * 1024
+
+
+@dataclass(frozen=True)
+class _PackedPrd:
+    """PRD content held in a packed form, such as compressed bytes."""
+
+    data: bytes
+    length: int
+    unpack: Callable[[bytes], str]
+
+
+# One slot per field, plus the alternative forms of the PRD content
+class Project:  # pylint: disable=too-many-instance-attributes
     """
     Represents a project in the system.
 
     A project is an entity with a name, PRD content, user ownership, and creation timestamp,
-    which can be used to organize conversations and work.
+    which can be used to organize conversations and work. ``prd_version`` counts the
+    changes made to the PRD content.
+
+    Large PRDs edited with ``edit_prd`` are held in a ``PrdRope``; reading ``prd``
+    joins it into a string once, until the next edit. A stored PRD may also be
+    held only in a packed form (see ``pack_prd``) and unpacked when read. The
+    section index in ``prd_outline`` is built on first use and then follows every
+    PRD change.
+
+    Projects are kept in memory by the thousands, so the class has ``__slots__``
+    instead of a per-instance dictionary, owner IDs are interned so all projects
+    of a user share one string, and UTC timestamps are stored as microseconds
+    since the epoch and turned into ``datetime`` objects when read. It is
+    compared and printed like the dataclass it replaces, and constructed with
+    its field names as keyword-only arguments.
     """
 
+    __slots__ = (
+        "id",
+        "user_id",
+        "name",
+        "prd_version",
+        "_created_at",
+        "_updated_at",
+        "_prd",
+        "_prd_rope",
+        "_prd_outline",
+        "_prd_packed",
+    )
+
     id: UUID
     user_id: str
     name: str
-    prd: str
-    created_at: datetime
-    updated_at: Optional[datetime] = None
+    prd_version: int
+    _created_at: int | datetime
+    _updated_at: int | datetime | None
+    _prd: Optional[str]
+    _prd_rope: Optional[PrdRope]
+    _prd_outline: Optional[PrdOutline]
+    _prd_packed: Optional[_PackedPrd]
+
+    # Keyword-only, with the field names of the dataclass it replaces
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        id: UUID,  # pylint: disable=redefined-builtin
+        user_id: str,
+        name: str,
+        prd: str,
+        created_at: datetime,
+        updated_at: Optional[datetime] = None,
+        prd_version: int = 0,
+    ) -> None:
+        """
+        Initialize a project.
+
+        Args:
+            id: The project ID.
+            user_id: The ID of the user who owns this project.
+            name: The name of the project.
+            prd: The PRD content.
+            created_at: When the project was created.
+            updated_at: When the project was last changed, if ever.
+            prd_version: The number of changes made to the PRD content.
+        """
+        self.id = id
+        self.user_id = intern(user_id)
+        self.name = name
+        self.prd_version = prd_version
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.prd = prd
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the fields of two projects, as a dataclass would."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return _fields(self) == _fields(other)  # type: ignore[arg-type]
+
+    # Mutable, so unhashable like a dataclass with eq=True
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Show the fields, as a dataclass would."""
+        values = ", ".join(
+            f"{name}={value!r}" for name, value in zip(_FIELD_NAMES, _fields(self))
+        )
+        return f"{self.__class__.__qualname__}({values})"
+
+    def snapshot(self) -> "Project":
+        """
+        Copy the project as it is now, unaffected by later changes.
+
+        The copy shares the PRD content instead of copying it; only the chunk
+        list of a rope is copied. It has no section index.
+
+        Returns:
+            A new Project instance.
+        """
+        # Fills in the private state of a new instance of this class
+        # pylint: disable=protected-access
+        copy = Project.__new__(Project)
+        copy.id = self.id
+        copy.user_id = self.user_id
+        copy.name = self.name
+        copy.prd_version = self.prd_version
+        copy._created_at = self._created_at
+        copy._updated_at = self._updated_at
+        copy._prd = self._prd
+        copy._prd_rope = None if self._prd_rope is None else self._prd_rope.copy()
+        copy._prd_packed = self._prd_packed
+        copy._prd_outline = None
+        return copy
 
     @classmethod
     def create(cls, user_id: str, name: str, prd: str = "") -> "Project":
@@ -36,7 +159,14 @@ class Project:
             A new Project instance.
         """
         now = datetime.now(UTC)
-        return cls(id=uuid4(), user_id=user_id, name=name, prd=prd, created_at=now, updated_at=None)
+        return cls(
+            id=uuid4(),
+            user_id=user_id,
+            name=name,
+            prd=prd,
+            created_at=now,
+            updated_at=None,
+        )
 
     def update_name(self, name: str) -> None:
         """
@@ -46,14 +176,253 @@ class Project:
             name: The new name for the project.
         """
         self.name = name
-        self.updated_at = datetime.now(UTC)
+        self._updated_at = _now()
+
+    @property
+    def created_at(self) -> datetime:
+        """When the project was created."""
+        return _from_timestamp(self._created_at)
+
+    @created_at.setter
+    def created_at(self, value: datetime) -> None:
+        self._created_at = _to_timestamp(value)
+
+    @property
+    def updated_at(self) -> Optional[datetime]:
+        """When the project was last changed, if ever."""
+        return _from_timestamp(self._updated_at)
+
+    @updated_at.setter
+    def updated_at(self, value: Optional[datetime]) -> None:
+        self._updated_at = _to_timestamp(value)
+
+    @property
+    def prd(self) -> str:
+        """The PRD content, joining a rope or unpacking it on first read."""
+        if self._prd is None:
+            if self._prd_rope is not None:
+                self._prd = str(self._prd_rope)
+            else:
+                packed = self._prd_packed
+                self._prd = packed.unpack(packed.data)  # type: ignore[union-attr]
+        return self._prd
+
+    @prd.setter
+    def prd(self, prd: str) -> None:
+        """Replace the PRD content, dropping any rope, packed form and section index."""
+        self._prd = prd
+        self._prd_rope = None
+        self._prd_packed = None
+        self._prd_outline = None
+
+    @property
+    def prd_length(self) -> int:
+        """Get the length of the PRD content without materializing it."""
+        if self._prd is not None:
+            return len(self._prd)
+        if self._prd_rope is not None:
+            return len(self._prd_rope)
+        return self._prd_packed.length  # type: ignore[union-attr]
 
-    def update_prd(self, prd: str) -> None:
+    def prd_slice(self, start: int, end: int) -> str:
+        """Get part of the PRD content without materializing all of it."""
+        if self._prd is None and self._prd_rope is not None:
+            return self._prd_rope.slice(start, end)
+        return self.prd[start:end]
+
+    @property
+    def has_prd_outline(self) -> bool:
+        """Tell whether the section index of the PRD content is built."""
+        return self._prd_outline is not None
+
+    def set_prd_outline(self, outline: PrdOutline, version: int) -> None:
         """
-        Update the project PRD content and set updated timestamp.
+        Use a section index built elsewhere, e.g. off the event loop.
+
+        Args:
+            outline: Section index of the PRD content at ``version``.
+            version: The PRD version the index was built from; the index is
+                dropped if the PRD changed since.
+        """
+        if version == self.prd_version:
+            self._prd_outline = outline
+
+    @property
+    def prd_outline(self) -> PrdOutline:
+        """Get the section index of the PRD content, building it on first use."""
+        if self._prd_outline is None:
+            self._prd_outline = PrdOutline(
+                self._prd_rope if self._prd is None and self._prd_rope else self.prd
+            )
+        return self._prd_outline
+
+    @property
+    def prd_packed(self) -> bool:
+        """Tell whether the PRD content is held in a packed form."""
+        return self._prd_packed is not None
+
+    def pack_prd(self, data: bytes, unpack: Callable[[bytes], str]) -> None:
+        """
+        Hold the PRD content only in a packed form, such as compressed bytes.
+
+        The next read of ``prd`` unpacks it and keeps the content until
+        ``release_prd``; any change of the PRD drops the packed form.
+
+        Args:
+            data: The current PRD content, packed.
+            unpack: Turns ``data`` back into the PRD content.
+        """
+        self._prd_packed = _PackedPrd(data, self.prd_length, unpack)
+        self._prd = None
+        self._prd_rope = None
+
+    def release_prd(self) -> None:
+        """Drop the unpacked content of a packed PRD, keeping only the packed form."""
+        if self._prd_packed is not None:
+            self._prd = None
+            self._prd_rope = None
+
+    def edit_prd(self, edits: Sequence[PrdEdit]) -> tuple[PrdHunk, ...]:
+        """
+        Apply text edits to the PRD content, bump its version and set updated timestamp.
+
+        PRDs of at least ``PRD_ROPE_THRESHOLD`` characters are moved into a rope
+        and edited in place instead of being copied.
+
+        Args:
+            edits: Edits sorted by offset, not overlapping, with offsets into the
+                current PRD content.
+
+        Returns:
+            The line hunks of the change, empty if nothing changed.
+
+        Raises:
+            ValueError: If an edit does not fit the PRD content.
+        """
+        rope = self._prd_rope
+        if rope is None and self.prd_length >= PRD_ROPE_THRESHOLD:
+            rope = PrdRope(self.prd)
+        if rope is not None:
+            hunks = rope.apply_edits(edits)
+            if hunks:
+                self._prd, self._prd_rope = None, rope
+        else:
+            prd = apply_prd_edits(self.prd, edits)
+            hunks = diff_prd(self.prd, prd)
+            self._prd = prd
+        if hunks:
+            self._prd_packed = None
+            if self._prd_outline is not None:
+                current = rope if rope is not None else self.prd
+                self._prd_outline.update(current, hunks)
+            self.prd_version += 1
+            self._updated_at = _now()
+        return hunks
+
+    def update_prd(
+        self, prd: str, hunks: Optional[tuple[PrdHunk, ...]] = None
+    ) -> tuple[PrdHunk, ...]:
+        """
+        Update the project PRD content, bump its version and set updated timestamp.
 
         Args:
             prd: The new PRD content for the project.
+            hunks: The line hunks from the current PRD content to ``prd``, if
+                already computed.
+
+        Returns:
+            The line hunks of the change.
         """
+        if hunks is None:
+            hunks = diff_prd(self.prd, prd)
+        outline = self._prd_outline
         self.prd = prd
-        self.updated_at = datetime.now(UTC)
+        if outline is not None:
+            outline.update(prd, hunks)
+            self._prd_outline = outline
+        self.prd_version += 1
+        self._updated_at = _now()
+        return hunks
+
+
+_FIELD_NAMES = (
+    "id",
+    "user_id",
+    "name",
+    "prd",
+    "created_at",
+    "updated_at",
+    "prd_version",
+)
+
+
+def _fields(project: Project) -> tuple:
+    """Get the values of the constructor arguments of a project."""
+    return (
+        project.id,
+        project.user_id,
+        project.name,
+        project.prd,
+        project.created_at,
+        project.updated_at,
+        project.prd_version,
+    )
+
+
+def _now() -> int:
+    """Get the current UTC time as a stored timestamp."""
+    return time.time_ns() // 1000
+
+
+@overload
+def _to_timestamp(value: datetime) -> int | datetime: ...
+
+
+@overload
+def _to_timestamp(value: Optional[datetime]) -> int | datetime | None: ...
+
+
+def _to_timestamp(value: Optional[datetime]) -> int | datetime | None:
+    """Turn a UTC datetime into microseconds since the epoch.
+
+    Naive datetimes and other time zones are kept as they are, so they read
+    back unchanged.
+    """
+    if value is not None and value.tzinfo is UTC:
+        return (value - _EPOCH) // _MICROSECOND
+    return value
+
+
+@overload
+def _from_timestamp(value: int | datetime) -> datetime: ...
+
+
+@overload
+def _from_timestamp(value: int | datetime | None) -> Optional[datetime]: ...
+
+
+def _from_timestamp(value: int | datetime | None) -> Optional[datetime]:
+    """Turn a stored timestamp back into a datetime."""
+    if isinstance(value, int):
+        return _EPOCH + timedelta(microseconds=value)
+    return value
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+@dataclass(frozen=True)
+class PrdRevision:
+    """
+    Describes a stored revision of a project's PRD.
+
+    Attributes:
+        version: The PRD version, as in ``Project.prd_version``.
+        created_at: When the revision was made.
+        size: Length of the PRD content in characters.
+    """
+
+    version: int
+    created_at: datetime
+    size: int
@@ -31,3 +31,51 @@ class ProjectAlreadyExistsError(ProjectError):
         """
         super().__init__(f"Project with ID {project_id} already exists")
         self.project_id = project_id
+
+
+class PrdRevisionNotFoundError(ProjectError):
+    """Raised when a PRD revision of a project is not available."""
+
+    def __init__(self, project_id: str, version: int):
+        """
+        Initialize the exception.
+
+        Args:
+            project_id: The ID of the project.
+            version: The PRD version that was not found.
+        """
+        super().__init__(f"PRD version {version} of project {project_id} not found")
+        self.project_id = project_id
+        self.version = version
+
+
+class PrdSectionNotFoundError(ProjectError):
+    """Raised when a PRD has no section with the requested slug."""
+
+    def __init__(self, project_id: str, slug: str):
+        """
+        Initialize the exception.
+
+        Args:
+            project_id: The ID of the project.
+            slug: The section slug that was not found.
+        """
+        super().__init__(f"Section {slug} not found in PRD of project {project_id}")
+        self.project_id = project_id
+        self.slug = slug
+
+
+class PrdVersionConflictError(ProjectError):
+    """Raised when a PRD change is based on an outdated PRD version."""
+
+    def __init__(self, project_id: str, current_version: int):
+        """
+        Initialize the exception.
+
+        Args:
+            project_id: The ID of the project.
+            current_version: The current PRD version of the project.
+        """
+        super().__init__(f"PRD of project {project_id} is at version {current_version}")
+        self.project_id = project_id
+        self.current_version = current_version
@@ -0,0 +1,159 @@
+"""Per-turn latency and throughput metrics."""
+
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable
+
+
+@dataclass(frozen=True)
+class ToolCallMetrics:
+    """Timing of a single tool invocation during a turn."""
+
+    name: str
+    duration: float
+
+
+# Flat on purpose: the fields map one-to-one onto the logged turn event
+@dataclass(frozen=True)
+class TurnMetrics:  # pylint: disable=too-many-instance-attributes
+    """
+    Structured record of one streamed turn.
+
+    Offsets (``first_chunk_at``, ``last_chunk_at``, ``duration``) are seconds
+    relative to the start of the request; ``timestamp`` is the wall-clock start
+    in seconds since the epoch.
+    """
+
+    source: str
+    role: str
+    timestamp: float
+    duration: float
+    first_chunk_at: float | None
+    last_chunk_at: float | None
+    chunk_count: int
+    completed: bool
+    prompt_tokens: int | None = None
+    completion_tokens: int | None = None
+    tool_calls: tuple[ToolCallMetrics, ...] = ()
+
+    @property
+    def ttft(self) -> float | None:
+        """Time to first chunk in seconds, if any chunk arrived."""
+        return self.first_chunk_at
+
+    @property
+    def completion_tokens_per_second(self) -> float | None:
+        """Completion token throughput while streaming, if usage is known."""
+        if (
+            self.completion_tokens is None
+            or self.first_chunk_at is None
+            or self.last_chunk_at is None
+        ):
+            return None
+        streaming = self.last_chunk_at - self.first_chunk_at
+        if streaming <= 0:
+            return None
+        return self.completion_tokens / streaming
+
+    def to_event(self) -> dict[str, Any]:
+        """
+        Convert the metrics into a JSON-serializable event.
+
+        Returns:
+            Dictionary with all fields plus the derived ``ttft`` and throughput.
+        """
+        event = asdict(self)
+        event["tool_calls"] = [asdict(call) for call in self.tool_calls]
+        event["ttft"] = self.ttft
+        event["completion_tokens_per_second"] = self.completion_tokens_per_second
+        return event
+
+
+TurnMetricsCallback = Callable[[TurnMetrics], None]
+
+
+# One accumulator per TurnMetrics field, so the record is built in one step
+@dataclass
+class TurnRecorder:  # pylint: disable=too-many-instance-attributes
+    """
+    Mutable accumulator that produces a ``TurnMetrics`` record for one turn.
+
+    Create it when the request starts, call ``on_chunk`` for every streamed
+    chunk and ``finish`` once the stream ends.
+    """
+
+    source: str
+    role: str
+    clock: Callable[[], float] = time.perf_counter
+    timestamp: float = field(default_factory=time.time)
+    _start: float = field(init=False)
+    _first_chunk: float | None = field(init=False, default=None)
+    _last_chunk: float | None = field(init=False, default=None)
+    _chunk_count: int = field(init=False, default=0)
+    _prompt_tokens: int | None = field(init=False, default=None)
+    _completion_tokens: int | None = field(init=False, default=None)
+    _tool_calls: list[ToolCallMetrics] = field(init=False, default_factory=list)
+
+    def __post_init__(self) -> None:
+        """Start the turn clock."""
+        self._start = self.clock()
+
+    def on_chunk(self) -> None:
+        """Record that a chunk has been streamed."""
+        now = self.clock() - self._start
+        if self._first_chunk is None:
+            self._first_chunk = now
+        self._last_chunk = now
+        self._chunk_count += 1
+
+    def add_usage(
+        self, prompt_tokens: int | None, completion_tokens: int | None
+    ) -> None:
+        """
+        Accumulate token usage reported by the model service.
+
+        A turn can span several model requests (e.g. around tool calls), so
+        usage is summed.
+
+        Args:
+            prompt_tokens: Prompt tokens of one model request, if reported.
+            completion_tokens: Completion tokens of one model request, if reported.
+        """
+        if prompt_tokens is not None:
+            self._prompt_tokens = (self._prompt_tokens or 0) + prompt_tokens
+        if completion_tokens is not None:
+            self._completion_tokens = (self._completion_tokens or 0) + completion_tokens
+
+    def add_tool_call(self, name: str, duration: float) -> None:
+        """
+        Record a tool invocation.
+
+        Args:
+            name: Fully qualified tool function name.
+            duration: Time spent in the tool in seconds.
+        """
+        self._tool_calls.append(ToolCallMetrics(name=name, duration=duration))
+
+    def finish(self, completed: bool = True) -> TurnMetrics:
+        """
+        Close the turn.
+
+        Args:
+            completed: False if the stream failed or was abandoned.
+
+        Returns:
+            The immutable metrics record for the turn.
+        """
+        return TurnMetrics(
+            source=self.source,
+            role=self.role,
+            timestamp=self.timestamp,
+            duration=self.clock() - self._start,
+            first_chunk_at=self._first_chunk,
+            last_chunk_at=self._last_chunk,
+            chunk_count=self._chunk_count,
+            completed=completed,
+            prompt_tokens=self._prompt_tokens,
+            completion_tokens=self._completion_tokens,
+            tool_calls=tuple(self._tool_calls),
+        )
@@ -1,9 +1,13 @@
 """Protocols for core components."""
 
-from typing import AsyncIterator, List, Optional, Protocol
+from typing import Any, AsyncIterator, Callable, List, Optional, Protocol, TypeVar
 from uuid import UUID
 
-from forgebase.core.entities import Project
+from forgebase.core.entities import PrdRevision, Project
+from forgebase.core.metrics import TurnMetricsCallback
+from forgebase.core.prd_diff import PrdHunk
+
+T = TypeVar("T")
 
 
 class AgentPort(Protocol):
@@ -43,6 +47,47 @@ class AgentPort(Protocol):
         """Set the current project context for agent tools."""
         ...
 
+    @property
+    def tool_call_count(self) -> int:
+        """Get the number of tool invocations made by this agent so far."""
+        ...
+
+    async def record_turn(self, user_text: str, reply_text: str) -> None:
+        """
+        Append a completed exchange to the conversation without invoking the model.
+
+        Used when a reply was produced elsewhere (e.g. replayed from a cache) so
+        that later turns still see the full conversation.
+
+        Args:
+            user_text: The user message of the exchange.
+            reply_text: The assistant reply of the exchange.
+        """
+        ...
+
+    def set_metrics_callback(self, callback: TurnMetricsCallback | None) -> None:
+        """
+        Register a hook that receives a ``TurnMetrics`` record after every turn.
+
+        Args:
+            callback: Function called with the metrics, or None to disable.
+        """
+        ...
+
+    def set_conversation(self, conversation_id: str | None) -> bool:
+        """
+        Switch to a persisted conversation, continuing it if it has stored turns.
+
+        Agents without conversation persistence start a fresh conversation.
+
+        Args:
+            conversation_id: The conversation to continue or start, or None.
+
+        Returns:
+            True if earlier turns of the conversation will be restored.
+        """
+        ...
+
 
 class ProjectRepositoryPort(Protocol):
     """
@@ -149,3 +194,97 @@ class ProjectRepositoryPort(Protocol):
             True if the project was deleted, False if it didn't exist or didn't belong to user.
         """
         ...
+
+
+class PrdHistoryPort(Protocol):
+    """
+    Defines the interface for storing the revisions of project PRDs.
+    """
+
+    async def record(self, project: Project, diff: Optional[tuple[PrdHunk, ...]]) -> None:
+        """
+        Store the current PRD revision of a project.
+
+        Implementations should read ``project.prd`` only when they store the full
+        content, since reading it may join a large PRD into a string.
+
+        Args:
+            project: The project, at its new PRD version.
+            diff: Hunks from the previous version, or None for a first revision.
+        """
+        ...
+
+    async def list_revisions(self, project_id: UUID) -> List[PrdRevision]:
+        """
+        List the stored revisions of a project's PRD.
+
+        Args:
+            project_id: The project to list revisions of.
+
+        Returns:
+            List of revisions, newest first.
+        """
+        ...
+
+    async def get_revision(self, project_id: UUID, version: int) -> Optional[str]:
+        """
+        Reconstruct the PRD content of a revision.
+
+        Args:
+            project_id: The project the PRD belongs to.
+            version: The PRD version to reconstruct.
+
+        Returns:
+            The PRD content if the revision is stored, None otherwise.
+        """
+        ...
+
+    async def delete(self, project_id: UUID) -> None:
+        """
+        Delete all revisions of a project's PRD.
+
+        Args:
+            project_id: The project whose history is deleted.
+        """
+        ...
+
+
+class WorkExecutorPort(Protocol):
+    """
+    Defines the interface for running CPU-heavy work off the event loop.
+
+    Work is given as a module-level function and picklable arguments, so an
+    implementation may run it in another process. ``size`` estimates the
+    amount of input, e.g. in characters; implementations may run small work
+    inline, where handing it off would cost more than it saves.
+    """
+
+    async def run_cpu(self, fn: Callable[..., T], *args: Any, size: int = 0) -> T:
+        """
+        Run pure-Python work that holds the GIL, such as diffing or parsing.
+
+        Args:
+            fn: Function to call.
+            *args: Arguments of the call.
+            size: Amount of input of the call.
+
+        Returns:
+            The result of the call.
+        """
+        ...
+
+    async def run_blocking(
+        self, fn: Callable[..., T], *args: Any, size: int = 0
+    ) -> T:
+        """
+        Run work that releases the GIL, such as hashing or compression.
+
+        Args:
+            fn: Function to call.
+            *args: Arguments of the call.
+            size: Amount of input of the call.
+
+        Returns:
+            The result of the call.
+        """
+        ...
@@ -0,0 +1,132 @@
+"""Line-based diffs between PRD revisions.
+
+Lines end at ``\n`` only, as they do for clients applying the diffs, so a
+stray ``\r`` or other Unicode line break stays inside its line.
+"""
+
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+
+
+@dataclass(frozen=True)
+class PrdHunk:
+    """Replacement of a run of lines in a PRD.
+
+    Attributes:
+        start: Index of the first replaced line in the old document
+        deleted: Number of old lines removed
+        lines: New lines inserted in their place, with their line endings
+    """
+
+    start: int
+    deleted: int
+    lines: tuple[str, ...] = ()
+
+
+def split_lines(text: str) -> list[str]:
+    """Split text after every ``\n``, keeping the line endings.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Lines whose concatenation is ``text``
+    """
+    lines = text.split("\n")
+    last = lines.pop()
+    result = [line + "\n" for line in lines]
+    if last:
+        result.append(last)
+    return result
+
+
+def diff_prd(old: str, new: str) -> tuple[PrdHunk, ...]:
+    """Compute the line hunks turning one PRD revision into another.
+
+    Unchanged leading and trailing lines are skipped before matching, so the
+    typical edit of one region costs little more than the region itself.
+
+    Args:
+        old: Previous PRD content
+        new: Current PRD content
+
+    Returns:
+        Hunks in document order, empty if the documents are equal
+    """
+    if old == new:
+        return ()
+    old_lines = split_lines(old)
+    new_lines = split_lines(new)
+
+    prefix = 0
+    limit = min(len(old_lines), len(new_lines))
+    while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+        prefix += 1
+    suffix = 0
+    limit -= prefix
+    while (
+        suffix < limit
+        and old_lines[len(old_lines) - 1 - suffix]
+        == new_lines[len(new_lines) - 1 - suffix]
+    ):
+        suffix += 1
+    old_middle = old_lines[prefix : len(old_lines) - suffix]
+    new_middle = new_lines[prefix : len(new_lines) - suffix]
+
+    matcher = SequenceMatcher(None, old_middle, new_middle, autojunk=False)
+    return tuple(
+        PrdHunk(prefix + i1, i2 - i1, tuple(new_middle[j1:j2]))
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    )
+
+
+def apply_prd_diff(old: str, hunks: tuple[PrdHunk, ...]) -> str:
+    """Apply hunks from ``diff_prd`` to the revision they were computed from.
+
+    Args:
+        old: PRD content the hunks are based on
+        hunks: Hunks in document order
+
+    Returns:
+        The resulting PRD content
+
+    Raises:
+        ValueError: If a hunk does not fit the document
+    """
+    return "".join(apply_prd_hunks(split_lines(old), hunks))
+
+
+def apply_prd_hunks(lines: list[str], hunks: tuple[PrdHunk, ...]) -> list[str]:
+    """Apply hunks to a revision split into lines, keeping the result split.
+
+    Lets a chain of diffs be replayed without joining and re-splitting the
+    document at every step.
+
+    Args:
+        lines: Lines of the revision, with their line endings
+        hunks: Hunks in document order
+
+    Returns:
+        Lines of the resulting revision
+
+    Raises:
+        ValueError: If a hunk does not fit the document
+    """
+    if not hunks:
+        return lines
+    parts: list[str] = []
+    position = 0
+    for hunk in hunks:
+        if hunk.start < position or hunk.start + hunk.deleted > len(lines):
+            raise ValueError("Diff does not apply to this PRD revision")
+        parts.extend(lines[position : hunk.start])
+        parts.extend(hunk.lines)
+        position = hunk.start + hunk.deleted
+    parts.extend(lines[position:])
+    return parts
+
+
+def diff_size(hunks: tuple[PrdHunk, ...]) -> int:
+    """Get the number of characters inserted by a diff."""
+    return sum(len(line) for hunk in hunks for line in hunk.lines)
@@ -0,0 +1,68 @@
+"""Offset-based text edits applied to a PRD."""
+
+from dataclasses import dataclass
+from typing import Sequence
+
+
+@dataclass(frozen=True)
+class PrdEdit:
+    """Replacement of a range of characters in a PRD.
+
+    Attributes:
+        offset: Position of the first replaced character, in Unicode code
+            points of the PRD the edits are based on
+        deleted: Number of characters removed
+        inserted: Text inserted at ``offset``
+    """
+
+    offset: int
+    deleted: int = 0
+    inserted: str = ""
+
+
+def apply_prd_edits(prd: str, edits: Sequence[PrdEdit]) -> str:
+    """Apply edits that all refer to positions in the same base PRD.
+
+    The result is assembled in a single pass over the unchanged ranges, so
+    the work besides that copy grows with the edits, not the document.
+
+    Args:
+        prd: PRD content the edits are based on
+        edits: Edits sorted by offset, not overlapping
+
+    Returns:
+        The edited PRD content
+
+    Raises:
+        ValueError: If an edit is out of range, unsorted or overlaps another
+    """
+    validate_prd_edits(edits, len(prd))
+    parts: list[str] = []
+    position = 0
+    for edit in edits:
+        parts.append(prd[position : edit.offset])
+        parts.append(edit.inserted)
+        position = edit.offset + edit.deleted
+    parts.append(prd[position:])
+    return "".join(parts)
+
+
+def validate_prd_edits(edits: Sequence[PrdEdit], length: int) -> None:
+    """Check that edits fit a PRD of a given length.
+
+    Args:
+        edits: Edits to check
+        length: Length of the PRD the edits are based on
+
+    Raises:
+        ValueError: If an edit is out of range, unsorted or overlaps another
+    """
+    position = 0
+    for edit in edits:
+        if edit.offset < 0 or edit.deleted < 0:
+            raise ValueError("Edit offsets and lengths cannot be negative")
+        if edit.offset < position:
+            raise ValueError("Edits must be sorted by offset and not overlap")
+        if edit.offset + edit.deleted > length:
+            raise ValueError("Edit extends past the end of the PRD")
+        position = edit.offset + edit.deleted
@@ -0,0 +1,453 @@
+"""Markdown to HTML rendering of PRDs."""
+
+import re
+from html import escape
+from typing import Callable
+
+from forgebase.core.prd_diff import split_lines
+from forgebase.core.prd_outline import parse_heading, unique_slug
+
+_FENCE = re.compile(r" {0,3}(`{3,}|~{3,})[ \t]*([^`\s]*)")
+_RULE = re.compile(r" {0,3}([-*_])(?:[ \t]*\1){2,}[ \t]*$")
+_QUOTE = re.compile(r" {0,3}> ?")
+_LIST_ITEM = re.compile(r"( *)([-*+]|\d{1,9}[.)])(?:( {1,4})(.*)|[ \t]*$)")
+_TASK = re.compile(r"\[([ xX])\] ")
+_TABLE_RULE = re.compile(r" *\|? *:?-+:? *(\| *:?-+:? *)*\|? *$")
+_CELL_SPLIT = re.compile(r"(?<!\\)\|")
+
+_CODE_RUN = re.compile(r"`+")
+_LINK = re.compile(r"(!?)\[([^\[\]]*)\]\(\s*<?([^)\s>]*)>?(?:\s+\"([^\"]*)\")?\s*\)")
+_AUTOLINK = re.compile(r"<((?:https?://|mailto:)[^>\s]+)>")
+_PLACEHOLDER = re.compile("\x00(\\d+)\x00")
+_DELIMITER = re.compile(r"\*\*|__|~~|\*|_")
+_DELIMITER_TAGS = {"**": "strong", "__": "strong", "*": "em", "_": "em", "~~": "del"}
+_SAFE_URL = re.compile(r"(?:https?:|mailto:|[^:]*$)", re.IGNORECASE)
+
+# Block quotes and lists nested deeper than this are rendered as plain text,
+# bounding the recursion of the parser
+MAX_NESTING = 32
+
+
+def render_prd_html(prd: str) -> str:
+    """Render PRD markdown as an HTML fragment.
+
+    Covers the CommonMark and GitHub features PRDs use: ATX headings, with
+    ``id`` attributes equal to the section slugs of ``PrdOutline``,
+    paragraphs, emphasis, code spans and fenced code, links and images,
+    block quotes, nested and task lists, tables and thematic breaks. Raw HTML
+    in the markdown is escaped, and only http, mailto and relative URLs are
+    linked. Containers nested more than ``MAX_NESTING`` levels deep are
+    rendered as text.
+
+    Args:
+        prd: PRD markdown
+
+    Returns:
+        HTML of the PRD content
+    """
+    # Split like PrdOutline, so both agree on the headings and their slugs
+    return _Renderer().render([line.rstrip("\n") for line in split_lines(prd)])
+
+
+# A renderer lives for one document; its helpers share the slugs and depth
+class _Renderer:  # pylint: disable=too-few-public-methods
+    """Block parser of one document, keeping its heading slugs unique."""
+
+    def __init__(self) -> None:
+        """Initialize with no slug handed out."""
+        self._slugs: dict[str, int] = {}
+        self._depth = 0
+
+    def render(self, lines: list[str]) -> str:
+        """Render a whole document."""
+        return "".join(self._blocks(lines, anchors=True))
+
+    def _blocks(
+        self, lines: list[str], anchors: bool = False, tight: bool = False
+    ) -> list[str]:
+        """Render the blocks of a document or of a container.
+
+        Args:
+            lines: Lines of the container, without line endings
+            anchors: Whether headings get ``id`` attributes (top level only,
+                as in the outline)
+            tight: Whether paragraphs are left unwrapped, as in tight lists
+        """
+        if self._depth >= MAX_NESTING:
+            text = _inline("\n".join(line.strip() for line in lines if line.strip()))
+            return [f"{text}\n" if tight else f"<p>{text}</p>\n"] if text else []
+        self._depth += 1
+        try:
+            return self._parse_blocks(lines, anchors, tight)
+        finally:
+            self._depth -= 1
+
+    def _parse_blocks(self, lines: list[str], anchors: bool, tight: bool) -> list[str]:
+        """Render the blocks of a container one nesting level down."""
+        out: list[str] = []
+        index = 0
+        while index < len(lines):
+            line = lines[index]
+            if not line.strip():
+                index += 1
+            elif fence := _FENCE.match(line):
+                index = self._code(lines, index, fence, out)
+            elif _RULE.match(line):
+                out.append("<hr>\n")
+                index += 1
+            elif heading := parse_heading(line):
+                level, title = heading
+                attribute = (
+                    f' id="{escape(unique_slug(title, self._slugs))}"'
+                    if anchors
+                    else ""
+                )
+                out.append(f"<h{level}{attribute}>{_inline(title)}</h{level}>\n")
+                index += 1
+            elif _QUOTE.match(line):
+                index = self._quote(lines, index, out)
+            elif _LIST_ITEM.match(line):
+                index = self._list(lines, index, out)
+            elif (
+                "|" in line
+                and index + 1 < len(lines)
+                and _TABLE_RULE.match(lines[index + 1])
+                and len(_cells(line)) == len(_cells(lines[index + 1]))
+            ):
+                index = self._table(lines, index, out)
+            else:
+                index = self._paragraph(lines, index, out, tight)
+        return out
+
+    def _code(
+        self, lines: list[str], index: int, fence: re.Match, out: list[str]
+    ) -> int:
+        """Render a fenced code block; returns the index after it."""
+        marker, language = fence.group(1), fence.group(2)
+        body = []
+        index += 1
+        while index < len(lines):
+            closing = _FENCE.match(lines[index])
+            if (
+                closing
+                and closing.group(1)[0] == marker[0]
+                and len(closing.group(1)) >= len(marker)
+                and not closing.group(2)
+            ):
+                index += 1
+                break
+            body.append(lines[index])
+            index += 1
+        attribute = f' class="language-{escape(language)}"' if language else ""
+        code = escape("".join(f"{line}\n" for line in body), quote=False)
+        out.append(f"<pre><code{attribute}>{code}</code></pre>\n")
+        return index
+
+    def _quote(self, lines: list[str], index: int, out: list[str]) -> int:
+        """Render a block quote; returns the index after it."""
+        body = []
+        while index < len(lines) and lines[index].strip():
+            quote = _QUOTE.match(lines[index])
+            if quote is None and _starts_block(lines[index]):
+                break
+            body.append(lines[index][quote.end() :] if quote else lines[index])
+            index += 1
+        out.append(f"<blockquote>\n{''.join(self._blocks(body))}</blockquote>\n")
+        return index
+
+    def _list(self, lines: list[str], index: int, out: list[str]) -> int:
+        """Render a list and the lists nested in it; returns the index after it."""
+        first = _LIST_ITEM.match(lines[index])
+        assert first is not None
+        ordered = first.group(2)[-1] in ".)"
+        items, tight, index = _list_items(lines, index, first)
+
+        start = ""
+        if ordered:
+            number = int(first.group(2)[:-1])
+            start = f' start="{number}"' if number != 1 else ""
+        tag = "ol" if ordered else "ul"
+        out.append(f"<{tag}{start}>\n")
+        out.extend(self._list_item(body, tight) for body in items)
+        out.append(f"</{tag}>\n")
+        return index
+
+    def _list_item(self, body: list[str], tight: bool) -> str:
+        """Render a list item, with its task checkbox if it has one."""
+        checkbox = ""
+        task = _TASK.match(body[0])
+        if task:
+            checked = " checked" if task.group(1) != " " else ""
+            checkbox = f'<input type="checkbox" disabled{checked}> '
+            body = [body[0][task.end() :], *body[1:]]
+        content = "".join(self._blocks(body, tight=tight)).rstrip("\n")
+        return f"<li>{checkbox}{content}</li>\n"
+
+    def _table(self, lines: list[str], index: int, out: list[str]) -> int:
+        """Render a pipe table; returns the index after it."""
+        header = _cells(lines[index])
+        alignments = []
+        for cell in _cells(lines[index + 1]):
+            if cell.startswith(":") and cell.endswith(":"):
+                alignments.append(' style="text-align:center"')
+            elif cell.endswith(":"):
+                alignments.append(' style="text-align:right"')
+            elif cell.startswith(":"):
+                alignments.append(' style="text-align:left"')
+            else:
+                alignments.append("")
+        columns = len(header)
+        alignments = (alignments + [""] * columns)[:columns]
+
+        def row(cells: list[str], tag: str) -> str:
+            cells = (cells + [""] * columns)[:columns]
+            return (
+                "<tr>"
+                + "".join(
+                    f"<{tag}{align}>{_inline(cell)}</{tag}>"
+                    for cell, align in zip(cells, alignments)
+                )
+                + "</tr>\n"
+            )
+
+        out.append("<table>\n<thead>\n" + row(header, "th") + "</thead>\n")
+        index += 2
+        body = []
+        while index < len(lines) and lines[index].strip() and "|" in lines[index]:
+            body.append(row(_cells(lines[index]), "td"))
+            index += 1
+        if body:
+            out.append("<tbody>\n" + "".join(body) + "</tbody>\n")
+        out.append("</table>\n")
+        return index
+
+    def _paragraph(
+        self, lines: list[str], index: int, out: list[str], tight: bool
+    ) -> int:
+        """Render a paragraph; returns the index after it."""
+        body = [lines[index].strip()]
+        index += 1
+        while (
+            index < len(lines)
+            and lines[index].strip()
+            and not _starts_block(lines[index])
+        ):
+            body.append(lines[index].strip())
+            index += 1
+        text = _inline("\n".join(body))
+        out.append(f"{text}\n" if tight else f"<p>{text}</p>\n")
+        return index
+
+
+def _list_items(
+    lines: list[str], index: int, first: re.Match[str]
+) -> tuple[list[list[str]], bool, int]:
+    """Collect the items of a list starting at a line.
+
+    Returns:
+        The lines of each item relative to its content column, whether the
+        list is tight, and the index after the list
+    """
+    indent = len(first.group(1))
+    ordered = first.group(2)[-1] in ".)"
+    column = indent + len(first.group(2)) + len(first.group(3) or " ")
+    items: list[list[str]] = []
+    tight = True
+    while index < len(lines):
+        line = lines[index]
+        item = _sibling(line, indent, ordered)
+        if item is not None:
+            column = indent + len(item.group(2)) + len(item.group(3) or " ")
+            items.append([item.group(4) or ""])
+            index += 1
+            continue
+        if not line.strip():
+            # A blank line belongs to the list if the list goes on after it
+            following = index + 1
+            while following < len(lines) and not lines[following].strip():
+                following += 1
+            if following == len(lines) or (
+                _indent(lines[following]) <= indent
+                and _sibling(lines[following], indent, ordered) is None
+            ):
+                break
+            tight = False
+            items[-1].append("")
+            index += 1
+            continue
+        spaces = _indent(line)
+        if spaces >= column or (spaces > indent and _LIST_ITEM.match(line)):
+            items[-1].append(line[min(spaces, column) :])
+        elif items[-1][-1].strip() and not _starts_block(line):
+            # Lazy continuation of the item's paragraph
+            items[-1].append(line.strip())
+        else:
+            break
+        index += 1
+    return items, tight, index
+
+
+def _starts_block(line: str) -> bool:
+    """Tell whether a line interrupts a paragraph.
+
+    As in CommonMark, only non-empty items of bullet lists or of ordered lists
+    starting at 1 do, so a line such as ``2024. was good`` stays in the text.
+    """
+    if _FENCE.match(line) or _RULE.match(line) or _QUOTE.match(line):
+        return True
+    if parse_heading(line):
+        return True
+    item = _LIST_ITEM.match(line)
+    return bool(item and item.group(4) and item.group(2) in ("-", "*", "+", "1.", "1)"))
+
+
+def _sibling(line: str, indent: int, ordered: bool) -> re.Match[str] | None:
+    """Match a list item continuing a list at an indentation, if the line is one."""
+    item = _LIST_ITEM.match(line)
+    if (
+        item is None
+        or len(item.group(1)) != indent
+        or (item.group(2)[-1] in ".)") != ordered
+    ):
+        return None
+    return item
+
+
+def _indent(line: str) -> int:
+    """Count the leading spaces of a line."""
+    return len(line) - len(line.lstrip(" "))
+
+
+def _cells(line: str) -> list[str]:
+    """Split a table row into the text of its cells."""
+    row = line.strip()
+    if row.startswith("|"):
+        row = row[1:]
+    if row.endswith("|") and not row.endswith("\\|"):
+        row = row[:-1]
+    return [cell.strip().replace("\\|", "|") for cell in _CELL_SPLIT.split(row)]
+
+
+def _inline(text: str) -> str:
+    """Render the inline markup of a span of text, escaping everything else.
+
+    Every step runs in linear time, so unclosed markers cannot make a long
+    paragraph backtrack quadratically.
+    """
+    # Code spans and links are swapped for placeholders so emphasis markers
+    # in code and URLs are left alone. Link labels keep the placeholders of
+    # their code spans, which are restored last.
+    kept: list[str] = []
+    texts: list[str] = []
+
+    def keep(html: str, plain: str = "") -> str:
+        kept.append(html)
+        texts.append(plain)
+        return f"\x00{len(kept) - 1}\x00"
+
+    def plain_text(label: str) -> str:
+        return _PLACEHOLDER.sub(lambda m: texts[int(m.group(1))], label)
+
+    def link(match: re.Match) -> str:
+        image, label, url, title = match.groups()
+        if not _SAFE_URL.match(url):
+            return keep(escape(match.group(0), quote=False))
+        attributes = f' title="{escape(title)}"' if title else ""
+        if image:
+            alt = escape(plain_text(label))
+            return keep(f'<img src="{escape(url)}" alt="{alt}"{attributes}>')
+        label_html = _emphasis(escape(label, quote=False))
+        return keep(f'<a href="{escape(url)}"{attributes}>{label_html}</a>')
+
+    def autolink(match: re.Match) -> str:
+        url = escape(match.group(1))
+        return keep(f'<a href="{url}">{url}</a>')
+
+    def restore(match: re.Match) -> str:
+        return _PLACEHOLDER.sub(restore, kept[int(match.group(1))])
+
+    text = _code_spans(text.replace("\x00", ""), keep)
+    text = _LINK.sub(link, text)
+    text = _AUTOLINK.sub(autolink, text)
+    text = _emphasis(escape(text, quote=False))
+    return _PLACEHOLDER.sub(restore, text)
+
+
+def _code_spans(text: str, keep: Callable[[str, str], str]) -> str:
+    """Replace code spans, from a backtick run to the next one as long.
+
+    Args:
+        text: Text to render
+        keep: Stores the HTML and plain text of a span, returning a placeholder
+    """
+    runs = list(_CODE_RUN.finditer(text))
+    # Index of the next run of the same length, found in one backward pass
+    closers: dict[int, int] = {}
+    following: dict[int, int] = {}
+    for index in range(len(runs) - 1, -1, -1):
+        length = runs[index].end() - runs[index].start()
+        if length in following:
+            closers[index] = following[length]
+        following[length] = index
+
+    out: list[str] = []
+    position = index = 0
+    while index < len(runs):
+        closer = closers.get(index)
+        if closer is None:
+            index += 1
+            continue
+        code = text[runs[index].end() : runs[closer].start()].strip()
+        out.append(text[position : runs[index].start()])
+        out.append(keep(f"<code>{escape(code, quote=False)}</code>", code))
+        position = runs[closer].end()
+        index = closer + 1
+    out.append(text[position:])
+    return "".join(out)
+
+
+def _emphasis(text: str) -> str:
+    """Render emphasis, strong emphasis and strikethrough.
+
+    Each delimiter closes the nearest open delimiter of its kind, found with a
+    stack; delimiters left open stay literal. Underscores do not open or
+    close inside words.
+    """
+    out: list[str] = []
+    # Open delimiters with their index in ``out`` and end offset in ``text``
+    openers: list[tuple[str, int, int]] = []
+    open_counts = dict.fromkeys(_DELIMITER_TAGS, 0)
+    position = 0
+    for match in _DELIMITER.finditer(text):
+        marker, start, end = match.group(), match.start(), match.end()
+        out.append(text[position:start])
+        position = end
+        can_open, can_close = _flanking(text, start, end)
+        if can_close and open_counts[marker]:
+            opener, index, opened_at = openers.pop()
+            while opener != marker:
+                open_counts[opener] -= 1
+                opener, index, opened_at = openers.pop()
+            open_counts[marker] -= 1
+            if opened_at < start:
+                out[index] = f"<{_DELIMITER_TAGS[marker]}>"
+                out.append(f"</{_DELIMITER_TAGS[marker]}>")
+                continue
+            # Nothing between the delimiters: this one may open instead
+        if can_open:
+            openers.append((marker, len(out), end))
+            open_counts[marker] += 1
+        out.append(marker)
+    out.append(text[position:])
+    return "".join(out)
+
+
+def _flanking(text: str, start: int, end: int) -> tuple[bool, bool]:
+    """Tell whether the delimiter at ``text[start:end]`` can open and close."""
+    before = text[start - 1] if start else " "
+    after = text[end] if end < len(text) else " "
+    in_word = text[start] == "_"
+    return (
+        not after.isspace() and not (in_word and before.isalnum()),
+        not before.isspace() and not (in_word and after.isalnum()),
+    )
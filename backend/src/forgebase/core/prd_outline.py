@@ -0,0 +1,266 @@
+"""Index of the markdown sections of a PRD."""
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Iterable
+
+from forgebase.core.prd_diff import PrdHunk, split_lines
+from forgebase.core.prd_rope import PrdRope
+
+_HEADING = re.compile(r" {0,3}(#{1,6})(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*\n?$")
+_FENCE = re.compile(r" {0,3}(`{3,}|~{3,})")
+_SLUG_DROP = re.compile(r"[^\w\- ]")
+_WORD = re.compile(r"\w+(?:['’-]\w+)*")
+
+
+@dataclass(frozen=True)
+class PrdSection:
+    """A heading of a PRD and the content under it.
+
+    Attributes:
+        slug: Unique identifier derived from the title
+        title: Heading text
+        level: Heading level, 1 to 6
+        start: Offset of the heading line
+        end: Offset after the section, subsections included
+        words: Number of words in the section, excluding its heading and
+            list or table markup
+    """
+
+    slug: str
+    title: str
+    level: int
+    start: int
+    end: int
+    words: int
+
+
+@dataclass(frozen=True)
+class _Block:
+    """A heading line and the lines up to the next heading (level 0: preamble)."""
+
+    level: int
+    title: str
+    lines: int
+    chars: int
+    words: int
+
+
+class PrdOutline:
+    """Section index of a PRD that can follow its changes.
+
+    The PRD is held as consecutive blocks, each a heading and the lines up to
+    the next heading. A change given as line hunks rescans only the blocks it
+    touches, plus the one before to absorb merged or split headings; the
+    following blocks are reused as they are. Headings inside fenced code are
+    ignored.
+    """
+
+    def __init__(self, prd: str | PrdRope) -> None:
+        """Index a PRD.
+
+        Args:
+            prd: PRD content
+        """
+        self._blocks = _scan(_lines(prd))[0]
+        self._sections: tuple[PrdSection, ...] | None = None
+
+    @property
+    def sections(self) -> tuple[PrdSection, ...]:
+        """Get the sections in document order."""
+        if self._sections is None:
+            self._sections = _sections(self._blocks)
+        return self._sections
+
+    def find(self, slug: str) -> PrdSection | None:
+        """Find a section by slug.
+
+        Args:
+            slug: Slug of the section
+
+        Returns:
+            The section, or None if the PRD has no such section
+        """
+        for section in self.sections:
+            if section.slug == slug:
+                return section
+        return None
+
+    def update(self, prd: str | PrdRope, hunks: tuple[PrdHunk, ...]) -> None:
+        """Refresh the index after a change.
+
+        Args:
+            prd: PRD content after the change
+            hunks: Line hunks of the change, as from ``diff_prd``
+        """
+        if not hunks:
+            return
+        blocks = self._blocks
+        starts = [0, *accumulate(block.lines for block in blocks)]
+        first_line = hunks[0].start
+        last_line = max(hunk.start + hunk.deleted for hunk in hunks)
+
+        first = max(bisect_right(starts, first_line) - 2, 0)
+        last = min(
+            bisect_right(starts, max(last_line - 1, first_line)) - 1, len(blocks) - 1
+        )
+        line_count = (
+            starts[last + 1]
+            - starts[first]
+            + sum(len(hunk.lines) - hunk.deleted for hunk in hunks)
+        )
+        offset = sum(block.chars for block in blocks[:first])
+        if isinstance(prd, PrdRope):
+            region = prd.take_lines(offset, line_count)
+        else:
+            region = _take_lines(prd, offset, line_count)
+
+        scanned, fence_open = _scan(split_lines(region))
+        if fence_open and last + 1 < len(blocks):
+            # An unclosed fence now swallows the headings that follow
+            self._blocks = _scan(_lines(prd))[0]
+        else:
+            if first > 0:
+                # The region starts at a heading unless that heading was removed
+                head = scanned.pop(0)
+                if head.lines:
+                    first -= 1
+                    scanned.insert(0, _merge(blocks[first], head))
+            self._blocks = blocks[:first] + scanned + blocks[last + 1 :]
+        self._sections = None
+
+
+def slugify(title: str) -> str:
+    """Derive a URL-friendly slug from a heading, GitHub style.
+
+    Args:
+        title: Heading text
+
+    Returns:
+        Lowercase slug with spaces turned into hyphens
+    """
+    return _SLUG_DROP.sub("", title.strip().lower()).replace(" ", "-") or "section"
+
+
+def parse_heading(line: str) -> tuple[int, str] | None:
+    """Parse an ATX heading line.
+
+    Args:
+        line: A line of markdown, with or without its line ending
+
+    Returns:
+        The heading level and text, or None if the line is not a heading
+    """
+    heading = _HEADING.match(line)
+    if heading is None:
+        return None
+    return len(heading.group(1)), heading.group(2) or ""
+
+
+def unique_slug(title: str, seen: dict[str, int]) -> str:
+    """Derive the slug of a heading, numbering repeated slugs.
+
+    Args:
+        title: Heading text
+        seen: Slugs handed out so far in the document, each with the last
+            suffix tried for it, updated in place
+
+    Returns:
+        The slug, suffixed ``-1``, ``-2``... when it was already handed out
+    """
+    base = slugify(title)
+    if base not in seen:
+        seen[base] = 0
+        return base
+    while True:
+        # A heading may itself read like a numbered slug, e.g. "Goals 1"
+        seen[base] += 1
+        slug = f"{base}-{seen[base]}"
+        if slug not in seen:
+            seen[slug] = 0
+            return slug
+
+
+def _take_lines(text: str, start: int, count: int) -> str:
+    """Get ``count`` lines of a string starting at an offset."""
+    end = start
+    for _ in range(count):
+        found = text.find("\n", end)
+        if found < 0:
+            return text[start:]
+        end = found + 1
+    return text[start:end]
+
+
+def _lines(prd: str | PrdRope) -> Iterable[str]:
+    """Get the lines of a PRD, with their line endings."""
+    return prd.lines() if isinstance(prd, PrdRope) else split_lines(prd)
+
+
+def _scan(source: Iterable[str]) -> tuple[list[_Block], bool]:
+    """Split lines into blocks; also report whether a code fence is left open.
+
+    The first block is the, possibly empty, text before the first heading.
+    """
+    blocks: list[_Block] = []
+    level, title, lines, chars, words = 0, "", 0, 0, 0
+    fence = ""
+    for line in source:
+        if fence:
+            marker = _FENCE.match(line)
+            if (
+                marker
+                and marker.group(1)[0] == fence[0]
+                and len(marker.group(1)) >= len(fence)
+            ):
+                fence = ""
+        elif (marker := _FENCE.match(line)) is not None:
+            fence = marker.group(1)
+        elif (heading := parse_heading(line)) is not None:
+            blocks.append(_Block(level, title, lines, chars, words))
+            level, title = heading
+            lines, chars, words = 1, len(line), 0
+            continue
+        lines += 1
+        chars += len(line)
+        words += len(_WORD.findall(line))
+    blocks.append(_Block(level, title, lines, chars, words))
+    return blocks, bool(fence)
+
+
+def _merge(block: _Block, tail: _Block) -> _Block:
+    """Append the lines of a headless block to the block before it."""
+    return _Block(
+        block.level,
+        block.title,
+        block.lines + tail.lines,
+        block.chars + tail.chars,
+        block.words + tail.words,
+    )
+
+
+def _sections(blocks: list[_Block]) -> tuple[PrdSection, ...]:
+    """Build the sections of indexed blocks."""
+    # Per section: slug, block, start offset, end offset, words
+    found: list[list] = []
+    open_sections: list[int] = []
+    seen: dict[str, int] = {}
+    offset = 0
+    for block in blocks:
+        if block.level:
+            while open_sections and found[open_sections[-1]][1].level >= block.level:
+                found[open_sections.pop()][3] = offset
+            slug = unique_slug(block.title, seen)
+            open_sections.append(len(found))
+            found.append([slug, block, offset, offset, 0])
+        for index in open_sections:
+            found[index][4] += block.words
+        offset += block.chars
+    for index in open_sections:
+        found[index][3] = offset
+    return tuple(
+        PrdSection(slug, block.title, block.level, start, end, words)
+        for slug, block, start, end, words in found
+    )
@@ -0,0 +1,352 @@
+"""Chunked rope holding large PRDs for cheap in-place edits."""
+
+from typing import Iterable, Iterator, Sequence
+
+from forgebase.core.prd_diff import PrdHunk, split_lines
+from forgebase.core.prd_edits import PrdEdit, validate_prd_edits
+
+# Chunks are split above twice this size and merged below a quarter of it
+CHUNK_SIZE = 2048
+
+
+class _PrefixSums:
+    """Fenwick tree over per-chunk counts.
+
+    Updates a count, sums a prefix and finds the chunk holding an offset in
+    O(log n).
+    """
+
+    def __init__(self, values: Iterable[int]) -> None:
+        """Build the tree in linear time.
+
+        Args:
+            values: Count of every chunk
+        """
+        tree = [0, *values]
+        size = len(tree) - 1
+        for index in range(1, size + 1):
+            parent = index + (index & -index)
+            if parent <= size:
+                tree[parent] += tree[index]
+        self._tree = tree
+        self._size = size
+        self._top = 1 << (size.bit_length() - 1) if size else 0
+
+    def add(self, index: int, delta: int) -> None:
+        """Add ``delta`` to the count of chunk ``index``."""
+        index += 1
+        while index <= self._size:
+            self._tree[index] += delta
+            index += index & -index
+
+    def prefix(self, count: int) -> int:
+        """Sum the counts of the first ``count`` chunks."""
+        total = 0
+        while count > 0:
+            total += self._tree[count]
+            count -= count & -count
+        return total
+
+    def search(self, offset: int) -> tuple[int, int]:
+        """Find the leading chunks whose counts sum to at most ``offset``.
+
+        Returns:
+            Their number, and what remains of ``offset`` after their sum
+        """
+        position = 0
+        step = self._top
+        while step:
+            following = position + step
+            if following <= self._size and self._tree[following] <= offset:
+                position = following
+                offset -= self._tree[following]
+            step >>= 1
+        return position, offset
+
+
+class PrdRope:
+    """Text stored as a list of bounded chunks.
+
+    Chunk lengths and newline counts are kept in Fenwick trees, so an edit
+    finds its chunks and updates the offsets in O(log n), and rewrites only
+    the chunks it touches. The trees are rebuilt only when chunks are split
+    or merged, which happens once per many edits of a region. Joining the
+    chunks into a ``str`` is left to readers of the whole document.
+    """
+
+    def __init__(self, text: str = "") -> None:
+        """Initialize a rope holding ``text``.
+
+        Args:
+            text: Initial content
+        """
+        # Never empty, so every offset maps to a chunk
+        self._chunks = [
+            text[start : start + CHUNK_SIZE]
+            for start in range(0, len(text), CHUNK_SIZE)
+        ] or [""]
+        self._length = len(text)
+        self._lengths: _PrefixSums | None = None
+        self._newlines: _PrefixSums | None = None
+
+    def __len__(self) -> int:
+        """Get the number of characters."""
+        return self._length
+
+    def __str__(self) -> str:
+        """Join the chunks into the full text."""
+        return "".join(self._chunks)
+
+    def copy(self) -> "PrdRope":
+        """Copy the rope, sharing its chunks (strings) but not its list."""
+        # Fills in the private state of a new instance of this class
+        # pylint: disable=protected-access
+        rope = PrdRope()
+        rope._chunks = list(self._chunks)
+        rope._length = self._length
+        return rope
+
+    @property
+    def chunk_count(self) -> int:
+        """Get the number of chunks."""
+        return len(self._chunks)
+
+    def slice(self, start: int, end: int) -> str:
+        """Get the text between two offsets.
+
+        Args:
+            start: Offset of the first character
+            end: Offset after the last character
+
+        Returns:
+            The text in ``[start, end)``
+        """
+        if start >= end:
+            return ""
+        first, first_offset = self._locate(start)
+        last, last_offset = self._locate(end)
+        if first == last:
+            return self._chunks[first][first_offset:last_offset]
+        return "".join(
+            [self._chunks[first][first_offset:]]
+            + self._chunks[first + 1 : last]
+            + [self._chunks[last][:last_offset]]
+        )
+
+    def line_number(self, offset: int) -> int:
+        """Get the index of the line containing an offset."""
+        index, inner = self._locate(offset)
+        before = self._newline_sums().prefix(index)
+        return before + self._chunks[index].count("\n", 0, inner)
+
+    def line_start(self, offset: int) -> int:
+        """Get the offset of the start of the line containing an offset."""
+        index, inner = self._locate(offset)
+        found = self._chunks[index].rfind("\n", 0, inner)
+        while found < 0 < index:
+            index -= 1
+            found = self._chunks[index].rfind("\n")
+        return self._chunk_start(index) + found + 1 if found >= 0 else 0
+
+    def line_end(self, offset: int) -> int:
+        """Get the offset after the first ``\\n`` at or after an offset."""
+        index, inner = self._locate(offset)
+        while index < len(self._chunks):
+            found = self._chunks[index].find("\n", inner)
+            if found >= 0:
+                return self._chunk_start(index) + found + 1
+            index += 1
+            inner = 0
+        return self._length
+
+    def lines(self) -> Iterator[str]:
+        """Iterate over the lines without joining the chunks.
+
+        Yields:
+            The lines, with their line endings, as from ``split_lines``
+        """
+        partial: list[str] = []
+        for chunk in self._chunks:
+            start = 0
+            while (end := chunk.find("\n", start)) >= 0:
+                partial.append(chunk[start : end + 1])
+                yield "".join(partial)
+                partial = []
+                start = end + 1
+            if start < len(chunk):
+                partial.append(chunk[start:])
+        if partial:
+            yield "".join(partial)
+
+    def take_lines(self, start: int, count: int) -> str:
+        """Get ``count`` lines starting at an offset.
+
+        Args:
+            start: Offset of the first line
+            count: Number of lines, fewer if the text ends before
+
+        Returns:
+            The lines, with their line endings
+        """
+        end = start
+        for _ in range(count):
+            end = self.line_end(end)
+        return self.slice(start, end)
+
+    def replace(self, offset: int, deleted: int, inserted: str) -> None:
+        """Replace a range of characters.
+
+        Args:
+            offset: Offset of the first replaced character
+            deleted: Number of characters removed
+            inserted: Text inserted at ``offset``
+
+        Raises:
+            ValueError: If the range is outside the text
+        """
+        end = offset + deleted
+        if offset < 0 or deleted < 0 or end > self._length:
+            raise ValueError("Edit extends past the end of the PRD")
+        if not deleted and not inserted:
+            return
+        first, first_offset = self._locate(offset)
+        last, last_offset = self._locate(end)
+        text = (
+            self._chunks[first][:first_offset]
+            + inserted
+            + self._chunks[last][last_offset:]
+        )
+        if len(text) < CHUNK_SIZE // 4:
+            # Merge a small remainder into a neighbour
+            if last + 1 < len(self._chunks):
+                last += 1
+                text += self._chunks[last]
+            elif first > 0:
+                first -= 1
+                text = self._chunks[first] + text
+        if len(text) > 2 * CHUNK_SIZE:
+            pieces = [
+                text[start : start + CHUNK_SIZE]
+                for start in range(0, len(text), CHUNK_SIZE)
+            ]
+        elif text or (first == 0 and last == len(self._chunks) - 1):
+            pieces = [text]
+        else:
+            pieces = []
+
+        if len(pieces) == last - first + 1 and self._lengths and self._newlines:
+            for index, piece in enumerate(pieces, first):
+                previous = self._chunks[index]
+                self._lengths.add(index, len(piece) - len(previous))
+                self._newlines.add(index, piece.count("\n") - previous.count("\n"))
+        else:
+            self._lengths = self._newlines = None
+        self._chunks[first : last + 1] = pieces
+        self._length += len(inserted) - deleted
+
+    def apply_edits(self, edits: Sequence[PrdEdit]) -> tuple[PrdHunk, ...]:
+        """Apply edits and describe them as line hunks.
+
+        The hunks are those ``diff_prd`` clients expect, computed from the
+        lines around each edit only.
+
+        Args:
+            edits: Edits sorted by offset, not overlapping, with offsets into
+                the current text
+
+        Returns:
+            Hunks turning the previous text into the edited one
+
+        Raises:
+            ValueError: If an edit is out of range, unsorted or overlaps another
+        """
+        validate_prd_edits(edits, self._length)
+        hunks = self._hunks(edits)
+        for edit in reversed(edits):
+            self.replace(edit.offset, edit.deleted, edit.inserted)
+        return hunks
+
+    def _hunks(self, edits: Sequence[PrdEdit]) -> tuple[PrdHunk, ...]:
+        """Compute the line hunks of validated edits before applying them.
+
+        Edits whose lines touch are grouped into one hunk. A hunk covers whole
+        lines of both the old and the new text: when the replacement of its
+        lines would not end with a line break, as after deleting through a
+        ``\n`` and inserting text without one, the hunk is widened to the end
+        of the next line, which the edit joins to its own.
+        """
+        pending = [edit for edit in edits if edit.deleted or edit.inserted]
+        hunks = []
+        index = 0
+        while index < len(pending):
+            start = self.line_start(pending[index].offset)
+            end = start
+            group: list[PrdEdit] = []
+            while True:
+                while index < len(pending) and (
+                    not group or self.line_start(pending[index].offset) < end
+                ):
+                    edit = pending[index]
+                    group.append(edit)
+                    end = max(end, self._edit_end(edit))
+                    index += 1
+                text = self._replacement(start, end, group)
+                if text.endswith("\n") or not text or end >= self._length:
+                    break
+                end = self.line_end(end)
+
+            old = self.slice(start, end)
+            deleted = old.count("\n") + (1 if old and not old.endswith("\n") else 0)
+            hunks.append(
+                PrdHunk(self.line_number(start), deleted, tuple(split_lines(text)))
+            )
+        return tuple(hunks)
+
+    def _edit_end(self, edit: PrdEdit) -> int:
+        """Get the end of the old lines an edit changes."""
+        if (
+            not edit.deleted
+            and edit.offset == self.line_start(edit.offset)
+            and edit.inserted.endswith("\n")
+        ):
+            # Whole lines inserted before a line leave it untouched
+            return edit.offset
+        return self.line_end(edit.offset + max(edit.deleted - 1, 0))
+
+    def _replacement(self, start: int, end: int, edits: Sequence[PrdEdit]) -> str:
+        """Get the text replacing ``[start, end)`` once edits inside it are applied."""
+        parts, position = [], start
+        for edit in edits:
+            parts.append(self.slice(position, edit.offset))
+            parts.append(edit.inserted)
+            position = edit.offset + edit.deleted
+        parts.append(self.slice(position, end))
+        return "".join(parts)
+
+    def _length_sums(self) -> _PrefixSums:
+        """Get the chunk lengths, rebuilding them after chunks changed."""
+        if self._lengths is None:
+            self._lengths = _PrefixSums(map(len, self._chunks))
+        return self._lengths
+
+    def _newline_sums(self) -> _PrefixSums:
+        """Get the chunk newline counts, rebuilding them after chunks changed."""
+        if self._newlines is None:
+            self._newlines = _PrefixSums(chunk.count("\n") for chunk in self._chunks)
+        return self._newlines
+
+    def _chunk_start(self, index: int) -> int:
+        """Get the offset of the first character of a chunk."""
+        return self._length_sums().prefix(index)
+
+    def _locate(self, offset: int) -> tuple[int, int]:
+        """Find the chunk holding an offset and the offset within it.
+
+        An offset at a chunk boundary belongs to the following chunk, except
+        the end of the text, which belongs to the last chunk.
+        """
+        index, inner = self._length_sums().search(offset)
+        if index == len(self._chunks):
+            index -= 1
+            inner += len(self._chunks[index])
+        return index, inner
@@ -0,0 +1,43 @@
+"""Domain events describing project mutations."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Optional
+from uuid import UUID
+
+from forgebase.core.prd_diff import PrdHunk
+
+PROJECT_CREATED = "created"
+PROJECT_UPDATED = "updated"
+PROJECT_DELETED = "deleted"
+
+
+# Flat on purpose: the fields map one-to-one onto the streamed event payload
+@dataclass(frozen=True)
+class ProjectEvent:  # pylint: disable=too-many-instance-attributes
+    """A mutation of a project made through ``ProjectService``.
+
+    Attributes:
+        kind: ``created``, ``updated`` or ``deleted``
+        project_id: ID of the mutated project
+        user_id: Owner of the project
+        changed: Fields whose values changed (``name``, ``prd``)
+        name: Project name after the mutation (None for deletions)
+        updated_at: Update timestamp after the mutation
+        prd_version: PRD version after the mutation (None for deletions)
+        prd_diff: Hunks turning PRD version ``prd_version - 1`` into
+            ``prd_version``, if this update changed the PRD
+    """
+
+    kind: str
+    project_id: UUID
+    user_id: str
+    changed: tuple[str, ...] = ()
+    name: Optional[str] = None
+    updated_at: Optional[datetime] = None
+    prd_version: Optional[int] = None
+    prd_diff: Optional[tuple[PrdHunk, ...]] = None
+
+
+# Receives every project event published by a ProjectService
+ProjectChangeCallback = Callable[[ProjectEvent], None]
@@ -1,11 +1,33 @@
 """Project management service for CRUD operations and business logic."""
 
 from __future__ import annotations
+from typing import Any, Callable, Sequence, TypeVar
 from uuid import UUID
 
-from forgebase.core.entities import Project
-from forgebase.core.exceptions import ProjectNotFoundError
-from forgebase.core.ports import ProjectRepositoryPort
+from forgebase.core.entities import PrdRevision, Project
+from forgebase.core.exceptions import (
+    PrdRevisionNotFoundError,
+    PrdSectionNotFoundError,
+    PrdVersionConflictError,
+    ProjectNotFoundError,
+)
+from forgebase.core.ports import (
+    PrdHistoryPort,
+    ProjectRepositoryPort,
+    WorkExecutorPort,
+)
+from forgebase.core.prd_diff import PrdHunk, diff_prd
+from forgebase.core.prd_edits import PrdEdit
+from forgebase.core.prd_outline import PrdOutline, PrdSection
+from forgebase.core.project_events import (
+    PROJECT_CREATED,
+    PROJECT_DELETED,
+    PROJECT_UPDATED,
+    ProjectChangeCallback,
+    ProjectEvent,
+)
+
+T = TypeVar("T")
 
 
 class ProjectService:
@@ -15,13 +37,27 @@ class ProjectService:
     persistence coordination, and business rules.
     """
 
-    def __init__(self, project_repository: ProjectRepositoryPort):
+    def __init__(
+        self,
+        project_repository: ProjectRepositoryPort,
+        on_change: ProjectChangeCallback | None = None,
+        prd_history: PrdHistoryPort | None = None,
+        executor: WorkExecutorPort | None = None,
+    ):
         """Initialize with a project repository.
 
         Args:
             project_repository: Repository for project persistence
+            on_change: Receives a ``ProjectEvent`` after every successful
+                mutation, e.g. to invalidate caches or notify clients
+            prd_history: Store recording every PRD revision (optional)
+            executor: Runs diffing and indexing of PRDs off the event loop
+                (optional, inline otherwise)
         """
         self._project_repository = project_repository
+        self._on_change = on_change
+        self._prd_history = prd_history
+        self._executor = executor
 
     async def create_project(self, user_id: str, name: str, prd: str = "") -> Project:
         """Create a new project.
@@ -45,7 +81,12 @@ class ProjectService:
             raise ValueError("Project name too long (maximum 255 characters)")
 
         project = Project.create(user_id=user_id, name=name, prd=prd)
-        return await self._project_repository.create(project)
+        snapshot = project.snapshot()
+        created = await self._project_repository.create(project)
+        if self._prd_history is not None:
+            await self._prd_history.record(snapshot, None)
+        self._publish(PROJECT_CREATED, snapshot, ("name", "prd"))
+        return created
 
     async def get_project(self, project_id: str, user_id: str) -> Project:
         """Get a project by ID for a specific user.
@@ -126,13 +167,77 @@ class ProjectService:
         if not existing_project:
             raise ProjectNotFoundError(f"Project {project_id} not found")
 
+        return await self._save(existing_project, name=name, prd=prd)
+
+    async def edit_prd(
+        self, project_id: str, user_id: str, base_version: int, edits: Sequence[PrdEdit]
+    ) -> Project:
+        """Apply text edits to a project's PRD.
+
+        Args:
+            project_id: The project ID as a string
+            user_id: The user ID that should own the project
+            base_version: PRD version the edits were made against
+            edits: Edits sorted by offset, with offsets into that version
+
+        Returns:
+            The updated project
+
+        Raises:
+            ProjectNotFoundError: If project is not found, doesn't belong to user, or ID format is invalid
+            PrdVersionConflictError: If the PRD changed since ``base_version``
+            ValueError: If an edit does not fit the PRD or user_id is empty
+        """
+        project = await self.get_project(project_id, user_id)
+        if project.prd_version != base_version:
+            raise PrdVersionConflictError(project_id, project.prd_version)
+        prd_diff = project.edit_prd(edits)
+        if not prd_diff:
+            return await self._persist(project, (), None)
+        return await self._persist(project, ("prd",), prd_diff)
+
+    async def _save(
+        self, existing_project: Project, name: str | None = None, prd: str | None = None
+    ) -> Project:
+        """Apply changes to a project, persist it and record what changed."""
         # Mutate existing project using entity methods to ensure timestamp logic
+        changed: list[str] = []
+        prd_diff: tuple[PrdHunk, ...] | None = None
         if name is not None and name != existing_project.name:
             existing_project.update_name(name)
+            changed.append("name")
         if prd is not None and prd != existing_project.prd:
-            existing_project.update_prd(prd)
+            version = existing_project.prd_version
+            old_prd = existing_project.prd
+            prd_diff = await self._run_cpu(
+                diff_prd, old_prd, prd, size=len(old_prd) + len(prd)
+            )
+            if existing_project.prd_version != version:
+                # Changed while the diff was computed; diff the new content
+                prd_diff = None
+            prd_diff = existing_project.update_prd(prd, prd_diff)
+            changed.append("prd")
+        return await self._persist(existing_project, tuple(changed), prd_diff)
+
+    async def _persist(
+        self,
+        project: Project,
+        changed: tuple[str, ...],
+        prd_diff: tuple[PrdHunk, ...] | None,
+    ) -> Project:
+        """Store a mutated project, record its PRD revision and publish the change.
 
-        return await self._project_repository.update(existing_project)
+        Must be called right after the mutation: the revision and the event
+        describe the project as it is on entry, not after another request
+        changed it while this one was awaiting.
+        """
+        snapshot = project.snapshot()
+        updated = await self._project_repository.update(project)
+        if prd_diff is not None and self._prd_history is not None:
+            await self._prd_history.record(snapshot, prd_diff)
+        if changed:
+            self._publish(PROJECT_UPDATED, snapshot, changed, prd_diff)
+        return updated
 
     async def delete_project(self, project_id: str, user_id: str) -> bool:
         """Delete a project by ID.
@@ -158,4 +263,163 @@ class ProjectService:
                 f"Invalid project ID format: {project_id}"
             ) from exc
 
-        return await self._project_repository.delete_for_user(project_uuid, user_id)
+        deleted = await self._project_repository.delete_for_user(project_uuid, user_id)
+        if deleted and self._prd_history is not None:
+            await self._prd_history.delete(project_uuid)
+        if deleted and self._on_change is not None:
+            self._on_change(ProjectEvent(PROJECT_DELETED, project_uuid, user_id))
+        return deleted
+
+    async def list_prd_revisions(self, project_id: str, user_id: str) -> list[PrdRevision]:
+        """List the stored PRD revisions of a project.
+
+        Args:
+            project_id: The project ID as a string
+            user_id: The user ID that should own the project
+
+        Returns:
+            List of revisions, newest first (empty without a history store)
+
+        Raises:
+            ProjectNotFoundError: If project is not found, doesn't belong to user, or ID format is invalid
+        """
+        project = await self.get_project(project_id, user_id)
+        if self._prd_history is None:
+            return []
+        return await self._prd_history.list_revisions(project.id)
+
+    async def get_prd_revision(self, project_id: str, user_id: str, version: int) -> str:
+        """Get the PRD content of a project at a given version.
+
+        Args:
+            project_id: The project ID as a string
+            user_id: The user ID that should own the project
+            version: The PRD version to fetch
+
+        Returns:
+            The PRD content of that version
+
+        Raises:
+            ProjectNotFoundError: If project is not found, doesn't belong to user, or ID format is invalid
+            PrdRevisionNotFoundError: If the version is not stored
+        """
+        project = await self.get_project(project_id, user_id)
+        prd = await self._prd_at(project, version)
+        if prd is None:
+            raise PrdRevisionNotFoundError(project_id, version)
+        return prd
+
+    async def get_prd_changes(
+        self, project_id: str, user_id: str, since: int
+    ) -> tuple[Project, tuple[PrdHunk, ...] | None]:
+        """Get a project and the PRD diff from a version the client has.
+
+        Args:
+            project_id: The project ID as a string
+            user_id: The user ID that should own the project
+            since: The PRD version the client has
+
+        Returns:
+            The project, and the hunks from version ``since`` to its current
+            PRD, or None if that version is not available to diff against
+
+        Raises:
+            ProjectNotFoundError: If project is not found, doesn't belong to user, or ID format is invalid
+        """
+        project = await self.get_project(project_id, user_id)
+        if since == project.prd_version:
+            return project, ()
+        old = await self._prd_at(project, since)
+        if old is None:
+            return project, None
+        prd = project.prd
+        return project, await self._run_cpu(
+            diff_prd, old, prd, size=len(old) + len(prd)
+        )
+
+    async def get_prd_outline(
+        self, project_id: str, user_id: str
+    ) -> tuple[Project, tuple[PrdSection, ...]]:
+        """Get a project and the sections of its PRD.
+
+        Args:
+            project_id: The project ID as a string
+            user_id: The user ID that should own the project
+
+        Returns:
+            The project, and its PRD sections in document order
+
+        Raises:
+            ProjectNotFoundError: If project is not found, doesn't belong to user, or ID format is invalid
+        """
+        project = await self.get_project(project_id, user_id)
+        return project, (await self._prd_outline(project)).sections
+
+    async def get_prd_section(
+        self, project_id: str, user_id: str, slug: str
+    ) -> tuple[Project, PrdSection, str]:
+        """Get a section of a project's PRD.
+
+        Args:
+            project_id: The project ID as a string
+            user_id: The user ID that should own the project
+            slug: Slug of the section, as listed in the outline
+
+        Returns:
+            The project, the section and its content, subsections included
+
+        Raises:
+            ProjectNotFoundError: If project is not found, doesn't belong to user, or ID format is invalid
+            PrdSectionNotFoundError: If the PRD has no section with that slug
+        """
+        project = await self.get_project(project_id, user_id)
+        section = (await self._prd_outline(project)).find(slug)
+        if section is None:
+            raise PrdSectionNotFoundError(project_id, slug)
+        return project, section, project.prd_slice(section.start, section.end)
+
+    async def _prd_outline(self, project: Project) -> PrdOutline:
+        """Get the section index of a project's PRD, building it if needed."""
+        if not project.has_prd_outline:
+            version = project.prd_version
+            outline = await self._run_cpu(
+                PrdOutline, project.prd, size=project.prd_length
+            )
+            project.set_prd_outline(outline, version)
+        return project.prd_outline
+
+    async def _run_cpu(self, fn: Callable[..., T], *args: Any, size: int) -> T:
+        """Run CPU-heavy PRD work on the executor, or inline without one."""
+        if self._executor is None:
+            return fn(*args)
+        return await self._executor.run_cpu(fn, *args, size=size)
+
+    async def _prd_at(self, project: Project, version: int) -> str | None:
+        """Get a project's PRD content at a version, if available."""
+        if version == project.prd_version:
+            return project.prd
+        if self._prd_history is None:
+            return None
+        return await self._prd_history.get_revision(project.id, version)
+
+    def _publish(
+        self,
+        kind: str,
+        project: Project,
+        changed: tuple[str, ...],
+        prd_diff: tuple[PrdHunk, ...] | None = None,
+    ) -> None:
+        """Report a mutated project to the change callback, if any."""
+        if self._on_change is not None:
+            self._on_change(
+                ProjectEvent(
+                    kind=kind,
+                    project_id=project.id,
+                    user_id=project.user_id,
+                    changed=changed,
+                    name=project.name,
+                    updated_at=project.updated_at,
+                    prd_version=project.prd_version,
+                    prd_diff=prd_diff,
+                )
+            )
@@ -1,7 +1,9 @@
 """Tool interface for agent plugins."""
 
-from typing import Protocol
-from semantic_kernel import Kernel
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from semantic_kernel import Kernel
 
 
 class ToolPort(Protocol):
@@ -12,7 +14,7 @@ class ToolPort(Protocol):
         """Name for the SK plugin."""
         ...
 
-    def register_with_kernel(self, kernel: Kernel) -> None:
+    def register_with_kernel(self, kernel: "Kernel") -> None:
         """Register this tool's functions with the SK kernel."""
         ...
 
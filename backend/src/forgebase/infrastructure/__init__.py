@@ -1,3 +1,3 @@
 """Infrastructure package for forgebase."""
 
-from . import agent, config, logging_config, project_repository
+from . import config, logging_config, project_repository
@@ -1,16 +1,189 @@
 """Agent implementation using Semantic Kernel and Azure OpenAI."""
 
-from typing import AsyncIterator, List
+import asyncio
+import json
+import time
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    List,
+    Sequence,
+)
 
+from openai import APIConnectionError, AsyncAzureOpenAI
 from semantic_kernel import Kernel
 from semantic_kernel.agents.chat_completion.chat_completion_agent import (
     ChatCompletionAgent,
     ChatHistoryAgentThread,
 )
 from semantic_kernel.connectors.ai.open_ai import AzureChatCompletion
+from semantic_kernel.connectors.ai.open_ai.const import DEFAULT_AZURE_API_VERSION
+from semantic_kernel.connectors.ai.open_ai.services.azure_config_base import (
+    AzureOpenAIConfigBase,
+)
+from semantic_kernel.connectors.ai.open_ai.services.open_ai_model_types import (
+    OpenAIModelTypes,
+)
+from semantic_kernel.contents import AuthorRole, ChatHistory, ChatMessageContent
+from semantic_kernel.filters import AutoFunctionInvocationContext, FilterTypes
 
+from forgebase.core.metrics import TurnMetricsCallback, TurnRecorder
 from forgebase.core.ports import AgentPort
 from forgebase.core.tool_port import ToolPort
+from forgebase.infrastructure.conversation_memory import ConversationMemoryManager
+from forgebase.infrastructure.conversation_store import ConversationStore
+from forgebase.infrastructure.deployment_router import (
+    DeploymentConfig,
+    DeploymentRouter,
+)
+from forgebase.infrastructure.hedging import HedgePolicy
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Check whether a failure should fail over to another deployment.
+
+    Throttling (429), server errors (5xx) and connection failures are
+    retryable; anything else (e.g. a 400 for a bad request) is not.
+
+    Args:
+        exc: Exception raised while streaming, possibly wrapped by SK
+
+    Returns:
+        True if another deployment should be tried
+    """
+    current: BaseException | None = exc
+    while current is not None:
+        status = getattr(current, "status_code", None)
+        if isinstance(status, int):
+            return status == 429 or status >= 500
+        if isinstance(current, APIConnectionError):
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
+# Approximate memory held by an SK chat message beyond its serialized size
+_MESSAGE_OVERHEAD_BYTES = 2048
+
+
+def _estimate_size(records: List[dict[str, Any]]) -> int:
+    """Estimate the memory held by messages from their serialized form.
+
+    Args:
+        records: Messages as stored in the conversation store
+
+    Returns:
+        Estimated size in bytes
+    """
+    return sum(
+        _MESSAGE_OVERHEAD_BYTES + len(json.dumps(record, separators=(",", ":")))
+        for record in records
+    )
+
+
+class _ClientChatCompletion(AzureChatCompletion):
+    """AzureChatCompletion around a prebuilt OpenAI client.
+
+    ``AzureChatCompletion`` validates the ``AZURE_OPENAI_*`` environment even
+    when a client is given, rejecting non-https endpoints such as a local
+    mock deployment. The client already holds the connection settings, so
+    that validation is skipped.
+    """
+
+    def __init__(self, deployment_name: str, client: AsyncAzureOpenAI) -> None:
+        """Initialize the service.
+
+        Args:
+            deployment_name: Azure OpenAI deployment name
+            client: Client connected to the deployment
+        """
+        # pylint: disable=non-parent-init-called,super-init-not-called
+        AzureOpenAIConfigBase.__init__(
+            self,
+            deployment_name=deployment_name,
+            ai_model_type=OpenAIModelTypes.CHAT,
+            client=client,
+        )
+
+
+def _create_service(
+    deployment: DeploymentConfig, max_retries: int
+) -> AzureChatCompletion:
+    """Create the chat completion service for one deployment.
+
+    The OpenAI client is built explicitly so client-side retries can be
+    disabled when the router can fail over to another deployment instead.
+
+    Args:
+        deployment: Deployment connection settings
+        max_retries: Retries performed by the OpenAI client itself
+
+    Returns:
+        Configured AzureChatCompletion service
+    """
+    return _ClientChatCompletion(
+        deployment_name=deployment.deployment_name,
+        client=AsyncAzureOpenAI(
+            azure_endpoint=deployment.endpoint,
+            azure_deployment=deployment.deployment_name,
+            api_key=deployment.api_key,
+            api_version=DEFAULT_AZURE_API_VERSION,
+            max_retries=max_retries,
+        ),
+    )
+
+
+_END_OF_STREAM = object()
+
+
+class _HedgedAttempt:
+    """One request of a hedged turn, consumed in its own task.
+
+    SK streams must be iterated from a single task (its telemetry context is
+    task-local), so each attempt is pumped into a queue by a dedicated task.
+    """
+
+    def __init__(self, thread: ChatHistoryAgentThread) -> None:
+        """Initialize the attempt.
+
+        Args:
+            thread: Private copy of the conversation used by this request
+        """
+        self.thread = thread
+        self._queue: asyncio.Queue[tuple[Any, BaseException | None]] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self, stream: AsyncIterator[Any]) -> None:
+        """Start consuming the stream in a background task."""
+        self._task = asyncio.create_task(self._pump(stream))
+
+    async def _pump(self, stream: AsyncIterator[Any]) -> None:
+        """Forward stream items, the end of stream, or an error to the queue."""
+        try:
+            async for item in stream:
+                self._queue.put_nowait((item, None))
+            self._queue.put_nowait((_END_OF_STREAM, None))
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            self._queue.put_nowait((_END_OF_STREAM, exc))
+
+    async def next(self) -> Any:
+        """Get the next item, or ``_END_OF_STREAM`` once the stream is done.
+
+        Raises:
+            Exception: The error that ended the stream
+        """
+        item, error = await self._queue.get()
+        if error is not None:
+            raise error
+        return item
+
+    def cancel(self) -> None:
+        """Cancel the request if it is still running."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
 
 
 class Agent(AgentPort):
@@ -19,43 +192,99 @@ class Agent(AgentPort):
     def __init__(
         self,
         *,
-        endpoint: str,
-        api_key: str,
-        deployment_name: str,
+        endpoint: str | None = None,
+        api_key: str | None = None,
+        deployment_name: str | None = None,
+        deployments: Sequence[DeploymentConfig] | None = None,
+        router: DeploymentRouter | None = None,
+        hedge_policy: HedgePolicy | None = None,
+        conversation_store: ConversationStore | None = None,
+        memory_manager: ConversationMemoryManager | None = None,
         instructions: str = "You are a helpful assistant.",
         role: str = "assistant",
         tools: List[ToolPort] | None = None,
     ) -> None:
         """Initialize the agent.
 
+        Either a single deployment (``endpoint``, ``api_key``,
+        ``deployment_name``) or a list of ``deployments`` must be given. With
+        several deployments each turn is routed by a ``DeploymentRouter`` and
+        fails over to another deployment on throttling or server errors. With
+        a ``hedge_policy`` a turn whose first token is later than the policy's
+        deadline is duplicated to a second deployment and the faster one wins.
+        With a ``conversation_store`` the thread of the conversation selected
+        by ``set_conversation`` is persisted after every turn, and a
+        ``memory_manager`` may then spill the thread out of memory between
+        turns; it is restored from the store on the next message.
+
         Args:
             endpoint: Azure OpenAI endpoint URL
             api_key: Azure OpenAI API key
             deployment_name: Azure OpenAI deployment name
+            deployments: Deployments to route between instead of a single one
+            router: Router to share health statistics between agents
+            hedge_policy: Enables hedged requests across deployments when set
+            conversation_store: Store persisting conversation threads
+            memory_manager: Budget deciding when to spill the thread from memory
             instructions: System instructions for the agent
             role: Role identifier for the agent
             tools: List of tools to make available to this agent
+
+        Raises:
+            ValueError: If no deployment is configured
         """
+        if router is None:
+            if not deployments:
+                if not (endpoint and api_key and deployment_name):
+                    raise ValueError("An Azure OpenAI deployment is required")
+                deployments = [
+                    DeploymentConfig(
+                        endpoint=endpoint,
+                        api_key=api_key,
+                        deployment_name=deployment_name,
+                    )
+                ]
+            router = DeploymentRouter(deployments)
+        self._router = router
+        self._hedge_policy = hedge_policy
+        self._conversation_store = conversation_store
+        self._conversation_id: str | None = None
+        self._restore_pending = False
+        self._persisted_messages = 0
+        self._memory_manager = memory_manager
+        self._thread_size = 0
+        self._turn_active = False
+
         self._role = role
         self._tools = tools or []
+        self._tool_call_count = 0
+        self._metrics_callback: TurnMetricsCallback | None = None
+        self._recorder: TurnRecorder | None = None
 
         # Create kernel and register tools
         self.kernel = Kernel()
+        self.kernel.add_filter(
+            FilterTypes.AUTO_FUNCTION_INVOCATION, self._on_tool_invocation
+        )
 
         # Register all tools with the kernel
         for tool in self._tools:
             tool.register_with_kernel(self.kernel)
 
-        self.agent = ChatCompletionAgent(
-            service=AzureChatCompletion(
-                deployment_name=deployment_name,
-                endpoint=endpoint,
-                api_key=api_key,
-            ),
-            kernel=self.kernel,  # Pass kernel with registered tools
-            name=f"forgebase-{role}",
-            instructions=instructions,
-        )
+        # One SK agent per deployment, all sharing the tools and the thread.
+        # With a single deployment the OpenAI client keeps its default retries.
+        single = len(router.deployments) == 1
+        self._agents = {
+            deployment.name: ChatCompletionAgent(
+                service=_create_service(deployment, max_retries=2 if single else 0),
+                # Pass kernel with registered tools
+                kernel=self.kernel if single else self._deployment_kernel(),
+                name=f"forgebase-{role}",
+                instructions=instructions,
+            )
+            for deployment in router.deployments
+        }
+        self.agent = next(iter(self._agents.values()))
 
         self.thread: ChatHistoryAgentThread | None = None
 
@@ -70,21 +299,389 @@ class Agent(AgentPort):
         Yields:
             String chunks of the agent's response
         """
-        if self.thread is None:
-            self.thread = ChatHistoryAgentThread()
+        self._ensure_thread()
+        self._turn_active = True
 
-        async for response in self.agent.invoke_stream(
-            messages=user_text, thread=self.thread
-        ):
+        recorder = TurnRecorder(source="agent", role=self._role)
+        self._recorder = recorder
+        completed = False
+        if self._hedge_policy is not None and len(self._agents) > 1:
+            responses = self._invoke_hedged(user_text)
+        else:
+            responses = self._invoke_with_failover(user_text)
+        try:
+            async for response in responses:
+                try:
+                    usage = response.content.metadata.get("usage")
+                    if usage is not None:
+                        recorder.add_usage(usage.prompt_tokens, usage.completion_tokens)
+                    if response.content and response.content.content:
+                        recorder.on_chunk()
+                        yield response.content.content
+                except AttributeError:
+                    continue
+            completed = True
+        finally:
+            await responses.aclose()
+            self._recorder = None
+            await self._persist_thread()
+            self._turn_active = False
+            self._report_memory()
+            if self._metrics_callback is not None:
+                self._metrics_callback(recorder.finish(completed=completed))
+
+    async def _attempt(
+        self,
+        deployment: DeploymentConfig,
+        messages: str | None,
+        thread: ChatHistoryAgentThread,
+    ) -> AsyncGenerator[Any, None]:
+        """Stream one model request to a deployment, reporting to the router.
+
+        A request cancelled before its first token, such as the loser of a
+        hedged race, is reported as a censored observation: its time to first
+        token is at least the time it ran.
+
+        Args:
+            deployment: Deployment to send the request to
+            messages: New user message, or None if already in the thread
+            thread: Thread holding the conversation for this request
+
+        Yields:
+            SK streaming response items
+        """
+        responded = False
+        started = time.perf_counter()
+        self._router.on_start(deployment)
+        try:
+            async for response in self._agents[deployment.name].invoke_stream(
+                messages=messages, thread=thread
+            ):
+                if not responded:
+                    responded = True
+                    ttft = time.perf_counter() - started
+                    self._router.on_first_token(deployment, ttft)
+                    if self._hedge_policy is not None:
+                        self._hedge_policy.observe(ttft)
+                yield response
+        except (asyncio.CancelledError, GeneratorExit):
+            if not responded:
+                elapsed = time.perf_counter() - started
+                self._router.on_cancel(deployment, elapsed)
+                if self._hedge_policy is not None:
+                    self._hedge_policy.observe_censored(elapsed)
+            raise
+        except Exception as exc:
+            if _is_retryable(exc):
+                self._router.on_failure(deployment)
+            raise
+        finally:
+            self._router.on_finish(deployment)
+
+    async def _invoke_with_failover(self, user_text: str) -> AsyncGenerator[Any, None]:
+        """Stream a turn, failing over to other deployments before the first token.
+
+        Args:
+            user_text: User input message
+
+        Yields:
+            SK streaming response items
+        """
+        assert self.thread is not None  # nosec - created by send_message_stream
+        tried: List[DeploymentConfig] = []
+        messages: str | None = user_text
+        while True:
+            deployment = self._router.choose(exclude=tried)
+            if deployment is None:
+                raise RuntimeError("All Azure OpenAI deployments failed")
+            tried.append(deployment)
+            responded = False
             try:
-                if response.content and response.content.content:
-                    yield response.content.content
-            except AttributeError:
-                continue
+                async for response in self._attempt(deployment, messages, self.thread):
+                    responded = True
+                    yield response
+                return
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                if (
+                    responded
+                    or not _is_retryable(exc)
+                    or len(tried) == len(self._agents)
+                ):
+                    raise
+                # The user message is already in the thread; retry without it
+                messages = None
+
+    async def _invoke_hedged(self, user_text: str) -> AsyncGenerator[Any, None]:
+        """Stream a turn, hedging to a second deployment if the first token is late.
+
+        Every request runs in its own task on its own copy of the thread, and
+        forwards its responses through a queue. The first request to respond
+        wins: its thread becomes the agent's thread and the other request is
+        cancelled before it can produce output or call tools.
+
+        Args:
+            user_text: User input message
+
+        Yields:
+            SK streaming response items
+        """
+        assert self.thread is not None  # nosec - created by send_message_stream
+        assert self._hedge_policy is not None  # nosec - checked by caller
+        history = [message async for message in self.thread.get_messages()]
+        deadline = self._hedge_policy.deadline()
+        tried: List[DeploymentConfig] = []
+        attempts: list[_HedgedAttempt] = []
+
+        def start(deployment: DeploymentConfig) -> _HedgedAttempt:
+            thread = ChatHistoryAgentThread(
+                chat_history=ChatHistory(messages=list(history))
+            )
+            attempt = _HedgedAttempt(thread)
+            attempt.start(self._attempt(deployment, user_text, thread))
+            attempts.append(attempt)
+            tried.append(deployment)
+            return attempt
+
+        try:
+            primary = start(self._router.choose() or self._router.deployments[0])
+            winner, first = await self._race(primary, deadline, tried, start)
+            for attempt in attempts:
+                if attempt is not winner:
+                    attempt.cancel()
+            self.thread = winner.thread
+            while first is not _END_OF_STREAM:
+                yield first
+                first = await winner.next()
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+
+    async def _race(
+        self,
+        primary: _HedgedAttempt,
+        deadline: float,
+        tried: List[DeploymentConfig],
+        start: Callable[[DeploymentConfig], _HedgedAttempt],
+    ) -> tuple[_HedgedAttempt, Any]:
+        """Wait for the first attempt to respond, hedging after the deadline.
+
+        Args:
+            primary: The first attempt of the turn
+            deadline: Seconds to wait before sending a hedge
+            tried: Deployments already used for this turn
+            start: Callback starting an attempt on a deployment
+
+        Returns:
+            The winning attempt and its first response item
+
+        Raises:
+            Exception: The last error if every attempt failed
+        """
+        hedged = False
+        waiting: dict[asyncio.Future[Any], _HedgedAttempt] = {}
+
+        def watch(attempt: _HedgedAttempt) -> None:
+            waiting[asyncio.ensure_future(attempt.next())] = attempt
+
+        watch(primary)
+        try:
+            while True:
+                done, _ = await asyncio.wait(
+                    waiting,
+                    timeout=None if hedged else deadline,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    hedged = True
+                    hedge = self._router.choose(exclude=tried)
+                    if hedge is not None:
+                        watch(start(hedge))
+                    continue
+                for future in done:
+                    attempt = waiting.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        return attempt, future.result()
+                    if not _is_retryable(error):
+                        raise error
+                    if not waiting:
+                        # Nothing left in flight: fail over like an unhedged turn
+                        replacement = self._router.choose(exclude=tried)
+                        if replacement is None:
+                            raise error
+                        watch(start(replacement))
+        finally:
+            for future in waiting:
+                future.cancel()
+
+    def _deployment_kernel(self) -> Kernel:
+        """Create a kernel sharing this agent's tools and filters.
+
+        SK agents resolve their chat service through the kernel, so each
+        deployment needs its own kernel for its service to be selected.
+
+        Returns:
+            Kernel with the same plugins and tool invocation filters
+        """
+        return Kernel(
+            plugins=self.kernel.plugins,
+            auto_function_invocation_filters=self.kernel.auto_function_invocation_filters,
+        )
+
+    async def _on_tool_invocation(
+        self,
+        context: AutoFunctionInvocationContext,
+        next: Callable[  # pylint: disable=redefined-builtin
+            [AutoFunctionInvocationContext], Awaitable[Any]
+        ],
+    ) -> None:
+        """Count and time model-initiated tool calls.
+
+        SK passes the continuation as the keyword argument ``next``.
+
+        Args:
+            context: SK auto function invocation context
+            next: Next filter (or the function itself) in the pipeline
+        """
+        self._tool_call_count += 1
+        started = time.perf_counter()
+        try:
+            await next(context)
+        finally:
+            if self._recorder is not None:
+                self._recorder.add_tool_call(
+                    context.function.fully_qualified_name,
+                    time.perf_counter() - started,
+                )
+
+    async def record_turn(self, user_text: str, reply_text: str) -> None:
+        """Append a completed exchange to the thread without calling the model.
+
+        Args:
+            user_text: User message of the exchange
+            reply_text: Assistant reply of the exchange
+        """
+        thread = self._ensure_thread()
+        await thread.on_new_message(
+            ChatMessageContent(role=AuthorRole.USER, content=user_text)
+        )
+        await thread.on_new_message(
+            ChatMessageContent(role=AuthorRole.ASSISTANT, content=reply_text)
+        )
+        await self._persist_thread()
+        self._report_memory()
 
     async def reset(self) -> None:
-        """Reset conversation state."""
+        """Reset conversation state, deleting the persisted conversation."""
+        self.thread = None
+        self._restore_pending = False
+        self._persisted_messages = 0
+        self._forget_memory()
+        if self._conversation_store is not None and self._conversation_id:
+            self._conversation_store.delete(self._conversation_id)
+
+    def set_conversation(self, conversation_id: str | None) -> bool:
+        """Switch to a persisted conversation.
+
+        The stored thread is only read when the next message is sent, so
+        resuming a conversation costs nothing until it is used.
+
+        Args:
+            conversation_id: Conversation to continue or start, or None for an
+                unpersisted conversation
+
+        Returns:
+            True if the conversation has stored turns that will be restored
+        """
+        self.thread = None
+        self._conversation_id = conversation_id
+        self._persisted_messages = 0
+        self._forget_memory()
+        self._restore_pending = bool(
+            self._conversation_store is not None
+            and conversation_id
+            and self._conversation_store.exists(conversation_id)
+        )
+        return self._restore_pending
+
+    def _ensure_thread(self) -> ChatHistoryAgentThread:
+        """Get the current thread, restoring it from the store if pending.
+
+        Returns:
+            The conversation thread
+        """
+        if self.thread is None:
+            messages: List[ChatMessageContent] = []
+            self._thread_size = 0
+            if self._restore_pending:
+                assert self._conversation_store is not None  # nosec
+                assert self._conversation_id is not None  # nosec
+                records = self._conversation_store.load(self._conversation_id)
+                messages = [ChatMessageContent.model_validate(r) for r in records]
+                self._thread_size = _estimate_size(records)
+                self._restore_pending = False
+            self._persisted_messages = len(messages)
+            self.thread = ChatHistoryAgentThread(
+                chat_history=ChatHistory(messages=messages)
+            )
+        return self.thread
+
+    async def _persist_thread(self) -> None:
+        """Append the thread's messages added since the last save to the store."""
+        if (
+            self._conversation_store is None
+            or not self._conversation_id
+            or self.thread is None
+        ):
+            return
+        messages = [message async for message in self.thread.get_messages()]
+        new_messages = messages[self._persisted_messages :]
+        if new_messages:
+            records = [
+                message.model_dump(mode="json", exclude_none=True)
+                for message in new_messages
+            ]
+            self._conversation_store.append(self._conversation_id, records)
+            self._thread_size += _estimate_size(records)
+        self._persisted_messages = len(messages)
+
+    def spill(self) -> bool:
+        """Release the thread from memory; it is restored on the next message.
+
+        Only a fully persisted thread of a stored conversation that is not in
+        the middle of a turn can be spilled.
+
+        Returns:
+            True if the thread was released
+        """
+        if (
+            self._turn_active
+            or self.thread is None
+            or self._conversation_store is None
+            or not self._conversation_id
+            or self._persisted_messages != len(self.thread)
+        ):
+            return False
         self.thread = None
+        self._restore_pending = self._persisted_messages > 0
+        self._thread_size = 0
+        return True
+
+    def _report_memory(self) -> None:
+        """Report the thread's estimated size to the memory manager."""
+        if (
+            self._memory_manager is not None
+            and self.thread is not None
+            and self._conversation_store is not None
+            and self._conversation_id
+        ):
+            self._memory_manager.touch(self, self._thread_size)
+
+    def _forget_memory(self) -> None:
+        """Stop the memory manager from tracking the dropped thread."""
+        self._thread_size = 0
+        if self._memory_manager is not None:
+            self._memory_manager.forget(self)
 
     @property
     def role(self) -> str:
@@ -96,6 +693,15 @@ class Agent(AgentPort):
         """Get available tool names."""
         return [tool.plugin_name for tool in self._tools]
 
+    @property
+    def tool_call_count(self) -> int:
+        """Get the number of tool invocations made so far."""
+        return self._tool_call_count
+
+    def set_metrics_callback(self, callback: TurnMetricsCallback | None) -> None:
+        """Register a hook that receives metrics after every turn."""
+        self._metrics_callback = callback
+
     def set_project_context(self, project_id: str | None) -> None:
         """Set the current project context for agent tools."""
         print(f"DEBUG Agent.set_project_context: project_id = {project_id}")
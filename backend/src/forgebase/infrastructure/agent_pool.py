@@ -0,0 +1,109 @@
+"""Pool of pre-built agents for instant session start."""
+
+import logging
+import queue
+import threading
+from typing import Callable
+
+from forgebase.core.ports import AgentPort
+
+logger = logging.getLogger(__name__)
+
+
+class AgentPool:
+    """Keeps a number of ready-to-use agents built ahead of time.
+
+    Building an ``Agent`` (kernel, tool plugins, instructions, SK agent) is
+    too slow for the request path. The pool builds ``size`` agents in a
+    background thread once started and refills after every checkout, so new
+    sessions normally get a warm agent without waiting. When the pool is
+    empty, ``checkout`` falls back to building an agent inline.
+    """
+
+    def __init__(self, factory: Callable[[], AgentPort], size: int) -> None:
+        """Initialize the pool (nothing is built until ``start``).
+
+        Args:
+            factory: Builds one fresh agent
+            size: Number of agents to keep ready
+
+        Raises:
+            ValueError: If size is not positive
+        """
+        if size <= 0:
+            raise ValueError("Agent pool size must be positive")
+        self._factory = factory
+        self._size = size
+        self._ready: queue.SimpleQueue[AgentPort] = queue.SimpleQueue()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._worker: threading.Thread | None = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def size(self) -> int:
+        """Get the number of agents the pool keeps ready."""
+        return self._size
+
+    @property
+    def ready(self) -> int:
+        """Get the number of agents currently ready for checkout."""
+        return self._ready.qsize()
+
+    def start(self) -> None:
+        """Start filling the pool in a background thread."""
+        if self._worker is not None:
+            return
+        self._stopped.clear()
+        self._worker = threading.Thread(
+            target=self._run, name="agent-pool", daemon=True
+        )
+        self._worker.start()
+        self._wakeup.set()
+
+    def stop(self) -> None:
+        """Stop the refill thread; agents already built stay available."""
+        if self._worker is None:
+            return
+        self._stopped.set()
+        self._wakeup.set()
+        self._worker.join()
+        self._worker = None
+
+    def fill(self) -> None:
+        """Build agents until the pool is full.
+
+        Runs on the refill thread, but may also be called directly, e.g. to
+        pre-warm synchronously.
+        """
+        while not self._stopped.is_set() and self._ready.qsize() < self._size:
+            self._ready.put(self._factory())
+
+    def checkout(self) -> AgentPort:
+        """Take a ready agent out of the pool.
+
+        Returns:
+            A pre-built agent, or a freshly built one if none is ready
+        """
+        try:
+            agent = self._ready.get_nowait()
+            self.hits += 1
+        except queue.Empty:
+            self.misses += 1
+            agent = self._factory()
+        self._wakeup.set()
+        return agent
+
+    def _run(self) -> None:
+        """Refill the pool whenever it is woken up."""
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            if self._stopped.is_set():
+                return
+            try:
+                self.fill()
+            except Exception:  # pylint: disable=broad-except
+                # Retried on the next checkout; checkout builds inline meanwhile
+                logger.exception("Failed to pre-build agent")
@@ -1,5 +1,6 @@
 """Simplified configuration."""
 
+import json
 import os
 from pathlib import Path
 from typing import List
@@ -9,9 +10,23 @@ from forgebase.core.chat_service import ChatService
 from forgebase.core.project_service import ProjectService
 from forgebase.core.ports import AgentPort
 from forgebase.core.tool_port import ToolPort
-from forgebase.infrastructure.agent import Agent
+from forgebase.infrastructure.agent_pool import AgentPool
+from forgebase.infrastructure.conversation_memory import ConversationMemoryManager
+from forgebase.infrastructure.conversation_store import ConversationStore
+from forgebase.infrastructure.logging_config import log_turn_metrics
+from forgebase.infrastructure.deployment_router import (
+    DeploymentConfig,
+    DeploymentRouter,
+)
+from forgebase.infrastructure.hedging import HedgePolicy
 from forgebase.infrastructure.stub_agent import StubAgent
+from forgebase.infrastructure.stub_profiles import StubProfile, parse_stub_profile
+from forgebase.infrastructure.prd_history import InMemoryPrdHistory
+from forgebase.infrastructure.prd_html_cache import PrdHtmlCache
+from forgebase.infrastructure.project_events import ProjectEventBus
 from forgebase.infrastructure.project_repository import InMemoryProjectRepository
+from forgebase.infrastructure.response_cache import CachingAgent, ResponseCache
+from forgebase.infrastructure.work_executor import WorkExecutor
 from forgebase.tools.prd_tools import PRDTools
 
 load_dotenv()
@@ -20,16 +35,57 @@ load_dotenv()
 # Global singleton repository instance
 _project_repository: InMemoryProjectRepository | None = None
 
+# Global response cache shared by all agents (None when disabled)
+_response_cache: ResponseCache | None = None
+
+# Global conversation store (None until first used or when disabled)
+_conversation_store: ConversationStore | None = None
+
+# Global memory manager spilling idle conversations (None when disabled)
+_conversation_memory: ConversationMemoryManager | None = None
+
+# Global pool of pre-built agents (None until first used or when disabled)
+_agent_pool: AgentPool | None = None
+
+# Global bus of project events (None until first used)
+_project_events: ProjectEventBus | None = None
+
+# Global PRD revision history (None until first used)
+_prd_history: InMemoryPrdHistory | None = None
+
+# Global cache of PRDs rendered as HTML (None until first used)
+_prd_html_cache: PrdHtmlCache | None = None
+
+# Global pools for CPU-heavy PRD work (None until first used)
+_work_executor: WorkExecutor | None = None
+
+# Global router tracking deployment health for all agents (None until first used)
+_deployment_router: DeploymentRouter | None = None
+
+# Global hedging policy learning TTFTs of all agents (None until first used or
+# when disabled)
+_hedge_policy: HedgePolicy | None = None
+
 
 def get_project_repository() -> InMemoryProjectRepository:
     """Get the shared project repository instance.
 
+    Setting ``FORGEBASE_PRD_COMPRESS_MIN_CHARS`` keeps PRDs at least that long
+    compressed while not recently used; ``FORGEBASE_PRD_HOT_CACHE_SIZE`` sets
+    how many large PRDs stay decompressed and ``FORGEBASE_PRD_COMPRESS_LEVEL``
+    the zlib level.
+
     Returns:
         Shared InMemoryProjectRepository instance
     """
     global _project_repository
     if _project_repository is None:
-        _project_repository = InMemoryProjectRepository()
+        _project_repository = InMemoryProjectRepository(
+            compress_min_chars=_env_int("FORGEBASE_PRD_COMPRESS_MIN_CHARS", 0),
+            hot_entries=_env_int("FORGEBASE_PRD_HOT_CACHE_SIZE", 16),
+            compress_level=_env_int("FORGEBASE_PRD_COMPRESS_LEVEL", 6),
+            executor=get_work_executor(),
+        )
     return _project_repository
 
 
@@ -42,6 +98,304 @@ def reset_project_repository() -> None:
     _project_repository = None
 
 
+def get_response_cache() -> ResponseCache | None:
+    """Get the shared response cache, if enabled.
+
+    The cache is enabled by setting ``FORGEBASE_RESPONSE_CACHE_SIZE`` to the
+    maximum number of cached replies; ``FORGEBASE_RESPONSE_CACHE_MAX_BYTES``
+    optionally caps their total size.
+
+    Returns:
+        Shared ResponseCache instance, or None if caching is disabled
+    """
+    global _response_cache
+    max_entries = _env_int("FORGEBASE_RESPONSE_CACHE_SIZE", 0)
+    if max_entries <= 0:
+        return None
+    if _response_cache is None:
+        _response_cache = ResponseCache(
+            max_entries=max_entries,
+            max_bytes=_env_int("FORGEBASE_RESPONSE_CACHE_MAX_BYTES", 4 * 1024 * 1024),
+        )
+    return _response_cache
+
+
+def reset_response_cache() -> None:
+    """Reset the global response cache for testing.
+
+    This function is intended for test isolation only.
+    """
+    global _response_cache
+    _response_cache = None
+
+
+def get_conversation_store() -> ConversationStore | None:
+    """Get the shared conversation store, if enabled.
+
+    Conversation threads are persisted when ``FORGEBASE_CONVERSATION_DIR``
+    names the directory to store them in.
+
+    Returns:
+        Shared ConversationStore instance, or None if persistence is disabled
+    """
+    global _conversation_store
+    directory = os.getenv("FORGEBASE_CONVERSATION_DIR")
+    if not directory:
+        return None
+    if _conversation_store is None:
+        _conversation_store = ConversationStore(directory)
+    return _conversation_store
+
+
+def reset_conversation_store() -> None:
+    """Reset the global conversation store for testing.
+
+    This function is intended for test isolation only.
+    """
+    global _conversation_store
+    _conversation_store = None
+
+
+def get_conversation_memory() -> ConversationMemoryManager | None:
+    """Get the shared manager spilling conversations out of memory, if enabled.
+
+    Requires a conversation store. ``FORGEBASE_CONVERSATION_MEMORY_MB`` caps
+    the estimated memory of resident conversation threads and
+    ``FORGEBASE_CONVERSATION_IDLE_MINUTES`` spills conversations idle for that
+    long; either enables the manager.
+
+    Returns:
+        Shared ConversationMemoryManager instance, or None if disabled
+    """
+    global _conversation_memory
+    budget_mb = _env_int("FORGEBASE_CONVERSATION_MEMORY_MB", 0)
+    idle_minutes = _env_int("FORGEBASE_CONVERSATION_IDLE_MINUTES", 0)
+    if get_conversation_store() is None or (budget_mb <= 0 and idle_minutes <= 0):
+        return None
+    if _conversation_memory is None:
+        _conversation_memory = ConversationMemoryManager(
+            budget_bytes=budget_mb * 1024 * 1024 if budget_mb > 0 else None,
+            idle_timeout=idle_minutes * 60.0 if idle_minutes > 0 else None,
+        )
+    return _conversation_memory
+
+
+def reset_conversation_memory() -> None:
+    """Reset the global conversation memory manager for testing.
+
+    This function is intended for test isolation only.
+    """
+    global _conversation_memory
+    _conversation_memory = None
+
+
+def get_agent_pool() -> AgentPool | None:
+    """Get the shared pool of pre-built agents, if enabled.
+
+    The pool is enabled by setting ``FORGEBASE_AGENT_POOL_SIZE`` to the number
+    of agents to keep ready. It starts filling in the background on first use.
+
+    Returns:
+        Shared, started AgentPool instance, or None if pooling is disabled
+    """
+    global _agent_pool
+    size = _env_int("FORGEBASE_AGENT_POOL_SIZE", 0)
+    if size <= 0:
+        return None
+    if _agent_pool is None:
+        # The refill thread only reads the shared singletons; creating them
+        # here keeps it from racing other callers to initialize them
+        project_service = get_project_service()
+        _init_agent_dependencies()
+        _agent_pool = AgentPool(lambda: _create_agent(project_service), size)
+        _agent_pool.start()
+    return _agent_pool
+
+
+def reset_agent_pool() -> None:
+    """Stop and drop the global agent pool.
+
+    Used on application shutdown and for test isolation.
+    """
+    global _agent_pool
+    if _agent_pool is not None:
+        _agent_pool.stop()
+    _agent_pool = None
+
+
+def get_deployment_router() -> DeploymentRouter | None:
+    """Get the router shared by all agents, if a deployment is configured.
+
+    Sharing it lets every chat session benefit from the TTFT, error rate and
+    circuit breaker state observed by the others.
+
+    Returns:
+        Shared DeploymentRouter instance, or None without Azure OpenAI config
+    """
+    global _deployment_router
+    if _deployment_router is None:
+        deployments = _load_deployments()
+        if not deployments:
+            return None
+        _deployment_router = DeploymentRouter(deployments)
+    return _deployment_router
+
+
+def reset_deployment_router() -> None:
+    """Reset the global deployment router for testing.
+
+    This function is intended for test isolation only.
+    """
+    global _deployment_router
+    _deployment_router = None
+
+
+def get_hedge_policy() -> HedgePolicy | None:
+    """Get the hedging policy shared by all agents, if enabled.
+
+    The policy learns its deadline from the TTFTs of every session, instead
+    of each new session hedging at the initial delay until it has seen
+    enough turns of its own.
+
+    Returns:
+        Shared HedgePolicy instance, or None if hedging is disabled
+    """
+    global _hedge_policy
+    if _hedge_policy is None:
+        _hedge_policy = _create_hedge_policy()
+    return _hedge_policy
+
+
+def reset_hedge_policy() -> None:
+    """Reset the global hedging policy for testing.
+
+    This function is intended for test isolation only.
+    """
+    global _hedge_policy
+    _hedge_policy = None
+
+
+def get_project_events() -> ProjectEventBus:
+    """Get the shared bus of project events.
+
+    Every project service from ``get_project_service`` publishes to it, so the
+    web app and the agent's tools share one stream of changes.
+    ``FORGEBASE_EVENT_BUFFER_SIZE`` bounds the events buffered per subscriber.
+
+    Returns:
+        Shared ProjectEventBus instance
+    """
+    global _project_events
+    if _project_events is None:
+        _project_events = ProjectEventBus(
+            buffer_size=max(_env_int("FORGEBASE_EVENT_BUFFER_SIZE", 64), 1)
+        )
+    return _project_events
+
+
+def reset_project_events() -> None:
+    """Reset the global project event bus for testing.
+
+    This function is intended for test isolation only.
+    """
+    global _project_events
+    _project_events = None
+
+
+def get_work_executor() -> WorkExecutor:
+    """Get the shared pools running CPU-heavy PRD work.
+
+    ``FORGEBASE_WORK_THREADS`` and ``FORGEBASE_WORK_PROCESSES`` size the
+    thread and process pools (0 processes runs all work in threads),
+    ``FORGEBASE_WORK_QUEUE_SIZE`` bounds the calls in flight per pool and
+    ``FORGEBASE_WORK_MIN_OFFLOAD_CHARS`` sets the PRD size below which work
+    runs inline.
+
+    Returns:
+        Shared WorkExecutor instance
+    """
+    global _work_executor
+    if _work_executor is None:
+        _work_executor = WorkExecutor(
+            thread_workers=_env_int("FORGEBASE_WORK_THREADS", 4),
+            process_workers=_env_int("FORGEBASE_WORK_PROCESSES", 2),
+            queue_size=_env_int("FORGEBASE_WORK_QUEUE_SIZE", 64),
+            min_offload_size=_env_int("FORGEBASE_WORK_MIN_OFFLOAD_CHARS", 16 * 1024),
+        )
+    return _work_executor
+
+
+def reset_work_executor() -> None:
+    """Shut down and drop the global work executor.
+
+    Used on application shutdown and for test isolation.
+    """
+    global _work_executor
+    if _work_executor is not None:
+        _work_executor.shutdown()
+    _work_executor = None
+
+
+def get_prd_history() -> InMemoryPrdHistory:
+    """Get the shared PRD revision history.
+
+    ``FORGEBASE_PRD_KEYFRAME_INTERVAL`` sets how many revisions may be stored
+    as diffs between two full copies of a PRD. Keyframes are compressed like
+    the repository's PRDs (see ``get_project_repository``).
+
+    Returns:
+        Shared InMemoryPrdHistory instance
+    """
+    global _prd_history
+    if _prd_history is None:
+        _prd_history = InMemoryPrdHistory(
+            keyframe_interval=_env_int("FORGEBASE_PRD_KEYFRAME_INTERVAL", 32),
+            executor=get_work_executor(),
+            compress_min_chars=_env_int("FORGEBASE_PRD_COMPRESS_MIN_CHARS", 0),
+            compress_level=_env_int("FORGEBASE_PRD_COMPRESS_LEVEL", 6),
+        )
+    return _prd_history
+
+
+def reset_prd_history() -> None:
+    """Reset the global PRD revision history for testing.
+
+    This function is intended for test isolation only.
+    """
+    global _prd_history
+    _prd_history = None
+
+
+def get_prd_html_cache() -> PrdHtmlCache:
+    """Get the shared cache of PRDs rendered as HTML.
+
+    ``FORGEBASE_PRD_HTML_CACHE_SIZE`` sets the number of cached renderings
+    (0 renders on every request) and ``FORGEBASE_PRD_HTML_CACHE_MAX_BYTES``
+    caps their total size.
+
+    Returns:
+        Shared PrdHtmlCache instance
+    """
+    global _prd_html_cache
+    if _prd_html_cache is None:
+        _prd_html_cache = PrdHtmlCache(
+            max_entries=_env_int("FORGEBASE_PRD_HTML_CACHE_SIZE", 64),
+            max_bytes=_env_int("FORGEBASE_PRD_HTML_CACHE_MAX_BYTES", 32 * 1024 * 1024),
+            executor=get_work_executor(),
+        )
+    return _prd_html_cache
+
+
+def reset_prd_html_cache() -> None:
+    """Drop the global PRD HTML cache.
+
+    Used on application shutdown, with the work executor it renders on, and
+    for test isolation.
+    """
+    global _prd_html_cache
+    _prd_html_cache = None
+
+
 def get_chat_service() -> ChatService:
     """Get the chat service.
 
@@ -49,9 +403,24 @@ def get_chat_service() -> ChatService:
         Configured ChatService instance
     """
     # Use the shared project service to ensure same repository
-    project_service = get_project_service()
-    agent = _create_agent(project_service)
-    return ChatService(agent)
+    agent = _create_agent(get_project_service())
+    return ChatService(agent, metrics_callback=log_turn_metrics)
+
+
+def checkout_chat_service() -> ChatService:
+    """Get a chat service for a new session.
+
+    The agent is checked out of the agent pool when pooling is enabled, so
+    that starting a session does not wait for an agent to be built. A single
+    long-lived service should use ``get_chat_service`` instead.
+
+    Returns:
+        Configured ChatService instance
+    """
+    pool = get_agent_pool()
+    if pool is None:
+        return get_chat_service()
+    return ChatService(pool.checkout(), metrics_callback=log_turn_metrics)
 
 
 def get_project_service() -> ProjectService:
@@ -61,7 +430,21 @@ def get_project_service() -> ProjectService:
         Configured ProjectService instance
     """
     repository = get_project_repository()
-    return ProjectService(repository)
+    return ProjectService(
+        repository,
+        on_change=get_project_events().publish,
+        prd_history=get_prd_history(),
+        executor=get_work_executor(),
+    )
+
+
+def _init_agent_dependencies() -> None:
+    """Create the shared singletons that ``_create_agent`` uses."""
+    get_deployment_router()
+    get_hedge_policy()
+    get_conversation_store()
+    get_conversation_memory()
+    get_response_cache()
 
 
 def _create_agent(project_service: ProjectService) -> AgentPort:
@@ -77,24 +460,149 @@ def _create_agent(project_service: ProjectService) -> AgentPort:
     prd_tools = PRDTools(project_service)
     tools: List[ToolPort] = [prd_tools]
 
-    endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
-    api_key = os.getenv("AZURE_OPENAI_API_KEY")
-    deployment_name = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME")
+    router = get_deployment_router()
+    instructions = _load_prd_instructions()
 
-    if endpoint and api_key and deployment_name:
-        return Agent(
-            endpoint=endpoint,
-            api_key=api_key,
-            deployment_name=deployment_name,
-            instructions=_load_prd_instructions(),
+    agent: AgentPort
+    if router is not None:
+        # Imported here so the stub path never loads Semantic Kernel
+        from forgebase.infrastructure.agent import Agent
+
+        agent = Agent(
+            router=router,
+            hedge_policy=get_hedge_policy(),
+            conversation_store=get_conversation_store(),
+            memory_manager=get_conversation_memory(),
+            instructions=instructions,
             role="prd_facilitator",
             tools=tools,
         )
-    return StubAgent(
-        instructions=_load_prd_instructions(),
-        role="prd_facilitator",
-        tools=tools,
-    )
+    else:
+        agent = StubAgent(
+            instructions=instructions,
+            role="prd_facilitator",
+            tools=tools,
+            profile=_load_stub_profile(),
+        )
+
+    cache = get_response_cache()
+    if cache is not None:
+        return CachingAgent(agent, cache, instructions=instructions)
+    return agent
+
+
+def _load_deployments() -> List[DeploymentConfig]:
+    """Load the Azure OpenAI deployments to route between.
+
+    ``AZURE_OPENAI_DEPLOYMENTS`` may hold a JSON list of objects with
+    ``endpoint``, ``api_key``, ``deployment_name`` and an optional ``weight``.
+    Otherwise the single deployment from ``AZURE_OPENAI_ENDPOINT``,
+    ``AZURE_OPENAI_API_KEY`` and ``AZURE_OPENAI_DEPLOYMENT_NAME`` is used.
+    Incomplete entries are skipped.
+
+    Returns:
+        Configured deployments, empty if none is complete
+
+    Raises:
+        ValueError: If ``AZURE_OPENAI_DEPLOYMENTS`` is not a JSON list
+    """
+    raw = os.getenv("AZURE_OPENAI_DEPLOYMENTS")
+    if raw:
+        try:
+            entries = json.loads(raw)
+        except ValueError as exc:
+            raise ValueError("AZURE_OPENAI_DEPLOYMENTS must be a JSON list") from exc
+        if not isinstance(entries, list):
+            raise ValueError("AZURE_OPENAI_DEPLOYMENTS must be a JSON list")
+        return [
+            DeploymentConfig(
+                endpoint=entry["endpoint"],
+                api_key=entry["api_key"],
+                deployment_name=entry["deployment_name"],
+                weight=float(entry.get("weight", 1.0)),
+            )
+            for entry in entries
+            if isinstance(entry, dict)
+            and entry.get("endpoint")
+            and entry.get("api_key")
+            and entry.get("deployment_name")
+        ]
+
+    endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
+    api_key = os.getenv("AZURE_OPENAI_API_KEY")
+    deployment_name = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME")
+    if endpoint and api_key and deployment_name:
+        return [
+            DeploymentConfig(
+                endpoint=endpoint, api_key=api_key, deployment_name=deployment_name
+            )
+        ]
+    return []
+
+
+def _load_stub_profile() -> StubProfile | None:
+    """Load the stub agent's latency profile.
+
+    ``FORGEBASE_STUB_PROFILE`` names a preset (``instant``, ``realistic``) or
+    holds a JSON profile; unset keeps the stub's canned replies.
+
+    Returns:
+        The profile, or None if not configured
+
+    Raises:
+        ValueError: If the profile is invalid
+    """
+    value = os.getenv("FORGEBASE_STUB_PROFILE")
+    if not value:
+        return None
+    return parse_stub_profile(value)
+
+
+def _create_hedge_policy() -> HedgePolicy | None:
+    """Create the hedging policy if enabled.
+
+    Setting ``FORGEBASE_HEDGE_PERCENTILE`` (e.g. ``95`` or ``99.9``) enables
+    hedged requests: a turn whose first token is later than that TTFT
+    percentile is duplicated to another deployment. It only applies with
+    several deployments; 0 disables it.
+
+    Returns:
+        HedgePolicy instance, or None if hedging is disabled
+
+    Raises:
+        ValueError: If the percentile is not a number from 0 to 100
+    """
+    raw = os.getenv("FORGEBASE_HEDGE_PERCENTILE")
+    if not raw:
+        return None
+    try:
+        percentile = float(raw)
+    except ValueError as exc:
+        raise ValueError("FORGEBASE_HEDGE_PERCENTILE must be a number") from exc
+    if not 0 <= percentile <= 100:
+        raise ValueError("FORGEBASE_HEDGE_PERCENTILE must be from 0 to 100")
+    if percentile == 0:
+        return None
+    return HedgePolicy(percentile=percentile)
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset, empty or invalid
+
+    Returns:
+        The parsed integer value
+    """
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
 
 
 def _load_prd_instructions() -> str:
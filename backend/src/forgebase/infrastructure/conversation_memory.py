@@ -0,0 +1,147 @@
+"""Memory budget for conversation threads held by agents."""
+
+import asyncio
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Protocol
+
+
+class SpillableConversation(Protocol):
+    """A conversation holder whose thread can be moved out of memory."""
+
+    def spill(self) -> bool:
+        """Drop the in-memory thread, keeping it restorable from storage.
+
+        Returns:
+            True if the thread was released
+        """
+        ...
+
+
+@dataclass
+class _Resident:
+    """Bookkeeping for a conversation currently held in memory."""
+
+    ref: "weakref.ReferenceType[SpillableConversation]"
+    size: int
+    last_used: float
+
+
+class ConversationMemoryManager:
+    """Spills idle or least recently used conversations out of memory.
+
+    Agents report the estimated size of their thread after every turn. A
+    conversation idle for longer than ``idle_timeout`` is spilled, and while
+    the resident threads together exceed ``budget_bytes`` the least recently
+    used ones are spilled as well. Spilled threads are reloaded from the
+    conversation store by the agent on its next message.
+
+    Conversations are tracked through weak references, so agents that are
+    discarded are simply forgotten.
+    """
+
+    def __init__(
+        self,
+        *,
+        budget_bytes: int | None = None,
+        idle_timeout: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the manager.
+
+        Args:
+            budget_bytes: Maximum estimated size of resident threads, or None
+            idle_timeout: Seconds of inactivity before spilling, or None
+            clock: Monotonic clock, injectable for tests
+        """
+        self._budget_bytes = budget_bytes
+        self._idle_timeout = idle_timeout
+        self._clock = clock
+        self._resident: OrderedDict[int, _Resident] = OrderedDict()
+        self.spills = 0
+
+    @property
+    def resident_bytes(self) -> int:
+        """Get the estimated size of all resident threads."""
+        return sum(entry.size for entry in self._resident.values())
+
+    @property
+    def resident_count(self) -> int:
+        """Get the number of conversations held in memory."""
+        return len(self._resident)
+
+    def touch(self, conversation: SpillableConversation, size: int) -> None:
+        """Record activity of a conversation and enforce the limits.
+
+        Args:
+            conversation: Conversation that just finished a turn
+            size: Estimated size of its thread in bytes
+        """
+        key = id(conversation)
+        self._resident.pop(key, None)
+        self._resident[key] = _Resident(
+            ref=weakref.ref(conversation), size=size, last_used=self._clock()
+        )
+        self.sweep()
+
+    def forget(self, conversation: SpillableConversation) -> None:
+        """Stop tracking a conversation, e.g. after it was reset or spilled."""
+        self._resident.pop(id(conversation), None)
+
+    def sweep(self) -> int:
+        """Spill idle conversations, then the oldest ones over the budget.
+
+        Returns:
+            Number of conversations spilled
+        """
+        now = self._clock()
+        spilled = 0
+        total = 0
+        for key, entry in list(self._resident.items()):
+            if entry.ref() is None:
+                del self._resident[key]
+                continue
+            idle = (
+                self._idle_timeout is not None
+                and now - entry.last_used >= self._idle_timeout
+            )
+            if idle and self._spill(key):
+                spilled += 1
+            elif key in self._resident:
+                total += entry.size
+
+        if self._budget_bytes is not None:
+            # Oldest first; the most recently used conversation is always kept
+            for key in list(self._resident)[:-1]:
+                if total <= self._budget_bytes:
+                    break
+                size = self._resident[key].size
+                if self._spill(key):
+                    spilled += 1
+                    total -= size
+        return spilled
+
+    async def run(self, interval: float) -> None:
+        """Sweep periodically until cancelled.
+
+        Args:
+            interval: Seconds between sweeps
+        """
+        while True:
+            await asyncio.sleep(interval)
+            self.sweep()
+
+    def _spill(self, key: int) -> bool:
+        """Spill one conversation, dropping dead or unspillable entries."""
+        conversation = self._resident[key].ref()
+        if conversation is None:
+            del self._resident[key]
+            return False
+        if not conversation.spill():
+            # Busy (e.g. mid-turn); it is touched again when the turn ends
+            return False
+        del self._resident[key]
+        self.spills += 1
+        return True
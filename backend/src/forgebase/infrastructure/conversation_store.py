@@ -0,0 +1,153 @@
+"""On-disk store for agent conversation threads."""
+
+import hashlib
+import json
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+_MAGIC = b"FBCV\x01"
+
+# Record header: payload length, CRC32 of the payload, flags
+_HEADER = struct.Struct("<IIB")
+_FLAG_ZLIB = 0x01
+
+# Preset zlib dictionary with the keys and values common to serialized chat
+# messages, so that even short single-message records compress well
+_ZDICT = (
+    b'"function_result","result":"function_call","arguments":'
+    b'"function_name":"update_prd","plugin_name":"PRDTools","name":"id":"call_'
+    b'"finish_reason":"stop","usage":{"prompt_tokens":"completion_tokens":'
+    b'"role":"assistant","role":"tool","role":"user","ai_model_id":'
+    b'{"metadata":{},"content_type":"text","text":"'
+    b'{"metadata":{},"content_type":"message","items":[{"metadata":{},'
+)
+
+
+class ConversationStore:
+    """Append-only binary logs of conversation messages.
+
+    Each conversation is stored in its own file, named by a hash of its id,
+    as a magic header followed by one record per message. A record is a
+    length/CRC32/flags header and the message as compact JSON, zlib-compressed
+    with a preset dictionary when that makes it smaller. Turns are appended
+    without rewriting earlier messages. A record torn by a crash mid-write is
+    detected by its CRC and cut off on the next load.
+
+    Messages are plain JSON-compatible dicts; converting them to and from
+    Semantic Kernel objects is up to the agent. The store is not safe for
+    concurrent writers in several processes.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize the store, creating the directory if needed.
+
+        Args:
+            directory: Directory holding the conversation files
+        """
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    def exists(self, conversation_id: str) -> bool:
+        """Check whether a conversation has stored messages."""
+        return self._path(conversation_id).exists()
+
+    def append(self, conversation_id: str, messages: Sequence[Dict[str, Any]]) -> None:
+        """Append messages to a conversation, creating it if needed.
+
+        Args:
+            conversation_id: Conversation to append to
+            messages: Messages in conversation order
+        """
+        if not messages:
+            return
+        path = self._path(conversation_id)
+        records = [_encode(message) for message in messages]
+        with path.open("ab") as file:
+            if file.tell() == 0:
+                records.insert(0, _MAGIC)
+            file.write(b"".join(records))
+
+    def load(self, conversation_id: str) -> List[Dict[str, Any]]:
+        """Load all messages of a conversation.
+
+        A damaged trailing record (e.g. from an interrupted append) is
+        dropped and truncated from the file.
+
+        Args:
+            conversation_id: Conversation to load
+
+        Returns:
+            Messages in conversation order, empty if the conversation is unknown
+
+        Raises:
+            ValueError: If the file is not a conversation log
+        """
+        path = self._path(conversation_id)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return []
+        if not data.startswith(_MAGIC):
+            raise ValueError(f"Not a conversation log: {path.name}")
+
+        messages: List[Dict[str, Any]] = []
+        offset = len(_MAGIC)
+        while offset < len(data):
+            message, end = _decode(data, offset)
+            if message is None:
+                os.truncate(path, offset)
+                break
+            messages.append(message)
+            offset = end
+        return messages
+
+    def delete(self, conversation_id: str) -> bool:
+        """Delete a conversation.
+
+        Returns:
+            True if the conversation existed
+        """
+        try:
+            self._path(conversation_id).unlink()
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _path(self, conversation_id: str) -> Path:
+        """Get the file of a conversation (ids never reach the filesystem)."""
+        digest = hashlib.sha256(conversation_id.encode("utf-8")).hexdigest()
+        return self._directory / f"{digest[:32]}.fbc"
+
+
+def _encode(message: Dict[str, Any]) -> bytes:
+    """Encode a message as a record."""
+    payload = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    compressor = zlib.compressobj(6, zdict=_ZDICT)
+    compressed = compressor.compress(payload) + compressor.flush()
+    flags = 0
+    if len(compressed) < len(payload):
+        payload, flags = compressed, _FLAG_ZLIB
+    return _HEADER.pack(len(payload), zlib.crc32(payload), flags) + payload
+
+
+def _decode(data: bytes, offset: int) -> tuple[Dict[str, Any] | None, int]:
+    """Decode the record at ``offset``.
+
+    Returns:
+        The message (None if the record is truncated or corrupt) and the
+        offset of the next record
+    """
+    if offset + _HEADER.size > len(data):
+        return None, offset
+    length, crc, flags = _HEADER.unpack_from(data, offset)
+    start = offset + _HEADER.size
+    payload = data[start : start + length]
+    if len(payload) < length or zlib.crc32(payload) != crc:
+        return None, offset
+    if flags & _FLAG_ZLIB:
+        decompressor = zlib.decompressobj(zdict=_ZDICT)
+        payload = decompressor.decompress(payload) + decompressor.flush()
+    return json.loads(payload), start + length
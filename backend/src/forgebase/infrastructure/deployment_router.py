@@ -0,0 +1,188 @@
+"""Latency-aware routing across several Azure OpenAI deployments."""
+
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, List, Sequence
+
+
+@dataclass(frozen=True)
+class DeploymentConfig:
+    """Connection settings for one Azure OpenAI deployment."""
+
+    endpoint: str
+    api_key: str
+    deployment_name: str
+    weight: float = 1.0
+
+    @property
+    def name(self) -> str:
+        """Get a unique, secret-free identifier for the deployment."""
+        return f"{self.endpoint.rstrip('/')}/{self.deployment_name}"
+
+
+@dataclass
+class DeploymentHealth:
+    """Rolling health statistics and circuit breaker state of a deployment."""
+
+    deployment: DeploymentConfig
+    ttft_ewma: float | None = None
+    inflight: int = 0
+    consecutive_failures: int = 0
+    open_until: float = 0.0
+    outcomes: deque[bool] = field(default_factory=lambda: deque(maxlen=20))
+
+    @property
+    def error_rate(self) -> float:
+        """Get the share of failed requests in the rolling window."""
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+
+@dataclass(frozen=True)
+class RouterSettings:
+    """Tuning of a ``DeploymentRouter``'s circuit breaker and latency average."""
+
+    failure_threshold: int = 3
+    cooldown: float = 30.0
+    ttft_alpha: float = 0.2
+
+
+class DeploymentRouter:
+    """Chooses a deployment for each turn based on latency, errors and load.
+
+    Each deployment keeps an exponentially weighted average of its time to
+    first token and a window of recent outcomes. Deployments are picked at
+    random, weighted by ``weight / (latency * (1 + inflight))`` scaled down by
+    the error rate, so traffic spreads across all healthy deployments while
+    favouring fast ones. After ``settings.failure_threshold`` consecutive
+    failures a deployment's circuit opens for ``settings.cooldown`` seconds; once it elapses a
+    single trial request is let through (half-open) and its outcome decides
+    whether the circuit closes again.
+    """
+
+    def __init__(
+        self,
+        deployments: Sequence[DeploymentConfig],
+        settings: RouterSettings | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Initialize the router.
+
+        Args:
+            deployments: Deployments to route between (at least one)
+            settings: Circuit breaker and TTFT average tuning
+            clock: Monotonic clock, injectable for tests
+            rng: Random generator, injectable for deterministic tests
+
+        Raises:
+            ValueError: If no deployments are given
+        """
+        if not deployments:
+            raise ValueError("At least one deployment is required")
+        self._health = {d.name: DeploymentHealth(deployment=d) for d in deployments}
+        self._settings = settings or RouterSettings()
+        self._clock = clock
+        self._rng = rng or random.Random()
+
+    @property
+    def deployments(self) -> List[DeploymentConfig]:
+        """Get the configured deployments."""
+        return [health.deployment for health in self._health.values()]
+
+    def health(self, deployment: DeploymentConfig) -> DeploymentHealth:
+        """Get the health statistics of a deployment."""
+        return self._health[deployment.name]
+
+    def choose(
+        self, exclude: Iterable[DeploymentConfig] = ()
+    ) -> DeploymentConfig | None:
+        """Pick the deployment for the next request.
+
+        Args:
+            exclude: Deployments already tried for this turn
+
+        Returns:
+            The chosen deployment, or None if every deployment was excluded
+        """
+        excluded = {d.name for d in exclude}
+        candidates = [h for n, h in self._health.items() if n not in excluded]
+        if not candidates:
+            return None
+
+        now = self._clock()
+        available = [h for h in candidates if h.open_until <= now]
+        if not available:
+            # Every circuit is open: fail over to the one that recovers first
+            return min(candidates, key=lambda h: h.open_until).deployment
+
+        known = [h.ttft_ewma for h in available if h.ttft_ewma is not None]
+        prior = sum(known) / len(known) if known else 1.0
+        scores = [
+            h.deployment.weight
+            * max(1.0 - h.error_rate, 0.05)
+            / (max(h.ttft_ewma or prior, 1e-3) * (1 + h.inflight))
+            for h in available
+        ]
+        return self._rng.choices(available, weights=scores)[0].deployment
+
+    def on_start(self, deployment: DeploymentConfig) -> None:
+        """Record that a request was sent to a deployment."""
+        health = self._health[deployment.name]
+        health.inflight += 1
+        if health.open_until and health.open_until <= self._clock():
+            # Half-open: hold the circuit while the trial request is in flight
+            health.open_until = self._clock() + self._settings.cooldown
+
+    def on_first_token(self, deployment: DeploymentConfig, ttft: float) -> None:
+        """Record a successful response and its time to first token.
+
+        Args:
+            deployment: Deployment that responded
+            ttft: Seconds from request start to the first chunk
+        """
+        health = self._health[deployment.name]
+        if health.ttft_ewma is None:
+            health.ttft_ewma = ttft
+        else:
+            health.ttft_ewma += self._settings.ttft_alpha * (ttft - health.ttft_ewma)
+        health.outcomes.append(True)
+        health.consecutive_failures = 0
+        health.open_until = 0.0
+
+    def on_cancel(self, deployment: DeploymentConfig, elapsed: float) -> None:
+        """Record a request cancelled before its first token.
+
+        The time to first token is only known to exceed ``elapsed``, so the
+        average moves towards it when it is slower than the average, and is
+        left alone otherwise.
+
+        Args:
+            deployment: Deployment of the cancelled request
+            elapsed: Seconds from request start to the cancellation
+        """
+        health = self._health[deployment.name]
+        if health.ttft_ewma is None:
+            health.ttft_ewma = elapsed
+        elif elapsed > health.ttft_ewma:
+            health.ttft_ewma += self._settings.ttft_alpha * (elapsed - health.ttft_ewma)
+
+    def on_failure(self, deployment: DeploymentConfig) -> None:
+        """Record a failed request, opening the circuit if needed."""
+        health = self._health[deployment.name]
+        health.outcomes.append(False)
+        health.consecutive_failures += 1
+        if (
+            health.open_until
+            or health.consecutive_failures >= self._settings.failure_threshold
+        ):
+            health.open_until = self._clock() + self._settings.cooldown
+
+    def on_finish(self, deployment: DeploymentConfig) -> None:
+        """Record that a request to a deployment is no longer in flight."""
+        health = self._health[deployment.name]
+        health.inflight = max(health.inflight - 1, 0)
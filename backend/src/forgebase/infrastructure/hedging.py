@@ -0,0 +1,86 @@
+"""Hedged request policy for tail-latency reduction."""
+
+import math
+from collections import deque
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class HedgeSettings:
+    """Tuning of a ``HedgePolicy``'s deadline.
+
+    Attributes:
+        min_delay: Lower bound of the deadline in seconds
+        initial_delay: Deadline used until ``min_samples`` are observed
+        min_samples: Observations needed before using the percentile
+        window: Number of recent observations kept
+    """
+
+    min_delay: float = 0.05
+    initial_delay: float = 2.0
+    min_samples: int = 20
+    window: int = 200
+
+
+class HedgePolicy:
+    """Decides how long to wait for a first token before hedging a request.
+
+    The deadline is a percentile of recently observed times to first token,
+    so only the slowest requests (the tail) are duplicated. Until enough
+    samples are collected ``settings.initial_delay`` is used, and the deadline
+    never drops below ``settings.min_delay`` to bound the extra load.
+    """
+
+    def __init__(
+        self, percentile: float = 95.0, settings: HedgeSettings | None = None
+    ) -> None:
+        """Initialize the policy.
+
+        Args:
+            percentile: TTFT percentile (0-100) used as the hedge deadline
+            settings: Deadline tuning
+
+        Raises:
+            ValueError: If the percentile is outside 0-100
+        """
+        if not 0 < percentile <= 100:
+            raise ValueError("Hedge percentile must be in (0, 100]")
+        self._percentile = percentile
+        self._settings = settings or HedgeSettings()
+        self._samples: deque[float] = deque(maxlen=self._settings.window)
+
+    def observe(self, ttft: float) -> None:
+        """Record the time to first token of a request.
+
+        Args:
+            ttft: Seconds from request start to the first response
+        """
+        self._samples.append(ttft)
+
+    def observe_censored(self, elapsed: float) -> None:
+        """Record a request cancelled before its first token.
+
+        Its time to first token is only known to exceed ``elapsed``. Dropping
+        it would leave the stalled requests out of the samples and pull the
+        deadline down, so it is recorded as ``elapsed`` when that already lies
+        beyond the current deadline; below it, the bound says nothing about
+        the tail.
+
+        Args:
+            elapsed: Seconds from request start to the cancellation
+        """
+        if elapsed >= self.deadline():
+            self._samples.append(elapsed)
+
+    def deadline(self) -> float:
+        """Get the current hedge deadline.
+
+        Returns:
+            Seconds to wait for a first token before sending a hedge
+        """
+        settings = self._settings
+        if len(self._samples) < settings.min_samples:
+            return max(settings.initial_delay, settings.min_delay)
+        ordered = sorted(self._samples)
+        index = math.ceil(self._percentile / 100 * len(ordered)) - 1
+        return max(ordered[max(index, 0)], settings.min_delay)
@@ -1,7 +1,10 @@
 """Logging configuration for the application."""
 
+import json
 import logging
 
+from forgebase.core.metrics import TurnMetrics
+
 
 def setup_logging(debug: bool = False) -> None:
     """
@@ -19,3 +22,17 @@ def setup_logging(debug: bool = False) -> None:
     logging.getLogger("azure.core.pipeline.policies.http_logging_policy").setLevel(
         logging.WARNING
     )
+
+
+def log_turn_metrics(metrics: TurnMetrics) -> None:
+    """
+    Emit turn metrics as a structured JSON event on the ``forgebase.metrics`` logger.
+
+    Args:
+        metrics: Metrics record of a completed or abandoned turn.
+    """
+    logger = logging.getLogger("forgebase.metrics")
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    event = metrics.to_event()
+    logger.info("turn_metrics %s", json.dumps(event), extra={"turn_metrics": event})
@@ -0,0 +1,308 @@
+"""Local stand-in for an Azure OpenAI chat-completions deployment.
+
+The server speaks enough of the streaming chat-completions protocol for the
+real ``Agent`` (Semantic Kernel + ``AzureChatCompletion``) to talk to it,
+including tool calls and usage reporting, so routing, failover, hedging and
+the SK streaming overhead can be exercised and benchmarked offline.
+
+Run it standalone and point ``AZURE_OPENAI_ENDPOINT`` at the printed URL::
+
+    PYTHONPATH=src python -m forgebase.infrastructure.mock_llm_server \
+        --port 8001 --first-token-delay 0.4 --token-rate 60 --tokens 200
+"""
+
+import argparse
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Sequence
+
+
+@dataclass(frozen=True)
+class MockToolCall:
+    """A tool call the mock model makes before answering.
+
+    ``name`` is the function name as advertised by SK, i.e.
+    ``<plugin>-<function>`` such as ``PRDTools-update_prd``.
+    """
+
+    name: str
+    arguments: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class MockLLMBehavior:
+    """How the mock deployment answers requests.
+
+    Delays may be constants or zero-argument callables returning seconds,
+    e.g. to sample from a distribution. ``token_rate`` (chunks per second)
+    takes precedence over ``chunk_delay``.
+
+    With ``tool_calls`` a request whose conversation does not end with tool
+    results is answered with those calls instead of text; the request
+    carrying the results then gets the text reply, like a real model turn.
+    """
+
+    status: int = 200
+    chunks: Sequence[str] = ("Hello", " from", " mock")
+    first_token_delay: float | Callable[[], float] = 0.0
+    chunk_delay: float | Callable[[], float] = 0.0
+    token_rate: float | None = None
+    tool_calls: Sequence[MockToolCall] = ()
+    requests: int = 0
+    tool_call_requests: int = 0
+
+
+def _seconds(delay: float | Callable[[], float]) -> float:
+    """Resolve a constant or sampled delay."""
+    return delay() if callable(delay) else delay
+
+
+def _wants_tool_calls(behavior: MockLLMBehavior, request: dict[str, Any]) -> bool:
+    """Check whether a request should be answered with the scripted tool calls."""
+    if not behavior.tool_calls:
+        return False
+    messages: list[dict[str, Any]] = request.get("messages") or [{}]
+    role: str | None = messages[-1].get("role")
+    return role != "tool"
+
+
+class _ChatCompletionsHandler(BaseHTTPRequestHandler):
+    """Request handler implementing streamed chat completions."""
+
+    server: "_MockHTTPServer"
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """Answer a chat-completions request with SSE chunks or an error."""
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        request = json.loads(body or b"{}")
+        behavior = self.server.behavior
+        call_tools = _wants_tool_calls(behavior, request)
+        with self.server.lock:
+            behavior.requests += 1
+            if call_tools:
+                behavior.tool_call_requests += 1
+
+        if behavior.status != 200:
+            body = json.dumps({"error": {"message": "mock failure"}}).encode()
+            self.send_response(behavior.status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            # Leave retries to the caller's router instead of the OpenAI client
+            self.send_header("x-should-retry", "false")
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        time.sleep(_seconds(behavior.first_token_delay))
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        try:
+            if call_tools:
+                completion_tokens = self._send_tool_calls(behavior.tool_calls)
+            else:
+                completion_tokens = self._send_text(behavior)
+            if (request.get("stream_options") or {}).get("include_usage"):
+                usage = {
+                    "prompt_tokens": len(body) // 4,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": len(body) // 4 + completion_tokens,
+                }
+                self._send_event(None, usage=usage)
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            # The client cancelled the stream (e.g. a hedged request that lost)
+            return
+
+    def _send_text(self, behavior: MockLLMBehavior) -> int:
+        """Stream the text reply at the configured rate.
+
+        Returns:
+            Number of chunks sent
+        """
+        if behavior.token_rate:
+            delay: float | Callable[[], float] = 1.0 / behavior.token_rate
+        else:
+            delay = behavior.chunk_delay
+        for index, chunk in enumerate(behavior.chunks):
+            if index:
+                time.sleep(_seconds(delay))
+            delta = {"role": "assistant", "content": chunk}
+            self._send_event({"index": 0, "delta": delta, "finish_reason": None})
+        self._send_event({"index": 0, "delta": {}, "finish_reason": "stop"})
+        return len(behavior.chunks)
+
+    def _send_tool_calls(self, tool_calls: Sequence[MockToolCall]) -> int:
+        """Stream the scripted tool calls, each in a single chunk.
+
+        Returns:
+            Number of chunks sent
+        """
+        for index, call in enumerate(tool_calls):
+            delta = {
+                "role": "assistant",
+                "tool_calls": [
+                    {
+                        "index": index,
+                        "id": f"call_mock_{index}",
+                        "type": "function",
+                        "function": {
+                            "name": call.name,
+                            "arguments": json.dumps(call.arguments),
+                        },
+                    }
+                ],
+            }
+            self._send_event({"index": 0, "delta": delta, "finish_reason": None})
+        self._send_event({"index": 0, "delta": {}, "finish_reason": "tool_calls"})
+        return len(tool_calls)
+
+    def _send_event(
+        self, choice: dict[str, Any] | None, usage: dict[str, int] | None = None
+    ) -> None:
+        """Write one ``chat.completion.chunk`` SSE event."""
+        payload: dict[str, Any] = {
+            "id": "chatcmpl-mock",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": "mock",
+            "choices": [choice] if choice is not None else [],
+        }
+        if usage is not None:
+            payload["usage"] = usage
+        self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode("utf-8"))
+        self.wfile.flush()
+
+    def log_message(
+        self, format: str, *args: Any  # pylint: disable=redefined-builtin
+    ) -> None:
+        """Silence per-request logging."""
+
+
+class _MockHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server carrying the shared behavior."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], behavior: MockLLMBehavior):
+        super().__init__(address, _ChatCompletionsHandler)
+        self.behavior = behavior
+        self.lock = threading.Lock()
+
+
+class MockLLMServer:
+    """Mock chat-completions deployment running in a background thread.
+
+    Use it as a context manager::
+
+        with MockLLMServer(MockLLMBehavior(first_token_delay=0.2)) as server:
+            agent = Agent(endpoint=server.endpoint, api_key="key",
+                          deployment_name="mock")
+    """
+
+    def __init__(
+        self,
+        behavior: MockLLMBehavior | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """Initialize the server (not yet listening).
+
+        Args:
+            behavior: Response behavior, defaults to an instant short reply
+            host: Interface to bind
+            port: Port to bind, 0 for a free port
+        """
+        self.behavior = behavior or MockLLMBehavior()
+        self._address = (host, port)
+        self._server: _MockHTTPServer | None = None
+
+    def start(self) -> "MockLLMServer":
+        """Start serving in a daemon thread.
+
+        Returns:
+            The server itself, for chaining
+        """
+        self._server = _MockHTTPServer(self._address, self.behavior)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    @property
+    def endpoint(self) -> str:
+        """Get the endpoint URL to use as ``AZURE_OPENAI_ENDPOINT``.
+
+        Raises:
+            RuntimeError: If the server is not running
+        """
+        if self._server is None:
+            raise RuntimeError("Mock LLM server is not running")
+        host, port = self._server.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode("ascii")
+        return f"http://{host}:{port}/"
+
+    def __enter__(self) -> "MockLLMServer":
+        """Start the server when entering a ``with`` block."""
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stop the server when leaving a ``with`` block."""
+        self.stop()
+
+
+def main() -> None:
+    """Serve a mock deployment from the command line until interrupted."""
+    parser = argparse.ArgumentParser(description="Mock Azure OpenAI deployment")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--first-token-delay", type=float, default=0.0)
+    parser.add_argument("--token-rate", type=float, default=None)
+    parser.add_argument("--tokens", type=int, default=None, help="Reply length")
+    parser.add_argument(
+        "--tool-call",
+        action="append",
+        default=[],
+        metavar="NAME=JSON",
+        help="Tool call to make before answering, e.g. PRDTools-update_prd={...}",
+    )
+    parser.add_argument("--status", type=int, default=200)
+    args = parser.parse_args()
+
+    behavior = MockLLMBehavior(
+        status=args.status,
+        chunks=(
+            [f" token{index}" for index in range(args.tokens)]
+            if args.tokens is not None
+            else MockLLMBehavior.chunks
+        ),
+        first_token_delay=args.first_token_delay,
+        token_rate=args.token_rate,
+        tool_calls=[
+            MockToolCall(name, json.loads(arguments or "{}"))
+            for name, _, arguments in (spec.partition("=") for spec in args.tool_call)
+        ],
+    )
+
+    with MockLLMServer(behavior, args.host, args.port) as server:
+        print(f"Mock deployment listening on {server.endpoint}", flush=True)
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""zlib compression of PRDs held in memory."""
+
+import zlib
+
+
+def compress_prd(prd: str, level: int = 6) -> bytes:
+    """Compress a PRD.
+
+    Args:
+        prd: PRD content
+        level: zlib level, from 1 (fastest) to 9 (smallest)
+
+    Returns:
+        The compressed UTF-8 encoding of the PRD
+    """
+    return zlib.compress(prd.encode("utf-8"), level)
+
+
+def decompress_prd(data: bytes) -> str:
+    """Decompress a PRD compressed by ``compress_prd``.
+
+    Args:
+        data: Compressed PRD
+
+    Returns:
+        PRD content
+    """
+    return zlib.decompress(data).decode("utf-8")
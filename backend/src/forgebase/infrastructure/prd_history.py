@@ -0,0 +1,198 @@
+"""In-memory PRD revision history stored as keyframes and deltas."""
+
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from forgebase.core.entities import PrdRevision, Project
+from forgebase.core.ports import WorkExecutorPort
+from forgebase.core.prd_diff import PrdHunk, apply_prd_hunks, diff_size, split_lines
+from forgebase.infrastructure.prd_compression import compress_prd, decompress_prd
+
+
+@dataclass(frozen=True)
+class _StoredRevision:
+    """A revision held either as full content or as a diff from the previous one.
+
+    Keyframes are held as text, or as compressed bytes when large.
+    """
+
+    revision: PrdRevision
+    keyframe: str | bytes | None = None
+    diff: tuple[PrdHunk, ...] = ()
+
+
+class InMemoryPrdHistory:
+    """
+    In-memory implementation of PrdHistoryPort.
+
+    The first revision of a project is stored in full. Later revisions store
+    only the diff from their predecessor, except for a full keyframe every
+    ``keyframe_interval`` versions, so reconstructing any revision replays at
+    most that many diffs. A revision whose diff is about as large as the
+    document itself, such as a complete rewrite, is stored as a keyframe too.
+
+    Keyframes of at least ``compress_min_chars`` characters are stored
+    zlib-compressed, so the history does not keep a full copy of PRDs that
+    the project repository holds compressed.
+    """
+
+    def __init__(
+        self,
+        keyframe_interval: int = 32,
+        executor: Optional[WorkExecutorPort] = None,
+        compress_min_chars: int = 0,
+        compress_level: int = 6,
+    ):
+        """
+        Initialize an empty history.
+
+        Args:
+            keyframe_interval: Maximum number of versions between two keyframes.
+            executor: Replays diffs and compresses keyframes off the event loop
+                (optional, inline otherwise).
+            compress_min_chars: Keyframes at least this long are compressed; 0
+                keeps every keyframe as text.
+            compress_level: zlib level, from 1 (fastest) to 9 (smallest).
+        """
+        self._keyframe_interval = max(keyframe_interval, 1)
+        self._executor = executor
+        self._compress_min_chars = compress_min_chars
+        self._compress_level = compress_level
+        self._revisions: dict[UUID, list[_StoredRevision]] = {}
+
+    @property
+    def stored_chars(self) -> int:
+        """Get the size of the keyframes and diffs held.
+
+        Text counts in characters and compressed keyframes in bytes.
+        """
+        return sum(
+            (
+                len(stored.keyframe)
+                if stored.keyframe is not None
+                else diff_size(stored.diff)
+            )
+            for revisions in self._revisions.values()
+            for stored in revisions
+        )
+
+    async def record(
+        self, project: Project, diff: Optional[tuple[PrdHunk, ...]]
+    ) -> None:
+        """
+        Store the current PRD revision of a project.
+
+        Args:
+            project: The project, at its new PRD version.
+            diff: Hunks from the previous version, or None for a first revision.
+        """
+        version = project.prd_version
+        size = project.prd_length
+        revision = PrdRevision(
+            version=version,
+            created_at=project.updated_at or project.created_at,
+            size=size,
+        )
+        revisions = self._revisions.setdefault(project.id, [])
+        if revisions and revisions[-1].revision.version != version - 1:
+            # Diffs only chain between consecutive versions; start over on a gap
+            revisions.clear()
+
+        if (
+            diff is None
+            or not revisions
+            or version - self._last_keyframe(revisions) >= self._keyframe_interval
+            or 2 * diff_size(diff) >= size
+        ):
+            revisions.append(
+                _StoredRevision(revision, keyframe=await self._keyframe(project.prd))
+            )
+        else:
+            revisions.append(_StoredRevision(revision, diff=diff))
+
+    async def list_revisions(self, project_id: UUID) -> list[PrdRevision]:
+        """
+        List the stored revisions of a project's PRD.
+
+        Args:
+            project_id: The project to list revisions of.
+
+        Returns:
+            List of revisions, newest first.
+        """
+        return [
+            stored.revision for stored in reversed(self._revisions.get(project_id, []))
+        ]
+
+    async def get_revision(self, project_id: UUID, version: int) -> Optional[str]:
+        """
+        Reconstruct the PRD content of a revision.
+
+        Args:
+            project_id: The project the PRD belongs to.
+            version: The PRD version to reconstruct.
+
+        Returns:
+            The PRD content if the revision is stored, None otherwise.
+        """
+        revisions = self._revisions.get(project_id)
+        if not revisions:
+            return None
+        index = version - revisions[0].revision.version
+        if not 0 <= index < len(revisions):
+            return None
+
+        start = index
+        while (keyframe := revisions[start].keyframe) is None:
+            start -= 1
+        if start == index and isinstance(keyframe, str):
+            return keyframe
+        diffs = [stored.diff for stored in revisions[start + 1 : index + 1]]
+        size = revisions[start].revision.size
+        if self._executor is None:
+            return _replay(keyframe, diffs)
+        if not diffs:
+            return await self._executor.run_blocking(
+                _replay, keyframe, diffs, size=size
+            )
+        return await self._executor.run_cpu(_replay, keyframe, diffs, size=size)
+
+    async def delete(self, project_id: UUID) -> None:
+        """
+        Delete all revisions of a project's PRD.
+
+        Args:
+            project_id: The project whose history is deleted.
+        """
+        self._revisions.pop(project_id, None)
+
+    async def _keyframe(self, prd: str) -> str | bytes:
+        """Get the stored form of a keyframe, compressing large ones."""
+        if not self._compress_min_chars or len(prd) < self._compress_min_chars:
+            return prd
+        if self._executor is None:
+            return compress_prd(prd, self._compress_level)
+        return await self._executor.run_blocking(
+            compress_prd, prd, self._compress_level, size=len(prd)
+        )
+
+    @staticmethod
+    def _last_keyframe(revisions: list[_StoredRevision]) -> int:
+        """Get the version of the newest keyframe of a project."""
+        for stored in reversed(revisions):
+            if stored.keyframe is not None:
+                return stored.revision.version
+        raise AssertionError("The first stored revision is always a keyframe")
+
+
+def _replay(keyframe: str | bytes, diffs: list[tuple[PrdHunk, ...]]) -> str:
+    """Decompress a keyframe if needed and apply successive diffs to it."""
+    if isinstance(keyframe, bytes):
+        keyframe = decompress_prd(keyframe)
+    if not diffs:
+        return keyframe
+    lines = split_lines(keyframe)
+    for diff in diffs:
+        lines = apply_prd_hunks(lines, diff)
+    return "".join(lines)
@@ -0,0 +1,146 @@
+"""Cache of PRDs rendered as HTML, keyed by content hash."""
+
+import asyncio
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from forgebase.core.ports import WorkExecutorPort
+from forgebase.core.prd_html import render_prd_html
+
+
+@dataclass(frozen=True)
+class RenderedPrd:
+    """HTML of a PRD and its entity tag.
+
+    Attributes:
+        etag: Strong entity tag, the quoted SHA-256 of the PRD markdown
+        html: UTF-8 encoded HTML
+    """
+
+    etag: str
+    html: bytes
+
+
+class PrdHtmlCache:
+    """LRU cache of rendered PRDs.
+
+    Entries are keyed by the hash of the markdown, so projects and versions
+    with the same content share an entry and nothing needs invalidating when
+    a PRD changes. Rendering runs off the event loop, on the executor if one
+    is given and in a worker thread otherwise, and concurrent requests for
+    the same content share one rendering. The cache is bounded both by entry
+    count and by the total size of the stored HTML.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 64,
+        max_bytes: int = 32 * 1024 * 1024,
+        executor: WorkExecutorPort | None = None,
+    ):
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached renderings
+            max_bytes: Maximum total size of the cached HTML
+            executor: Runs hashing and rendering (optional)
+        """
+        self._executor = executor
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, RenderedPrd] = OrderedDict()
+        self._total_bytes = 0
+        self._pending: dict[str, asyncio.Future[RenderedPrd]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        """Get the number of cached renderings."""
+        return len(self._entries)
+
+    @staticmethod
+    def etag(prd: str) -> str:
+        """Compute the entity tag of a PRD's HTML without rendering it.
+
+        Args:
+            prd: PRD markdown
+
+        Returns:
+            Quoted hex digest of the markdown
+        """
+        return f'"{hashlib.sha256(prd.encode("utf-8")).hexdigest()}"'
+
+    async def tag(self, prd: str) -> str:
+        """Compute ``etag``, on the executor if one is given.
+
+        Args:
+            prd: PRD markdown
+
+        Returns:
+            Quoted hex digest of the markdown
+        """
+        if self._executor is None:
+            return self.etag(prd)
+        return await self._executor.run_blocking(self.etag, prd, size=len(prd))
+
+    async def render(self, prd: str, etag: str | None = None) -> RenderedPrd:
+        """Get the HTML of a PRD, rendering it on a miss.
+
+        Args:
+            prd: PRD markdown
+            etag: The PRD's ``etag``, if already computed
+
+        Returns:
+            The rendered PRD
+        """
+        key = etag or self.etag(prd)
+        cached = self._entries.get(key)
+        if cached is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cached
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            self.hits += 1
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        future: asyncio.Future[RenderedPrd] = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            if self._executor is None:
+                html = await asyncio.to_thread(render_prd_html, prd)
+            else:
+                html = await self._executor.run_cpu(render_prd_html, prd, size=len(prd))
+            rendered = RenderedPrd(key, html.encode("utf-8"))
+            self._put(rendered)
+            future.set_result(rendered)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Waiters re-raise it; mark it retrieved for a render nobody shared
+            future.exception()
+            raise
+        finally:
+            del self._pending[key]
+        return rendered
+
+    def _put(self, rendered: RenderedPrd) -> None:
+        """Store a rendering, evicting least recently used entries as needed."""
+        size = len(rendered.html)
+        if self._max_entries <= 0 or size > self._max_bytes:
+            return
+        self._entries[rendered.etag] = rendered
+        self._total_bytes += size
+        while (
+            len(self._entries) > self._max_entries
+            or self._total_bytes > self._max_bytes
+        ):
+            _, oldest = self._entries.popitem(last=False)
+            self._total_bytes -= len(oldest.html)
+            self.evictions += 1
@@ -0,0 +1,152 @@
+"""In-process publish/subscribe bus for project events."""
+
+import asyncio
+from collections import defaultdict
+from typing import AsyncIterator, List
+from uuid import UUID
+
+from forgebase.core.project_events import ProjectChangeCallback, ProjectEvent
+
+
+class ProjectSubscription:
+    """A bounded stream of events of one project for one consumer.
+
+    Events are buffered up to ``buffer_size``. A consumer that falls further
+    behind is dropped: the subscription is closed with ``overflowed`` set, and
+    the consumer should re-read the project and subscribe again.
+    """
+
+    def __init__(self, bus: "ProjectEventBus", project_id: UUID, buffer_size: int):
+        """Initialize the subscription on the current event loop.
+
+        Args:
+            bus: Bus the subscription belongs to
+            project_id: Project whose events are delivered
+            buffer_size: Maximum number of undelivered events
+        """
+        self.project_id = project_id
+        self.overflowed = False
+        self._bus = bus
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue[ProjectEvent | None] = asyncio.Queue(buffer_size)
+        self._closed = False
+
+    def offer(self, event: ProjectEvent) -> None:
+        """Deliver an event, from any thread."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._put(event)
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._put, event)
+
+    def _put(self, event: ProjectEvent) -> None:
+        """Queue an event on the subscription's loop, dropping a slow consumer."""
+        if self._closed:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            self._bus.dropped += 1
+            self.close()
+            # Make room for the end-of-stream marker
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(None)
+
+    async def next(self, timeout: float | None = None) -> ProjectEvent | None:
+        """Wait for the next event.
+
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely
+
+        Returns:
+            The event, or None once the subscription was dropped
+
+        Raises:
+            TimeoutError: If no event arrived within ``timeout``
+        """
+        return await asyncio.wait_for(self._queue.get(), timeout)
+
+    async def __aiter__(self) -> AsyncIterator[ProjectEvent]:
+        """Iterate over events until the subscription is dropped."""
+        while (event := await self.next()) is not None:
+            yield event
+
+    def close(self) -> None:
+        """Stop receiving events."""
+        if not self._closed:
+            self._closed = True
+            self._bus.unsubscribe(self)
+
+
+class ProjectEventBus:
+    """Fans project events out to listeners and per-project subscriptions.
+
+    Listeners are plain callbacks run synchronously on publish, for cheap
+    in-process reactions such as cache invalidation. Subscriptions buffer the
+    events of one project for an asynchronous consumer such as an SSE stream.
+    """
+
+    def __init__(self, buffer_size: int = 64) -> None:
+        """Initialize an empty bus.
+
+        Args:
+            buffer_size: Events buffered per subscription before it is dropped
+        """
+        self._buffer_size = buffer_size
+        self._listeners: List[ProjectChangeCallback] = []
+        self._subscriptions: defaultdict[UUID, set[ProjectSubscription]] = defaultdict(
+            set
+        )
+        self.published = 0
+        self.dropped = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        """Get the number of open subscriptions."""
+        return sum(len(subs) for subs in self._subscriptions.values())
+
+    def publish(self, event: ProjectEvent) -> None:
+        """Deliver an event to all listeners and the project's subscriptions.
+
+        Usable directly as ``ProjectService``'s ``on_change`` callback.
+        """
+        self.published += 1
+        for listener in list(self._listeners):
+            listener(event)
+        for subscription in list(self._subscriptions.get(event.project_id, ())):
+            subscription.offer(event)
+
+    def add_listener(self, listener: ProjectChangeCallback) -> None:
+        """Call ``listener`` with every published event."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: ProjectChangeCallback) -> None:
+        """Stop calling a listener added with ``add_listener``."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def subscribe(self, project_id: UUID) -> ProjectSubscription:
+        """Subscribe to a project's events; must be called on an event loop.
+
+        Args:
+            project_id: Project to follow
+
+        Returns:
+            Subscription to consume and eventually ``close``
+        """
+        subscription = ProjectSubscription(self, project_id, self._buffer_size)
+        self._subscriptions[project_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: ProjectSubscription) -> None:
+        """Remove a subscription; ``ProjectSubscription.close`` calls this."""
+        subscriptions = self._subscriptions.get(subscription.project_id)
+        if subscriptions is not None:
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.project_id]
@@ -1,10 +1,14 @@
 """In-memory implementation of project repository."""
 
+from collections import OrderedDict
+from functools import partial
 from typing import Optional
 from uuid import UUID
 
 from forgebase.core.entities import Project
+from forgebase.core.ports import WorkExecutorPort
 from forgebase.core.exceptions import ProjectAlreadyExistsError, ProjectNotFoundError
+from forgebase.infrastructure.prd_compression import compress_prd, decompress_prd
 
 
 class InMemoryProjectRepository:
@@ -14,11 +18,46 @@ class InMemoryProjectRepository:
     This implementation stores projects in memory using a dictionary.
     It's suitable for development and testing, but data will be lost
     when the application restarts.
+
+    Optionally, PRDs of at least ``compress_min_chars`` characters are kept
+    zlib-compressed once they fall out of a small LRU of recently used ones.
+    Reading the PRD of such a project decompresses it and moves it back into
+    the LRU; changing it drops the compressed copy until it is evicted again.
+    Evicted PRDs are compressed by the next repository call, on the executor
+    if one is given.
     """
 
-    def __init__(self):
-        """Initialize the repository with an empty storage."""
+    def __init__(
+        self,
+        compress_min_chars: int = 0,
+        hot_entries: int = 16,
+        compress_level: int = 6,
+        executor: Optional[WorkExecutorPort] = None,
+    ):
+        """
+        Initialize the repository with an empty storage.
+
+        Args:
+            compress_min_chars: PRDs at least this long are compressed while not
+                recently used; 0 keeps every PRD as text.
+            hot_entries: Number of recently used large PRDs kept decompressed.
+            compress_level: zlib level, from 1 (fastest) to 9 (smallest).
+            executor: Compresses PRDs off the event loop (optional, inline otherwise).
+        """
         self._projects: dict[UUID, Project] = {}
+        self._compress_min_chars = compress_min_chars
+        self._hot_entries = max(hot_entries, 1)
+        self._compress_level = compress_level
+        self._executor = executor
+        self._hot: OrderedDict[UUID, None] = OrderedDict()
+        self._evicted: list[UUID] = []
+        self.compressions = 0
+        self.decompressions = 0
+
+    @property
+    def compress_min_chars(self) -> int:
+        """Get the PRD length from which PRDs are kept compressed; 0 if never."""
+        return self._compress_min_chars
 
     async def create(self, project: Project) -> Project:
         """
@@ -37,6 +76,8 @@ class InMemoryProjectRepository:
             raise ProjectAlreadyExistsError(str(project.id))
 
         self._projects[project.id] = project
+        self._touch(project)
+        await self._compress_evicted()
         return project
 
     async def get_by_id(self, project_id: UUID) -> Optional[Project]:
@@ -49,7 +90,11 @@ class InMemoryProjectRepository:
         Returns:
             The project if found, None otherwise.
         """
-        return self._projects.get(project_id)
+        project = self._projects.get(project_id)
+        if project is not None:
+            self._touch(project)
+            await self._compress_evicted()
+        return project
 
     async def get_by_id_for_user(self, project_id: UUID, user_id: str) -> Optional[Project]:
         """
@@ -64,6 +109,8 @@ class InMemoryProjectRepository:
         """
         project = self._projects.get(project_id)
         if project and project.user_id == user_id:
+            self._touch(project)
+            await self._compress_evicted()
             return project
         return None
 
@@ -108,6 +155,8 @@ class InMemoryProjectRepository:
             raise ProjectNotFoundError(str(project.id))
 
         self._projects[project.id] = project
+        self._touch(project)
+        await self._compress_evicted()
         return project
 
     async def delete(self, project_id: UUID) -> bool:
@@ -122,6 +171,7 @@ class InMemoryProjectRepository:
         """
         if project_id in self._projects:
             del self._projects[project_id]
+            self._hot.pop(project_id, None)
             return True
         return False
 
@@ -139,5 +189,55 @@ class InMemoryProjectRepository:
         project = self._projects.get(project_id)
         if project and project.user_id == user_id:
             del self._projects[project_id]
+            self._hot.pop(project_id, None)
             return True
         return False
+
+    def _touch(self, project: Project) -> None:
+        """Mark a large PRD as recently used, compressing the least recent ones."""
+        if not self._compress_min_chars:
+            return
+        if project.prd_length < self._compress_min_chars:
+            self._hot.pop(project.id, None)
+            return
+        self._hot[project.id] = None
+        self._hot.move_to_end(project.id)
+        while len(self._hot) > self._hot_entries:
+            evicted = self._projects.get(self._hot.popitem(last=False)[0])
+            if evicted is None:
+                continue
+            if evicted.prd_packed:
+                evicted.release_prd()
+            else:
+                self._evicted.append(evicted.id)
+
+    async def _compress_evicted(self) -> None:
+        """Compress the PRDs evicted from the LRU that are still cold."""
+        while self._evicted:
+            project = self._projects.get(self._evicted.pop())
+            if project is None or project.id in self._hot or project.prd_packed:
+                continue
+            version = project.prd_version
+            prd = project.prd
+            if self._executor is None:
+                data = compress_prd(prd, self._compress_level)
+            else:
+                data = await self._executor.run_blocking(
+                    compress_prd, prd, self._compress_level, size=len(prd)
+                )
+            if (
+                project.prd_version == version
+                and project.id not in self._hot
+                and self._projects.get(project.id) is project
+            ):
+                project.pack_prd(data, partial(self._decompress, project.id))
+                self.compressions += 1
+
+    def _decompress(self, project_id: UUID, data: bytes) -> str:
+        """Decompress a PRD being read and mark it as recently used."""
+        prd = decompress_prd(data)
+        self.decompressions += 1
+        project = self._projects.get(project_id)
+        if project is not None:
+            self._touch(project)
+        return prd
@@ -0,0 +1,261 @@
+"""Exact-match response cache for agent turns."""
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import AsyncIterator, List, Sequence
+
+from forgebase.core.metrics import TurnMetricsCallback
+from forgebase.core.ports import AgentPort
+
+
+def _normalize(text: str) -> str:
+    """Collapse whitespace so trivially different inputs share a cache entry.
+
+    Args:
+        text: Raw message text
+
+    Returns:
+        Text with leading/trailing whitespace removed and inner runs collapsed
+    """
+    return " ".join(text.split())
+
+
+class ResponseCache:
+    """LRU cache of streamed agent replies.
+
+    Entries store the reply as the original sequence of chunks so hits can be
+    replayed with the same chunk boundaries. The cache is bounded both by entry
+    count and by the total size of the stored replies.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 4 * 1024 * 1024):
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached replies
+            max_bytes: Maximum total UTF-8 size of all cached replies
+        """
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[str, ...]] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(
+        instructions: str,
+        history: Sequence[tuple[str, str]],
+        user_text: str,
+        tool_state: Sequence[str],
+    ) -> str:
+        """Build a cache key for a turn.
+
+        Args:
+            instructions: System instructions of the agent
+            history: Prior (user, assistant) exchanges of the conversation
+            user_text: The new user message
+            tool_state: Strings describing the tools and their context
+
+        Returns:
+            Hex digest identifying the turn
+        """
+        payload = json.dumps(
+            [
+                instructions,
+                [[_normalize(user), _normalize(reply)] for user, reply in history],
+                _normalize(user_text),
+                list(tool_state),
+            ],
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> tuple[str, ...] | None:
+        """Look up a cached reply and mark it as recently used.
+
+        Args:
+            key: Cache key from ``make_key``
+
+        Returns:
+            The cached reply chunks, or None on a miss
+        """
+        chunks = self._entries.get(key)
+        if chunks is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return chunks
+
+    def put(self, key: str, chunks: Sequence[str]) -> bool:
+        """Store a reply, evicting least recently used entries as needed.
+
+        Args:
+            key: Cache key from ``make_key``
+            chunks: Reply chunks in streaming order
+
+        Returns:
+            True if stored, False if the reply alone exceeds the size cap
+        """
+        size = sum(len(chunk.encode("utf-8")) for chunk in chunks)
+        if self._max_entries <= 0 or size > self._max_bytes:
+            return False
+
+        self._discard(key)
+        self._entries[key] = tuple(chunks)
+        self._sizes[key] = size
+        self._total_bytes += size
+
+        while (
+            len(self._entries) > self._max_entries
+            or self._total_bytes > self._max_bytes
+        ):
+            oldest = next(iter(self._entries))
+            self._discard(oldest)
+            self.evictions += 1
+        return True
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self._sizes.clear()
+        self._total_bytes = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached replies."""
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        """Get the total size of cached replies in bytes."""
+        return self._total_bytes
+
+    def _discard(self, key: str) -> None:
+        """Remove an entry if present and release its size."""
+        if key in self._entries:
+            del self._entries[key]
+            self._total_bytes -= self._sizes.pop(key)
+
+
+class CachingAgent(AgentPort):
+    """Agent decorator that serves repeated turns from a ``ResponseCache``.
+
+    A turn is cached only if it streamed to completion without invoking any
+    tool, since replaying it would otherwise skip the tool's side effects.
+    Cache hits are recorded on the wrapped agent so later turns that miss the
+    cache still see the whole conversation. Resumed conversations bypass the
+    cache, since their earlier turns are not known to the cache key, and so do
+    conversations after a turn that failed or was abandoned, since the wrapped
+    agent may have kept part of it.
+    """
+
+    def __init__(
+        self, agent: AgentPort, cache: ResponseCache, *, instructions: str = ""
+    ) -> None:
+        """Initialize the caching agent.
+
+        Args:
+            agent: Agent that produces replies on cache misses
+            cache: Cache shared between conversations
+            instructions: System instructions of the wrapped agent
+        """
+        self._agent = agent
+        self._cache = cache
+        self._instructions = instructions
+        self._history: List[tuple[str, str]] | None = []
+        self._project_id: str | None = None
+
+    async def send_message_stream(self, user_text: str) -> AsyncIterator[str]:
+        """Send message and stream the cached or freshly generated reply.
+
+        Args:
+            user_text: User input message
+
+        Yields:
+            String chunks of the agent's response
+        """
+        if self._history is None:
+            async for chunk in self._agent.send_message_stream(user_text):
+                yield chunk
+            return
+
+        key = self._cache.make_key(
+            self._instructions, self._history, user_text, self._tool_state()
+        )
+        cached = self._cache.get(key)
+        if cached is not None:
+            reply = "".join(cached)
+            await self._agent.record_turn(user_text, reply)
+            self._history.append((user_text, reply))
+            for chunk in cached:
+                yield chunk
+            return
+
+        history = self._history
+        tool_calls_before = self._agent.tool_call_count
+        chunks: List[str] = []
+        completed = False
+        try:
+            async for chunk in self._agent.send_message_stream(user_text):
+                chunks.append(chunk)
+                yield chunk
+            completed = True
+        finally:
+            if not completed:
+                # The history no longer describes what the wrapped agent saw
+                self._history = None
+
+        # Only reached when the stream completed; partial replies are never cached
+        history.append((user_text, "".join(chunks)))
+        if self._agent.tool_call_count == tool_calls_before:
+            self._cache.put(key, chunks)
+
+    async def record_turn(self, user_text: str, reply_text: str) -> None:
+        """Append a completed exchange to the conversation."""
+        await self._agent.record_turn(user_text, reply_text)
+        if self._history is not None:
+            self._history.append((user_text, reply_text))
+
+    async def reset(self) -> None:
+        """Reset conversation state (the shared cache is kept)."""
+        self._history = []
+        await self._agent.reset()
+
+    @property
+    def role(self) -> str:
+        """Get agent role."""
+        return self._agent.role
+
+    @property
+    def available_tools(self) -> List[str]:
+        """Get available tool names."""
+        return self._agent.available_tools
+
+    @property
+    def tool_call_count(self) -> int:
+        """Get the number of tool invocations made so far."""
+        return self._agent.tool_call_count
+
+    def set_metrics_callback(self, callback: TurnMetricsCallback | None) -> None:
+        """Register a hook on the wrapped agent (cache hits emit no agent metrics)."""
+        self._agent.set_metrics_callback(callback)
+
+    def set_conversation(self, conversation_id: str | None) -> bool:
+        """Switch the wrapped agent's conversation."""
+        resumed = self._agent.set_conversation(conversation_id)
+        self._history = None if resumed else []
+        return resumed
+
+    def set_project_context(self, project_id: str | None) -> None:
+        """Set the current project context for agent tools."""
+        self._project_id = project_id
+        self._agent.set_project_context(project_id)
+
+    def _tool_state(self) -> List[str]:
+        """Describe the tools and their context for cache keying."""
+        return [*sorted(self._agent.available_tools), f"project={self._project_id}"]
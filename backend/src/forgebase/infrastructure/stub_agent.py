@@ -1,16 +1,30 @@
 """Stub agent implementation for development and testing."""
 
 import asyncio
+import random
+import time
 from typing import AsyncIterator, List
 
+from forgebase.core.metrics import TurnMetricsCallback, TurnRecorder
 from forgebase.core.ports import AgentPort
 from forgebase.core.tool_port import ToolPort
+from forgebase.infrastructure.stub_profiles import StubProfile
+
+# Words that profiled replies and generated PRDs are made of
+_VOCABULARY = tuple(
+    "the product user users should can export dashboard requirement feature goal "
+    "metric release mobile web onboarding search report latency secure data team "
+    "workflow integration notification support scope launch customer priority "
+    "must and with for to of a".split()
+)
 
 
 class StubAgent(AgentPort):
     """Mock agent implementation for development and testing.
 
     Provides realistic-looking responses without requiring external AI services.
+    With a ``StubProfile`` it instead models a real deployment's latency, reply
+    lengths, tool calls and failures, for load testing without network access.
     """
 
     def __init__(
@@ -19,6 +33,7 @@ class StubAgent(AgentPort):
         instructions: str = "You are a helpful assistant.",
         role: str = "assistant",
         tools: List[ToolPort] | None = None,
+        profile: StubProfile | None = None,
     ) -> None:
         """Initialize the stub agent.
 
@@ -26,11 +41,16 @@ class StubAgent(AgentPort):
             instructions: System instructions for the agent (ignored in stub)
             role: Role identifier for the agent
             tools: List of tools available to this agent
+            profile: Latency and behavior profile, or None for canned replies
         """
         self._role = role
         self._instructions = instructions
         self._message_count = 0
         self._tools = tools or []
+        self._metrics_callback: TurnMetricsCallback | None = None
+        self._profile = profile
+        self._rng = random.Random(profile.seed if profile else None)
+        self._tool_call_count = 0
 
     async def send_message_stream(self, user_text: str) -> AsyncIterator[str]:
         """Send message and stream a mock response.
@@ -42,15 +62,102 @@ class StubAgent(AgentPort):
             String chunks of a simulated agent response
         """
         self._message_count += 1
+        recorder = TurnRecorder(source="agent", role=self._role)
+        completed = False
+
+        try:
+            if self._profile is not None:
+                async for chunk in self._profiled_response(self._profile, recorder):
+                    recorder.on_chunk()
+                    yield chunk
+                completed = True
+                return
+
+            # Generate a more realistic response based on user input
+            response_parts = self._generate_response(user_text)
 
-        # Generate a more realistic response based on user input
-        response_parts = self._generate_response(user_text)
+            # Simulate realistic streaming with slight delays
+            for chunk in response_parts:
+                recorder.on_chunk()
+                yield chunk
+                # Small delay to simulate network latency
+                await asyncio.sleep(0.02)
+            completed = True
+        finally:
+            if self._metrics_callback is not None:
+                self._metrics_callback(recorder.finish(completed=completed))
 
-        # Simulate realistic streaming with slight delays
-        for chunk in response_parts:
-            yield chunk
-            # Small delay to simulate network latency
-            await asyncio.sleep(0.02)
+    async def _profiled_response(
+        self, profile: StubProfile, recorder: TurnRecorder
+    ) -> AsyncIterator[str]:
+        """Stream a reply sampled from a profile.
+
+        Args:
+            profile: Profile to sample latencies, length and failures from
+            recorder: Recorder of the turn, receiving tool call timings
+
+        Yields:
+            One word per chunk
+
+        Raises:
+            TimeoutError: If a timeout is injected
+            RuntimeError: If an error is injected
+        """
+        rng = self._rng
+        await asyncio.sleep(profile.ttft.sample(rng))
+
+        failure = rng.random()
+        if failure < profile.timeout_rate:
+            await asyncio.sleep(profile.timeout)
+            raise TimeoutError("Injected stub agent timeout")
+        if failure < profile.timeout_rate + profile.error_rate:
+            raise RuntimeError("Injected stub agent error")
+
+        if rng.random() < profile.tool_call_probability:
+            await self._update_prd(recorder)
+
+        count = max(1, round(profile.response_tokens.sample(rng)))
+        for index in range(count):
+            if index:
+                await asyncio.sleep(profile.inter_token.sample(rng))
+            yield rng.choice(_VOCABULARY) + " "
+
+    async def _update_prd(self, recorder: TurnRecorder) -> None:
+        """Save a generated PRD through every tool offering ``update_prd``.
+
+        Args:
+            recorder: Recorder of the turn, receiving the tool call timings
+        """
+        for tool in self._tools:
+            update_prd = getattr(tool, "update_prd", None)
+            if update_prd is None:
+                continue
+            started = time.perf_counter()
+            await update_prd(self._generate_prd())
+            self._tool_call_count += 1
+            recorder.add_tool_call(
+                f"{tool.plugin_name}-update_prd", time.perf_counter() - started
+            )
+
+    def _generate_prd(self) -> str:
+        """Generate a random PRD in markdown.
+
+        Returns:
+            PRD content with a few sections of requirements
+        """
+        rng = self._rng
+
+        def sentence(words: int) -> str:
+            text = " ".join(rng.choice(_VOCABULARY) for _ in range(words))
+            return text.capitalize() + "."
+
+        sections = [f"# {sentence(4)[:-1].title()}"]
+        for title in ("Problem", "Goals", "Requirements", "Success Metrics"):
+            items = "\n".join(
+                f"- {sentence(rng.randint(6, 14))}" for _ in range(rng.randint(2, 6))
+            )
+            sections.append(f"## {title}\n\n{items}")
+        return "\n\n".join(sections) + "\n"
 
     def _generate_response(self, user_text: str) -> List[str]:
         """Generate a mock response based on user input.
@@ -193,6 +300,15 @@ class StubAgent(AgentPort):
             "generation.",
         ]
 
+    async def record_turn(self, user_text: str, reply_text: str) -> None:
+        """Count an exchange produced elsewhere as part of the conversation.
+
+        Args:
+            user_text: User message of the exchange (ignored in stub)
+            reply_text: Assistant reply of the exchange (ignored in stub)
+        """
+        self._message_count += 1
+
     async def reset(self) -> None:
         """Reset conversation state."""
         self._message_count = 0
@@ -207,6 +323,20 @@ class StubAgent(AgentPort):
         """Get available tool names."""
         return [tool.plugin_name for tool in self._tools]
 
+    @property
+    def tool_call_count(self) -> int:
+        """Get the number of tool invocations made so far."""
+        return self._tool_call_count
+
+    def set_metrics_callback(self, callback: TurnMetricsCallback | None) -> None:
+        """Register a hook that receives metrics after every turn."""
+        self._metrics_callback = callback
+
+    def set_conversation(self, conversation_id: str | None) -> bool:
+        """Start a fresh conversation (the stub does not persist conversations)."""
+        self._message_count = 0
+        return False
+
     def set_project_context(self, project_id: str | None) -> None:
         """Set the current project context for agent tools."""
         for tool in self._tools:
@@ -0,0 +1,165 @@
+"""Latency and behavior profiles for the stub agent.
+
+A profile makes ``StubAgent`` behave like a real model deployment for load
+tests without network access: sampled time to first token, inter-token
+delays and reply lengths, tool calls that really update the PRD, and
+injected errors and timeouts. All sampling uses a seeded random generator,
+so runs are reproducible.
+"""
+
+import json
+import math
+import random
+from dataclasses import dataclass
+from typing import Any, Dict
+
+
+@dataclass(frozen=True)
+class Distribution:
+    """A sampled non-negative quantity.
+
+    ``kind`` is ``constant`` (``a``), ``uniform`` (between ``a`` and ``b``)
+    or ``lognormal`` (median ``a``, shape ``b``), the usual shape of LLM
+    latencies and reply lengths.
+    """
+
+    kind: str = "constant"
+    a: float = 0.0
+    b: float = 0.0
+
+    def __post_init__(self) -> None:
+        """Validate the distribution.
+
+        Raises:
+            ValueError: If the kind is unknown or a parameter is negative
+        """
+        if self.kind not in ("constant", "uniform", "lognormal"):
+            raise ValueError(f"Unknown distribution: {self.kind}")
+        if self.a < 0 or self.b < 0:
+            raise ValueError("Distribution parameters must not be negative")
+
+    @classmethod
+    def from_spec(cls, spec: Any) -> "Distribution":
+        """Parse a distribution from its JSON form.
+
+        Accepts a number (constant) or a single-key object such as
+        ``{"uniform": [0.1, 0.3]}`` or ``{"lognormal": [0.5, 0.4]}``.
+
+        Raises:
+            ValueError: If the spec is malformed
+        """
+        if isinstance(spec, (int, float)):
+            return cls("constant", float(spec))
+        if isinstance(spec, dict) and len(spec) == 1:
+            ((kind, params),) = spec.items()
+            if kind == "constant" and isinstance(params, (int, float)):
+                return cls("constant", float(params))
+            if isinstance(params, list) and len(params) == 2:
+                return cls(kind, float(params[0]), float(params[1]))
+        raise ValueError(f"Invalid distribution: {spec!r}")
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one value.
+
+        Args:
+            rng: Random generator to draw from
+
+        Returns:
+            A non-negative sample
+        """
+        if self.kind == "uniform":
+            return rng.uniform(self.a, self.b)
+        if self.kind == "lognormal":
+            if self.a == 0:
+                return 0.0
+            return rng.lognormvariate(math.log(self.a), self.b)
+        return self.a
+
+
+@dataclass(frozen=True)
+class StubProfile:
+    """How a profiled ``StubAgent`` answers.
+
+    Attributes:
+        ttft: Seconds before the first chunk
+        inter_token: Seconds between chunks
+        response_tokens: Number of chunks (words) per reply
+        tool_call_probability: Chance that a turn updates the PRD first
+        error_rate: Chance that a turn fails before its first chunk
+        timeout_rate: Chance that a turn stalls for ``timeout`` and then fails
+        timeout: Seconds an injected timeout stalls
+        seed: Seed of the agent's random generator
+    """
+
+    ttft: Distribution = Distribution()
+    inter_token: Distribution = Distribution()
+    response_tokens: Distribution = Distribution("constant", 50)
+    tool_call_probability: float = 0.0
+    error_rate: float = 0.0
+    timeout_rate: float = 0.0
+    timeout: float = 30.0
+    seed: int | None = 0
+
+    def __post_init__(self) -> None:
+        """Validate the probabilities.
+
+        Raises:
+            ValueError: If a probability is outside [0, 1]
+        """
+        for name in ("tool_call_probability", "error_rate", "timeout_rate"):
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise ValueError(f"{name} must be between 0 and 1")
+
+
+STUB_PROFILES: Dict[str, StubProfile] = {
+    # No delays: measures the server's own overhead
+    "instant": StubProfile(),
+    # Roughly a hosted GPT-4-class deployment under moderate load
+    "realistic": StubProfile(
+        ttft=Distribution("lognormal", 0.6, 0.4),
+        inter_token=Distribution("lognormal", 0.015, 0.3),
+        response_tokens=Distribution("lognormal", 200, 0.6),
+        tool_call_probability=0.1,
+        error_rate=0.01,
+        timeout_rate=0.002,
+    ),
+}
+
+
+def parse_stub_profile(value: str) -> StubProfile:
+    """Parse a profile from a preset name or a JSON object.
+
+    The JSON object may set any ``StubProfile`` field; distributions use the
+    form accepted by ``Distribution.from_spec``. Example::
+
+        {"ttft": {"lognormal": [0.5, 0.4]}, "inter_token": 0.02, "seed": 7}
+
+    Args:
+        value: Preset name (see ``STUB_PROFILES``) or JSON object
+
+    Returns:
+        The profile
+
+    Raises:
+        ValueError: If the value is neither a preset nor a valid profile
+    """
+    if value in STUB_PROFILES:
+        return STUB_PROFILES[value]
+    try:
+        spec = json.loads(value)
+    except ValueError as exc:
+        raise ValueError(f"Unknown stub profile: {value}") from exc
+    if not isinstance(spec, dict):
+        raise ValueError("Stub profile must be a preset name or a JSON object")
+
+    fields: Dict[str, Any] = {}
+    for name, item in spec.items():
+        if name in ("ttft", "inter_token", "response_tokens"):
+            fields[name] = Distribution.from_spec(item)
+        elif name in ("tool_call_probability", "error_rate", "timeout_rate", "timeout"):
+            fields[name] = float(item)
+        elif name == "seed":
+            fields[name] = None if item is None else int(item)
+        else:
+            raise ValueError(f"Unknown stub profile field: {name}")
+    return StubProfile(**fields)
@@ -0,0 +1,214 @@
+"""Shared thread and process pools for CPU-heavy work."""
+
+import asyncio
+import functools
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class PoolMetrics:
+    """Counters of one pool.
+
+    Attributes:
+        submitted: Calls handed to the pool
+        inline: Calls small enough to run on the event loop instead
+        completed: Handed-off calls that returned
+        failed: Handed-off calls that raised
+        waiting: Calls currently waiting for room in the queue
+        running: Calls currently queued in or running on the pool
+        max_waiting: Highest number of calls seen waiting at once
+        wait_seconds: Total time calls waited for room in the queue
+        busy_seconds: Total time from handing off calls to their results
+    """
+
+    submitted: int = 0
+    inline: int = 0
+    completed: int = 0
+    failed: int = 0
+    waiting: int = 0
+    running: int = 0
+    max_waiting: int = 0
+    wait_seconds: float = 0.0
+    busy_seconds: float = 0.0
+
+
+class _Pool:
+    """An executor created on first use, with a bounded number of calls in flight."""
+
+    def __init__(self, factory: Callable[[], Executor], queue_size: int) -> None:
+        """Initialize without starting any worker.
+
+        Args:
+            factory: Creates the underlying executor
+            queue_size: Maximum number of calls queued in or running on it
+        """
+        self._factory = factory
+        self._executor: Executor | None = None
+        self._queue_size = max(queue_size, 1)
+        self._slots: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.metrics = PoolMetrics()
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run a call on the pool, waiting for room in its queue first."""
+        metrics = self.metrics
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._loop is not loop:
+            # Semaphores belong to one event loop, e.g. per test client
+            self._slots = asyncio.Semaphore(self._queue_size)
+            self._loop = loop
+        slots = self._slots
+        metrics.waiting += 1
+        metrics.max_waiting = max(metrics.max_waiting, metrics.waiting)
+        started = time.perf_counter()
+        try:
+            await slots.acquire()
+        finally:
+            metrics.waiting -= 1
+        handed_off = time.perf_counter()
+        metrics.wait_seconds += handed_off - started
+        metrics.submitted += 1
+        metrics.running += 1
+        try:
+            if self._executor is None:
+                self._executor = self._factory()
+            result = await loop.run_in_executor(
+                self._executor, functools.partial(fn, *args)
+            )
+        except BrokenProcessPool:
+            # A worker died; start a new pool for the next calls
+            metrics.failed += 1
+            self.shutdown()
+            raise
+        except BaseException:
+            metrics.failed += 1
+            raise
+        else:
+            metrics.completed += 1
+            return result
+        finally:
+            metrics.running -= 1
+            metrics.busy_seconds += time.perf_counter() - handed_off
+            slots.release()
+
+    def shutdown(self) -> None:
+        """Stop the workers; a later call starts new ones."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+class WorkExecutor:
+    """
+    Implementation of WorkExecutorPort shared by the whole application.
+
+    Pure-Python work runs in a process pool, since threads would still hold
+    the GIL and stall the event loop serving the chat and event streams; work
+    that releases the GIL runs in a thread pool. Each pool accepts a bounded
+    number of calls, and further callers wait on the event loop, so a burst
+    of large documents queues up instead of piling onto the pools. Work on
+    inputs smaller than ``min_offload_size`` runs inline. Workers are started
+    on first use.
+    """
+
+    def __init__(
+        self,
+        thread_workers: int = 4,
+        process_workers: int = 2,
+        queue_size: int = 64,
+        min_offload_size: int = 16 * 1024,
+    ) -> None:
+        """
+        Initialize the pools.
+
+        Args:
+            thread_workers: Number of threads for work releasing the GIL.
+            process_workers: Number of processes for pure-Python work; 0 runs
+                it in the thread pool instead.
+            queue_size: Maximum number of calls queued in or running on each pool.
+            min_offload_size: Input size below which work runs inline.
+        """
+        self._min_offload_size = min_offload_size
+        self._threads = _Pool(
+            functools.partial(
+                ThreadPoolExecutor,
+                max_workers=max(thread_workers, 1),
+                thread_name_prefix="forgebase-work",
+            ),
+            queue_size,
+        )
+        self._processes = (
+            _Pool(
+                functools.partial(
+                    ProcessPoolExecutor,
+                    max_workers=process_workers,
+                    # Forking a process running threads is unsafe
+                    mp_context=multiprocessing.get_context("spawn"),
+                ),
+                queue_size,
+            )
+            if process_workers > 0
+            else self._threads
+        )
+
+    async def run_cpu(self, fn: Callable[..., T], *args: Any, size: int = 0) -> T:
+        """
+        Run pure-Python work that holds the GIL, such as diffing or parsing.
+
+        Args:
+            fn: Module-level function to call.
+            *args: Picklable arguments of the call.
+            size: Amount of input of the call.
+
+        Returns:
+            The result of the call.
+        """
+        return await self._run(self._processes, fn, args, size)
+
+    async def run_blocking(self, fn: Callable[..., T], *args: Any, size: int = 0) -> T:
+        """
+        Run work that releases the GIL, such as hashing or compression.
+
+        Args:
+            fn: Function to call.
+            *args: Arguments of the call.
+            size: Amount of input of the call.
+
+        Returns:
+            The result of the call.
+        """
+        return await self._run(self._threads, fn, args, size)
+
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        """
+        Get the counters of both pools.
+
+        Returns:
+            Dictionary of ``threads`` and ``processes`` counters; they are the
+            same when pure-Python work runs in the thread pool.
+        """
+        return {
+            "threads": asdict(self._threads.metrics),
+            "processes": asdict(self._processes.metrics),
+        }
+
+    def shutdown(self) -> None:
+        """Stop all workers; later calls start new ones."""
+        self._threads.shutdown()
+        self._processes.shutdown()
+
+    async def _run(
+        self, pool: _Pool, fn: Callable[..., T], args: tuple[Any, ...], size: int
+    ) -> T:
+        """Run a call inline when small, otherwise on a pool."""
+        if size < self._min_offload_size:
+            pool.metrics.inline += 1
+            return fn(*args)
+        return await pool.run(fn, *args)
@@ -14,14 +14,22 @@ def main() -> None:
 
 @main.command()
 @click.option("--debug", is_flag=True, help="Enable debug logging.")
-def chat(debug: bool) -> None:
+@click.option(
+    "--conversation",
+    default=None,
+    help="Persisted conversation to continue or start.",
+)
+def chat(debug: bool, conversation: str | None) -> None:
     """Starts an interactive chat session."""
     logging_config.setup_logging(debug)
     chat_service = config.get_chat_service()
+    resumed = chat_service.set_conversation(conversation)
 
     async def run() -> None:
         """Runs the async chat loop."""
         print("Starting chat session. Type /exit to end, /reset to clear.")
+        if resumed:
+            print(f"Continuing conversation '{conversation}'.")
         while True:
             try:
                 user_input = await asyncio.to_thread(lambda: input("User> "))
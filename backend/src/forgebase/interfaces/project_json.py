@@ -0,0 +1,342 @@
+"""Direct JSON serialization of projects for API responses.
+
+Produces exactly the bytes of validating a ``Project`` into a
+``ProjectResponse``, dumping it by alias and rendering it with
+``JSONResponse``, but builds the camelCase object in one step and encodes
+it once. ``orjson`` is used when installed: its output for these payloads
+is identical to the compact stdlib encoding, and it formats ids and UTC or
+naive timestamps natively, which is most of the remaining cost.
+
+``ProjectPayloadCache`` keeps the encoded bytes of recently served projects
+so reads of unchanged projects skip encoding altogether.
+"""
+
+import json
+from collections import OrderedDict
+from datetime import UTC, datetime, timedelta
+from typing import Any, Iterable
+from uuid import UUID
+
+from pydantic import TypeAdapter
+
+from forgebase.core.entities import PrdRevision, Project
+from forgebase.core.prd_diff import PrdHunk
+from forgebase.core.prd_outline import PrdSection
+from forgebase.core.project_events import ProjectEvent
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+_DATETIME = TypeAdapter(datetime)
+_ZERO = timedelta(0)
+
+
+def _format_datetime(value: datetime | None) -> str | None:
+    """Format a timestamp the way pydantic does in JSON mode."""
+    if value is None:
+        return None
+    offset = value.utcoffset()
+    if offset is None:
+        return value.isoformat()
+    if offset == _ZERO:
+        return value.replace(tzinfo=None).isoformat() + "Z"
+    if offset % timedelta(minutes=1):
+        # Sub-minute offsets are rounded by pydantic; leave those to it
+        return str(_DATETIME.dump_python(value, mode="json"))
+    return value.isoformat()
+
+
+def _native_datetime(value: datetime | None) -> datetime | str | None:
+    """Leave timestamps orjson formats like pydantic to orjson."""
+    if value is None or value.tzinfo is None or value.tzinfo is UTC:
+        return value
+    return _format_datetime(value)
+
+
+def _project_object(project: Project) -> dict[str, Any]:
+    """Build the camelCase response object of a project."""
+    if orjson is not None:
+        return {
+            "id": project.id,
+            "userId": project.user_id,
+            "name": project.name,
+            "prd": project.prd,
+            "createdAt": _native_datetime(project.created_at),
+            "updatedAt": _native_datetime(project.updated_at),
+            "prdVersion": project.prd_version,
+        }
+    return {
+        "id": str(project.id),
+        "userId": project.user_id,
+        "name": project.name,
+        "prd": project.prd,
+        "createdAt": _format_datetime(project.created_at),
+        "updatedAt": _format_datetime(project.updated_at),
+        "prdVersion": project.prd_version,
+    }
+
+
+def _encode(content: Any) -> bytes:
+    """Encode like ``JSONResponse``: compact, UTF-8, non-ASCII unescaped."""
+    if orjson is not None:
+        # orjson is a compiled extension whose members pylint cannot inspect
+        # pylint: disable=no-member
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def project_to_json(project: Project) -> bytes:
+    """Serialize a project to its API JSON representation.
+
+    Args:
+        project: Project to serialize
+
+    Returns:
+        UTF-8 encoded JSON object with camelCase field names
+    """
+    return _encode(_project_object(project))
+
+
+def projects_to_json(projects: Iterable[Project]) -> bytes:
+    """Serialize projects to a JSON array of their API representations.
+
+    Args:
+        projects: Projects to serialize
+
+    Returns:
+        UTF-8 encoded JSON array
+    """
+    return _encode([_project_object(project) for project in projects])
+
+
+def _diff_object(hunks: Iterable[PrdHunk]) -> list[dict[str, Any]]:
+    """Build the JSON form of PRD diff hunks."""
+    return [
+        {"at": hunk.start, "delete": hunk.deleted, "insert": list(hunk.lines)}
+        for hunk in hunks
+    ]
+
+
+def project_event_to_json(event: ProjectEvent) -> bytes:
+    """Serialize a project event for the project event stream.
+
+    PRD changes carry a ``diff`` from version ``prdVersion - 1``: each hunk
+    replaces ``delete`` lines starting at line ``at`` of that version with
+    the ``insert`` lines, which keep their line endings.
+
+    Args:
+        event: Event to serialize
+
+    Returns:
+        UTF-8 encoded JSON object with camelCase field names
+    """
+    content: dict[str, Any] = {
+        "type": event.kind,
+        "projectId": str(event.project_id),
+        "changed": list(event.changed),
+        "name": event.name,
+        "updatedAt": _format_datetime(event.updated_at),
+        "prdVersion": event.prd_version,
+    }
+    if event.prd_diff is not None:
+        content["diff"] = _diff_object(event.prd_diff)
+    return _encode(content)
+
+
+def prd_version_to_json(project: Project) -> bytes:
+    """Serialize the PRD version of a project after an edit.
+
+    Args:
+        project: The edited project
+
+    Returns:
+        UTF-8 encoded JSON object with ``prdVersion`` and ``updatedAt``
+    """
+    return _encode(
+        {
+            "prdVersion": project.prd_version,
+            "updatedAt": _format_datetime(project.updated_at),
+        }
+    )
+
+
+def prd_revisions_to_json(revisions: Iterable[PrdRevision]) -> bytes:
+    """Serialize a list of PRD revisions.
+
+    Args:
+        revisions: Revisions to serialize
+
+    Returns:
+        UTF-8 encoded JSON array of ``prdVersion``, ``createdAt`` and ``size``
+    """
+    return _encode(
+        [
+            {
+                "prdVersion": revision.version,
+                "createdAt": _format_datetime(revision.created_at),
+                "size": revision.size,
+            }
+            for revision in revisions
+        ]
+    )
+
+
+def prd_revision_to_json(version: int, prd: str) -> bytes:
+    """Serialize the PRD content of a stored revision.
+
+    Args:
+        version: PRD version of the revision
+        prd: PRD content at that version
+
+    Returns:
+        UTF-8 encoded JSON object with ``prdVersion`` and ``prd``
+    """
+    return _encode({"prdVersion": version, "prd": prd})
+
+
+def prd_to_json(
+    project: Project, since: int | None = None, diff: Iterable[PrdHunk] | None = None
+) -> bytes:
+    """Serialize a project's PRD, or the diff bringing a client up to date.
+
+    Args:
+        project: Project whose PRD is served
+        since: PRD version the client has, if it asked for a diff
+        diff: Hunks from version ``since`` to the current one, or None to
+            send the full PRD
+
+    Returns:
+        UTF-8 encoded JSON object with ``prdVersion`` and either ``prd`` or
+        ``baseVersion`` and ``diff``
+    """
+    content: dict[str, Any] = {"prdVersion": project.prd_version}
+    if since is not None and diff is not None:
+        content["baseVersion"] = since
+        content["diff"] = _diff_object(diff)
+    else:
+        content["prd"] = project.prd
+    return _encode(content)
+
+
+def _section_object(section: PrdSection) -> dict[str, Any]:
+    """Build the JSON object of a PRD section."""
+    return {
+        "slug": section.slug,
+        "title": section.title,
+        "level": section.level,
+        "start": section.start,
+        "end": section.end,
+        "words": section.words,
+    }
+
+
+def prd_outline_to_json(project: Project, sections: Iterable[PrdSection]) -> bytes:
+    """Serialize the section index of a project's PRD.
+
+    Args:
+        project: Project whose PRD is indexed
+        sections: Sections of the PRD in document order
+
+    Returns:
+        UTF-8 encoded JSON object with ``prdVersion`` and ``sections``, each
+        with its slug, title, level, offsets and word count
+    """
+    return _encode(
+        {
+            "prdVersion": project.prd_version,
+            "sections": [_section_object(section) for section in sections],
+        }
+    )
+
+
+def prd_section_to_json(project: Project, section: PrdSection, content: str) -> bytes:
+    """Serialize one section of a project's PRD.
+
+    Args:
+        project: Project whose PRD holds the section
+        section: The section
+        content: Text of the section, subsections included
+
+    Returns:
+        UTF-8 encoded JSON object of the section with ``prdVersion`` and
+        ``content``
+    """
+    return _encode(
+        {
+            **_section_object(section),
+            "prdVersion": project.prd_version,
+            "content": content,
+        }
+    )
+
+
+class ProjectPayloadCache:
+    """LRU cache of encoded project JSON, keyed by project ID.
+
+    Entries must be invalidated whenever a project changes; register
+    ``invalidate`` as a project change listener. List responses are assembled
+    by joining the cached fragments, which is byte-identical to encoding the
+    list at once. Projects whose PRD is at least ``max_prd_chars`` long are
+    encoded on every request instead, so the cache holds no full copy of the
+    PRDs the repository keeps compressed.
+    """
+
+    def __init__(self, max_entries: int = 10_000, max_prd_chars: int = 0) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Number of encoded projects to keep
+            max_prd_chars: PRD length from which projects are not cached; 0
+                caches projects of any size
+        """
+        self._max_entries = max_entries
+        self._max_prd_chars = max_prd_chars
+        self._payloads: OrderedDict[UUID, bytes] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Get the number of cached projects."""
+        return len(self._payloads)
+
+    def project_json(self, project: Project) -> bytes:
+        """Get the encoded JSON of a project, encoding it on a miss.
+
+        Args:
+            project: Project to serialize
+
+        Returns:
+            Same bytes as ``project_to_json(project)``
+        """
+        payload = self._payloads.get(project.id)
+        if payload is not None:
+            self.hits += 1
+            self._payloads.move_to_end(project.id)
+            return payload
+        self.misses += 1
+        payload = project_to_json(project)
+        if self._max_prd_chars and project.prd_length >= self._max_prd_chars:
+            return payload
+        self._payloads[project.id] = payload
+        if len(self._payloads) > self._max_entries:
+            self._payloads.popitem(last=False)
+        return payload
+
+    def projects_json(self, projects: Iterable[Project]) -> bytes:
+        """Get the encoded JSON array of projects from cached fragments.
+
+        Args:
+            projects: Projects to serialize
+
+        Returns:
+            Same bytes as ``projects_to_json(projects)``
+        """
+        return b"[" + b",".join(self.project_json(p) for p in projects) + b"]"
+
+    def invalidate(self, project_id: UUID) -> None:
+        """Drop the cached JSON of a changed or deleted project."""
+        self._payloads.pop(project_id, None)
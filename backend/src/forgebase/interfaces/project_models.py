@@ -39,6 +39,30 @@ class ProjectUpdatePRDRequest(BaseModel):
     prd: str = Field(..., description="The new PRD content for the project")
 
 
+class PrdEditOperation(BaseModel):
+    """A text edit of a PRD, positioned in the PRD version it is based on."""
+
+    offset: int = Field(
+        ..., ge=0, description="Position of the edit, in Unicode code points"
+    )
+    delete: int = Field(0, ge=0, description="Number of characters removed")
+    insert: str = Field("", description="Text inserted at the offset")
+
+
+class ProjectPrdEditRequest(BaseModel):
+    """Request model for editing a project's PRD with text operations."""
+
+    base_version: int = Field(
+        ...,
+        ge=0,
+        alias="baseVersion",
+        description="PRD version the edits were made against",
+    )
+    edits: list[PrdEditOperation] = Field(
+        ..., description="Edits sorted by offset, not overlapping"
+    )
+
+
 class ProjectResponse(BaseModel):
     """Response model for project data."""
 
@@ -55,6 +79,9 @@ class ProjectResponse(BaseModel):
     updated_at: Optional[datetime] = Field(
         None, alias="updatedAt", description="When the project was last updated"
     )
+    prd_version: int = Field(
+        0, alias="prdVersion", description="Number of changes made to the PRD"
+    )
 
 
 class ChatStreamRequest(BaseModel):
@@ -1,27 +1,58 @@
 """Web interface for the forgebase chat application."""
 
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
-from typing import Any, cast
+from typing import AsyncIterator, Optional
 from uuid import UUID
 
-from fastapi import FastAPI, Request, HTTPException, Depends
+from fastapi import FastAPI, Request, HTTPException, Depends, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, JSONResponse, RedirectResponse
+from fastapi.responses import StreamingResponse, JSONResponse, RedirectResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 from forgebase.core.chat_service import ChatService
 from forgebase.core.project_service import ProjectService
-from forgebase.core.exceptions import ProjectNotFoundError, ProjectAlreadyExistsError
+from forgebase.core.exceptions import (
+    PrdVersionConflictError,
+    ProjectAlreadyExistsError,
+    ProjectError,
+    ProjectNotFoundError,
+)
+from forgebase.core.prd_edits import PrdEdit
 from forgebase.infrastructure import config, logging_config
 from forgebase.interfaces import project_models
+from forgebase.core.project_events import PROJECT_DELETED, ProjectEvent
+from forgebase.infrastructure.prd_html_cache import PrdHtmlCache
+from forgebase.infrastructure.project_events import ProjectEventBus, ProjectSubscription
+from forgebase.infrastructure.work_executor import WorkExecutor
+from forgebase.interfaces.project_json import (
+    ProjectPayloadCache,
+    prd_outline_to_json,
+    prd_revision_to_json,
+    prd_revisions_to_json,
+    prd_section_to_json,
+    prd_to_json,
+    prd_version_to_json,
+    project_event_to_json,
+    project_to_json,
+)
 from forgebase.interfaces.project_models import ChatStreamRequest
 
 # Temporary test user ID - will be replaced with proper authentication later
 TEST_USER_ID = "test-user-123"
 
+# Conversation of the shared web chat, persisted across restarts when enabled
+WEB_CONVERSATION_ID = "web"
+
+# Seconds between checks for idle conversations to spill out of memory
+CONVERSATION_SWEEP_INTERVAL = 60.0
+
+# Seconds of silence after which a project event stream sends a keepalive
+EVENT_KEEPALIVE_INTERVAL = 15.0
+
 # Set up a logger for our endpoint logging
 logger = logging.getLogger("forgebase.api")
 logger.setLevel(logging.INFO)
@@ -52,12 +83,44 @@ async def lifespan(fastapi_app: FastAPI):
     """
     logging_config.setup_logging(debug=False)
     fastapi_app.state.chat_service = config.get_chat_service()
+    fastapi_app.state.chat_service.set_conversation(WEB_CONVERSATION_ID)
     fastapi_app.state.project_service = config.get_project_service()
+    events = config.get_project_events()
+    # Large PRDs kept compressed by the repository are not cached as JSON
+    payloads = ProjectPayloadCache(
+        max_prd_chars=config.get_project_repository().compress_min_chars
+    )
+
+    def invalidate_payload(event: ProjectEvent) -> None:
+        payloads.invalidate(event.project_id)
+
+    events.add_listener(invalidate_payload)
+    fastapi_app.state.project_events = events
+    fastapi_app.state.project_payloads = payloads
+    fastapi_app.state.prd_html_cache = config.get_prd_html_cache()
+    fastapi_app.state.work_executor = config.get_work_executor()
+    memory = config.get_conversation_memory()
+    sweeper = (
+        asyncio.create_task(memory.run(CONVERSATION_SWEEP_INTERVAL))
+        if memory is not None
+        else None
+    )
     try:
         yield
     finally:
+        if sweeper is not None:
+            sweeper.cancel()
         fastapi_app.state.chat_service = None
         fastapi_app.state.project_service = None
+        events.remove_listener(invalidate_payload)
+        fastapi_app.state.project_events = None
+        fastapi_app.state.project_payloads = None
+        fastapi_app.state.prd_html_cache = None
+        fastapi_app.state.work_executor = None
+        # Stop the workers and let a later app start fresh pools; the HTML
+        # cache is dropped with the executor it renders on
+        config.reset_prd_html_cache()
+        config.reset_work_executor()
 
 
 def get_chat_service(request: Request) -> ChatService:
@@ -78,6 +141,42 @@ def get_project_service(request: Request) -> ProjectService:
     return service  # type: ignore[no-any-return]
 
 
+def get_project_payloads(request: Request) -> ProjectPayloadCache:
+    """Dependency to retrieve the serialized project cache from application state."""
+    payloads = getattr(request.app.state, "project_payloads", None)
+    if payloads is None:
+        raise HTTPException(
+            status_code=500, detail="Project payload cache not initialized")
+    return payloads  # type: ignore[no-any-return]
+
+
+def get_prd_html_cache(request: Request) -> PrdHtmlCache:
+    """Dependency to retrieve the rendered PRD cache from application state."""
+    cache = getattr(request.app.state, "prd_html_cache", None)
+    if cache is None:
+        raise HTTPException(
+            status_code=500, detail="PRD HTML cache not initialized")
+    return cache  # type: ignore[no-any-return]
+
+
+def get_work_executor(request: Request) -> WorkExecutor:
+    """Dependency to retrieve the work executor from application state."""
+    executor = getattr(request.app.state, "work_executor", None)
+    if executor is None:
+        raise HTTPException(
+            status_code=500, detail="Work executor not initialized")
+    return executor  # type: ignore[no-any-return]
+
+
+def get_project_events(request: Request) -> ProjectEventBus:
+    """Dependency to retrieve the project event bus from application state."""
+    events = getattr(request.app.state, "project_events", None)
+    if events is None:
+        raise HTTPException(
+            status_code=500, detail="Project events not initialized")
+    return events  # type: ignore[no-any-return]
+
+
 def get_cors_origins() -> list[str]:
     """Get CORS origins from environment variable or use defaults."""
     cors_origins_env = os.getenv("CORS_ORIGINS")
@@ -104,6 +203,64 @@ def get_cors_origins() -> list[str]:
     return origins
 
 
+def _json_response(body: bytes) -> Response:
+    """Wrap pre-serialized JSON in a response."""
+    return Response(content=body, media_type="application/json")
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Tell whether an If-None-Match header lists an entity tag."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+
+def _sse_event(chunk: str) -> bytes:
+    """Frame a chat chunk as an SSE data event."""
+    # Escape newlines for SSE format
+    escaped_chunk = chunk.replace("\n", "\\n")
+    return f"data: {escaped_chunk}\n\n".encode("utf-8")
+
+
+def _sse_message(event: str, data: bytes) -> bytes:
+    """Frame a named SSE event with a single-line data payload."""
+    return b"event: " + event.encode("utf-8") + b"\ndata: " + data + b"\n\n"
+
+
+async def _project_event_stream(
+    subscription: ProjectSubscription, keepalive: float = EVENT_KEEPALIVE_INTERVAL
+) -> AsyncIterator[bytes]:
+    """Stream a project's events as SSE until it is deleted or the client lags.
+
+    A client too slow to keep up is sent a ``resync`` event and the stream
+    ends; it should re-fetch the project and reconnect.
+
+    Args:
+        subscription: Subscription to the project's events, closed at the end
+        keepalive: Seconds of silence before a keepalive comment is sent
+
+    Yields:
+        SSE frames
+    """
+    try:
+        yield b": connected\n\n"
+        while True:
+            try:
+                event = await subscription.next(timeout=keepalive)
+            except TimeoutError:
+                yield b": keepalive\n\n"
+                continue
+            if event is None:
+                yield _sse_message("resync", b"{}")
+                return
+            yield _sse_message(event.kind, project_event_to_json(event))
+            if event.kind == PROJECT_DELETED:
+                return
+    finally:
+        subscription.close()
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
     fastapi_app = FastAPI(
@@ -151,6 +308,11 @@ def create_app() -> FastAPI:
         """Health check endpoint."""
         return {"status": "healthy"}
 
+    @fastapi_app.get("/api/metrics/executor")
+    async def executor_metrics(executor: WorkExecutor = Depends(get_work_executor)):
+        """Counters of the pools running CPU-heavy PRD work."""
+        return executor.metrics()
+
     @fastapi_app.post("/api/chat/stream")
     async def chat_stream(
         request: ChatStreamRequest,
@@ -169,9 +331,7 @@ def create_app() -> FastAPI:
 
         async def generate():
             async for chunk in chat_service.send_message_stream(request.message):
-                # Escape newlines for SSE format
-                escaped_chunk = chunk.replace("\n", "\\n")
-                yield f"data: {escaped_chunk}\n\n".encode("utf-8")
+                yield _sse_event(chunk)
             # Completion marker
             yield b"data: [DONE]\n\n"
 
@@ -193,13 +353,6 @@ def create_app() -> FastAPI:
         return {"status": "reset"}
 
     # Project management endpoints
-    def _project_to_payload(project_models_module, project) -> dict[str, Any]:
-        """Serialize project with camelCase field names."""
-        resp = project_models_module.ProjectResponse.model_validate(project)
-        return cast(
-            dict[str, Any], resp.model_dump(mode="json", by_alias=True)
-        )  # type: ignore[no-any-return]
-
     @fastapi_app.post("/api/projects", response_model=project_models.ProjectResponse)
     async def create_project(
         request: project_models.ProjectCreateRequest,
@@ -212,7 +365,7 @@ def create_app() -> FastAPI:
             project = await project_service.create_project(TEST_USER_ID, request.name, request.prd)
             logger.info(
                 "CREATE_PROJECT_SUCCESS: user_id=%s, project_id=%s", TEST_USER_ID, project.id)
-            return JSONResponse(content=_project_to_payload(project_models, project))
+            return _json_response(project_to_json(project))
         except ProjectAlreadyExistsError as exc:
             raise HTTPException(status_code=409, detail=str(exc)) from exc
 
@@ -221,21 +374,22 @@ def create_app() -> FastAPI:
     )
     async def list_projects(
         project_service: ProjectService = Depends(get_project_service),
+        payloads: ProjectPayloadCache = Depends(get_project_payloads),
     ):
         """List all projects."""
         logger.info("LIST_PROJECTS: user_id=%s", TEST_USER_ID)
         projects = await project_service.list_projects(TEST_USER_ID)
         logger.info(
             "LIST_PROJECTS_SUCCESS: user_id=%s, count=%s", TEST_USER_ID, len(projects))
-        return JSONResponse(
-            content=[_project_to_payload(project_models, p) for p in projects]
-        )
+        return _json_response(payloads.projects_json(projects))
 
     @fastapi_app.get(
         "/api/projects/{project_id}", response_model=project_models.ProjectResponse
     )
     async def get_project(
-        project_id: UUID, project_service: ProjectService = Depends(get_project_service)
+        project_id: UUID,
+        project_service: ProjectService = Depends(get_project_service),
+        payloads: ProjectPayloadCache = Depends(get_project_payloads),
     ):
         """Get a project by ID."""
         logger.info(
@@ -244,10 +398,141 @@ def create_app() -> FastAPI:
             project = await project_service.get_project(str(project_id), TEST_USER_ID)
             logger.info(
                 "GET_PROJECT_SUCCESS: user_id=%s, project_id=%s", TEST_USER_ID, project_id)
-            return JSONResponse(content=_project_to_payload(project_models, project))
+            return _json_response(payloads.project_json(project))
+        except ProjectNotFoundError as exc:
+            raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+    @fastapi_app.get("/api/projects/{project_id}/prd")
+    async def get_project_prd(
+        project_id: UUID,
+        since: Optional[int] = Query(
+            None, ge=0, description="PRD version the client already has"),
+        project_service: ProjectService = Depends(get_project_service),
+    ):
+        """Get a project's PRD, or the diff from the version the client has."""
+        logger.info(
+            "GET_PROJECT_PRD: user_id=%s, project_id=%s, since=%s",
+            TEST_USER_ID, project_id, since)
+        try:
+            if since is None:
+                project = await project_service.get_project(str(project_id), TEST_USER_ID)
+                return _json_response(prd_to_json(project))
+            project, diff = await project_service.get_prd_changes(
+                str(project_id), TEST_USER_ID, since)
+            return _json_response(prd_to_json(project, since, diff))
         except ProjectNotFoundError as exc:
             raise HTTPException(status_code=404, detail=str(exc)) from exc
 
+    @fastapi_app.get("/api/projects/{project_id}/prd.html")
+    async def get_project_prd_html(
+        project_id: UUID,
+        request: Request,
+        project_service: ProjectService = Depends(get_project_service),
+        cache: PrdHtmlCache = Depends(get_prd_html_cache),
+    ):
+        """Get a project's PRD rendered as HTML, revalidated by ETag."""
+        logger.info(
+            "GET_PROJECT_PRD_HTML: user_id=%s, project_id=%s", TEST_USER_ID, project_id)
+        try:
+            project = await project_service.get_project(str(project_id), TEST_USER_ID)
+        except ProjectNotFoundError as exc:
+            raise HTTPException(status_code=404, detail=str(exc)) from exc
+        prd = project.prd
+        etag = await cache.tag(prd)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        rendered = await cache.render(prd, etag)
+        return Response(
+            content=rendered.html, media_type="text/html; charset=utf-8", headers=headers)
+
+    @fastapi_app.get("/api/projects/{project_id}/prd/revisions")
+    async def list_prd_revisions(
+        project_id: UUID,
+        project_service: ProjectService = Depends(get_project_service),
+    ):
+        """List the stored PRD revisions of a project, newest first."""
+        logger.info(
+            "LIST_PRD_REVISIONS: user_id=%s, project_id=%s", TEST_USER_ID, project_id)
+        try:
+            revisions = await project_service.list_prd_revisions(
+                str(project_id), TEST_USER_ID)
+        except ProjectNotFoundError as exc:
+            raise HTTPException(status_code=404, detail=str(exc)) from exc
+        return _json_response(prd_revisions_to_json(revisions))
+
+    @fastapi_app.get("/api/projects/{project_id}/prd/revisions/{version}")
+    async def get_prd_revision(
+        project_id: UUID,
+        version: int,
+        project_service: ProjectService = Depends(get_project_service),
+    ):
+        """Get the PRD content of a project at a given version."""
+        logger.info(
+            "GET_PRD_REVISION: user_id=%s, project_id=%s, version=%s",
+            TEST_USER_ID, project_id, version)
+        try:
+            prd = await project_service.get_prd_revision(
+                str(project_id), TEST_USER_ID, version)
+        except ProjectError as exc:
+            raise HTTPException(status_code=404, detail=str(exc)) from exc
+        return _json_response(prd_revision_to_json(version, prd))
+
+    @fastapi_app.get("/api/projects/{project_id}/prd/outline")
+    async def get_prd_outline(
+        project_id: UUID,
+        project_service: ProjectService = Depends(get_project_service),
+    ):
+        """Get the section index of a project's PRD."""
+        logger.info(
+            "GET_PRD_OUTLINE: user_id=%s, project_id=%s", TEST_USER_ID, project_id)
+        try:
+            project, sections = await project_service.get_prd_outline(
+                str(project_id), TEST_USER_ID)
+        except ProjectNotFoundError as exc:
+            raise HTTPException(status_code=404, detail=str(exc)) from exc
+        return _json_response(prd_outline_to_json(project, sections))
+
+    @fastapi_app.get("/api/projects/{project_id}/prd/sections/{slug}")
+    async def get_prd_section(
+        project_id: UUID,
+        slug: str,
+        project_service: ProjectService = Depends(get_project_service),
+    ):
+        """Get one section of a project's PRD by slug."""
+        logger.info(
+            "GET_PRD_SECTION: user_id=%s, project_id=%s, slug=%s",
+            TEST_USER_ID, project_id, slug)
+        try:
+            project, section, content = await project_service.get_prd_section(
+                str(project_id), TEST_USER_ID, slug)
+        except ProjectError as exc:
+            raise HTTPException(status_code=404, detail=str(exc)) from exc
+        return _json_response(prd_section_to_json(project, section, content))
+
+    @fastapi_app.get("/api/projects/{project_id}/events")
+    async def project_events(
+        project_id: UUID,
+        project_service: ProjectService = Depends(get_project_service),
+        events: ProjectEventBus = Depends(get_project_events),
+    ):
+        """Stream change notifications of a project (SSE)."""
+        logger.info(
+            "PROJECT_EVENTS: user_id=%s, project_id=%s", TEST_USER_ID, project_id)
+        try:
+            await project_service.get_project(str(project_id), TEST_USER_ID)
+        except ProjectNotFoundError as exc:
+            raise HTTPException(status_code=404, detail=str(exc)) from exc
+        return StreamingResponse(
+            _project_event_stream(events.subscribe(project_id)),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+                "X-Accel-Buffering": "no",
+            },
+        )
+
     @fastapi_app.patch(
         "/api/projects/{project_id}", response_model=project_models.ProjectResponse
     )
@@ -265,9 +550,32 @@ def create_app() -> FastAPI:
             )
             logger.info(
                 "UPDATE_PROJECT_SUCCESS: user_id=%s, project_id=%s", TEST_USER_ID, project_id)
-            return JSONResponse(content=_project_to_payload(project_models, project))
+            return _json_response(project_to_json(project))
+        except ProjectNotFoundError as exc:
+            raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+    @fastapi_app.patch("/api/projects/{project_id}/prd")
+    async def edit_project_prd(
+        project_id: UUID,
+        request: project_models.ProjectPrdEditRequest,
+        project_service: ProjectService = Depends(get_project_service),
+    ):
+        """Apply text edits to a project's PRD if it is still at the base version."""
+        logger.info(
+            "EDIT_PROJECT_PRD: user_id=%s, project_id=%s, base_version=%s, edits=%s",
+            TEST_USER_ID, project_id, request.base_version, len(request.edits))
+        edits = [PrdEdit(op.offset, op.delete, op.insert) for op in request.edits]
+        try:
+            project = await project_service.edit_prd(
+                str(project_id), TEST_USER_ID, request.base_version, edits
+            )
         except ProjectNotFoundError as exc:
             raise HTTPException(status_code=404, detail=str(exc)) from exc
+        except PrdVersionConflictError as exc:
+            raise HTTPException(status_code=409, detail=str(exc)) from exc
+        except ValueError as exc:
+            raise HTTPException(status_code=422, detail=str(exc)) from exc
+        return _json_response(prd_version_to_json(project))
 
     @fastapi_app.delete("/api/projects/{project_id}")
     async def delete_project(
@@ -1,10 +1,13 @@
 """PRD management tools for agents."""
 
-from semantic_kernel import Kernel
-from semantic_kernel.functions import kernel_function
+from typing import TYPE_CHECKING
 
 from forgebase.core.tool_port import ToolPort
 from forgebase.core.project_service import ProjectService
+from forgebase.tools.tool_function import add_tool_plugin, tool_function
+
+if TYPE_CHECKING:
+    from semantic_kernel import Kernel
 
 
 class PRDTools(ToolPort):
@@ -21,16 +24,16 @@ class PRDTools(ToolPort):
     def plugin_name(self) -> str:
         return "PRDTools"
 
-    def register_with_kernel(self, kernel: Kernel) -> None:
+    def register_with_kernel(self, kernel: "Kernel") -> None:
         """Register PRD functions with the kernel."""
-        kernel.add_plugin(self, plugin_name=self.plugin_name)
+        add_tool_plugin(kernel, self, self.plugin_name)
 
     def set_project_context(self, project_id: str | None) -> None:
         """Set the current project context for operations."""
         print(f"DEBUG PRDTools: Setting project context to: {project_id}")
         self._current_project_id = project_id
 
-    @kernel_function(
+    @tool_function(
         description="Update the PRD content of the current project", name="update_prd"
     )
     async def update_prd(self, prd_content: str) -> str:
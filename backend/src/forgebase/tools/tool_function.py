@@ -0,0 +1,108 @@
+"""Kernel function declarations that do not import Semantic Kernel.
+
+Semantic Kernel's ``kernel_function`` decorator needs ``semantic_kernel`` at
+class definition time, which makes importing any tool pull in the whole SK
+and Azure stack. Tools declare their functions with ``tool_function`` instead;
+the SK metadata is attached when a tool is first registered with a kernel,
+i.e. only once a real ``Agent`` is built. The resulting plugin is cached per
+tool class so each further kernel only binds it to the tool instance.
+"""
+
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+if TYPE_CHECKING:
+    from semantic_kernel import Kernel
+    from semantic_kernel.functions import KernelFunctionFromMethod, KernelPlugin
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_TOOL_FUNCTION_ATTR = "__forgebase_tool_function__"
+
+# Introspected plugins and their method functions by (tool class, plugin name)
+_plugin_templates: dict[
+    tuple[type, str], tuple["KernelPlugin", dict[str, "KernelFunctionFromMethod"]]
+] = {}
+
+
+def tool_function(*, name: str, description: str) -> Callable[[F], F]:
+    """Mark a tool method to be exposed as a kernel function.
+
+    Args:
+        name: Function name shown to the model
+        description: Function description shown to the model
+
+    Returns:
+        Decorator recording the declaration on the method
+    """
+
+    def decorator(func: F) -> F:
+        setattr(func, _TOOL_FUNCTION_ATTR, (name, description))
+        return func
+
+    return decorator
+
+
+def add_tool_plugin(kernel: "Kernel", tool: Any, plugin_name: str) -> None:
+    """Register a tool's declared functions as a kernel plugin.
+
+    The plugin is introspected once per tool class and plugin name; later
+    registrations copy the cached functions and bind them to ``tool``, which
+    skips SK's reflection and metadata validation.
+
+    Args:
+        kernel: Kernel to add the plugin to
+        tool: Tool instance whose class declares ``tool_function`` methods
+        plugin_name: Name of the plugin
+    """
+    cached = _plugin_templates.get((type(tool), plugin_name))
+    if cached is None:
+        cached = _build_plugin_template(tool, plugin_name)
+        _plugin_templates[(type(tool), plugin_name)] = cached
+    template, methods = cached
+
+    functions = {}
+    for name, function in methods.items():
+        method = getattr(tool, function.method.__name__)
+        functions[name] = function.model_copy(
+            update={
+                "method": method,
+                "stream_method": method if function.stream_method else None,
+            }
+        )
+    kernel.add_plugin(template.model_copy(update={"functions": functions}))
+
+
+def _build_plugin_template(
+    tool: Any, plugin_name: str
+) -> tuple["KernelPlugin", dict[str, "KernelFunctionFromMethod"]]:
+    """Introspect a tool class into a plugin bound to ``tool``.
+
+    Args:
+        tool: Tool instance whose class declares ``tool_function`` methods
+        plugin_name: Name of the plugin
+
+    Returns:
+        The plugin, used as template for instances of the same class, and
+        its functions by name
+    """
+    # Deferred so that declaring tools does not load Semantic Kernel
+    # pylint: disable-next=import-outside-toplevel
+    from semantic_kernel.functions import (
+        KernelFunctionFromMethod,
+        KernelPlugin,
+        kernel_function,
+    )
+
+    for cls in type(tool).__mro__:
+        for func in vars(cls).values():
+            declaration = getattr(func, _TOOL_FUNCTION_ATTR, None)
+            if declaration and not getattr(func, "__kernel_function__", False):
+                name, description = declaration
+                kernel_function(func, name=name, description=description)
+    plugin = KernelPlugin.from_object(plugin_name=plugin_name, plugin_instance=tool)
+    methods = {
+        function.name: function
+        for function in plugin
+        if isinstance(function, KernelFunctionFromMethod)
+    }
+    return plugin, methods
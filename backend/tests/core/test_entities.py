@@ -1,9 +1,12 @@
 """Tests for core entities."""
 
-from datetime import datetime
+from datetime import UTC, datetime, timedelta, timezone
 from uuid import UUID
 
+from forgebase.core import entities
 from forgebase.core.entities import Project
+from forgebase.core.prd_diff import apply_prd_diff
+from forgebase.core.prd_edits import PrdEdit
 
 
 class TestProject:
@@ -71,6 +74,7 @@ class TestProject:
         assert project.created_at == original_created_at
         assert project.updated_at is not None
         assert project.updated_at >= original_created_at
+        assert project.prd_version == 1
 
     def test_project_dataclass_properties(self):
         """Test that Project behaves as expected as a dataclass."""
@@ -87,3 +91,134 @@ class TestProject:
 
         assert project1 == project2
         assert project1 is not project2
+
+    def test_compact_storage(self):
+        """Test slots, shared owner IDs and timestamps stored as integers."""
+        project1 = Project.create("".join(["test-", "user"]), "One")
+        project2 = Project.create("".join(["test-", "user"]), "Two")
+        assert not hasattr(project1, "__dict__")
+        assert project1.user_id is project2.user_id
+
+        created_at = project1.created_at
+        assert isinstance(project1._created_at, int)
+        assert created_at.tzinfo is UTC
+        assert project1.created_at == created_at
+        project1.update_name("Renamed")
+        assert project1.updated_at >= created_at
+
+        for value in (
+            datetime(2024, 1, 1, 12, 30, 0, 500000),
+            datetime(2024, 1, 1, tzinfo=timezone(timedelta(hours=-5))),
+            datetime(1969, 12, 31, 23, 59, 59, 999999, tzinfo=UTC),
+        ):
+            project = Project(
+                id=project1.id,
+                user_id="test-user",
+                name="Demo",
+                prd="",
+                created_at=value,
+            )
+            assert project.created_at == value
+            assert project.created_at.tzinfo is value.tzinfo
+
+    def test_edit_prd(self):
+        """Test editing a small PRD with text edits."""
+        project = Project.create("test-user", "Test", prd="# PRD\n- One\n")
+
+        hunks = project.edit_prd([PrdEdit(8, 3, "Two")])
+
+        assert project.prd == "# PRD\n- Two\n"
+        assert apply_prd_diff("# PRD\n- One\n", hunks) == project.prd
+        assert project.prd_version == 1
+        assert project.updated_at is not None
+        assert project.edit_prd([]) == ()
+        assert project.prd_version == 1
+
+    def test_prd_outline_follows_changes(self, monkeypatch):
+        """Test that the cached section index follows edits and replacements."""
+        monkeypatch.setattr(entities, "PRD_ROPE_THRESHOLD", 10)
+        project = Project.create("test-user", "Test", prd="# PRD\n## Goals\n- One\n")
+        outline = project.prd_outline
+
+        project.edit_prd([PrdEdit(6, 0, "## Scope\n")])
+        assert project.prd_outline is outline
+        assert [s.slug for s in outline.sections] == ["prd", "scope", "goals"]
+        goals = outline.find("goals")
+        assert project.prd_slice(goals.start, goals.end) == "## Goals\n- One\n"
+
+        project.update_prd("# Replaced\n")
+        assert project.prd_outline is outline
+        assert [s.slug for s in outline.sections] == ["replaced"]
+
+        project.prd = "# Reset\n"
+        assert [s.slug for s in project.prd_outline.sections] == ["reset"]
+
+    def test_packed_prd(self):
+        """Test holding the PRD packed, unpacking on read and dropping on change."""
+        project = Project.create("test-user", "Test", prd="# PRD\n- One\n")
+        unpacked = []
+
+        def unpack(data: bytes) -> str:
+            unpacked.append(data)
+            return data.decode()
+
+        project.pack_prd(b"# PRD\n- One\n", unpack)
+        assert project.prd_packed
+        assert project.prd_length == 12
+        assert project.prd == "# PRD\n- One\n"
+        assert project.prd == "# PRD\n- One\n"
+        project.release_prd()
+        assert project.prd_slice(0, 5) == "# PRD"
+        assert len(unpacked) == 2
+
+        project.edit_prd([PrdEdit(8, 3, "Two")])
+        assert not project.prd_packed
+        assert project.prd == "# PRD\n- Two\n"
+
+    def test_edit_large_prd_uses_rope(self, monkeypatch):
+        """Test that large PRDs are edited in a rope and read back as text."""
+        monkeypatch.setattr(entities, "PRD_ROPE_THRESHOLD", 10)
+        original = "".join(f"- Requirement {i}\n" for i in range(100))
+        project = Project.create("test-user", "Test", prd=original)
+
+        hunks = project.edit_prd([PrdEdit(0, 1, "*"), PrdEdit(20, 0, "new ")])
+        project.edit_prd([PrdEdit(project.prd_length, 0, "- Last\n")])
+
+        expected = "*" + original[1:20] + "new " + original[20:] + "- Last\n"
+        assert project.prd_length == len(expected)
+        assert project.prd == expected
+        assert apply_prd_diff(original, hunks) == expected[: -len("- Last\n")]
+        assert project.prd_version == 2
+
+        project.update_prd("# Replaced\n")
+        assert project.prd == "# Replaced\n"
+        assert project == Project(
+            id=project.id,
+            user_id="test-user",
+            name="Test",
+            prd="# Replaced\n",
+            created_at=project.created_at,
+            updated_at=project.updated_at,
+            prd_version=3,
+        )
+
+    def test_snapshot_is_not_changed_by_later_edits(self, monkeypatch):
+        """Test that a snapshot keeps the state of the project when taken."""
+        monkeypatch.setattr(entities, "PRD_ROPE_THRESHOLD", 10)
+        project = Project.create("test-user", "Test", prd="# PRD\n- One\n")
+        project.edit_prd([PrdEdit(8, 3, "Two")])
+
+        snapshot = project.snapshot()
+        project.edit_prd([PrdEdit(0, 0, "Intro\n")])
+        project.update_name("Renamed")
+
+        assert snapshot == Project(
+            id=project.id,
+            user_id="test-user",
+            name="Test",
+            prd="# PRD\n- Two\n",
+            created_at=project.created_at,
+            updated_at=snapshot.updated_at,
+            prd_version=1,
+        )
+        assert project.prd == "Intro\n# PRD\n- Two\n"
@@ -0,0 +1,71 @@
+"""Tests for per-turn metrics."""
+
+from forgebase.core.metrics import TurnRecorder
+
+
+class FakeClock:
+    """Manually advanced clock for deterministic timings."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTurnRecorder:
+    """Test cases for TurnRecorder and TurnMetrics."""
+
+    def test_records_chunk_offsets(self):
+        """Test that first/last chunk offsets are relative to the start."""
+        clock = FakeClock()
+        recorder = TurnRecorder(source="agent", role="test", clock=clock)
+        clock.now = 100.5
+        recorder.on_chunk()
+        clock.now = 101.5
+        recorder.on_chunk()
+        clock.now = 102.0
+        metrics = recorder.finish()
+
+        assert metrics.ttft == 0.5
+        assert metrics.last_chunk_at == 1.5
+        assert metrics.duration == 2.0
+        assert metrics.chunk_count == 2
+        assert metrics.completed
+
+    def test_usage_is_summed_and_throughput_derived(self):
+        """Test that usage across model requests is accumulated."""
+        clock = FakeClock()
+        recorder = TurnRecorder(source="agent", role="test", clock=clock)
+        recorder.on_chunk()
+        recorder.add_usage(10, 4)
+        recorder.add_usage(12, None)
+        recorder.add_usage(None, 16)
+        clock.now = 102.0
+        recorder.on_chunk()
+        metrics = recorder.finish()
+
+        assert metrics.prompt_tokens == 22
+        assert metrics.completion_tokens == 20
+        assert metrics.completion_tokens_per_second == 10.0
+
+    def test_no_chunks_or_usage(self):
+        """Test metrics for an abandoned turn without output."""
+        metrics = TurnRecorder(source="agent", role="test").finish(completed=False)
+
+        assert metrics.ttft is None
+        assert metrics.prompt_tokens is None
+        assert metrics.completion_tokens_per_second is None
+        assert not metrics.completed
+
+    def test_to_event_includes_tool_calls(self):
+        """Test that events are plain dictionaries including tool timings."""
+        recorder = TurnRecorder(source="agent", role="test")
+        recorder.add_tool_call("PRDTools-update_prd", 0.25)
+        event = recorder.finish().to_event()
+
+        assert event["tool_calls"] == [
+            {"name": "PRDTools-update_prd", "duration": 0.25}
+        ]
+        assert event["source"] == "agent"
+        assert "ttft" in event
@@ -0,0 +1,61 @@
+"""Tests for PRD diffs."""
+
+import random
+
+import pytest
+
+from forgebase.core.prd_diff import PrdHunk, apply_prd_diff, diff_prd
+
+BASE = "# PRD\n\n## Goals\n- Fast\n- Simple\n\n## Scope\n- Web\n"
+
+
+class TestPrdDiff:
+    """Test cases for diff_prd and apply_prd_diff."""
+
+    def test_equal_documents_have_no_hunks(self):
+        """Test that unchanged PRDs produce an empty diff."""
+        assert diff_prd(BASE, BASE) == ()
+
+    def test_single_line_edit_is_one_hunk(self):
+        """Test that an edit only carries the changed line."""
+        new = BASE.replace("- Simple\n", "- Simple to use\n")
+
+        assert diff_prd(BASE, new) == (PrdHunk(4, 1, ("- Simple to use\n",)),)
+
+    @pytest.mark.parametrize(
+        "old, new",
+        [
+            ("", BASE),
+            (BASE, ""),
+            ("no newline", "no newline\nmore"),
+            (BASE, BASE + "## Risks\n"),
+            (BASE, "Intro\n" + BASE),
+            ("a\r\nb\r\n", "a\nb\n"),
+        ],
+    )
+    def test_round_trip(self, old, new):
+        """Test that applying the diff reproduces the new PRD."""
+        assert apply_prd_diff(old, diff_prd(old, new)) == new
+
+    def test_round_trip_random_edits(self):
+        """Test round trips over random line edits."""
+        rng = random.Random(42)
+        lines = [f"line {i}\n" for i in range(50)]
+        for _ in range(200):
+            old = "".join(lines)
+            for _ in range(rng.randint(1, 4)):
+                index = rng.randrange(len(lines) + 1)
+                action = rng.choice(["insert", "delete", "replace"])
+                if action == "insert" or not lines:
+                    lines.insert(index, f"new {rng.random()}\n")
+                elif action == "delete":
+                    del lines[min(index, len(lines) - 1)]
+                else:
+                    lines[min(index, len(lines) - 1)] = f"edit {rng.random()}\n"
+            new = "".join(lines)
+            assert apply_prd_diff(old, diff_prd(old, new)) == new
+
+    def test_rejects_diff_of_another_revision(self):
+        """Test that a hunk outside the document is refused."""
+        with pytest.raises(ValueError):
+            apply_prd_diff("one line\n", (PrdHunk(3, 1, ()),))
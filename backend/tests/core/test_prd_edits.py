@@ -0,0 +1,39 @@
+"""Tests for PRD text edits."""
+
+import pytest
+
+from forgebase.core.prd_edits import PrdEdit, apply_prd_edits
+
+
+class TestApplyPrdEdits:
+    """Test cases for apply_prd_edits."""
+
+    def test_applies_edits_against_base_offsets(self):
+        """Test that every offset refers to the unedited PRD."""
+        prd = "# PRD\nGoals: fast\n"
+
+        edited = apply_prd_edits(
+            prd,
+            [PrdEdit(2, 3, "Spec"), PrdEdit(13, 4, "simple"), PrdEdit(18, 0, "End\n")],
+        )
+
+        assert edited == "# Spec\nGoals: simple\nEnd\n"
+
+    def test_no_edits_keeps_prd(self):
+        """Test that an empty edit list is a no-op."""
+        assert apply_prd_edits("# PRD\n", []) == "# PRD\n"
+
+    @pytest.mark.parametrize(
+        "edits",
+        [
+            [PrdEdit(7, 0, "x")],
+            [PrdEdit(5, 2)],
+            [PrdEdit(3, 2), PrdEdit(4, 0, "x")],
+            [PrdEdit(4, 0), PrdEdit(1, 0)],
+            [PrdEdit(-1, 0)],
+        ],
+    )
+    def test_rejects_invalid_edits(self, edits):
+        """Test that out-of-range, unsorted or overlapping edits are refused."""
+        with pytest.raises(ValueError):
+            apply_prd_edits("# PRD\n", edits)
@@ -0,0 +1,110 @@
+"""Tests for PRD markdown rendering."""
+
+import time
+
+from forgebase.core.prd_html import MAX_NESTING, render_prd_html
+from forgebase.core.prd_outline import PrdOutline
+
+
+class TestRenderPrdHtml:
+    """Test cases for render_prd_html."""
+
+    def test_headings_use_outline_slugs(self):
+        """Test that heading anchors match the section slugs."""
+        prd = (
+            "# PRD\n## Goals\n```\n# Not a heading\n```\n> # Quoted\n## Goals\n"
+            "Text\u2028# Same line\n"
+        )
+
+        html = render_prd_html(prd)
+
+        assert '<h1 id="prd">PRD</h1>' in html
+        assert '<h2 id="goals">Goals</h2>' in html
+        assert '<h2 id="goals-1">Goals</h2>' in html
+        assert "<h1>Quoted</h1>" in html
+        assert "Same line</h1>" not in html
+        assert [s.slug for s in PrdOutline(prd).sections] == ["prd", "goals", "goals-1"]
+
+    def test_blocks(self):
+        """Test paragraphs, lists, quotes, code, tables and rules."""
+        prd = (
+            "Intro\ntext\n\n"
+            "- [x] Done\n- Open\n  1. Step\n\n"
+            "> Note\n\n"
+            "```python\nx = '<a>'\n```\n\n"
+            "| Name | Size |\n|:---|---:|\n| a \\| b | 2 |\n\n"
+            "---\n"
+        )
+
+        assert render_prd_html(prd) == (
+            "<p>Intro\ntext</p>\n"
+            "<ul>\n"
+            '<li><input type="checkbox" disabled checked> Done</li>\n'
+            "<li>Open\n<ol>\n<li>Step</li>\n</ol></li>\n"
+            "</ul>\n"
+            "<blockquote>\n<p>Note</p>\n</blockquote>\n"
+            "<pre><code class=\"language-python\">x = '&lt;a&gt;'\n</code></pre>\n"
+            "<table>\n<thead>\n"
+            '<tr><th style="text-align:left">Name</th>'
+            '<th style="text-align:right">Size</th></tr>\n'
+            "</thead>\n<tbody>\n"
+            '<tr><td style="text-align:left">a | b</td>'
+            '<td style="text-align:right">2</td></tr>\n'
+            "</tbody>\n</table>\n"
+            "<hr>\n"
+        )
+
+    def test_inline_markup(self):
+        """Test emphasis, code spans and links."""
+        html = render_prd_html(
+            "**Bold** *em* ~~old~~ `a_b*` [docs](https://x.io/a_b_c) ![logo](l.png)"
+        )
+
+        assert html == (
+            "<p><strong>Bold</strong> <em>em</em> <del>old</del> <code>a_b*</code> "
+            '<a href="https://x.io/a_b_c">docs</a> <img src="l.png" alt="logo"></p>\n'
+        )
+
+    def test_code_spans_in_link_labels(self):
+        """Test that code in link labels and image alt text is kept."""
+        html = render_prd_html("[`x_y` *z*](https://x.io) ![`a` b](i.png)")
+
+        assert html == (
+            '<p><a href="https://x.io"><code>x_y</code> <em>z</em></a> '
+            '<img src="i.png" alt="a b"></p>\n'
+        )
+
+    def test_unclosed_markers_render_in_linear_time(self):
+        """Test that unclosed inline markers do not backtrack quadratically."""
+        paragraphs = [
+            "**a " * 20000,
+            "_a " * 20000,
+            "[" * 50000,
+            "x " + "".join("`" * k + "a" for k in range(1, 300)),
+        ]
+
+        started = time.perf_counter()
+        for paragraph in paragraphs:
+            html = render_prd_html(paragraph)
+            assert "<strong>" not in html and "<code>" not in html
+        assert time.perf_counter() - started < 1.0
+
+    def test_escapes_html_and_unsafe_links(self):
+        """Test that raw HTML and script URLs are not passed through."""
+        html = render_prd_html(
+            '<script>alert(1)</script> [x](javascript:alert(1)) [y](a" onclick="b)'
+        )
+
+        assert "<script>" not in html
+        assert "&lt;script&gt;" in html
+        assert "href" not in html
+
+    def test_deep_nesting_is_rendered_as_text(self):
+        """Test that nesting past the limit neither recurses further nor fails."""
+        quotes = render_prd_html(">" * 600 + " *deep*")
+        lists = render_prd_html("- " * 600 + "item")
+
+        assert quotes.count("<blockquote>") == MAX_NESTING
+        assert "&gt;&gt;" in quotes and "<em>deep</em>" in quotes
+        assert lists.count("<ul>") == MAX_NESTING
+        assert lists.endswith("</ul>\n")
@@ -0,0 +1,91 @@
+"""Tests for the PRD section index."""
+
+import random
+
+from forgebase.core.prd_diff import diff_prd
+from forgebase.core.prd_edits import PrdEdit
+from forgebase.core.prd_outline import PrdOutline, slugify
+from forgebase.core.prd_rope import PrdRope
+
+PRD = """Intro line
+
+# Product
+
+## Goals
+Ship fast and stay simple.
+
+## Requirements ##
+- Export as PDF
+### Goals
+Nested goals here.
+
+```markdown
+# Not a heading
+```
+
+# Risks
+"""
+
+
+class TestPrdOutline:
+    """Test cases for PrdOutline."""
+
+    def test_sections(self):
+        """Test headings, nesting, offsets, slugs and word counts."""
+        outline = PrdOutline(PRD)
+
+        summary = [(s.slug, s.title, s.level, s.words) for s in outline.sections]
+        assert summary == [
+            ("product", "Product", 1, 15),
+            ("goals", "Goals", 2, 5),
+            ("requirements", "Requirements", 2, 10),
+            ("goals-1", "Goals", 3, 7),
+            ("risks", "Risks", 1, 0),
+        ]
+        requirements = outline.find("requirements")
+        assert requirements is not None
+        assert PRD[requirements.start : requirements.end].startswith("## Requirements")
+        assert PRD[requirements.end :] == "# Risks\n"
+        assert outline.find("missing") is None
+
+    def test_slugify(self):
+        """Test GitHub-style slugs."""
+        assert slugify("  Goals & Non-Goals (v2) ") == "goals--non-goals-v2"
+        assert slugify("!!!") == "section"
+
+    def test_slugs_stay_unique(self):
+        """Test that numbered slugs do not collide with numbered titles."""
+        outline = PrdOutline("# A\n# A\n# A-1\n# A 2\n# A\n")
+
+        slugs = [s.slug for s in outline.sections]
+        assert slugs == ["a", "a-1", "a-1-1", "a-2", "a-3"]
+
+    def test_incremental_updates_match_rebuild(self):
+        """Test that following line hunks gives the same index as rescanning."""
+        rng = random.Random(5)
+        pieces = ["# Title\n", "## Goals\n", "text here\n", "```\n", "more words\n"]
+        pieces += ["### Sub\n", "\n", "- item\n", "~~~\n", "#NotHeading\n"]
+        prd = "".join(rng.choice(pieces) for _ in range(30))
+        outline = PrdOutline(prd)
+        for _ in range(300):
+            lines = prd.splitlines(keepends=True)
+            start = rng.randrange(len(lines) + 1)
+            end = min(start + rng.randint(0, 3), len(lines))
+            new_lines = [rng.choice(pieces) for _ in range(rng.randint(0, 3))]
+            new = "".join(lines[:start] + new_lines + lines[end:])
+
+            outline.update(new, diff_prd(prd, new))
+
+            assert outline.sections == PrdOutline(new).sections
+            prd = new
+
+    def test_update_from_rope(self):
+        """Test refreshing the index from a rope without joining it."""
+        rope = PrdRope(PRD)
+        outline = PrdOutline(rope)
+
+        hunks = rope.apply_edits([PrdEdit(PRD.index("## Goals"), 0, "# Vision\n")])
+        outline.update(rope, hunks)
+
+        assert [s.slug for s in outline.sections][:3] == ["product", "vision", "goals"]
+        assert outline.sections == PrdOutline(str(rope)).sections
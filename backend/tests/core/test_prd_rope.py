@@ -0,0 +1,110 @@
+"""Tests for the PRD rope."""
+
+import random
+
+import pytest
+
+from forgebase.core import prd_rope
+from forgebase.core.prd_diff import (
+    PrdHunk,
+    apply_prd_diff,
+    apply_prd_hunks,
+    diff_prd,
+    split_lines,
+)
+from forgebase.core.prd_edits import PrdEdit, apply_prd_edits
+from forgebase.core.prd_rope import PrdRope
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    """Use tiny chunks so edits cross chunk boundaries."""
+    monkeypatch.setattr(prd_rope, "CHUNK_SIZE", 8)
+
+
+def _random_edits(rng: random.Random, length: int) -> list[PrdEdit]:
+    offsets = sorted(rng.sample(range(length + 1), min(rng.randint(1, 3), length + 1)))
+    edits = []
+    for index, offset in enumerate(offsets):
+        limit = (offsets[index + 1] if index + 1 < len(offsets) else length) - offset
+        text = rng.choice(["", "x", "new line\n", "\n", "a\nb", "## Heading\n\n"])
+        edits.append(PrdEdit(offset, rng.randint(0, min(limit, 12)), text))
+    return edits
+
+
+class TestPrdRope:
+    """Test cases for PrdRope."""
+
+    def test_slices_and_lines(self):
+        """Test reads across chunk boundaries."""
+        text = "# PRD\n\n## Goals\n- Fast\n- Simple\n"
+        rope = PrdRope(text)
+
+        assert str(rope) == text
+        assert len(rope) == len(text)
+        assert rope.chunk_count > 1
+        assert rope.slice(3, 20) == text[3:20]
+        assert rope.line_number(len(text)) == text.count("\n")
+        assert rope.line_start(20) == text.rfind("\n", 0, 20) + 1
+        assert rope.line_end(20) == text.find("\n", 20) + 1
+        assert list(rope.lines()) == split_lines(text)
+        assert list(PrdRope("no newline").lines()) == ["no newline"]
+        assert not list(PrdRope().lines())
+
+    def test_random_edits_match_strings_and_hunks(self):
+        """Test that edits and their hunks agree with plain string edits."""
+        rng = random.Random(3)
+        text = "".join(f"- Requirement {i}\n" for i in range(20))
+        rope = PrdRope(text)
+        for _ in range(500):
+            edits = _random_edits(rng, len(text))
+            expected = apply_prd_edits(text, edits)
+
+            hunks = rope.apply_edits(edits)
+
+            assert str(rope) == expected
+            assert apply_prd_diff(text, hunks) == expected
+            text = expected
+
+    def test_hunks_are_line_aligned(self):
+        """Test that hunks replace whole lines, like those of ``diff_prd``."""
+        rng = random.Random(7)
+        text = "".join(f"- Requirement {i}\n" for i in range(20)) + "tail"
+        rope = PrdRope(text)
+        for _ in range(500):
+            edits = _random_edits(rng, len(text))
+            expected = apply_prd_edits(text, edits)
+
+            hunks = rope.apply_edits(edits)
+
+            lines = apply_prd_hunks(split_lines(text), hunks)
+            assert lines == apply_prd_hunks(split_lines(text), diff_prd(text, expected))
+            assert lines == split_lines(expected)
+            text = expected
+
+    def test_joining_lines_widens_the_hunk(self):
+        """Test that deleting a line break takes in the line joined to the edit."""
+        rope = PrdRope("a\nb\nc\n")
+
+        assert rope.apply_edits([PrdEdit(0, 2, "X")]) == (PrdHunk(0, 2, ("Xb\n",)),)
+        assert rope.apply_edits([PrdEdit(2, 1, "")]) == (PrdHunk(0, 2, ("Xbc\n",)),)
+        assert str(rope) == "Xbc\n"
+
+    def test_delete_everything(self):
+        """Test that a rope can be emptied and refilled."""
+        rope = PrdRope("some text\nacross chunks\n")
+
+        rope.apply_edits([PrdEdit(0, len(rope))])
+        assert str(rope) == ""
+        rope.apply_edits([PrdEdit(0, 0, "# New\n")])
+
+        assert str(rope) == "# New\n"
+
+    def test_rejects_out_of_range_edit(self):
+        """Test that invalid edits leave the rope unchanged."""
+        rope = PrdRope("# PRD\n")
+
+        with pytest.raises(ValueError):
+            rope.apply_edits([PrdEdit(2, 1, "x"), PrdEdit(5, 9)])
+
+        assert str(rope) == "# PRD\n"
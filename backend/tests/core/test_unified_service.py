@@ -1,15 +1,49 @@
 """Tests for the split service layer."""
 
+import asyncio
+import random
 from uuid import uuid4
 import pytest
 
 from forgebase.core.chat_service import ChatService
 from forgebase.core.project_service import ProjectService
-from forgebase.core.exceptions import ProjectNotFoundError
+from forgebase.core.exceptions import (
+    PrdRevisionNotFoundError,
+    PrdSectionNotFoundError,
+    PrdVersionConflictError,
+    ProjectNotFoundError,
+)
+from forgebase.core import entities
+from forgebase.core.prd_edits import PrdEdit, apply_prd_edits
+from forgebase.core.prd_outline import PrdOutline
+from forgebase.infrastructure.prd_history import InMemoryPrdHistory
 from forgebase.infrastructure.stub_agent import StubAgent
 from forgebase.infrastructure.project_repository import InMemoryProjectRepository
 
 
+class RecordingExecutor:
+    """Work executor running calls inline and recording their functions."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def run_cpu(self, fn, *args, size=0):
+        self.calls.append(fn.__name__)
+        return fn(*args)
+
+    async def run_blocking(self, fn, *args, size=0):
+        self.calls.append(fn.__name__)
+        return fn(*args)
+
+
+class YieldingRepository(InMemoryProjectRepository):
+    """Repository whose updates let other tasks run, like a database would."""
+
+    async def update(self, project):
+        await asyncio.sleep(0)
+        return await super().update(project)
+
+
 class TestChatService:
     """Test the ChatService."""
 
@@ -33,6 +67,21 @@ class TestChatService:
         assert len(response) > 0
         assert "Hello!" in response  # StubAgent responds to greetings
 
+    @pytest.mark.asyncio
+    async def test_metrics_callback_receives_service_and_agent_metrics(self):
+        """Test that the metrics hook sees both the service and the agent turn."""
+        events = []
+        chat_service = ChatService(StubAgent(role="test_agent"), metrics_callback=events.append)
+
+        chunks = [chunk async for chunk in chat_service.send_message_stream("Hello")]
+
+        sources = sorted(metrics.source for metrics in events)
+        assert sources == ["agent", "chat_service"]
+        for metrics in events:
+            assert metrics.chunk_count == len(chunks)
+            assert metrics.ttft is not None
+            assert metrics.completed
+
     @pytest.mark.asyncio
     async def test_reset_chat(self, chat_service):
         """Test that the chat service can reset chat."""
@@ -60,6 +109,27 @@ class TestProjectService:
         assert project.prd == "Test PRD"
         assert project.id is not None
 
+    @pytest.mark.asyncio
+    async def test_mutations_publish_events(self):
+        """Test that creates, real updates and deletes publish project events."""
+        events = []
+        project_service = ProjectService(InMemoryProjectRepository(), on_change=events.append)
+
+        project = await project_service.create_project("test-user", "Test Project")
+        await project_service.get_project(str(project.id), "test-user")
+        await project_service.update_project(str(project.id), "test-user", prd="New PRD")
+        await project_service.update_project(str(project.id), "test-user", prd="New PRD")
+        await project_service.delete_project(str(project.id), "test-user")
+        await project_service.delete_project(str(project.id), "test-user")
+
+        assert [event.kind for event in events] == ["created", "updated", "deleted"]
+        assert all(event.project_id == project.id for event in events)
+        assert events[1].changed == ("prd",)
+        assert events[1].name == "Test Project"
+        assert events[1].updated_at == project.updated_at
+        assert events[1].prd_version == project.prd_version == 1
+        assert events[1].prd_diff is not None
+
     @pytest.mark.asyncio
     async def test_get_project(self, project_service):
         """Test getting a project."""
@@ -211,3 +281,156 @@ class TestProjectService:
 
         with pytest.raises(ProjectNotFoundError, match="Invalid project ID format"):
             await project_service.delete_project("not-a-uuid", user_id)
+
+    @pytest.mark.asyncio
+    async def test_prd_revisions(self):
+        """Test that PRD versions are recorded and can be fetched and diffed."""
+        history = InMemoryPrdHistory()
+        project_service = ProjectService(InMemoryProjectRepository(), prd_history=history)
+        user_id = "test-user"
+        project = await project_service.create_project(user_id, "Test", prd="# v0\n")
+        project_id = str(project.id)
+        await project_service.update_project(project_id, user_id, prd="# v0\n- one\n")
+        await project_service.update_project(project_id, user_id, name="Renamed")
+        await project_service.update_project(project_id, user_id, prd="# v0\n- two\n")
+
+        revisions = await project_service.list_prd_revisions(project_id, user_id)
+        assert [revision.version for revision in revisions] == [2, 1, 0]
+        assert await project_service.get_prd_revision(project_id, user_id, 1) == "# v0\n- one\n"
+        with pytest.raises(PrdRevisionNotFoundError):
+            await project_service.get_prd_revision(project_id, user_id, 3)
+
+        _, diff = await project_service.get_prd_changes(project_id, user_id, 0)
+        assert diff is not None and len(diff) == 1
+        assert (await project_service.get_prd_changes(project_id, user_id, 2))[1] == ()
+        assert (await project_service.get_prd_changes(project_id, user_id, 9))[1] is None
+
+        await project_service.delete_project(project_id, user_id)
+        assert await history.list_revisions(project.id) == []
+
+    @pytest.mark.asyncio
+    async def test_edit_prd(self):
+        """Test that text edits apply only on top of the expected version."""
+        events = []
+        project_service = ProjectService(
+            InMemoryProjectRepository(), on_change=events.append
+        )
+        user_id = "test-user"
+        project = await project_service.create_project(user_id, "Test", prd="# PRD\n")
+        project_id = str(project.id)
+
+        edited = await project_service.edit_prd(
+            project_id, user_id, 0, [PrdEdit(6, 0, "- Goal\n")]
+        )
+
+        assert edited.prd == "# PRD\n- Goal\n"
+        assert edited.prd_version == 1
+        assert events[-1].changed == ("prd",)
+        with pytest.raises(PrdVersionConflictError) as conflict:
+            await project_service.edit_prd(project_id, user_id, 0, [PrdEdit(0, 1)])
+        assert conflict.value.current_version == 1
+        with pytest.raises(ValueError):
+            await project_service.edit_prd(project_id, user_id, 1, [PrdEdit(99, 1)])
+        assert (await project_service.get_project(project_id, user_id)).prd_version == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_changes_publish_their_own_state(self):
+        """Test that events and revisions are not overtaken by a later change."""
+        events = []
+        history = InMemoryPrdHistory()
+        project_service = ProjectService(
+            YieldingRepository(), on_change=events.append, prd_history=history
+        )
+        user_id = "test-user"
+        project = await project_service.create_project(user_id, "Test", prd="# PRD\n")
+        project_id = str(project.id)
+        await project_service.edit_prd(project_id, user_id, 0, [PrdEdit(6, 0, "- A\n")])
+
+        await asyncio.gather(
+            project_service.update_project(project_id, user_id, name="Renamed"),
+            project_service.edit_prd(project_id, user_id, 1, [PrdEdit(10, 0, "- B\n")]),
+        )
+
+        renamed, edited = events[-2:]
+        assert (renamed.changed, renamed.prd_version) == (("name",), 1)
+        assert (edited.changed, edited.prd_version) == (("prd",), 2)
+        revisions = await history.list_revisions(project.id)
+        assert [revision.version for revision in revisions] == [2, 1, 0]
+        assert await history.get_revision(project.id, 2) == "# PRD\n- A\n- B\n"
+
+    @pytest.mark.asyncio
+    async def test_edited_prd_revisions_round_trip(self, monkeypatch):
+        """Test that revisions made by rope edits are rebuilt from their diffs."""
+        monkeypatch.setattr(entities, "PRD_ROPE_THRESHOLD", 10)
+        history = InMemoryPrdHistory(keyframe_interval=100)
+        project_service = ProjectService(InMemoryProjectRepository(), prd_history=history)
+        user_id = "test-user"
+        prd = "# PRD\n" + "".join(f"## Part {i}\n- Item {i}\n" for i in range(10))
+        project = await project_service.create_project(user_id, "Test", prd=prd)
+        project_id = str(project.id)
+        await project_service.get_prd_outline(project_id, user_id)
+        rng = random.Random(5)
+        revisions = [prd]
+        while len(revisions) < 30:
+            offset = rng.randrange(len(prd))
+            deleted = rng.randint(1, min(8, len(prd) - offset))
+            edit = PrdEdit(offset, deleted, rng.choice(["X", "## New\n", "", "a\nb"]))
+            prd = apply_prd_edits(prd, [edit])
+            await project_service.edit_prd(project_id, user_id, len(revisions) - 1, [edit])
+            revisions.append(prd)
+
+        for version, expected in enumerate(revisions):
+            assert await project_service.get_prd_revision(project_id, user_id, version) == expected
+        edited, sections = await project_service.get_prd_outline(project_id, user_id)
+        assert edited.prd == prd
+        assert sections == PrdOutline(prd).sections
+
+    @pytest.mark.asyncio
+    async def test_prd_sections(self):
+        """Test the PRD outline and fetching a section by slug."""
+        project_service = ProjectService(InMemoryProjectRepository())
+        user_id = "test-user"
+        project = await project_service.create_project(
+            user_id, "Test", prd="# PRD\n## Goals\n- Fast\n## Risks\n"
+        )
+        project_id = str(project.id)
+        await project_service.update_project(
+            project_id, user_id, prd="# PRD\n## Goals\n- Fast\n- Simple\n## Risks\n"
+        )
+
+        _, sections = await project_service.get_prd_outline(project_id, user_id)
+        _, section, content = await project_service.get_prd_section(
+            project_id, user_id, "goals"
+        )
+
+        assert [(s.slug, s.words) for s in sections] == [
+            ("prd", 2),
+            ("goals", 2),
+            ("risks", 0),
+        ]
+        assert section.title == "Goals"
+        assert content == "## Goals\n- Fast\n- Simple\n"
+        with pytest.raises(PrdSectionNotFoundError):
+            await project_service.get_prd_section(project_id, user_id, "missing")
+
+    @pytest.mark.asyncio
+    async def test_prd_work_runs_on_executor(self):
+        """Test that diffing and indexing PRDs go through the work executor."""
+        executor = RecordingExecutor()
+        project_service = ProjectService(
+            InMemoryProjectRepository(),
+            prd_history=InMemoryPrdHistory(),
+            executor=executor,
+        )
+        user_id = "test-user"
+        project = await project_service.create_project(user_id, "Test", prd="# A\n")
+        project_id = str(project.id)
+
+        await project_service.update_project(project_id, user_id, prd="# B\n")
+        _, diff = await project_service.get_prd_changes(project_id, user_id, 0)
+        _, sections = await project_service.get_prd_outline(project_id, user_id)
+        await project_service.get_prd_outline(project_id, user_id)
+
+        assert executor.calls == ["diff_prd", "diff_prd", "PrdOutline"]
+        assert diff is not None and diff[0].lines == ("# B\n",)
+        assert [section.slug for section in sections] == ["b"]
@@ -0,0 +1,54 @@
+"""Shared fixtures for infrastructure tests."""
+
+import pytest
+
+from forgebase.infrastructure import config
+from forgebase.infrastructure.mock_llm_server import MockLLMBehavior, MockLLMServer
+
+
+@pytest.fixture(autouse=True)
+def reset_deployment_routing():
+    """Build the shared router and hedging policy from each test's settings."""
+    config.reset_deployment_router()
+    config.reset_hedge_policy()
+    yield
+    config.reset_deployment_router()
+    config.reset_hedge_policy()
+
+
+@pytest.fixture
+def mock_deployment():
+    """Start local mock chat-completions servers.
+
+    Returns a factory taking a ``MockLLMBehavior`` and returning the
+    ``(endpoint, behavior)`` of a running server.
+    """
+    servers = []
+
+    def start(behavior: MockLLMBehavior | None = None):
+        server = MockLLMServer(behavior).start()
+        servers.append(server)
+        return server.endpoint, server.behavior
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+@pytest.fixture
+def mock_azure_openai(mock_deployment, monkeypatch):
+    """Point the ``AZURE_OPENAI_*`` configuration at a mock deployment.
+
+    Returns a factory taking a ``MockLLMBehavior`` and returning the behavior
+    of the running server, so ``config`` builds a real ``Agent`` against it.
+    """
+
+    def start(behavior: MockLLMBehavior | None = None) -> MockLLMBehavior:
+        endpoint, behavior = mock_deployment(behavior)
+        monkeypatch.delenv("AZURE_OPENAI_DEPLOYMENTS", raising=False)
+        monkeypatch.setenv("AZURE_OPENAI_ENDPOINT", endpoint)
+        monkeypatch.setenv("AZURE_OPENAI_API_KEY", "mock-key")
+        monkeypatch.setenv("AZURE_OPENAI_DEPLOYMENT_NAME", "mock")
+        return behavior
+
+    return start
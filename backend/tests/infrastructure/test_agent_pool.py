@@ -0,0 +1,91 @@
+"""Tests for the pre-built agent pool."""
+
+import time
+
+import pytest
+
+from forgebase.infrastructure.agent_pool import AgentPool
+from forgebase.infrastructure.stub_agent import StubAgent
+
+
+def _wait_for(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached in time")
+        time.sleep(0.005)
+
+
+class CountingFactory:
+    """Agent factory counting builds, optionally failing."""
+
+    def __init__(self, fail_times: int = 0) -> None:
+        self.builds = 0
+        self.fail_times = fail_times
+
+    def __call__(self) -> StubAgent:
+        if self.fail_times:
+            self.fail_times -= 1
+            raise RuntimeError("boom")
+        self.builds += 1
+        return StubAgent(role=f"agent-{self.builds}")
+
+
+class TestAgentPool:
+    """Test cases for AgentPool."""
+
+    def test_requires_positive_size(self):
+        """Test that an empty pool is rejected."""
+        with pytest.raises(ValueError):
+            AgentPool(StubAgent, 0)
+
+    def test_start_prebuilds_agents(self):
+        """Test that starting the pool builds agents in the background."""
+        factory = CountingFactory()
+        pool = AgentPool(factory, 3)
+        pool.start()
+        try:
+            _wait_for(lambda: pool.ready == 3)
+        finally:
+            pool.stop()
+        assert factory.builds == 3
+
+    def test_checkout_returns_ready_agent_and_refills(self):
+        """Test that checkouts hit the pool and are replaced in the background."""
+        factory = CountingFactory()
+        pool = AgentPool(factory, 2)
+        pool.start()
+        try:
+            _wait_for(lambda: pool.ready == 2)
+            first = pool.checkout()
+            second = pool.checkout()
+            _wait_for(lambda: pool.ready == 2)
+        finally:
+            pool.stop()
+
+        assert first is not second
+        assert pool.hits == 2
+        assert pool.misses == 0
+        assert factory.builds == 4
+
+    def test_checkout_builds_inline_when_empty(self):
+        """Test that an empty pool still hands out an agent."""
+        pool = AgentPool(CountingFactory(), 1)
+
+        agent = pool.checkout()
+
+        assert isinstance(agent, StubAgent)
+        assert pool.misses == 1
+
+    def test_factory_errors_do_not_stop_refills(self):
+        """Test that a failed build is retried on the next checkout."""
+        factory = CountingFactory(fail_times=1)
+        pool = AgentPool(factory, 1)
+        pool.start()
+        try:
+            _wait_for(lambda: factory.fail_times == 0)
+            pool.checkout()
+            _wait_for(lambda: pool.ready == 1)
+        finally:
+            pool.stop()
+        assert pool.misses == 1
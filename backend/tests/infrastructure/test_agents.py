@@ -1,9 +1,14 @@
 """Tests for the agent implementations."""
 
 import pytest
+from semantic_kernel.contents import ChatHistory, FunctionCallContent
 
+from forgebase.core.metrics import TurnRecorder
+from forgebase.core.project_service import ProjectService
 from forgebase.infrastructure.agent import Agent
+from forgebase.infrastructure.project_repository import InMemoryProjectRepository
 from forgebase.infrastructure.stub_agent import StubAgent
+from forgebase.tools.prd_tools import PRDTools
 
 
 class TestAgent:
@@ -23,6 +28,86 @@ class TestAgent:
         assert agent.agent is not None  # Should have real agent instance
         assert not agent.available_tools
 
+    def test_tools_are_registered_as_kernel_functions(self):
+        """Test that tool functions are exposed to the kernel on registration."""
+        tools = PRDTools(ProjectService(InMemoryProjectRepository()))
+        agent = Agent(
+            endpoint="https://test.openai.azure.com/",
+            api_key="test-key",
+            deployment_name="test-deployment",
+            tools=[tools],
+        )
+
+        function = agent.kernel.get_function("PRDTools", "update_prd")
+        assert function.description == "Update the PRD content of the current project"
+        assert [p.name for p in function.metadata.parameters] == ["prd_content"]
+
+    def test_tool_plugin_metadata_is_shared_between_agents(self):
+        """Test that agents reuse tool metadata but bind their own tool instance."""
+        service = ProjectService(InMemoryProjectRepository())
+        tools = [PRDTools(service), PRDTools(service)]
+        agents = [
+            Agent(
+                endpoint="https://test.openai.azure.com/",
+                api_key="test-key",
+                deployment_name="test-deployment",
+                tools=[tool],
+            )
+            for tool in tools
+        ]
+
+        first, second = (
+            agent.kernel.get_function("PRDTools", "update_prd") for agent in agents
+        )
+        assert first.metadata is second.metadata
+        assert first.method.__self__ is tools[0]
+        assert second.method.__self__ is tools[1]
+
+    @pytest.mark.asyncio
+    async def test_tool_invocation_filter_runs_in_kernel(self):
+        """Test that SK calls the tool filter, which counts and times the call."""
+        agent = Agent(
+            endpoint="https://test.openai.azure.com/",
+            api_key="test-key",
+            deployment_name="test-deployment",
+            tools=[PRDTools(ProjectService(InMemoryProjectRepository()))],
+        )
+        recorder = TurnRecorder(source="agent", role="test")
+        agent._recorder = recorder
+        history = ChatHistory()
+
+        await agent.kernel.invoke_function_call(
+            FunctionCallContent(
+                id="call-1",
+                name="PRDTools-update_prd",
+                arguments='{"prd_content": "# PRD"}',
+            ),
+            history,
+            function_call_count=1,
+            request_index=0,
+        )
+
+        assert agent.tool_call_count == 1
+        tool_calls = recorder.finish(completed=True).tool_calls
+        assert [call.name for call in tool_calls] == ["PRDTools-update_prd"]
+        result = history.messages[-1].items[0]
+        assert "No project context" in str(result.result)
+
+    @pytest.mark.asyncio
+    async def test_record_turn_appends_to_thread(self):
+        """Test that record_turn adds the exchange without calling the model."""
+        agent = Agent(
+            endpoint="https://test.openai.azure.com/",
+            api_key="test-key",
+            deployment_name="test-deployment",
+        )
+
+        await agent.record_turn("Hello", "Hi there")
+
+        assert agent.thread is not None
+        assert len(agent.thread) == 2
+        assert agent.tool_call_count == 0
+
 
 class TestStubAgent:
     """Test the StubAgent implementation."""
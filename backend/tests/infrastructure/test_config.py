@@ -1,14 +1,21 @@
 """Tests for configuration and agent selection logic."""
 
 import os
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from forgebase.infrastructure import config
 from forgebase.infrastructure.stub_agent import StubAgent
 from forgebase.infrastructure.agent import Agent
 from forgebase.core.chat_service import ChatService
 from forgebase.core.project_service import ProjectService
 from forgebase.infrastructure.project_repository import InMemoryProjectRepository
+from forgebase.infrastructure.response_cache import CachingAgent
+from forgebase.infrastructure.stub_profiles import STUB_PROFILES
 
 
 class TestConfiguration:
@@ -81,6 +88,154 @@ class TestConfiguration:
         agent = config._create_agent(project_service)
         assert isinstance(agent, Agent)
 
+    @patch.dict(
+        os.environ,
+        {
+            "AZURE_OPENAI_DEPLOYMENTS": (
+                '[{"endpoint": "https://a.openai.azure.com/", "api_key": "k1",'
+                ' "deployment_name": "gpt", "weight": 2},'
+                ' {"endpoint": "https://b.openai.azure.com/", "api_key": "k2",'
+                ' "deployment_name": "gpt"},'
+                ' {"endpoint": "https://c.openai.azure.com/", "api_key": ""}]'
+            ),
+        },
+        clear=True,
+    )
+    def test_load_deployments_from_json_list(self):
+        """Test that multiple deployments are read and incomplete ones skipped."""
+        deployments = config._load_deployments()
+        assert [d.endpoint for d in deployments] == [
+            "https://a.openai.azure.com/",
+            "https://b.openai.azure.com/",
+        ]
+        assert deployments[0].weight == 2.0
+        agent = config._create_agent(ProjectService(InMemoryProjectRepository()))
+        assert isinstance(agent, Agent)
+
+    @patch.dict(
+        os.environ,
+        {
+            "AZURE_OPENAI_ENDPOINT": "https://test.openai.azure.com/",
+            "AZURE_OPENAI_API_KEY": "test-key",
+            "AZURE_OPENAI_DEPLOYMENT_NAME": "test-deployment",
+        },
+        clear=True,
+    )
+    def test_agents_share_deployment_router(self):
+        """Test that deployment health is tracked once per process."""
+        project_service = ProjectService(InMemoryProjectRepository())
+        first = config._create_agent(project_service)
+        second = config._create_agent(project_service)
+
+        router = config.get_deployment_router()
+        assert router is not None
+        assert first._router is router
+        assert second._router is router
+        config.reset_deployment_router()
+        assert config.get_deployment_router() is not router
+
+    @patch.dict(
+        os.environ,
+        {
+            "AZURE_OPENAI_ENDPOINT": "https://test.openai.azure.com/",
+            "AZURE_OPENAI_API_KEY": "test-key",
+            "AZURE_OPENAI_DEPLOYMENT_NAME": "test-deployment",
+            "FORGEBASE_HEDGE_PERCENTILE": "95",
+        },
+        clear=True,
+    )
+    def test_agents_share_hedge_policy(self):
+        """Test that the hedge deadline is learned from all sessions."""
+        project_service = ProjectService(InMemoryProjectRepository())
+        first = config._create_agent(project_service)
+        second = config._create_agent(project_service)
+
+        policy = config.get_hedge_policy()
+        assert policy is not None
+        assert first._hedge_policy is policy
+        assert second._hedge_policy is policy
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_no_deployment_router_without_config(self):
+        """Test that no router is built when no deployment is configured."""
+        assert config.get_deployment_router() is None
+
+    @patch.dict(os.environ, {"FORGEBASE_HEDGE_PERCENTILE": "95"}, clear=True)
+    def test_create_hedge_policy_when_enabled(self):
+        """Test that hedging is enabled only with a valid percentile."""
+        assert config._create_hedge_policy() is not None
+        with patch.dict(os.environ, {"FORGEBASE_HEDGE_PERCENTILE": "0"}):
+            assert config._create_hedge_policy() is None
+        with patch.dict(os.environ, {"FORGEBASE_HEDGE_PERCENTILE": "99.9"}):
+            policy = config._create_hedge_policy()
+            assert policy is not None
+            assert policy._percentile == 99.9
+
+    @pytest.mark.parametrize("value", ["ninety", "-1", "100.5"])
+    def test_create_hedge_policy_rejects_invalid_percentile(self, value):
+        """Test that a percentile outside 0-100 is reported."""
+        with patch.dict(
+            os.environ, {"FORGEBASE_HEDGE_PERCENTILE": value}, clear=True
+        ), pytest.raises(ValueError):
+            config._create_hedge_policy()
+
+    @patch.dict(os.environ, {"FORGEBASE_STUB_PROFILE": "instant"}, clear=True)
+    def test_load_stub_profile_preset(self):
+        """Test that the stub profile is read from the environment."""
+        assert config._load_stub_profile() is STUB_PROFILES["instant"]
+        with patch.dict(os.environ, {"FORGEBASE_STUB_PROFILE": ""}):
+            assert config._load_stub_profile() is None
+
+    @patch.dict(os.environ, {"AZURE_OPENAI_DEPLOYMENTS": "not json"}, clear=True)
+    def test_load_deployments_rejects_invalid_json(self):
+        """Test that a malformed deployment list is reported."""
+        with pytest.raises(ValueError, match="AZURE_OPENAI_DEPLOYMENTS"):
+            config._load_deployments()
+
+    @patch.dict(os.environ, {"FORGEBASE_RESPONSE_CACHE_SIZE": "8"}, clear=True)
+    def test_create_agent_wraps_with_cache_when_enabled(self):
+        """Test that _create_agent adds the shared response cache when configured."""
+        config.reset_response_cache()
+        project_service = ProjectService(InMemoryProjectRepository())
+        agent = config._create_agent(project_service)
+        assert isinstance(agent, CachingAgent)
+        assert config.get_response_cache() is config.get_response_cache()
+        config.reset_response_cache()
+
+    @patch.dict(os.environ, {"FORGEBASE_AGENT_POOL_SIZE": "2"}, clear=True)
+    def test_checkout_chat_service_checks_out_pooled_agent(self):
+        """Test that session chat services take their agent from the pool."""
+        try:
+            pool = config.get_agent_pool()
+            assert pool is not None
+            pool.fill()
+
+            service = config.checkout_chat_service()
+            config.get_chat_service()
+
+            assert isinstance(service, ChatService)
+            assert (pool.hits, pool.misses) == (1, 0)
+        finally:
+            config.reset_agent_pool()
+        assert config._agent_pool is None
+
+    @patch.dict(
+        os.environ,
+        {"FORGEBASE_AGENT_POOL_SIZE": "1", "FORGEBASE_RESPONSE_CACHE_SIZE": "8"},
+        clear=True,
+    )
+    def test_agent_pool_creates_singletons_before_refilling(self):
+        """Test that the refill thread does not initialize shared singletons."""
+        config.reset_response_cache()
+        try:
+            with patch.object(config.AgentPool, "start"):
+                config.get_agent_pool()
+            assert config._response_cache is not None
+            assert config._project_events is not None
+        finally:
+            config.reset_agent_pool()
+            config.reset_response_cache()
+
     @patch.dict(os.environ, {}, clear=True)
     def test_get_chat_service_returns_valid_service_with_stub(self):
         """Test that get_chat_service returns a valid ChatService with stub agent."""
@@ -101,6 +256,30 @@ class TestConfiguration:
         service = config.get_chat_service()
         assert isinstance(service, ChatService)
 
+    def test_stub_path_does_not_import_semantic_kernel(self):
+        """Test that the web app and a stub agent load without Semantic Kernel."""
+        code = (
+            "import sys\n"
+            "from forgebase.interfaces import web\n"
+            "from forgebase.infrastructure import config\n"
+            "config._create_agent(config.get_project_service())\n"
+            "print(sorted({m.split('.')[0] for m in sys.modules}))\n"
+        )
+        env = {
+            "PATH": os.environ.get("PATH", ""),
+            "PYTHONPATH": str(Path(config.__file__).parents[2]),
+        }
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            env=env,
+            text=True,
+        )
+
+        assert "'semantic_kernel'" not in result.stdout
+        assert "'openai'" not in result.stdout
+
     @patch.dict(os.environ, {}, clear=True)
     def test_get_project_service_returns_valid_service(self):
         """Test that get_project_service returns a valid ProjectService."""
@@ -0,0 +1,151 @@
+"""Tests for spilling conversations out of memory."""
+
+import pytest
+
+from forgebase.infrastructure.agent import Agent
+from forgebase.infrastructure.conversation_memory import ConversationMemoryManager
+from forgebase.infrastructure.conversation_store import ConversationStore
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeConversation:
+    """Conversation recording whether it was spilled."""
+
+    def __init__(self, busy: bool = False) -> None:
+        self.busy = busy
+        self.spilled = False
+
+    def spill(self) -> bool:
+        if self.busy:
+            return False
+        self.spilled = True
+        return True
+
+
+class TestConversationMemoryManager:
+    """Test cases for ConversationMemoryManager."""
+
+    def test_spills_idle_conversations(self):
+        """Test that conversations idle past the timeout are spilled."""
+        clock = FakeClock()
+        manager = ConversationMemoryManager(idle_timeout=60.0, clock=clock)
+        idle, active = FakeConversation(), FakeConversation()
+        manager.touch(idle, 100)
+        clock.now = 50.0
+        manager.touch(active, 100)
+
+        clock.now = 61.0
+        assert manager.sweep() == 1
+
+        assert idle.spilled
+        assert not active.spilled
+        assert manager.resident_bytes == 100
+
+    def test_budget_spills_least_recently_used(self):
+        """Test that the oldest conversations are spilled over the budget."""
+        manager = ConversationMemoryManager(budget_bytes=250)
+        conversations = [FakeConversation() for _ in range(4)]
+        for conversation in conversations:
+            manager.touch(conversation, 100)
+
+        assert [c.spilled for c in conversations] == [True, True, False, False]
+        assert manager.resident_count == 2
+        assert manager.spills == 2
+
+    def test_most_recent_conversation_is_kept(self):
+        """Test that a single conversation larger than the budget stays resident."""
+        manager = ConversationMemoryManager(budget_bytes=10)
+        conversation = FakeConversation()
+        manager.touch(conversation, 100)
+
+        assert not conversation.spilled
+
+    def test_busy_conversations_are_skipped(self):
+        """Test that conversations refusing to spill stay tracked."""
+        clock = FakeClock()
+        manager = ConversationMemoryManager(idle_timeout=1.0, clock=clock)
+        busy = FakeConversation(busy=True)
+        manager.touch(busy, 100)
+        clock.now = 5.0
+
+        assert manager.sweep() == 0
+        assert manager.resident_count == 1
+
+    def test_discarded_conversations_are_forgotten(self):
+        """Test that garbage-collected conversations are dropped."""
+        manager = ConversationMemoryManager(budget_bytes=1000)
+        manager.touch(FakeConversation(), 100)
+
+        manager.sweep()
+
+        assert manager.resident_count == 0
+
+
+class TestAgentSpilling:
+    """Spilling and restoring the real Agent's threads."""
+
+    @staticmethod
+    def _agent(store: ConversationStore, manager: ConversationMemoryManager):
+        return Agent(
+            endpoint="https://test.openai.azure.com/",
+            api_key="test-key",
+            deployment_name="test-deployment",
+            conversation_store=store,
+            memory_manager=manager,
+        )
+
+    @pytest.mark.asyncio
+    async def test_idle_thread_is_spilled_and_restored(self, tmp_path):
+        """Test that an idle thread leaves memory and returns on the next turn."""
+        clock = FakeClock()
+        manager = ConversationMemoryManager(idle_timeout=60.0, clock=clock)
+        agent = self._agent(ConversationStore(tmp_path), manager)
+        agent.set_conversation("c1")
+        await agent.record_turn("Hello", "Hi")
+        assert manager.resident_bytes > 0
+
+        clock.now = 120.0
+        manager.sweep()
+        assert agent.thread is None
+        assert manager.resident_count == 0
+
+        await agent.record_turn("PRD?", "Sure")
+        assert agent.thread is not None
+        assert len(agent.thread) == 4
+
+    @pytest.mark.asyncio
+    async def test_budget_spills_other_agents(self, tmp_path):
+        """Test that a new conversation pushes older ones out of memory."""
+        store = ConversationStore(tmp_path)
+        manager = ConversationMemoryManager(budget_bytes=1)
+        first, second = self._agent(store, manager), self._agent(store, manager)
+        first.set_conversation("c1")
+        second.set_conversation("c2")
+
+        await first.record_turn("Hello", "Hi")
+        await second.record_turn("Hello", "Hi")
+
+        assert first.thread is None
+        assert second.thread is not None
+
+    @pytest.mark.asyncio
+    async def test_unpersisted_conversation_is_not_spilled(self):
+        """Test that threads without a stored conversation stay in memory."""
+        agent = Agent(
+            endpoint="https://test.openai.azure.com/",
+            api_key="test-key",
+            deployment_name="test-deployment",
+        )
+        await agent.record_turn("Hello", "Hi")
+
+        assert not agent.spill()
+        assert agent.thread is not None
@@ -0,0 +1,140 @@
+"""Tests for conversation persistence."""
+
+import pytest
+
+from forgebase.infrastructure.agent import Agent
+from forgebase.infrastructure.conversation_store import ConversationStore
+
+
+def _message(role: str, text: str) -> dict:
+    return {"role": role, "items": [{"content_type": "text", "text": text}]}
+
+
+class TestConversationStore:
+    """Test cases for ConversationStore."""
+
+    def test_append_and_load_round_trip(self, tmp_path):
+        """Test that appended messages are loaded back in order."""
+        store = ConversationStore(tmp_path)
+        store.append("c1", [_message("user", "Hello")])
+        store.append("c1", [_message("assistant", "Hi"), _message("user", "PRD?")])
+
+        assert store.load("c1") == [
+            _message("user", "Hello"),
+            _message("assistant", "Hi"),
+            _message("user", "PRD?"),
+        ]
+        assert store.load("unknown") == []
+
+    def test_conversations_are_separate(self, tmp_path):
+        """Test that ids map to separate files, whatever characters they use."""
+        store = ConversationStore(tmp_path)
+        store.append("../a", [_message("user", "a")])
+        store.append("b", [_message("user", "b")])
+
+        assert store.load("../a") == [_message("user", "a")]
+        assert store.load("b") == [_message("user", "b")]
+        assert len(list(tmp_path.iterdir())) == 2
+
+    def test_records_are_compressed(self, tmp_path):
+        """Test that repetitive messages take less space than their JSON."""
+        store = ConversationStore(tmp_path)
+        text = "The product must let users export their PRD. " * 20
+        store.append("c1", [_message("user", text)])
+
+        (path,) = tmp_path.iterdir()
+        assert path.stat().st_size < len(text) / 2
+
+    def test_torn_tail_is_truncated(self, tmp_path):
+        """Test that an interrupted append only loses the damaged record."""
+        store = ConversationStore(tmp_path)
+        store.append("c1", [_message("user", "kept")])
+        (path,) = tmp_path.iterdir()
+        intact = path.stat().st_size
+        store.append("c1", [_message("assistant", "torn")])
+        with path.open("r+b") as file:
+            file.truncate(path.stat().st_size - 3)
+
+        assert store.load("c1") == [_message("user", "kept")]
+        assert path.stat().st_size == intact
+        store.append("c1", [_message("assistant", "again")])
+        assert len(store.load("c1")) == 2
+
+    def test_rejects_foreign_files(self, tmp_path):
+        """Test that files without the log header are not parsed."""
+        store = ConversationStore(tmp_path)
+        store.append("c1", [_message("user", "Hello")])
+        (path,) = tmp_path.iterdir()
+        path.write_bytes(b"not a log")
+
+        with pytest.raises(ValueError):
+            store.load("c1")
+
+    def test_delete(self, tmp_path):
+        """Test that deleted conversations no longer exist."""
+        store = ConversationStore(tmp_path)
+        store.append("c1", [_message("user", "Hello")])
+
+        assert store.delete("c1")
+        assert not store.exists("c1")
+        assert not store.delete("c1")
+
+
+class TestAgentPersistence:
+    """Persistence and resumption of the real Agent's threads."""
+
+    @staticmethod
+    def _agent(endpoint: str, store: ConversationStore) -> Agent:
+        return Agent(
+            endpoint=endpoint,
+            api_key="key",
+            deployment_name="gpt",
+            conversation_store=store,
+        )
+
+    @pytest.mark.asyncio
+    async def test_thread_survives_a_new_agent(self, mock_deployment, tmp_path):
+        """Test that a conversation is restored lazily by another agent."""
+        endpoint, _ = mock_deployment()
+        store = ConversationStore(tmp_path)
+        first = self._agent(endpoint, store)
+        assert not first.set_conversation("c1")
+        async for _ in first.send_message_stream("Hello"):
+            pass
+
+        second = self._agent(endpoint, store)
+        assert second.set_conversation("c1")
+        assert second.thread is None  # nothing is read before the next message
+        async for _ in second.send_message_stream("Next"):
+            pass
+
+        assert second.thread is not None
+        assert len(second.thread) == 4
+        assert len(store.load("c1")) == 4
+
+    @pytest.mark.asyncio
+    async def test_turns_are_appended_incrementally(self, tmp_path):
+        """Test that each turn appends only its own messages."""
+        store = ConversationStore(tmp_path)
+        agent = self._agent("https://test.openai.azure.com/", store)
+        agent.set_conversation("c1")
+        await agent.record_turn("Hello", "Hi")
+        await agent.record_turn("PRD?", "Sure")
+
+        contents = [
+            item["text"] for message in store.load("c1") for item in message["items"]
+        ]
+        assert contents == ["Hello", "Hi", "PRD?", "Sure"]
+
+    @pytest.mark.asyncio
+    async def test_reset_deletes_conversation(self, tmp_path):
+        """Test that resetting clears the persisted conversation."""
+        store = ConversationStore(tmp_path)
+        agent = self._agent("https://test.openai.azure.com/", store)
+        agent.set_conversation("c1")
+        await agent.record_turn("Hello", "Hi")
+
+        await agent.reset()
+
+        assert not store.exists("c1")
+        assert not agent.set_conversation("c1")
@@ -0,0 +1,154 @@
+"""Tests for multi-deployment routing and failover."""
+
+import random
+from collections import Counter
+
+import pytest
+
+from forgebase.infrastructure.agent import Agent
+from forgebase.infrastructure.deployment_router import (
+    DeploymentConfig,
+    DeploymentRouter,
+    RouterSettings,
+)
+
+from forgebase.infrastructure.mock_llm_server import MockLLMBehavior
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _deployment(name: str, weight: float = 1.0) -> DeploymentConfig:
+    return DeploymentConfig(
+        endpoint=f"https://{name}.openai.azure.com/",
+        api_key="test-key",
+        deployment_name="gpt",
+        weight=weight,
+    )
+
+
+class TestDeploymentRouter:
+    """Test cases for DeploymentRouter."""
+
+    def test_requires_deployments(self):
+        """Test that an empty deployment list is rejected."""
+        with pytest.raises(ValueError):
+            DeploymentRouter([])
+
+    def test_prefers_lower_latency(self):
+        """Test that faster deployments receive most of the traffic."""
+        fast, slow = _deployment("fast"), _deployment("slow")
+        router = DeploymentRouter([fast, slow], rng=random.Random(1))
+        router.on_first_token(fast, 0.1)
+        router.on_first_token(slow, 1.0)
+
+        picks = Counter(router.choose().name for _ in range(1000))
+
+        assert picks[fast.name] > 850
+
+    def test_respects_weights(self):
+        """Test that weights scale traffic between equally fast deployments."""
+        big, small = _deployment("big", weight=3.0), _deployment("small")
+        router = DeploymentRouter([big, small], rng=random.Random(1))
+
+        picks = Counter(router.choose().name for _ in range(1000))
+
+        assert 650 < picks[big.name] < 850
+
+    def test_circuit_opens_and_half_opens(self):
+        """Test circuit breaking after consecutive failures and recovery."""
+        clock = FakeClock()
+        broken, healthy = _deployment("broken"), _deployment("healthy")
+        router = DeploymentRouter(
+            [broken, healthy],
+            RouterSettings(failure_threshold=2, cooldown=10.0),
+            clock=clock,
+        )
+        router.on_failure(broken)
+        router.on_failure(broken)
+
+        assert {router.choose().name for _ in range(50)} == {healthy.name}
+
+        clock.now = 11.0
+        router.on_start(broken)  # half-open trial holds the circuit
+        assert {router.choose().name for _ in range(50)} == {healthy.name}
+        router.on_first_token(broken, 0.1)
+        router.on_finish(broken)
+        assert router.health(broken).open_until == 0.0
+
+    def test_all_open_fails_over_to_first_recovering(self):
+        """Test that routing still returns a deployment when every circuit is open."""
+        clock = FakeClock()
+        first, second = _deployment("first"), _deployment("second")
+        router = DeploymentRouter(
+            [first, second], RouterSettings(failure_threshold=1), clock=clock
+        )
+        router.on_failure(first)
+        clock.now = 1.0
+        router.on_failure(second)
+
+        assert router.choose() == first
+        assert router.choose(exclude=[first]) == second
+        assert router.choose(exclude=[first, second]) is None
+
+    def test_error_rate_is_rolling(self):
+        """Test that the error rate covers only the recent window."""
+        deployment = _deployment("d")
+        router = DeploymentRouter([deployment], RouterSettings(failure_threshold=100))
+        for _ in range(5):
+            router.on_failure(deployment)
+        for _ in range(20):
+            router.on_first_token(deployment, 0.1)
+
+        assert router.health(deployment).error_rate == 0.0
+
+
+class TestAgentFailover:
+    """Failover of the real Agent between local mock deployments."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status", [429, 503])
+    async def test_fails_over_on_retryable_status(self, mock_deployment, status):
+        """Test that throttled or failing deployments are skipped within a turn."""
+        bad_endpoint, bad = mock_deployment(MockLLMBehavior(status=status))
+        good_endpoint, good = mock_deployment()
+        bad_deployment = DeploymentConfig(bad_endpoint, "key", "gpt", weight=1000.0)
+        good_deployment = DeploymentConfig(good_endpoint, "key", "gpt", weight=0.001)
+        router = DeploymentRouter([bad_deployment, good_deployment])
+        agent = Agent(router=router)
+
+        reply = "".join([c async for c in agent.send_message_stream("Hello")])
+
+        assert reply == "Hello from mock"
+        assert bad.requests == 1
+        assert good.requests == 1
+        assert router.health(bad_deployment).error_rate == 1.0
+        assert router.health(good_deployment).ttft_ewma is not None
+        # The retried turn must not duplicate the user message
+        assert len(agent.thread) == 2
+
+    @pytest.mark.asyncio
+    async def test_does_not_fail_over_on_client_error(self, mock_deployment):
+        """Test that bad requests are raised instead of retried elsewhere."""
+        bad_endpoint, _ = mock_deployment(MockLLMBehavior(status=400))
+        good_endpoint, good = mock_deployment()
+        agent = Agent(
+            router=DeploymentRouter(
+                [
+                    DeploymentConfig(bad_endpoint, "key", "gpt", weight=1000.0),
+                    DeploymentConfig(good_endpoint, "key", "gpt", weight=0.001),
+                ]
+            )
+        )
+
+        with pytest.raises(Exception):
+            async for _ in agent.send_message_stream("Hello"):
+                pass
+        assert good.requests == 0
@@ -0,0 +1,139 @@
+"""Tests for hedged requests."""
+
+import asyncio
+import time
+
+import pytest
+
+from forgebase.infrastructure.agent import Agent
+from forgebase.infrastructure.deployment_router import (
+    DeploymentConfig,
+    DeploymentRouter,
+)
+from forgebase.infrastructure.hedging import HedgePolicy, HedgeSettings
+from forgebase.infrastructure.mock_llm_server import MockLLMBehavior
+
+
+class TestHedgePolicy:
+    """Test cases for HedgePolicy."""
+
+    def test_initial_delay_until_enough_samples(self):
+        """Test that the initial delay is used while warming up."""
+        policy = HedgePolicy(settings=HedgeSettings(initial_delay=1.5, min_samples=3))
+        policy.observe(0.1)
+        policy.observe(0.1)
+
+        assert policy.deadline() == 1.5
+
+    def test_percentile_deadline(self):
+        """Test that the deadline follows the configured percentile."""
+        policy = HedgePolicy(90, HedgeSettings(min_delay=0.0, min_samples=1))
+        for value in range(1, 11):
+            policy.observe(value / 10)
+
+        assert policy.deadline() == pytest.approx(0.9)
+
+    def test_min_delay_floor(self):
+        """Test that the deadline never drops below the floor."""
+        policy = HedgePolicy(settings=HedgeSettings(min_delay=0.2, min_samples=1))
+        policy.observe(0.01)
+
+        assert policy.deadline() == 0.2
+
+    def test_censored_observation_only_above_deadline(self):
+        """Test that cancelled requests count only when they ran past the tail."""
+        policy = HedgePolicy(90, HedgeSettings(min_delay=0.0, min_samples=1))
+        policy.observe(0.5)
+
+        policy.observe_censored(0.1)
+        assert policy.deadline() == 0.5
+
+        policy.observe_censored(3.0)
+        assert policy.deadline() == 3.0
+
+    def test_rejects_invalid_percentile(self):
+        """Test that percentiles outside (0, 100] are rejected."""
+        with pytest.raises(ValueError):
+            HedgePolicy(percentile=0)
+
+
+def _hedged_agent(slow_endpoint, fast_endpoint, initial_delay):
+    router = DeploymentRouter(
+        [
+            DeploymentConfig(slow_endpoint, "key", "gpt", weight=1000.0),
+            DeploymentConfig(fast_endpoint, "key", "gpt", weight=0.001),
+        ]
+    )
+    return Agent(
+        router=router,
+        hedge_policy=HedgePolicy(settings=HedgeSettings(initial_delay=initial_delay)),
+    )
+
+
+class TestAgentHedging:
+    """Hedging of the real Agent between local mock deployments."""
+
+    @pytest.mark.asyncio
+    async def test_hedge_wins_when_primary_stalls(self, mock_deployment):
+        """Test that a stalled primary is beaten by the hedged request."""
+        slow_endpoint, slow = mock_deployment(
+            MockLLMBehavior(chunks=("slow",), first_token_delay=2.0)
+        )
+        fast_endpoint, fast = mock_deployment(MockLLMBehavior(chunks=("fast",)))
+        agent = _hedged_agent(slow_endpoint, fast_endpoint, initial_delay=0.1)
+
+        started = time.perf_counter()
+        reply = "".join([c async for c in agent.send_message_stream("Hello")])
+
+        assert reply == "fast"
+        assert time.perf_counter() - started < 1.5
+        assert slow.requests == 1
+        assert fast.requests == 1
+        # Only the winning request's exchange is kept
+        assert len(agent.thread) == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_loser_is_observed(self, mock_deployment):
+        """Test that the stalled primary still reports how long it ran."""
+        slow_endpoint, _ = mock_deployment(
+            MockLLMBehavior(chunks=("slow",), first_token_delay=2.0)
+        )
+        fast_endpoint, _ = mock_deployment(MockLLMBehavior(chunks=("fast",)))
+        agent = _hedged_agent(slow_endpoint, fast_endpoint, initial_delay=0.1)
+
+        _ = [c async for c in agent.send_message_stream("Hello")]
+        await asyncio.sleep(0.1)  # let the cancelled loser unwind
+
+        router = agent._router
+        slow, fast = router.deployments
+        slow_ttft = router.health(slow).ttft_ewma
+        fast_ttft = router.health(fast).ttft_ewma
+        assert slow_ttft is not None and fast_ttft is not None
+        assert slow_ttft > fast_ttft
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_when_primary_is_fast(self, mock_deployment):
+        """Test that hedges are only sent after the deadline."""
+        primary_endpoint, primary = mock_deployment(MockLLMBehavior(chunks=("one",)))
+        other_endpoint, other = mock_deployment(MockLLMBehavior(chunks=("two",)))
+        agent = _hedged_agent(primary_endpoint, other_endpoint, initial_delay=5.0)
+
+        first = "".join([c async for c in agent.send_message_stream("Hello")])
+        second = "".join([c async for c in agent.send_message_stream("Again")])
+
+        assert (first, second) == ("one", "one")
+        assert primary.requests == 2
+        assert other.requests == 0
+        assert len(agent.thread) == 4
+
+    @pytest.mark.asyncio
+    async def test_hedging_fails_over_on_error(self, mock_deployment):
+        """Test that a failing primary is replaced even before the deadline."""
+        bad_endpoint, _ = mock_deployment(MockLLMBehavior(status=503))
+        good_endpoint, good = mock_deployment(MockLLMBehavior(chunks=("ok",)))
+        agent = _hedged_agent(bad_endpoint, good_endpoint, initial_delay=5.0)
+
+        reply = "".join([c async for c in agent.send_message_stream("Hello")])
+
+        assert reply == "ok"
+        assert good.requests == 1
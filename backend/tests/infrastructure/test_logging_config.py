@@ -3,6 +3,7 @@
 import logging
 from unittest.mock import patch, MagicMock
 
+from forgebase.core.metrics import TurnRecorder
 from forgebase.infrastructure import logging_config
 
 
@@ -59,3 +60,16 @@ class TestLoggingConfig:
             "azure.core.pipeline.policies.http_logging_policy"
         )
         mock_azure_logger.setLevel.assert_called_once_with(logging.WARNING)
+
+    def test_log_turn_metrics_emits_structured_event(self, caplog):
+        """Test that turn metrics are logged with a JSON-serializable payload."""
+        metrics = TurnRecorder(source="agent", role="test_agent").finish()
+
+        with caplog.at_level(logging.INFO, logger="forgebase.metrics"):
+            logging_config.log_turn_metrics(metrics)
+
+        assert len(caplog.records) == 1
+        record = caplog.records[0]
+        assert record.turn_metrics["source"] == "agent"
+        assert record.turn_metrics["chunk_count"] == 0
+        assert "turn_metrics" in record.getMessage()
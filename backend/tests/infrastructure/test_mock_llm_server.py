@@ -0,0 +1,70 @@
+"""End-to-end tests of the real Agent against the mock deployment."""
+
+import time
+
+import pytest
+
+from forgebase.core.project_service import ProjectService
+from forgebase.infrastructure import config
+from forgebase.infrastructure.agent import Agent
+from forgebase.infrastructure.mock_llm_server import MockLLMBehavior, MockToolCall
+from forgebase.infrastructure.project_repository import InMemoryProjectRepository
+
+
+async def _collect(agent, text: str = "Hello") -> list[str]:
+    return [chunk async for chunk in agent.send_message_stream(text)]
+
+
+class TestMockAzureOpenAI:
+    """Test cases for the configured Agent talking to the mock server."""
+
+    @pytest.mark.asyncio
+    async def test_configured_agent_streams_reply(self, mock_azure_openai):
+        """Test that the environment-configured Agent streams the mock reply."""
+        behavior = mock_azure_openai()
+        agent = config._create_agent(config.get_project_service())
+        metrics = []
+        agent.set_metrics_callback(metrics.append)
+
+        chunks = await _collect(agent)
+
+        assert isinstance(agent, Agent)
+        assert "".join(chunks) == "Hello from mock"
+        assert behavior.requests == 1
+        assert metrics[0].completion_tokens == 3
+
+    @pytest.mark.asyncio
+    async def test_tool_call_updates_prd(self, mock_azure_openai):
+        """Test that a mock tool call runs the PRD tool before the reply."""
+        behavior = mock_azure_openai(
+            MockLLMBehavior(
+                chunks=("Updated", " the PRD"),
+                tool_calls=[
+                    MockToolCall("PRDTools-update_prd", {"prd_content": "# Mock PRD"})
+                ],
+            )
+        )
+        service = ProjectService(InMemoryProjectRepository())
+        project = await service.create_project("test-user-123", "Demo")
+        agent = config._create_agent(service)
+        agent.set_project_context(str(project.id))
+
+        chunks = await _collect(agent, "Write the PRD")
+
+        updated = await service.get_project(str(project.id), "test-user-123")
+        assert updated.prd == "# Mock PRD"
+        assert "".join(chunks) == "Updated the PRD"
+        assert agent.tool_call_count == 1
+        assert (behavior.requests, behavior.tool_call_requests) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_token_rate_paces_the_stream(self, mock_azure_openai):
+        """Test that chunks are streamed at the configured rate."""
+        mock_azure_openai(MockLLMBehavior(chunks=("a",) * 6, token_rate=100))
+        agent = config._create_agent(config.get_project_service())
+
+        started = time.perf_counter()
+        chunks = await _collect(agent)
+
+        assert len(chunks) == 6
+        assert time.perf_counter() - started >= 0.05
@@ -0,0 +1,149 @@
+"""Tests for the in-memory PRD revision history."""
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from forgebase.core.entities import Project
+from forgebase.core.prd_diff import diff_prd
+from forgebase.infrastructure.prd_history import InMemoryPrdHistory
+from forgebase.infrastructure.work_executor import WorkExecutor
+
+NOW = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _revisions(count: int) -> list[str]:
+    """Build PRD revisions that each change one line of a long document."""
+    lines = [f"- Requirement {i}\n" for i in range(100)]
+    revisions = ["".join(lines)]
+    for version in range(1, count):
+        lines[version % len(lines)] = f"- Revised requirement {version}\n"
+        revisions.append("".join(lines))
+    return revisions
+
+
+def _project(project_id, version: int, prd: str) -> Project:
+    return Project(
+        id=project_id,
+        user_id="test-user",
+        name="Demo",
+        prd=prd,
+        created_at=NOW,
+        updated_at=NOW,
+        prd_version=version,
+    )
+
+
+async def _record_all(history: InMemoryPrdHistory, project_id, revisions) -> None:
+    previous = None
+    for version, prd in enumerate(revisions):
+        diff = None if previous is None else diff_prd(previous, prd)
+        await history.record(_project(project_id, version, prd), diff)
+        previous = prd
+
+
+class TestInMemoryPrdHistory:
+    """Test cases for InMemoryPrdHistory."""
+
+    @pytest.mark.asyncio
+    async def test_reconstructs_every_revision(self):
+        """Test that any stored version is rebuilt exactly."""
+        history = InMemoryPrdHistory(keyframe_interval=8)
+        project_id = uuid4()
+        revisions = _revisions(30)
+
+        await _record_all(history, project_id, revisions)
+
+        for version, prd in enumerate(revisions):
+            assert await history.get_revision(project_id, version) == prd
+        assert await history.get_revision(project_id, 30) is None
+        assert await history.get_revision(uuid4(), 0) is None
+
+    @pytest.mark.asyncio
+    async def test_replays_diffs_on_executor(self):
+        """Test that reconstruction runs on the work executor."""
+        executor = WorkExecutor(process_workers=0, min_offload_size=0)
+        history = InMemoryPrdHistory(keyframe_interval=8, executor=executor)
+        project_id = uuid4()
+        revisions = _revisions(20)
+
+        await _record_all(history, project_id, revisions)
+        try:
+            for version, prd in enumerate(revisions):
+                assert await history.get_revision(project_id, version) == prd
+        finally:
+            executor.shutdown()
+
+        # Keyframes at versions 0, 8 and 16 are returned as they are
+        assert executor.metrics()["threads"]["completed"] == 17
+
+    @pytest.mark.asyncio
+    async def test_compresses_large_keyframes(self):
+        """Test that large keyframes are held compressed and rebuilt exactly."""
+        history = InMemoryPrdHistory(keyframe_interval=8, compress_min_chars=1024)
+        project_id = uuid4()
+        revisions = _revisions(20)
+
+        await _record_all(history, project_id, revisions)
+
+        for version, prd in enumerate(revisions):
+            assert await history.get_revision(project_id, version) == prd
+        # Three compressed keyframes cost less than one as text
+        assert history.stored_chars < len(revisions[-1])
+
+        small_id = uuid4()
+        await _record_all(history, small_id, ["# Small\n"])
+        assert history._revisions[small_id][0].keyframe == "# Small\n"
+
+    @pytest.mark.asyncio
+    async def test_stores_deltas_between_keyframes(self):
+        """Test that small edits cost far less than full copies."""
+        history = InMemoryPrdHistory(keyframe_interval=10)
+        project_id = uuid4()
+        revisions = _revisions(30)
+
+        await _record_all(history, project_id, revisions)
+
+        # Keyframes at versions 0, 10 and 20, one changed line otherwise
+        assert history.stored_chars < 4 * len(revisions[-1])
+        listed = await history.list_revisions(project_id)
+        assert [revision.version for revision in listed] == list(range(29, -1, -1))
+        assert listed[0].size == len(revisions[-1])
+
+    @pytest.mark.asyncio
+    async def test_rewrite_is_stored_as_keyframe(self):
+        """Test that a complete rewrite is not stored as a diff."""
+        history = InMemoryPrdHistory()
+        project_id = uuid4()
+
+        await _record_all(history, project_id, ["# Old\n", "# New\nBody\n"])
+
+        assert history.stored_chars == len("# Old\n") + len("# New\nBody\n")
+        assert await history.get_revision(project_id, 1) == "# New\nBody\n"
+
+    @pytest.mark.asyncio
+    async def test_version_gap_starts_over(self):
+        """Test that a non-consecutive version replaces the history."""
+        history = InMemoryPrdHistory()
+        project_id = uuid4()
+        await _record_all(history, project_id, _revisions(3))
+
+        await history.record(
+            _project(project_id, 7, "# PRD\n"), diff_prd("", "# PRD\n")
+        )
+
+        assert [r.version for r in await history.list_revisions(project_id)] == [7]
+        assert await history.get_revision(project_id, 7) == "# PRD\n"
+
+    @pytest.mark.asyncio
+    async def test_delete(self):
+        """Test that deleting drops all revisions of a project."""
+        history = InMemoryPrdHistory()
+        project_id = uuid4()
+        await _record_all(history, project_id, _revisions(3))
+
+        await history.delete(project_id)
+
+        assert await history.list_revisions(project_id) == []
+        assert history.stored_chars == 0
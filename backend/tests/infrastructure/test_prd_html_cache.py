@@ -0,0 +1,62 @@
+"""Tests for the rendered PRD cache."""
+
+import asyncio
+
+import pytest
+
+from forgebase.infrastructure import prd_html_cache
+from forgebase.infrastructure.prd_html_cache import PrdHtmlCache
+
+
+class TestPrdHtmlCache:
+    """Test cases for PrdHtmlCache."""
+
+    @pytest.mark.asyncio
+    async def test_caches_by_content(self):
+        """Test that equal content is rendered once under a strong ETag."""
+        cache = PrdHtmlCache()
+
+        first = await cache.render("# PRD\n")
+        second = await cache.render("# PRD\n", PrdHtmlCache.etag("# PRD\n"))
+        other = await cache.render("# Other\n")
+
+        assert first is second
+        assert first.html == b'<h1 id="prd">PRD</h1>\n'
+        assert first.etag.startswith('"') and not first.etag.startswith("W/")
+        assert other.etag != first.etag
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_a_rendering(self, monkeypatch):
+        """Test that concurrent misses for the same content render once."""
+        calls = []
+
+        def render(prd):
+            calls.append(prd)
+            return prd
+
+        monkeypatch.setattr(prd_html_cache, "render_prd_html", render)
+        cache = PrdHtmlCache()
+
+        results = await asyncio.gather(*(cache.render("same") for _ in range(5)))
+
+        assert calls == ["same"]
+        assert all(result is results[0] for result in results)
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        """Test the entry and size bounds."""
+        cache = PrdHtmlCache(max_entries=2)
+        await cache.render("a")
+        await cache.render("b")
+        await cache.render("a")
+        await cache.render("c")
+
+        assert len(cache) == 2
+        assert cache.evictions == 1
+        await cache.render("a")
+        assert cache.misses == 3
+
+        small = PrdHtmlCache(max_bytes=4)
+        await small.render("a long paragraph")
+        assert len(small) == 0
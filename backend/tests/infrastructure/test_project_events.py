@@ -0,0 +1,88 @@
+"""Tests for the project event bus."""
+
+import asyncio
+import threading
+from uuid import uuid4
+
+import pytest
+
+from forgebase.core.project_events import ProjectEvent
+from forgebase.infrastructure.project_events import ProjectEventBus
+
+
+def _event(project_id, kind="updated") -> ProjectEvent:
+    return ProjectEvent(kind, project_id, "test-user-123", ("prd",), "Demo")
+
+
+class TestProjectEventBus:
+    """Test cases for ProjectEventBus."""
+
+    @pytest.mark.asyncio
+    async def test_delivers_events_of_the_subscribed_project(self):
+        """Test that subscribers only receive their project's events."""
+        bus = ProjectEventBus()
+        project_id = uuid4()
+        subscription = bus.subscribe(project_id)
+
+        bus.publish(_event(uuid4()))
+        bus.publish(_event(project_id))
+
+        event = await subscription.next(timeout=1)
+        assert event.project_id == project_id
+        with pytest.raises(TimeoutError):
+            await subscription.next(timeout=0.01)
+
+    @pytest.mark.asyncio
+    async def test_listeners_run_synchronously(self):
+        """Test that listeners see every event during publish."""
+        bus = ProjectEventBus()
+        seen = []
+        bus.add_listener(seen.append)
+        event = _event(uuid4())
+
+        bus.publish(event)
+        bus.remove_listener(seen.append)
+        bus.publish(event)
+
+        assert seen == [event]
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_is_dropped(self):
+        """Test that overflowing the buffer closes the subscription."""
+        bus = ProjectEventBus(buffer_size=2)
+        project_id = uuid4()
+        slow = bus.subscribe(project_id)
+        fast = bus.subscribe(project_id)
+
+        for _ in range(3):
+            bus.publish(_event(project_id))
+            await fast.next(timeout=1)
+
+        assert slow.overflowed
+        assert await slow.next(timeout=1) is None
+        assert bus.dropped == 1
+        assert bus.subscriber_count == 1
+
+    @pytest.mark.asyncio
+    async def test_publish_from_another_thread(self):
+        """Test that events published off the loop reach the subscriber."""
+        bus = ProjectEventBus()
+        project_id = uuid4()
+        subscription = bus.subscribe(project_id)
+
+        thread = threading.Thread(target=bus.publish, args=(_event(project_id),))
+        thread.start()
+        thread.join()
+
+        assert (await subscription.next(timeout=1)).project_id == project_id
+
+    @pytest.mark.asyncio
+    async def test_close_unsubscribes(self):
+        """Test that closed subscriptions stop receiving events."""
+        bus = ProjectEventBus()
+        subscription = bus.subscribe(uuid4())
+
+        subscription.close()
+
+        assert bus.subscriber_count == 0
+        await asyncio.sleep(0)
@@ -7,6 +7,7 @@ import pytest
 from forgebase.core.entities import Project
 from forgebase.core.exceptions import ProjectAlreadyExistsError, ProjectNotFoundError
 from forgebase.infrastructure.project_repository import InMemoryProjectRepository
+from forgebase.infrastructure.work_executor import WorkExecutor
 
 
 class TestInMemoryProjectRepository:
@@ -151,3 +152,64 @@ class TestInMemoryProjectRepository:
         non_existent_id = uuid4()
         result = await repository.delete(non_existent_id)
         assert result is False
+
+
+class TestCompressedPrdStorage:
+    """Test cases for keeping cold PRDs compressed."""
+
+    @pytest.mark.asyncio
+    async def test_cold_prds_are_compressed(self):
+        """Test that PRDs evicted from the hot cache are compressed and readable."""
+        repository = InMemoryProjectRepository(compress_min_chars=10, hot_entries=1)
+        first = Project.create("test-user", "First", prd="# First\n" * 10)
+        second = Project.create("test-user", "Second", prd="# Second\n" * 10)
+        small = Project.create("test-user", "Small", prd="# S\n")
+
+        await repository.create(first)
+        await repository.create(second)
+        await repository.create(small)
+
+        assert first.prd_packed and not second.prd_packed and not small.prd_packed
+        assert first.prd_length == len("# First\n" * 10)
+        assert (await repository.get_by_id(first.id)).prd == "# First\n" * 10
+        assert repository.decompressions == 1
+        # Reading the first PRD made it hot and evicted the second
+        assert second.prd_packed
+        assert second.prd == "# Second\n" * 10
+        assert repository.compressions == 2
+
+    @pytest.mark.asyncio
+    async def test_changes_drop_the_compressed_copy(self):
+        """Test that a changed PRD is compressed again only once evicted."""
+        repository = InMemoryProjectRepository(compress_min_chars=10, hot_entries=1)
+        project = Project.create("test-user", "First", prd="# First\n" * 10)
+        await repository.create(project)
+        await repository.create(Project.create("test-user", "Other", prd="x" * 20))
+        assert project.prd_packed
+
+        project.update_prd("# Changed\n" * 10)
+        assert not project.prd_packed
+        await repository.update(project)
+        await repository.create(Project.create("test-user", "More", prd="y" * 20))
+
+        assert project.prd_packed
+        assert project.prd == "# Changed\n" * 10
+        assert await repository.delete(project.id)
+
+    @pytest.mark.asyncio
+    async def test_compresses_on_executor(self):
+        """Test that compression runs on the work executor."""
+        executor = WorkExecutor(process_workers=0, min_offload_size=0)
+        repository = InMemoryProjectRepository(
+            compress_min_chars=10, hot_entries=1, executor=executor
+        )
+        project = Project.create("test-user", "First", prd="# First\n" * 10)
+        try:
+            await repository.create(project)
+            await repository.create(Project.create("test-user", "Other", prd="x" * 20))
+        finally:
+            executor.shutdown()
+
+        assert project.prd_packed
+        assert executor.metrics()["threads"]["completed"] == 1
+        assert project.prd == "# First\n" * 10
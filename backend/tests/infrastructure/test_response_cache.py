@@ -0,0 +1,221 @@
+"""Tests for the exact-match response cache."""
+
+import pytest
+
+from forgebase.infrastructure.response_cache import CachingAgent, ResponseCache
+from forgebase.infrastructure.stub_agent import StubAgent
+
+
+class ToolCallingAgent(StubAgent):
+    """Stub agent that reports a tool call on every turn."""
+
+    def __init__(self) -> None:
+        super().__init__(role="test_agent")
+        self.calls = 0
+        self.recorded: list[tuple[str, str]] = []
+
+    async def send_message_stream(self, user_text: str):
+        self.calls += 1
+        yield "saved "
+        yield "PRD"
+
+    async def record_turn(self, user_text: str, reply_text: str) -> None:
+        self.recorded.append((user_text, reply_text))
+
+    @property
+    def tool_call_count(self) -> int:
+        return self.calls
+
+
+class FailingAgent(StubAgent):
+    """Stub agent whose first stream fails after the first chunk."""
+
+    def __init__(self) -> None:
+        super().__init__(role="test_agent")
+        self.failed = False
+
+    async def send_message_stream(self, user_text: str):
+        if self.failed:
+            async for chunk in super().send_message_stream(user_text):
+                yield chunk
+            return
+        self.failed = True
+        yield "partial"
+        raise RuntimeError("stream failed")
+
+
+class ResumingAgent(StubAgent):
+    """Stub agent that always resumes a conversation with earlier turns."""
+
+    def set_conversation(self, conversation_id: str | None) -> bool:
+        return conversation_id is not None
+
+
+async def _collect(agent, text):
+    return [chunk async for chunk in agent.send_message_stream(text)]
+
+
+class TestResponseCache:
+    """Test cases for ResponseCache."""
+
+    def test_key_normalizes_whitespace(self):
+        """Test that whitespace differences map to the same key."""
+        key1 = ResponseCache.make_key("inst", [("hi", "hello")], " hello  there ", [])
+        key2 = ResponseCache.make_key("inst", [(" hi", "hello ")], "hello there", [])
+        assert key1 == key2
+
+    def test_key_depends_on_all_parts(self):
+        """Test that instructions, history, text and tool state all matter."""
+        base = ResponseCache.make_key("inst", [], "hello", ["PRDTools"])
+        assert base != ResponseCache.make_key("other", [], "hello", ["PRDTools"])
+        assert base != ResponseCache.make_key(
+            "inst", [("a", "b")], "hello", ["PRDTools"]
+        )
+        assert base != ResponseCache.make_key("inst", [], "bye", ["PRDTools"])
+        assert base != ResponseCache.make_key("inst", [], "hello", [])
+
+    def test_lru_eviction_by_entries(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", ["1"])
+        cache.put("b", ["2"])
+        assert cache.get("a") == ("1",)
+        cache.put("c", ["3"])
+
+        assert cache.get("b") is None
+        assert cache.get("a") == ("1",)
+        assert cache.get("c") == ("3",)
+        assert cache.evictions == 1
+
+    def test_size_cap(self):
+        """Test that the byte cap evicts entries and rejects oversized replies."""
+        cache = ResponseCache(max_entries=10, max_bytes=10)
+        assert cache.put("a", ["12345"])
+        assert cache.put("b", ["123456"])
+        assert cache.get("a") is None
+        assert cache.total_bytes == 6
+        assert not cache.put("c", ["x" * 11])
+        assert len(cache) == 1
+
+
+class TestCachingAgent:
+    """Test cases for CachingAgent."""
+
+    @pytest.mark.asyncio
+    async def test_hit_replays_original_chunks(self):
+        """Test that a repeated first turn is replayed chunk for chunk."""
+        cache = ResponseCache()
+        first = await _collect(CachingAgent(StubAgent(), cache), "Hello")
+        second = await _collect(CachingAgent(StubAgent(), cache), "Hello")
+
+        assert second == first
+        assert cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_hit_is_recorded_on_wrapped_agent(self):
+        """Test that cache hits keep the wrapped agent's conversation in sync."""
+        cache = ResponseCache()
+        await _collect(CachingAgent(StubAgent(), cache), "Hello")
+
+        inner = StubAgent()
+        agent = CachingAgent(inner, cache)
+        await _collect(agent, "Hello")
+        reply = "".join(await _collect(agent, "Hello again"))
+
+        # The stub numbers its messages, so the replayed turn must have counted
+        assert "#2" in reply
+
+    @pytest.mark.asyncio
+    async def test_history_is_part_of_key(self):
+        """Test that the same text later in a conversation is not a hit."""
+        cache = ResponseCache()
+        agent = CachingAgent(StubAgent(), cache)
+        await _collect(agent, "Hello")
+        await _collect(agent, "Hello")
+
+        assert cache.hits == 0
+        assert len(cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_project_context_is_part_of_key(self):
+        """Test that turns in different projects do not share entries."""
+        cache = ResponseCache()
+        await _collect(CachingAgent(StubAgent(), cache), "Hello")
+
+        agent = CachingAgent(StubAgent(), cache)
+        agent.set_project_context("project-1")
+        await _collect(agent, "Hello")
+
+        assert cache.hits == 0
+
+    @pytest.mark.asyncio
+    async def test_tool_turns_bypass_cache(self):
+        """Test that turns invoking tools are never stored."""
+        cache = ResponseCache()
+        inner = ToolCallingAgent()
+        await _collect(CachingAgent(inner, cache), "Save it")
+        await _collect(CachingAgent(inner, cache), "Save it")
+
+        assert inner.calls == 2
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_partial_stream_is_not_cached(self):
+        """Test that an abandoned stream does not populate the cache."""
+        cache = ResponseCache()
+        stream = CachingAgent(StubAgent(), cache).send_message_stream("Hello")
+        await stream.__anext__()
+        await stream.aclose()
+
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_interrupted_turn_bypasses_cache(self):
+        """Test that turns after a failed or abandoned turn are not served."""
+        cache = ResponseCache()
+        await _collect(CachingAgent(StubAgent(), cache), "Hello")
+
+        abandoned = CachingAgent(StubAgent(), cache)
+        stream = abandoned.send_message_stream("Hi")
+        await stream.__anext__()
+        await stream.aclose()
+        await _collect(abandoned, "Hello")
+
+        failed = CachingAgent(FailingAgent(), cache)
+        with pytest.raises(RuntimeError):
+            await _collect(failed, "Hi")
+        await _collect(failed, "Hello")
+
+        assert cache.hits == 0
+        assert len(cache) == 1
+
+        await abandoned.reset()
+        await _collect(abandoned, "Hello")
+        assert cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_reset_clears_history_not_cache(self):
+        """Test that reset starts a new conversation that can hit the cache."""
+        cache = ResponseCache()
+        agent = CachingAgent(StubAgent(), cache)
+        await _collect(agent, "Hello")
+        await agent.reset()
+        await _collect(agent, "Hello")
+
+        assert cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_resumed_conversation_bypasses_cache(self):
+        """Test that turns of a resumed conversation are neither served nor stored."""
+        cache = ResponseCache()
+        await _collect(CachingAgent(StubAgent(), cache), "Hello")
+
+        agent = CachingAgent(ResumingAgent(), cache)
+        assert agent.set_conversation("c1")
+        await _collect(agent, "Hello")
+        assert cache.hits == 0
+        assert len(cache) == 1
+
+        await agent.reset()
+        await _collect(agent, "Hello")
+        assert cache.hits == 1
@@ -0,0 +1,154 @@
+"""Tests for stub agent latency and behavior profiles."""
+
+import random
+
+import pytest
+
+from forgebase.core.project_service import ProjectService
+from forgebase.infrastructure.project_repository import InMemoryProjectRepository
+from forgebase.infrastructure.stub_agent import StubAgent
+from forgebase.infrastructure.stub_profiles import (
+    STUB_PROFILES,
+    Distribution,
+    StubProfile,
+    parse_stub_profile,
+)
+from forgebase.tools.prd_tools import PRDTools
+
+
+async def _collect(agent: StubAgent, text: str = "Hello") -> list[str]:
+    return [chunk async for chunk in agent.send_message_stream(text)]
+
+
+class TestDistribution:
+    """Test cases for Distribution."""
+
+    @pytest.mark.parametrize(
+        "spec, expected",
+        [
+            (0.5, Distribution("constant", 0.5)),
+            ({"constant": 2}, Distribution("constant", 2.0)),
+            ({"uniform": [0.1, 0.3]}, Distribution("uniform", 0.1, 0.3)),
+            ({"lognormal": [0.5, 0.4]}, Distribution("lognormal", 0.5, 0.4)),
+        ],
+    )
+    def test_from_spec(self, spec, expected):
+        """Test that the JSON forms parse into distributions."""
+        assert Distribution.from_spec(spec) == expected
+
+    @pytest.mark.parametrize(
+        "spec", ["fast", {"uniform": [1]}, {"poisson": [1, 2]}, {"constant": -1}]
+    )
+    def test_from_spec_rejects_invalid(self, spec):
+        """Test that malformed distributions are rejected."""
+        with pytest.raises(ValueError):
+            Distribution.from_spec(spec)
+
+    def test_samples(self):
+        """Test that samples follow the distribution's parameters."""
+        rng = random.Random(1)
+        uniform = [Distribution("uniform", 1, 2).sample(rng) for _ in range(100)]
+        lognormal = sorted(
+            Distribution("lognormal", 0.5, 0.4).sample(rng) for _ in range(1001)
+        )
+
+        assert all(1 <= value <= 2 for value in uniform)
+        assert 0.4 < lognormal[500] < 0.6
+
+
+class TestParseStubProfile:
+    """Test cases for parse_stub_profile."""
+
+    def test_preset(self):
+        """Test that presets are looked up by name."""
+        assert parse_stub_profile("realistic") is STUB_PROFILES["realistic"]
+
+    def test_json(self):
+        """Test that JSON profiles set the given fields."""
+        profile = parse_stub_profile(
+            '{"ttft": {"uniform": [0.1, 0.2]}, "error_rate": 0.5, "seed": 3}'
+        )
+
+        assert profile.ttft == Distribution("uniform", 0.1, 0.2)
+        assert profile.error_rate == 0.5
+        assert profile.seed == 3
+
+    @pytest.mark.parametrize(
+        "value", ["unknown", "[1, 2]", '{"colour": 1}', '{"error_rate": 2}']
+    )
+    def test_invalid(self, value):
+        """Test that unknown presets and invalid profiles are rejected."""
+        with pytest.raises(ValueError):
+            parse_stub_profile(value)
+
+
+class TestProfiledStubAgent:
+    """Test cases for StubAgent with a profile."""
+
+    @pytest.mark.asyncio
+    async def test_replies_are_deterministic_per_seed(self):
+        """Test that the same seed produces the same replies."""
+        profile = StubProfile(response_tokens=Distribution("uniform", 5, 50), seed=7)
+
+        first = await _collect(StubAgent(profile=profile))
+        second = await _collect(StubAgent(profile=profile))
+        other = await _collect(StubAgent(profile=StubProfile(seed=8)))
+
+        assert first == second
+        assert first != other
+
+    @pytest.mark.asyncio
+    async def test_reply_length_and_ttft(self):
+        """Test that reply length and time to first token follow the profile."""
+        metrics = []
+        agent = StubAgent(
+            profile=StubProfile(
+                ttft=Distribution("constant", 0.05),
+                response_tokens=Distribution("constant", 12),
+            )
+        )
+        agent.set_metrics_callback(metrics.append)
+
+        chunks = await _collect(agent)
+
+        assert len(chunks) == 12
+        assert metrics[0].ttft >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_tool_call_updates_prd(self):
+        """Test that profiled tool calls really update the project's PRD."""
+        service = ProjectService(InMemoryProjectRepository())
+        project = await service.create_project("test-user-123", "Demo")
+        tools = PRDTools(service)
+        metrics = []
+        agent = StubAgent(tools=[tools], profile=StubProfile(tool_call_probability=1.0))
+        agent.set_metrics_callback(metrics.append)
+        agent.set_project_context(str(project.id))
+
+        await _collect(agent)
+
+        updated = await service.get_project(str(project.id), "test-user-123")
+        assert updated.prd.startswith("# ")
+        assert "## Requirements" in updated.prd
+        assert agent.tool_call_count == 1
+        assert metrics[0].tool_calls[0].name == "PRDTools-update_prd"
+
+    @pytest.mark.asyncio
+    async def test_error_injection(self):
+        """Test that injected errors fail the turn before any output."""
+        agent = StubAgent(profile=StubProfile(error_rate=1.0))
+
+        with pytest.raises(RuntimeError):
+            await _collect(agent)
+
+    @pytest.mark.asyncio
+    async def test_timeout_injection(self):
+        """Test that injected timeouts stall and then fail the turn."""
+        metrics = []
+        agent = StubAgent(profile=StubProfile(timeout_rate=1.0, timeout=0.05))
+        agent.set_metrics_callback(metrics.append)
+
+        with pytest.raises(TimeoutError):
+            await _collect(agent)
+        assert metrics[0].duration >= 0.05
+        assert not metrics[0].completed
@@ -0,0 +1,97 @@
+"""Tests for the shared work executor."""
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from forgebase.core.prd_diff import diff_prd
+from forgebase.infrastructure.work_executor import WorkExecutor
+
+
+def _thread_name() -> str:
+    return threading.current_thread().name
+
+
+def _fail() -> None:
+    raise ValueError("boom")
+
+
+class TestWorkExecutor:
+    """Test cases for WorkExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_small_work_runs_inline(self):
+        """Test that work below the offload size stays on the event loop."""
+        executor = WorkExecutor(min_offload_size=100)
+
+        name = await executor.run_blocking(_thread_name, size=99)
+
+        assert name == threading.current_thread().name
+        assert executor.metrics()["threads"]["inline"] == 1
+        assert executor.metrics()["threads"]["submitted"] == 0
+
+    @pytest.mark.asyncio
+    async def test_blocking_work_runs_in_threads(self):
+        """Test that work releasing the GIL goes to the thread pool."""
+        executor = WorkExecutor(min_offload_size=0)
+        try:
+            name = await executor.run_blocking(_thread_name)
+        finally:
+            executor.shutdown()
+
+        assert name.startswith("forgebase-work")
+        assert executor.metrics()["threads"]["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cpu_work_runs_in_processes(self):
+        """Test that pure-Python work goes to another process."""
+        executor = WorkExecutor(process_workers=1, min_offload_size=0)
+        try:
+            pid = await executor.run_cpu(os.getpid)
+            hunks = await executor.run_cpu(diff_prd, "a\nb\n", "a\nc\n")
+        finally:
+            executor.shutdown()
+
+        assert pid != os.getpid()
+        assert hunks == diff_prd("a\nb\n", "a\nc\n")
+        assert executor.metrics()["processes"]["completed"] == 2
+        assert executor.metrics()["threads"]["submitted"] == 0
+
+    @pytest.mark.asyncio
+    async def test_queue_is_bounded(self):
+        """Test that calls beyond the queue size wait on the event loop."""
+        executor = WorkExecutor(
+            thread_workers=2, process_workers=0, queue_size=1, min_offload_size=0
+        )
+        try:
+            started = time.perf_counter()
+            await asyncio.gather(
+                executor.run_cpu(time.sleep, 0.05),
+                executor.run_cpu(time.sleep, 0.05),
+            )
+            elapsed = time.perf_counter() - started
+        finally:
+            executor.shutdown()
+
+        metrics = executor.metrics()
+        assert metrics["processes"] == metrics["threads"]
+        assert metrics["threads"]["completed"] == 2
+        assert metrics["threads"]["max_waiting"] == 1
+        assert metrics["threads"]["wait_seconds"] >= 0.04
+        assert elapsed >= 0.1
+        assert metrics["threads"]["running"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failures_are_counted(self):
+        """Test that errors reach the caller and the metrics."""
+        executor = WorkExecutor(process_workers=0, min_offload_size=0)
+        try:
+            with pytest.raises(ValueError):
+                await executor.run_blocking(_fail)
+        finally:
+            executor.shutdown()
+
+        assert executor.metrics()["threads"]["failed"] == 1
@@ -8,5 +8,13 @@ from forgebase.infrastructure import config
 def reset_repository():
     """Reset the global repository before each test for isolation."""
     config.reset_project_repository()
+    config.reset_project_events()
+    config.reset_prd_history()
+    config.reset_prd_html_cache()
+    config.reset_work_executor()
     yield
     config.reset_project_repository()
+    config.reset_project_events()
+    config.reset_prd_history()
+    config.reset_prd_html_cache()
+    config.reset_work_executor()
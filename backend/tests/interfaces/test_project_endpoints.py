@@ -6,6 +6,7 @@ import pytest
 
 from fastapi.testclient import TestClient
 
+from forgebase.infrastructure import config
 from forgebase.interfaces.web import create_app
 
 sys.path.insert(0, "/workspaces/forgebase/backend/src")
@@ -261,3 +262,126 @@ class TestProjectAPI:
         list_response = client.get("/api/projects")
         assert list_response.status_code == 200
         assert list_response.json() == []
+
+    def test_edit_prd_with_text_operations(self, client):
+        """Test editing a PRD with offset-based operations."""
+        project_id = client.post(
+            "/api/projects", json={"name": "Demo", "prd": "# PRD\n"}
+        ).json()["id"]
+
+        response = client.patch(
+            f"/api/projects/{project_id}/prd",
+            json={"baseVersion": 0, "edits": [{"offset": 6, "insert": "- Goal\n"}]},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["prdVersion"] == 1
+        assert response.json()["updatedAt"] is not None
+        assert (
+            client.get(f"/api/projects/{project_id}").json()["prd"] == "# PRD\n- Goal\n"
+        )
+
+    def test_edit_prd_preconditions(self, client):
+        """Test stale versions, invalid edits and unknown projects."""
+        project_id = client.post(
+            "/api/projects", json={"name": "Demo", "prd": "# PRD\n"}
+        ).json()["id"]
+        client.patch(f"/api/projects/{project_id}", json={"prd": "# New PRD\n"})
+
+        stale = client.patch(
+            f"/api/projects/{project_id}/prd",
+            json={"baseVersion": 0, "edits": [{"offset": 0, "delete": 1}]},
+        )
+        invalid = client.patch(
+            f"/api/projects/{project_id}/prd",
+            json={"baseVersion": 1, "edits": [{"offset": 50, "delete": 1}]},
+        )
+        missing = client.patch(
+            f"/api/projects/{uuid4()}/prd", json={"baseVersion": 0, "edits": []}
+        )
+
+        assert stale.status_code == 409
+        assert invalid.status_code == 422
+        assert missing.status_code == 404
+        assert client.get(f"/api/projects/{project_id}").json()["prd"] == "# New PRD\n"
+
+    def test_prd_outline_and_sections(self, client):
+        """Test the PRD outline and section endpoints."""
+        project_id = client.post(
+            "/api/projects",
+            json={"name": "Demo", "prd": "# PRD\n## Goals\n- Fast\n## Goals\n"},
+        ).json()["id"]
+
+        outline = client.get(f"/api/projects/{project_id}/prd/outline")
+        section = client.get(f"/api/projects/{project_id}/prd/sections/goals")
+        missing = client.get(f"/api/projects/{project_id}/prd/sections/risks")
+        unknown = client.get(f"/api/projects/{uuid4()}/prd/outline")
+
+        assert outline.status_code == 200
+        assert outline.json()["prdVersion"] == 0
+        assert outline.json()["sections"][1] == {
+            "slug": "goals",
+            "title": "Goals",
+            "level": 2,
+            "start": 6,
+            "end": 22,
+            "words": 1,
+        }
+        assert [s["slug"] for s in outline.json()["sections"]] == [
+            "prd",
+            "goals",
+            "goals-1",
+        ]
+        assert section.json()["content"] == "## Goals\n- Fast\n"
+        assert missing.status_code == 404
+        assert unknown.status_code == 404
+
+    def test_prd_html_with_etag(self, client):
+        """Test rendering the PRD as HTML and revalidating it by ETag."""
+        project_id = client.post(
+            "/api/projects", json={"name": "Demo", "prd": "# PRD\n- **Fast**\n"}
+        ).json()["id"]
+
+        response = client.get(f"/api/projects/{project_id}/prd.html")
+        etag = response.headers["etag"]
+        unchanged = client.get(
+            f"/api/projects/{project_id}/prd.html", headers={"If-None-Match": etag}
+        )
+        client.patch(f"/api/projects/{project_id}", json={"prd": "# New\n"})
+        changed = client.get(
+            f"/api/projects/{project_id}/prd.html", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "text/html; charset=utf-8"
+        assert response.text == (
+            '<h1 id="prd">PRD</h1>\n<ul>\n<li><strong>Fast</strong></li>\n</ul>\n'
+        )
+        assert unchanged.status_code == 304
+        assert unchanged.headers["etag"] == etag
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert client.get(f"/api/projects/{uuid4()}/prd.html").status_code == 404
+
+    def test_executor_metrics(self, client):
+        """Test that the work executor reports its pools."""
+        response = client.get("/api/metrics/executor")
+
+        assert response.status_code == 200
+        assert set(response.json()) == {"threads", "processes"}
+        assert response.json()["threads"]["failed"] == 0
+
+    def test_app_restart_gets_fresh_executor(self):
+        """Test that shutting an app down resets the shared work executor."""
+        with TestClient(create_app()) as client:
+            first = client.app.state.work_executor
+        assert config.get_work_executor() is not first
+
+        with TestClient(create_app()) as restarted:
+            prd = "# PRD\n" + "- Requirement\n" * 5000
+            created = restarted.post("/api/projects", json={"name": "Big", "prd": prd})
+            project_id = created.json()["id"]
+            assert (
+                restarted.get(f"/api/projects/{project_id}/prd.html").status_code == 200
+            )
+            assert restarted.app.state.work_executor is config.get_work_executor()
@@ -0,0 +1,145 @@
+"""Tests for the project event stream."""
+
+import json
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from forgebase.core.project_events import ProjectEvent
+from forgebase.infrastructure import config
+from forgebase.infrastructure.project_events import ProjectEventBus
+from forgebase.interfaces.project_json import project_event_to_json
+from forgebase.interfaces.web import _project_event_stream, create_app
+
+
+def _data(message: bytes) -> dict:
+    """Parse the data line of an SSE message."""
+    return json.loads(message.split(b"\ndata: ")[1])
+
+
+class TestProjectEventStream:
+    """Test cases for streaming project events as SSE."""
+
+    @pytest.mark.asyncio
+    async def test_streams_changes_until_deleted(self):
+        """Test that the stream forwards events and ends with the deletion."""
+        bus = ProjectEventBus()
+        project_id = uuid4()
+        subscription = bus.subscribe(project_id)
+        stream = _project_event_stream(subscription)
+
+        assert await anext(stream) == b": connected\n\n"
+        bus.publish(ProjectEvent("updated", project_id, "u", ("prd",), "Demo"))
+        bus.publish(ProjectEvent("deleted", project_id, "u"))
+
+        updated = await anext(stream)
+        assert updated.startswith(b"event: updated\n")
+        assert _data(updated)["changed"] == ["prd"]
+        assert (await anext(stream)).startswith(b"event: deleted\n")
+        with pytest.raises(StopAsyncIteration):
+            await anext(stream)
+        assert bus.subscriber_count == 0
+
+    @pytest.mark.asyncio
+    async def test_keepalive_and_resync(self):
+        """Test keepalive comments and the resync sent to a lagging client."""
+        bus = ProjectEventBus(buffer_size=1)
+        project_id = uuid4()
+        stream = _project_event_stream(bus.subscribe(project_id), keepalive=0.01)
+
+        await anext(stream)
+        assert await anext(stream) == b": keepalive\n\n"
+        for _ in range(2):
+            bus.publish(ProjectEvent("updated", project_id, "u", ("name",), "Demo"))
+
+        assert (await anext(stream)).startswith(b"event: resync\n")
+        with pytest.raises(StopAsyncIteration):
+            await anext(stream)
+
+    def test_unknown_project_returns_404(self):
+        """Test that subscribing to a missing project fails."""
+        with TestClient(create_app()) as client:
+            response = client.get(f"/api/projects/{uuid4()}/events")
+        assert response.status_code == 404
+
+
+class TestPrdDiffs:
+    """Test that clients can follow PRD changes through diffs."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a test client for the FastAPI app."""
+        with TestClient(create_app()) as client:
+            yield client
+
+    @pytest.mark.asyncio
+    async def test_update_event_carries_diff(self):
+        """Test that a PRD update streams a diff against the previous version."""
+        service = config.get_project_service()
+        project = await service.create_project("u", "Demo", prd="# PRD\n- One\n")
+        subscription = config.get_project_events().subscribe(project.id)
+
+        await service.update_project(str(project.id), "u", prd="# PRD\n- Two\n")
+
+        data = json.loads(project_event_to_json(await subscription.next(timeout=1)))
+        assert data["prdVersion"] == 1
+        assert data["diff"] == [{"at": 1, "delete": 1, "insert": ["- Two\n"]}]
+
+    def test_prd_since_current_version_is_empty_diff(self, client):
+        """Test that an up-to-date client gets no content."""
+        project_id = client.post("/api/projects", json={"name": "Demo"}).json()["id"]
+        client.patch(f"/api/projects/{project_id}", json={"prd": "# PRD\n"})
+
+        response = client.get(f"/api/projects/{project_id}/prd", params={"since": 1})
+
+        assert response.json() == {"prdVersion": 1, "baseVersion": 1, "diff": []}
+
+    def test_prd_without_since_is_full_document(self, client):
+        """Test that the PRD endpoint falls back to the full document."""
+        project_id = client.post(
+            "/api/projects", json={"name": "Demo", "prd": "# PRD\n"}
+        ).json()["id"]
+
+        response = client.get(f"/api/projects/{project_id}/prd", params={"since": 7})
+
+        assert response.json() == {"prdVersion": 0, "prd": "# PRD\n"}
+        assert client.get(f"/api/projects/{project_id}").json()["prdVersion"] == 0
+
+    def test_prd_since_older_version_is_diff(self, client):
+        """Test that a client behind by several versions gets one diff."""
+        project_id = client.post(
+            "/api/projects", json={"name": "Demo", "prd": "a\nb\nc\n"}
+        ).json()["id"]
+        client.patch(f"/api/projects/{project_id}", json={"prd": "a\nB\nc\n"})
+        client.patch(f"/api/projects/{project_id}", json={"prd": "a\nB\nc\nd\n"})
+
+        response = client.get(f"/api/projects/{project_id}/prd", params={"since": 0})
+
+        assert response.json() == {
+            "prdVersion": 2,
+            "baseVersion": 0,
+            "diff": [
+                {"at": 1, "delete": 1, "insert": ["B\n"]},
+                {"at": 3, "delete": 0, "insert": ["d\n"]},
+            ],
+        }
+
+    def test_revision_endpoints(self, client):
+        """Test listing and fetching PRD revisions."""
+        project_id = client.post(
+            "/api/projects", json={"name": "Demo", "prd": "# v0\n"}
+        ).json()["id"]
+        client.patch(f"/api/projects/{project_id}", json={"prd": "# v1\n"})
+
+        revisions = client.get(f"/api/projects/{project_id}/prd/revisions").json()
+        first = client.get(f"/api/projects/{project_id}/prd/revisions/0")
+        missing = client.get(f"/api/projects/{project_id}/prd/revisions/5")
+
+        assert [revision["prdVersion"] for revision in revisions] == [1, 0]
+        assert revisions[0]["size"] == len("# v1\n")
+        assert first.json() == {"prdVersion": 0, "prd": "# v0\n"}
+        assert first.headers["content-type"] == "application/json"
+        assert first.content == b'{"prdVersion":0,"prd":"# v0\\n"}'
+        assert missing.status_code == 404
+        assert client.get(f"/api/projects/{uuid4()}/prd/revisions").status_code == 404
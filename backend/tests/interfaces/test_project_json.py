@@ -0,0 +1,164 @@
+"""Tests for project JSON serialization and its cache."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from forgebase.core.entities import Project
+from forgebase.infrastructure import config
+from forgebase.interfaces import project_json
+from forgebase.interfaces.project_models import ProjectResponse
+from forgebase.interfaces.web import TEST_USER_ID, create_app
+
+
+def _reference(content) -> bytes:
+    """Serialize the way the endpoints did through pydantic and JSONResponse."""
+    return JSONResponse(content=content).body
+
+
+def _payload(project: Project):
+    return ProjectResponse.model_validate(project).model_dump(
+        mode="json", by_alias=True
+    )
+
+
+def _project(**changes) -> Project:
+    fields = {
+        "id": uuid4(),
+        "user_id": "test-user-123",
+        "name": "Demo",
+        "prd": "# PRD\n\n- Export as PDF\n",
+        "created_at": datetime.now(UTC),
+        "updated_at": None,
+    }
+    fields.update(changes)
+    return Project(**fields)
+
+
+PROJECTS = [
+    _project(),
+    _project(updated_at=datetime.now(UTC)),
+    _project(name="Ünïcödé 🚀 名前", prd='Quotes " and \\ and \t\x00\x1f\x7f '),
+    _project(created_at=datetime(2024, 1, 1, tzinfo=UTC)),
+    _project(created_at=datetime(2024, 1, 1, 12, 30, 0, 500000)),
+    _project(created_at=datetime(2024, 1, 1, tzinfo=timezone(timedelta(hours=-5)))),
+    _project(created_at=datetime(2024, 1, 1, tzinfo=timezone(timedelta(seconds=30)))),
+    _project(created_at=datetime(2024, 1, 1, tzinfo=timezone(timedelta(0)))),
+]
+
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request, monkeypatch):
+    """Run each test with orjson and with the stdlib fallback."""
+    if request.param == "json":
+        monkeypatch.setattr(project_json, "orjson", None)
+    elif project_json.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+class TestProjectJson:
+    """Test cases for project_to_json and projects_to_json."""
+
+    @pytest.mark.parametrize("project", PROJECTS)
+    def test_matches_pydantic_serialization(self, encoder, project):
+        """Test that a project serializes to the same bytes as before."""
+        assert project_json.project_to_json(project) == _reference(_payload(project))
+
+    def test_list_matches_pydantic_serialization(self, encoder):
+        """Test that a project list serializes to the same bytes as before."""
+        expected = _reference([_payload(project) for project in PROJECTS])
+
+        assert project_json.projects_to_json(PROJECTS) == expected
+        assert project_json.projects_to_json([]) == b"[]"
+
+
+class TestProjectPayloadCache:
+    """Test cases for ProjectPayloadCache."""
+
+    def test_serves_cached_bytes_until_invalidated(self):
+        """Test that a project is encoded once until it is invalidated."""
+        cache = project_json.ProjectPayloadCache()
+        project = _project()
+
+        first = cache.project_json(project)
+        project.update_prd("# Changed")
+        stale = cache.project_json(project)
+        cache.invalidate(project.id)
+        fresh = cache.project_json(project)
+
+        assert first == stale
+        assert fresh == project_json.project_to_json(project)
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_list_is_assembled_from_fragments(self):
+        """Test that a list built from cached fragments matches direct encoding."""
+        cache = project_json.ProjectPayloadCache()
+        cache.project_json(PROJECTS[0])
+
+        assert cache.projects_json(PROJECTS) == project_json.projects_to_json(PROJECTS)
+        assert cache.projects_json([]) == b"[]"
+
+    def test_evicts_least_recently_used(self):
+        """Test that the cache stays within its size."""
+        cache = project_json.ProjectPayloadCache(max_entries=2)
+        first, second, third = PROJECTS[:3]
+        cache.project_json(first)
+        cache.project_json(second)
+        cache.project_json(first)
+        cache.project_json(third)
+
+        assert len(cache) == 2
+        cache.project_json(first)
+        assert cache.misses == 3
+
+    def test_large_prds_are_not_cached(self):
+        """Test that projects with a PRD past the limit are encoded every time."""
+        cache = project_json.ProjectPayloadCache(max_prd_chars=100)
+        small, large = _project(), _project(prd="- Requirement\n" * 10)
+
+        assert cache.project_json(large) == project_json.project_to_json(large)
+        cache.project_json(small)
+
+        assert len(cache) == 1
+        cache.project_json(large)
+        assert (cache.hits, cache.misses) == (0, 3)
+
+
+class TestCachedEndpoints:
+    """Test that project endpoints never serve stale cached JSON."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a test client for the FastAPI app."""
+        with TestClient(create_app()) as client:
+            yield client
+
+    def test_change_through_another_service_invalidates(self, client):
+        """Test that an update made by the agent's tools is visible on the next read."""
+        project_id = client.post("/api/projects", json={"name": "Demo"}).json()["id"]
+        assert client.get(f"/api/projects/{project_id}").json()["prd"] == ""
+        assert client.get("/api/projects").json()[0]["prd"] == ""
+
+        # The PRD tools use their own ProjectService over the shared repository
+        service = config.get_project_service()
+        asyncio.run(service.update_project(project_id, TEST_USER_ID, prd="# Agent PRD"))
+
+        assert client.get(f"/api/projects/{project_id}").json()["prd"] == "# Agent PRD"
+        assert client.get("/api/projects").json()[0]["prd"] == "# Agent PRD"
+
+    def test_patch_and_delete_invalidate(self, client):
+        """Test that API mutations invalidate the cached JSON."""
+        project_id = client.post("/api/projects", json={"name": "Demo"}).json()["id"]
+        client.get(f"/api/projects/{project_id}")
+
+        client.patch(f"/api/projects/{project_id}", json={"name": "Renamed"})
+        assert client.get(f"/api/projects/{project_id}").json()["name"] == "Renamed"
+
+        client.delete(f"/api/projects/{project_id}")
+        assert client.get(f"/api/projects/{project_id}").status_code == 404
+        assert client.get("/api/projects").json() == []